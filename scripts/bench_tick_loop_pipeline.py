@@ -0,0 +1,61 @@
+"""Benchmark the pipelined CMP-0 tick loop against the serial one."""
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from core.tick_loop import (  # noqa: E402
+    TickLoopPipelineConfig,
+    TickLoopWindowSpec,
+    run_cmp0_tick_loop,
+)
+from governance import GovernanceConfigV1  # noqa: E402
+from umx.profile_cmp0 import gf01_profile_cmp0  # noqa: E402
+from umx.topology_profile import gf01_topology_profile  # noqa: E402
+
+
+def _run(ticks: int, pipeline: TickLoopPipelineConfig | None):
+    started = time.perf_counter()
+    result = run_cmp0_tick_loop(
+        topo=gf01_topology_profile(),
+        profile=gf01_profile_cmp0(),
+        initial_state=[3, 1, 0, 0, 0, 0],
+        total_ticks=ticks,
+        window_specs=[
+            TickLoopWindowSpec(window_id="W", apx_name="APX", start_tick=1, end_tick=8),
+        ],
+        primary_window_id="W",
+        run_id="BENCH",
+        nid="N/A",
+        governance=GovernanceConfigV1(governance_mode="OBSERVE"),
+        pipeline=pipeline,
+    )
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=5_000)
+    parser.add_argument("--depth", type=int, default=64)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args()
+
+    serial, serial_seconds = _run(args.ticks, None)
+    pipelined, pipelined_seconds = _run(
+        args.ticks, TickLoopPipelineConfig(depth=args.depth, workers=args.workers)
+    )
+    if pipelined != serial:
+        raise SystemExit("pipelined run diverged from the serial run")
+    print(f"ticks={args.ticks} depth={args.depth} workers={args.workers or 'cpu_count'}")
+    print(f"serial    {args.ticks / serial_seconds:10.0f} ticks/s")
+    print(f"pipelined {args.ticks / pipelined_seconds:10.0f} ticks/s")
+    print(f"speedup   {serial_seconds / pipelined_seconds:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Benchmark generated per-topology UMX kernels against the generic engine."""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "src"))
+
+from umx import ProfileCMP0V1, UMXRunContext, load_topology_profile  # noqa: E402
+
+TOPOLOGY_DIR = ROOT / "docs" / "fixtures" / "topologies"
+
+
+def _ticks_per_second(ctx: UMXRunContext, state, ticks: int, mode: str) -> float:
+    ctx.init_state(state)
+    started = time.perf_counter()
+    if mode == "step":
+        ctx.run_until(ticks)
+    else:
+        ctx.fast_forward(ticks, check_every=None)
+    return ticks / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ticks", type=int, default=20_000)
+    parser.add_argument("--mode", choices=("step", "advance"), default="step")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument(
+        "--topologies", nargs="+", default=sorted(path.name for path in TOPOLOGY_DIR.glob("*.json"))
+    )
+    args = parser.parse_args()
+
+    print(f"ticks={args.ticks} mode={args.mode}")
+    print(f"{'topology':>34} {'E':>4} {'python t/s':>12} {'codegen t/s':>12} {'speedup':>8}")
+    for name in args.topologies:
+        topo = load_topology_profile(TOPOLOGY_DIR / name)
+        profile = ProfileCMP0V1(SC=topo.SC)
+        rng = random.Random(args.seed)
+        state = [rng.randint(0, 10_000) for _ in range(topo.N)]
+
+        python_ctx = UMXRunContext(topo=topo, profile=profile, backend="python")
+        codegen_ctx = UMXRunContext(topo=topo, profile=profile, backend="codegen")
+        # Warm-up tick generates and compiles the kernel outside the timed region.
+        codegen_ctx.init_state(state)
+        codegen_ctx.step()
+        python_rate = _ticks_per_second(python_ctx, state, args.ticks, args.mode)
+        codegen_rate = _ticks_per_second(codegen_ctx, state, args.ticks, args.mode)
+        if codegen_ctx.current_state() != python_ctx.current_state():
+            raise SystemExit(f"codegen run diverged on {name}")
+        print(
+            f"{name:>34} {len(topo.edges):>4} {python_rate:12.0f} {codegen_rate:12.0f}"
+            f" {codegen_rate / python_rate:8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Benchmark partitioned multi-process UMX stepping against the single-process engine."""
+from __future__ import annotations
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from umx import (  # noqa: E402
+    PartitionedExecutor,
+    ProfileCMP0V1,
+    UMXRunContext,
+    topology_profile_from_dict,
+)
+
+
+def _random_topology(nodes: int, degree: int, seed: int):
+    rng = random.Random(seed)
+    edges = []
+    for i in range(1, nodes + 1):
+        for offset in range(1, degree + 1):
+            # Mostly local edges with an occasional long-range link, so
+            # contiguous partitions see a realistic share of cut edges.
+            j = i + offset if rng.random() < 0.9 else rng.randint(1, nodes)
+            j = (j - 1) % nodes + 1
+            if j != i:
+                edges.append({"i": i, "j": j, "k": rng.randint(1, 8), "cap": 64, "SC": 32})
+    return topology_profile_from_dict(
+        {
+            "gid": "BENCH_PARTITIONED",
+            "profile": "CMP-0",
+            "N": nodes,
+            "nodes": [{"node_id": idx, "label": f"n{idx}"} for idx in range(1, nodes + 1)],
+            "edges": [dict(edge, e_id=e_id) for e_id, edge in enumerate(edges, start=1)],
+            "SC": 32,
+        }
+    )
+
+
+def _time_run(ctx: UMXRunContext, state, ticks: int, mode: str) -> float:
+    ctx.init_state(state)
+    started = time.perf_counter()
+    if mode == "step":
+        ctx.run_until(ticks)
+    else:
+        ctx.fast_forward(ticks, check_every=None)
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--nodes", type=int, default=20_000)
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--ticks", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--mode", choices=("step", "advance"), default="step")
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    topo = _random_topology(args.nodes, args.degree, args.seed)
+    profile = ProfileCMP0V1(SC=topo.SC)
+    rng = random.Random(args.seed)
+    state = [rng.randint(0, 10_000) for _ in range(topo.N)]
+
+    baseline_ctx = UMXRunContext(topo=topo, profile=profile)
+    baseline = _time_run(baseline_ctx, state, args.ticks, args.mode)
+    expected = baseline_ctx.current_state()
+    print(f"N={topo.N} E={len(topo.edges)} ticks={args.ticks} mode={args.mode}")
+    print(f"{'workers':>8} {'cut_edges':>10} {'seconds':>9} {'ms/tick':>9} {'speedup':>8}")
+    print(f"{'engine':>8} {'-':>10} {baseline:9.3f} {1000 * baseline / args.ticks:9.2f} {1.0:8.2f}")
+    for workers in args.workers:
+        with PartitionedExecutor(workers) as executor:
+            ctx = UMXRunContext(topo=topo, profile=profile, executor=executor)
+            # Warm-up tick starts the worker pool outside the timed region.
+            ctx.init_state(state)
+            ctx.step()
+            elapsed = _time_run(ctx, state, args.ticks, args.mode)
+            if ctx.current_state() != expected:
+                raise SystemExit(f"partitioned run with {workers} workers diverged")
+            plan = executor.plan
+            print(
+                f"{workers:>8} {plan.cut_edges:>10} {elapsed:9.3f}"
+                f" {1000 * elapsed / args.ticks:9.2f} {baseline / elapsed:8.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -20,6 +20,7 @@ from core.serialization import (
     serialize_uledger_entry,
 )
 from gate import run_session
+from loom.chain import DEFAULT_SEGMENT_BLOCKS, migrate_loom_block_store
 from ops import RunSummary, append_run_summaries, build_introspection_view
 from ops.snapshots import (
     DEFAULT_SNAPSHOT_DIR,
@@ -27,6 +28,7 @@ from ops.snapshots import (
     render_snapshot_diffs,
     write_snapshot,
 )
+from umx.topology_binary import convert_topology_json, load_topology_binary
 
 
 REPO_ROOT = Path(__file__).resolve().parent.parent
@@ -225,6 +227,33 @@ def _hero_suite_command(args: argparse.Namespace) -> None:
     hero_suite_main(sub_args)
 
 
+def _topology_convert_command(args: argparse.Namespace) -> None:
+    target = convert_topology_json(args.source, args.output)
+    topology = load_topology_binary(target)
+    _json_print(
+        {
+            "path": str(target),
+            "gid": topology.gid,
+            "N": topology.N,
+            "E": topology.E,
+            "content_hash": topology.content_hash,
+        }
+    )
+
+
+def _loom_migrate_command(args: argparse.Namespace) -> None:
+    store = migrate_loom_block_store(Path(args.root), segment_blocks=args.segment_blocks)
+    index = store.replay_index()
+    _json_print(
+        {
+            "path": str(store.root),
+            "p_blocks": len(index["p"]),
+            "i_blocks": len(index["i"]),
+            "segment_blocks": store.segment_blocks,
+        }
+    )
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Aether introspection CLI")
     parser.add_argument(
@@ -302,6 +331,35 @@ def build_parser() -> argparse.ArgumentParser:
     )
     snapshot_cmp.set_defaults(func=_snapshot_compare_command)
 
+    topology_parser = subparsers.add_parser("topology", help="Topology file tools")
+    topology_subparsers = topology_parser.add_subparsers(
+        dest="topology_command", required=True
+    )
+    topology_convert = topology_subparsers.add_parser(
+        "convert",
+        help="Convert a JSON TopologyProfile into the binary memory-mappable format",
+    )
+    topology_convert.add_argument("source", help="TopologyProfile JSON path")
+    topology_convert.add_argument(
+        "--output", help="Binary output path (defaults to <source>.umxtopo)"
+    )
+    topology_convert.set_defaults(func=_topology_convert_command)
+
+    loom_parser = subparsers.add_parser("loom", help="Loom block store tools")
+    loom_subparsers = loom_parser.add_subparsers(dest="loom_command", required=True)
+    loom_migrate = loom_subparsers.add_parser(
+        "migrate",
+        help="Convert a JSON-index Loom block store to the segment layout in place",
+    )
+    loom_migrate.add_argument("root", help="Block store directory")
+    loom_migrate.add_argument(
+        "--segment-blocks",
+        type=int,
+        default=DEFAULT_SEGMENT_BLOCKS,
+        help="Blocks per segment file",
+    )
+    loom_migrate.set_defaults(func=_loom_migrate_command)
+
     suite_parser = subparsers.add_parser(
         "hero-suite",
         help="Run all hero commands and sweeps (Phase 9 orchestrator)",
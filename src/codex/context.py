@@ -16,7 +16,7 @@ from core.slp import SLPEventV1
 from loom.loom import LoomIBlockV1, LoomPBlockV1
 from press import APXManifestV1, APXiViewV1
 from press.aeon import AEONWindowGrammarV1, AEONWindowRegistry
-from umx.tick_ledger import EdgeFluxV1, UMXTickLedgerV1
+from umx.tick_ledger import EdgeFluxV1, UMXTickLedgerV1, edge_flux_column
 
 
 def _canonical_hash(payload: dict) -> str:
@@ -187,6 +187,31 @@ class CodexProposalV1:
             raise ValueError("evaluated_at_tick must be a non-negative integer when provided")
 
 
+_RUNTIME_COUNTERS = (
+    "total_ticks",
+    "total_p_blocks",
+    "total_i_blocks",
+    "total_manifests",
+    "total_envelopes",
+    "total_aeon_windows",
+    "total_apxi_views",
+)
+_RUNTIME_TALLIES = (
+    "edge_pattern_counts",
+    "ledger_pattern_counts",
+    "ledger_pattern_ticks",
+    "ledger_pattern_edge_ids",
+    "slp_sequences",
+    "slp_sequence_ticks",
+)
+
+
+def _as_tuple(value: object) -> object:
+    if isinstance(value, list):
+        return tuple(_as_tuple(item) for item in value)
+    return value
+
+
 @dataclass
 class CodexRuntimeStats:
     """Runtime ingestion counters and lightweight pattern tallies."""
@@ -218,24 +243,32 @@ class CodexRuntimeStats:
         if run_id not in self.ingested_runs:
             self.ingested_runs.append(run_id)
 
-    def _record_edge_patterns(self, edges: Sequence[EdgeFluxV1]) -> None:
-        for edge in edges:
-            key = (edge.e_id, edge.du, edge.f_e)
-            self.edge_pattern_counts[key] = self.edge_pattern_counts.get(key, 0) + 1
+    def _record_edge_patterns(
+        self, e_ids: Sequence[int], dus: Sequence[int], f_es: Sequence[int]
+    ) -> None:
+        counts = self.edge_pattern_counts
+        for key in zip(e_ids, dus, f_es):
+            counts[key] = counts.get(key, 0) + 1
 
-    def _record_ledger_signature(self, edges: Sequence[EdgeFluxV1], tick: int) -> None:
-        ordered = sorted(edges, key=lambda edge: edge.e_id)
-        du_sig = tuple(edge.du for edge in ordered)
-        f_e_sig = tuple(edge.f_e for edge in ordered)
+    def _record_ledger_signature(
+        self, e_ids: Sequence[int], dus: Sequence[int], f_es: Sequence[int], tick: int
+    ) -> None:
+        order = sorted(range(len(e_ids)), key=e_ids.__getitem__)
+        du_sig = tuple(dus[idx] for idx in order)
+        f_e_sig = tuple(f_es[idx] for idx in order)
         key = (du_sig, f_e_sig)
         self.ledger_pattern_counts[key] = self.ledger_pattern_counts.get(key, 0) + 1
         self.ledger_pattern_ticks.setdefault(key, []).append(tick)
-        self.ledger_pattern_edge_ids.setdefault(key, tuple(edge.e_id for edge in ordered))
+        if key not in self.ledger_pattern_edge_ids:
+            self.ledger_pattern_edge_ids[key] = tuple(e_ids[idx] for idx in order)
 
     def record_tick(self, edges: Sequence[EdgeFluxV1], tick: int) -> None:
+        e_ids = edge_flux_column(edges, "e_id")
+        dus = edge_flux_column(edges, "du")
+        f_es = edge_flux_column(edges, "f_e")
         self.total_ticks += 1
-        self._record_edge_patterns(edges)
-        self._record_ledger_signature(edges, tick)
+        self._record_edge_patterns(e_ids, dus, f_es)
+        self._record_ledger_signature(e_ids, dus, f_es, tick)
 
     def record_slp_sequence(
         self, *, gid: str, op_types: Sequence[str], ticks: Sequence[int]
@@ -244,6 +277,29 @@ class CodexRuntimeStats:
         self.slp_sequences[key] = self.slp_sequences.get(key, 0) + 1
         self.slp_sequence_ticks.setdefault(key, []).extend(ticks)
 
+    def to_dict(self) -> Dict[str, object]:
+        """Return JSON-ready counters; tuple-keyed tallies become ``[key, value]`` pairs."""
+
+        payload: Dict[str, object] = {name: getattr(self, name) for name in _RUNTIME_COUNTERS}
+        payload["ingested_runs"] = list(self.ingested_runs)
+        for name in _RUNTIME_TALLIES:
+            payload[name] = [
+                [key, list(value) if isinstance(value, list) else value]
+                for key, value in getattr(self, name).items()
+            ]
+        return payload
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> "CodexRuntimeStats":
+        stats = cls(**{name: int(data[name]) for name in _RUNTIME_COUNTERS})
+        stats.ingested_runs = [str(run_id) for run_id in data["ingested_runs"]]
+        for name in _RUNTIME_TALLIES:
+            tally = getattr(stats, name)
+            for key, value in data[name]:
+                tally[_as_tuple(key)] = list(value) if name.endswith("_ticks") else _as_tuple(value)
+        return stats
+
+
 
 class CodexContext:
     """Observer-only Codex context for ingesting run traces."""
@@ -271,6 +327,7 @@ class CodexContext:
         self._last_ingest_tick_range: Optional[tuple[int, int]] = None
         self._last_aeon_windows: Optional[AEONWindowGrammarV1] = None
         self._last_apxi_views: tuple[APXiViewV1, ...] = ()
+        self._streamed_tick_range: Optional[tuple[int, int]] = None
 
     def ingest(
         self,
@@ -305,23 +362,116 @@ class CodexContext:
         if envelopes is not None and len(envelopes) not in (0, len(ledgers)):
             raise ValueError("envelopes, when provided, must match tick count or be empty")
 
-        self.runtime_stats.note_run(run_id)
-
         for ledger, p_block in zip(ledgers, p_blocks):
-            if ledger.tick != p_block.tick:
-                raise ValueError("ledger and p_block ticks must align")
-            self.runtime_stats.record_tick(ledger.edges, ledger.tick)
-            self.runtime_stats.total_p_blocks += 1
+            self._record_tick(ledger, p_block)
+
+        ticks = [ledger.tick for ledger in ledgers]
+        self._record_run(
+            gid=gid,
+            run_id=run_id,
+            tick_range=(min(ticks), max(ticks)),
+            i_block_count=len(i_blocks) if i_blocks else 0,
+            manifests=manifests,
+            envelope_count=len(envelopes) if envelopes else 0,
+            aeon_windows=aeon_windows,
+            apxi_views=apxi_views,
+            window_id=window_id,
+            slp_events=slp_events,
+        )
+
+    def ingest_tick(self, ledger: UMXTickLedgerV1, p_block: LoomPBlockV1) -> None:
+        """Tally one tick of a streamed run, as :meth:`ingest` would.
+
+        Streaming callers feed ticks in order as they are produced and call
+        :meth:`finish_ingest` once the run ends; the resulting statistics are
+        identical to a single :meth:`ingest` over the whole run.
+        """
 
-        if i_blocks:
-            self.runtime_stats.total_i_blocks += len(i_blocks)
+        self._record_tick(ledger, p_block)
+        start_tick = self._streamed_tick_range[0] if self._streamed_tick_range else ledger.tick
+        self._streamed_tick_range = (min(start_tick, ledger.tick), ledger.tick)
+
+    def finish_ingest(
+        self,
+        *,
+        gid: str,
+        run_id: str,
+        i_block_count: int = 0,
+        manifests: Optional[Mapping[str, APXManifestV1] | Sequence[APXManifestV1]] = None,
+        envelope_count: int = 0,
+        window_id: Optional[str] = None,
+    ) -> None:
+        """Complete a streamed ingest started with :meth:`ingest_tick`."""
+
+        if not gid or not isinstance(gid, str):
+            raise ValueError("gid must be a non-empty string")
+        if not run_id or not isinstance(run_id, str):
+            raise ValueError("run_id must be a non-empty string")
+        if self._streamed_tick_range is None:
+            raise ValueError("ledgers must be provided for ingestion")
+        tick_range, self._streamed_tick_range = self._streamed_tick_range, None
+        self._record_run(
+            gid=gid,
+            run_id=run_id,
+            tick_range=tick_range,
+            i_block_count=i_block_count,
+            manifests=manifests,
+            envelope_count=envelope_count,
+            window_id=window_id,
+        )
+
+    def streamed_ingest_state(self) -> Dict[str, object]:
+        """Return the runtime statistics and open streamed-ingest range as JSON-ready data.
+
+        Tick loop checkpoints store this so a resumed run can continue the
+        ingest started with :meth:`ingest_tick`.
+        """
+
+        return {
+            "runtime_stats": self.runtime_stats.to_dict(),
+            "tick_range": list(self._streamed_tick_range) if self._streamed_tick_range else None,
+        }
+
+    def restore_streamed_ingest(self, state: Mapping[str, object]) -> None:
+        """Replace the runtime statistics with a :meth:`streamed_ingest_state` snapshot."""
+
+        self.runtime_stats = CodexRuntimeStats.from_dict(state["runtime_stats"])
+        tick_range = state["tick_range"]
+        self._streamed_tick_range = (
+            (int(tick_range[0]), int(tick_range[1])) if tick_range else None
+        )
+
+    def _record_tick(self, ledger: UMXTickLedgerV1, p_block: LoomPBlockV1) -> None:
+        if ledger.tick != p_block.tick:
+            raise ValueError("ledger and p_block ticks must align")
+        self.runtime_stats.record_tick(ledger.edges, ledger.tick)
+        self.runtime_stats.total_p_blocks += 1
+
+    def _record_run(
+        self,
+        *,
+        gid: str,
+        run_id: str,
+        tick_range: tuple[int, int],
+        i_block_count: int,
+        manifests: Optional[Mapping[str, APXManifestV1] | Sequence[APXManifestV1]],
+        envelope_count: int,
+        aeon_windows: Optional[AEONWindowGrammarV1 | AEONWindowRegistry] = None,
+        apxi_views: Optional[Mapping[str, APXiViewV1] | Sequence[APXiViewV1]] = None,
+        window_id: Optional[str] = None,
+        slp_events: Optional[Sequence[SLPEventV1]] = None,
+    ) -> None:
+        self.runtime_stats.note_run(run_id)
+
+        if i_block_count:
+            self.runtime_stats.total_i_blocks += i_block_count
 
         if manifests:
             manifest_count = len(manifests) if isinstance(manifests, Mapping) else len(list(manifests))
             self.runtime_stats.total_manifests += manifest_count
 
-        if envelopes:
-            self.runtime_stats.total_envelopes += len(envelopes)
+        if envelope_count:
+            self.runtime_stats.total_envelopes += envelope_count
 
         if slp_events:
             op_types = [evt.op_type.value if hasattr(evt.op_type, "value") else str(evt.op_type) for evt in slp_events]
@@ -343,8 +493,7 @@ class CodexContext:
             self.runtime_stats.total_apxi_views += len(view_list)
             self._last_apxi_views = view_list
 
-        ticks = [ledger.tick for ledger in ledgers]
-        start_tick, end_tick = min(ticks), max(ticks)
+        start_tick, end_tick = tick_range
         resolved_window_id = window_id or f"{gid}_ticks_{start_tick}_{end_tick}"
         if not isinstance(resolved_window_id, str) or not resolved_window_id:
             raise ValueError("window_id must resolve to a non-empty string")
@@ -256,7 +256,10 @@ class EngineRuntime:
             return override
         if not isinstance(override, Mapping):
             raise ValueError("metrics override must be a mapping or MetricsConfigV1")
-        return MetricsConfigV1(enabled=bool(override.get("enabled", True)))
+        return MetricsConfigV1(
+            enabled=bool(override.get("enabled", True)),
+            profile_stages=bool(override.get("profile_stages", current.profile_stages)),
+        )
 
     @staticmethod
     def _governance_snapshot(config: GovernanceConfigV1) -> dict[str, Any]:
@@ -6,7 +6,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
 
-from gate import PressStreamSpecV1, SessionConfigV1, load_pfna_v0
+from gate import (
+    ARTIFACT_PROFILES,
+    PFNAJsonlStreamV0,
+    PressStreamSpecV1,
+    SessionConfigV1,
+    load_pfna_v0,
+)
 from governance import GovernanceConfigV1, governance_config_from_mapping
 from ops import LoggingConfigV1, MetricsConfigV1
 from core.tick_loop import TickLoopWindowSpec
@@ -94,6 +100,7 @@ class RunConfigV1:
     diagnostics: Dict[str, Any] = field(default_factory=dict)
     logging: LoggingConfigV1 = field(default_factory=LoggingConfigV1)
     metrics: MetricsConfigV1 = field(default_factory=MetricsConfigV1)
+    artifact_profile: str = "full"
 
     def __post_init__(self) -> None:
         if self.v != 1:
@@ -126,6 +133,10 @@ class RunConfigV1:
             raise ValueError("logging must be a LoggingConfigV1 instance")
         if not isinstance(self.metrics, MetricsConfigV1):
             raise ValueError("metrics must be a MetricsConfigV1 instance")
+        if self.artifact_profile not in ARTIFACT_PROFILES:
+            raise ValueError(
+                f"artifact_profile must be one of {sorted(ARTIFACT_PROFILES)}"
+            )
 
 
 @dataclass(frozen=True)
@@ -235,7 +246,10 @@ def logging_config_from_mapping(data: Mapping[str, Any]) -> LoggingConfigV1:
 
 def metrics_config_from_mapping(data: Mapping[str, Any]) -> MetricsConfigV1:
     _ensure_mapping(data, "metrics")
-    return MetricsConfigV1(enabled=bool(data.get("enabled", False)))
+    return MetricsConfigV1(
+        enabled=bool(data.get("enabled", False)),
+        profile_stages=bool(data.get("profile_stages", False)),
+    )
 
 
 def _derive_governance_config(run_config: RunConfigV1) -> GovernanceConfigV1:
@@ -298,6 +312,7 @@ def run_config_from_mapping(data: Mapping[str, Any]) -> RunConfigV1:
         diagnostics=dict(data.get("diagnostics", {})),
         logging=logging_config_from_mapping(data.get("logging", {})),
         metrics=metrics_config_from_mapping(data.get("metrics", {})),
+        artifact_profile=str(data.get("artifact_profile", "full")),
     )
 
 
@@ -487,7 +502,10 @@ def build_session_config_from_run_config(
         if not run_config.pfna_path:
             raise ValueError("enable_pfna is true but pfna_path is missing")
         pfna_path = _resolve_relative(base_dir, run_config.pfna_path, label="pfna_path")
-        pfna_inputs = load_pfna_v0(pfna_path, expected_length=topo.N)
+        if pfna_path.suffix == ".jsonl":
+            pfna_inputs = PFNAJsonlStreamV0(pfna_path, expected_length=topo.N)
+        else:
+            pfna_inputs = load_pfna_v0(pfna_path, expected_length=topo.N)
     elif run_config.pfna_path:
         _validate_path((base_dir / run_config.pfna_path).resolve(), "pfna_path")
 
@@ -504,6 +522,7 @@ def build_session_config_from_run_config(
         governance=_derive_governance_config(run_config),
         logging_config=run_config.logging,
         metrics_config=run_config.metrics,
+        artifact_profile=ARTIFACT_PROFILES[run_config.artifact_profile],
     )
 
 
@@ -9,7 +9,22 @@ from core.multigraph import (
     load_multigraph_run_config,
     multigraph_config_from_mapping,
 )
-from core.tick_loop import GF01RunResult, TickLoopWindowSpec, run_cmp0_tick_loop, run_gf01
+from core.checkpoint import (
+    TickLoopCheckpointConfig,
+    TickLoopCheckpointV1,
+    latest_tick_loop_checkpoint,
+    load_tick_loop_checkpoint,
+)
+from core.tick_loop import (
+    GF01RunResult,
+    TickLoopArtifactV1,
+    TickLoopPipelineConfig,
+    TickLoopSummaryV1,
+    TickLoopWindowSpec,
+    iter_cmp0_tick_loop,
+    run_cmp0_tick_loop,
+    run_gf01,
+)
 from core.serialization import (
     dumps_gf01_run,
     dumps_session_run,
@@ -19,7 +34,15 @@ from core.serialization import (
 
 __all__ = [
     "GF01RunResult",
+    "TickLoopCheckpointConfig",
+    "TickLoopCheckpointV1",
+    "latest_tick_loop_checkpoint",
+    "load_tick_loop_checkpoint",
+    "TickLoopArtifactV1",
+    "TickLoopPipelineConfig",
+    "TickLoopSummaryV1",
     "TickLoopWindowSpec",
+    "iter_cmp0_tick_loop",
     "run_cmp0_tick_loop",
     "run_gf01",
     "serialize_gf01_run",
@@ -0,0 +1,506 @@
+"""Resumable checkpoints for long CMP-0 tick loop runs.
+
+A :class:`TickLoopCheckpointV1` holds everything
+:func:`core.tick_loop.iter_cmp0_tick_loop` needs to continue a run after a
+given tick. That covers the UMX state and Loom chain value, the Loom recorder
+tip, the open Press window buffers and the manifests of closed windows. It
+also covers the PFNA ingress cursor, the U-ledger head, the Codex runtime
+statistics and the ticks whose scenes still wait for the primary window
+manifest. Checkpoints are JSON files named by tick and are replaced
+atomically, so a run killed mid-write still leaves the previous checkpoint
+intact.
+
+The optional artefact log (``artifacts.jsonl`` next to the checkpoints)
+holds every artefact a run yielded, one JSON line each, so collected
+results can be rebuilt when the run resumes.
+"""
+from __future__ import annotations
+
+import json
+import os
+import shutil
+from dataclasses import dataclass, fields
+from pathlib import Path
+from typing import (
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from gate import NAPEnvelopeV1, SceneFrameV1
+from loom.loom import FluxSummaryV1, LoomIBlockV1, LoomPBlockV1, TopologyEdgeSnapshotV1
+from press import APXManifestV1, APXStreamV1, APXiViewV1
+from press.apxi import APXiDescriptorV1, APXiMDLBreakdown
+from uledger import ULedgerEntryV1
+from umx.tick_ledger import (
+    EDGE_FLUX_FIELDS,
+    EdgeFluxColumnsV1,
+    UMXTickLedgerV1,
+    edge_flux_column,
+)
+
+CHECKPOINT_VERSION = 1
+ARTIFACT_LOG_NAME = "artifacts.jsonl"
+_CHECKPOINT_GLOB = "checkpoint_*.json"
+
+
+@dataclass(frozen=True)
+class TickLoopCheckpointConfig:
+    """Where and how often a tick loop run writes checkpoints.
+
+    A checkpoint is due every ``every`` ticks. While the primary window is
+    still open, the checkpoint also carries the ticks whose scenes wait for
+    its manifest, so it grows with that window. Only the newest ``keep``
+    files are retained, or every file when ``keep`` is None.
+
+    ``artifact_log`` also appends every yielded artefact to
+    ``artifacts.jsonl`` in ``directory``, so a resumed run can rebuild the
+    artefacts yielded before its checkpoint.
+    :func:`core.tick_loop.run_cmp0_tick_loop` always turns it on.
+    """
+
+    directory: Path
+    every: int = 10_000
+    keep: int | None = 2
+    artifact_log: bool = False
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "directory", Path(self.directory))
+        if self.every <= 0:
+            raise ValueError("every must be a positive integer")
+        if self.keep is not None and self.keep <= 0:
+            raise ValueError("keep must be a positive integer when provided")
+
+
+@dataclass(frozen=True)
+class TickLoopCheckpointV1:
+    """State of a tick loop run after ``tick``.
+
+    ``artifact_count`` is how many artefacts the run had yielded by then.
+    A resumed run yields exactly the artefacts that followed, so a consumer
+    persisting the stream truncates it to ``artifact_count`` entries before
+    appending. ``ingress_envelope_count`` is how many ingress envelopes had
+    been emitted; the envelopes themselves live in the artefact log.
+    ``pending_ticks`` holds the simulated ticks still waiting for the
+    primary window manifest. ``artifact_log`` and ``artifact_log_size`` point
+    at the artefact log and its length at this checkpoint, when one is kept.
+    """
+
+    run_id: str
+    gid: str
+    total_ticks: int
+    artifact_profile: str
+    tick: int
+    artifact_count: int
+    umx_state: Tuple[int, ...]
+    chain: int
+    loom_recorder: Mapping[str, object]
+    press_buffers: Mapping[str, Mapping[str, Sequence[object]]]
+    manifests: Tuple[APXManifestV1, ...] = ()
+    apxi_views: Tuple[APXiViewV1, ...] = ()
+    ingress_cursor: int = 0
+    ingress_envelope_count: int = 0
+    envelope_count: int = 0
+    i_block_count: int = 0
+    governance_seq: int = 0
+    u_ledger: Optional[Mapping[str, object]] = None
+    deferred_u_ledger_hashes: Tuple[Mapping[str, object], ...] = ()
+    codex: Optional[Mapping[str, object]] = None
+    pending_ticks: Tuple[Mapping[str, object], ...] = ()
+    artifact_log: Optional[str] = None
+    artifact_log_size: int = 0
+
+    def __post_init__(self) -> None:
+        if not 1 <= self.tick < self.total_ticks:
+            raise ValueError("checkpoint tick must lie within the run")
+        if self.artifact_count < 0:
+            raise ValueError("artifact_count must be non-negative")
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "v": CHECKPOINT_VERSION,
+            "run_id": self.run_id,
+            "gid": self.gid,
+            "total_ticks": self.total_ticks,
+            "artifact_profile": self.artifact_profile,
+            "tick": self.tick,
+            "artifact_count": self.artifact_count,
+            "umx_state": list(self.umx_state),
+            "chain": self.chain,
+            "loom_recorder": dict(self.loom_recorder),
+            "press_buffers": {
+                window_id: dict(buffers) for window_id, buffers in self.press_buffers.items()
+            },
+            "manifests": [_manifest_to_dict(manifest) for manifest in self.manifests],
+            "apxi_views": [view.to_dict() for view in self.apxi_views],
+            "ingress_cursor": self.ingress_cursor,
+            "ingress_envelope_count": self.ingress_envelope_count,
+            "envelope_count": self.envelope_count,
+            "i_block_count": self.i_block_count,
+            "governance_seq": self.governance_seq,
+            "u_ledger": dict(self.u_ledger) if self.u_ledger is not None else None,
+            "deferred_u_ledger_hashes": [dict(hashes) for hashes in self.deferred_u_ledger_hashes],
+            "codex": dict(self.codex) if self.codex is not None else None,
+            "pending_ticks": [dict(record) for record in self.pending_ticks],
+            "artifact_log": self.artifact_log,
+            "artifact_log_size": self.artifact_log_size,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> "TickLoopCheckpointV1":
+        if data.get("v") != CHECKPOINT_VERSION:
+            raise ValueError(f"Unsupported tick loop checkpoint version {data.get('v')!r}")
+        return cls(
+            run_id=str(data["run_id"]),
+            gid=str(data["gid"]),
+            total_ticks=int(data["total_ticks"]),
+            artifact_profile=str(data["artifact_profile"]),
+            tick=int(data["tick"]),
+            artifact_count=int(data["artifact_count"]),
+            umx_state=tuple(int(value) for value in data["umx_state"]),
+            chain=int(data["chain"]),
+            loom_recorder=dict(data["loom_recorder"]),
+            press_buffers={
+                str(window_id): dict(buffers)
+                for window_id, buffers in data["press_buffers"].items()
+            },
+            manifests=tuple(map(_manifest_from_dict, data["manifests"])),
+            apxi_views=tuple(map(_apxi_view_from_dict, data["apxi_views"])),
+            ingress_cursor=int(data["ingress_cursor"]),
+            ingress_envelope_count=int(data["ingress_envelope_count"]),
+            envelope_count=int(data["envelope_count"]),
+            i_block_count=int(data["i_block_count"]),
+            governance_seq=int(data["governance_seq"]),
+            u_ledger=data["u_ledger"],
+            deferred_u_ledger_hashes=tuple(data["deferred_u_ledger_hashes"]),
+            codex=data["codex"],
+            pending_ticks=tuple(data["pending_ticks"]),
+            artifact_log=data["artifact_log"],
+            artifact_log_size=int(data["artifact_log_size"]),
+        )
+
+    def to_json(self) -> str:
+        return json.dumps(self.to_dict(), sort_keys=True, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "TickLoopCheckpointV1":
+        return cls.from_dict(json.loads(text))
+
+
+def _manifest_to_dict(manifest: APXManifestV1) -> Dict[str, object]:
+    return {
+        "apx_name": manifest.apx_name,
+        "profile": manifest.profile,
+        "manifest_check": manifest.manifest_check,
+        "gid": manifest.gid,
+        "window_id": manifest.window_id,
+        "streams": [
+            {
+                "stream_id": stream.stream_id,
+                "description": stream.description,
+                "scheme": stream.scheme,
+                "params": stream.params,
+                "L_model": stream.L_model,
+                "L_residual": stream.L_residual,
+                "L_total": stream.L_total,
+            }
+            for stream in manifest.streams
+        ],
+        "apxi_view_ref": manifest.apxi_view_ref,
+    }
+
+
+def _manifest_from_dict(data: Mapping[str, object]) -> APXManifestV1:
+    return APXManifestV1(
+        apx_name=str(data["apx_name"]),
+        profile=str(data["profile"]),
+        manifest_check=int(data["manifest_check"]),
+        gid=str(data["gid"]),
+        window_id=str(data["window_id"]),
+        streams=[APXStreamV1(**stream) for stream in data["streams"]],
+        apxi_view_ref=data["apxi_view_ref"],
+    )
+
+
+def _apxi_view_from_dict(data: Mapping[str, object]) -> APXiViewV1:
+    return APXiViewV1(
+        apx_name=str(data["apx_name"]),
+        window_id=str(data["window_id"]),
+        aeon_window_id=data["aeon_window_id"],
+        residual_scheme=str(data["residual_scheme"]),
+        descriptors_by_stream={
+            stream_name: tuple(
+                APXiMDLBreakdown(
+                    descriptor=APXiDescriptorV1.from_dict(item["descriptor"]),
+                    residual_scheme=item["residual_scheme"],
+                    L_model=item["L_model"],
+                    L_residual=item["L_residual"],
+                    L_total=item["L_total"],
+                )
+                for item in breakdowns
+            )
+            for stream_name, breakdowns in data["descriptors_by_stream"].items()
+        },
+    )
+
+
+def _envelope_to_dict(envelope: NAPEnvelopeV1) -> Dict[str, object]:
+    return {
+        "v": envelope.v,
+        "tick": envelope.tick,
+        "gid": envelope.gid,
+        "nid": envelope.nid,
+        "layer": envelope.layer,
+        "mode": envelope.mode,
+        "payload_ref": envelope.payload_ref,
+        "seq": envelope.seq,
+        "prev_chain": envelope.prev_chain,
+        "sig": envelope.sig,
+        "slp_event_ids": list(envelope.slp_event_ids),
+        "meta": dict(envelope.meta),
+    }
+
+
+def _envelope_from_dict(data: Mapping[str, object]) -> NAPEnvelopeV1:
+    return NAPEnvelopeV1(**{**data, "slp_event_ids": tuple(data["slp_event_ids"])})
+
+
+def _fields_to_dict(record: object) -> Dict[str, object]:
+    return {item.name: getattr(record, item.name) for item in fields(record)}
+
+
+def _ledger_to_dict(ledger: UMXTickLedgerV1) -> Dict[str, object]:
+    return {
+        **_fields_to_dict(ledger),
+        "edges": {
+            name: list(edge_flux_column(ledger.edges, name)) for name in EDGE_FLUX_FIELDS
+        },
+    }
+
+
+def _ledger_from_dict(data: Mapping[str, object]) -> UMXTickLedgerV1:
+    return UMXTickLedgerV1(**{**data, "edges": EdgeFluxColumnsV1(**data["edges"])})
+
+
+def _p_block_to_dict(block: LoomPBlockV1) -> Dict[str, object]:
+    return {
+        **_fields_to_dict(block),
+        "edge_flux_summary": [_fields_to_dict(item) for item in block.edge_flux_summary],
+    }
+
+
+def _p_block_from_dict(data: Mapping[str, object]) -> LoomPBlockV1:
+    return LoomPBlockV1(
+        **{
+            **data,
+            "edge_flux_summary": [FluxSummaryV1(**item) for item in data["edge_flux_summary"]],
+        }
+    )
+
+
+def _i_block_to_dict(block: LoomIBlockV1) -> Dict[str, object]:
+    return {
+        **_fields_to_dict(block),
+        "topology_snapshot": [_fields_to_dict(edge) for edge in block.topology_snapshot],
+    }
+
+
+def _i_block_from_dict(data: Mapping[str, object]) -> LoomIBlockV1:
+    return LoomIBlockV1(
+        **{
+            **data,
+            "topology_snapshot": [
+                TopologyEdgeSnapshotV1(**edge) for edge in data["topology_snapshot"]
+            ],
+        }
+    )
+
+
+def _scene_from_dict(data: Mapping[str, object]) -> SceneFrameV1:
+    return SceneFrameV1(**{**data, "pfna_refs": tuple(data["pfna_refs"])})
+
+
+def _u_ledger_entry_from_dict(data: Mapping[str, object]) -> ULedgerEntryV1:
+    return ULedgerEntryV1(**{**data, "slp_event_refs": tuple(data["slp_event_refs"])})
+
+
+_ENVELOPE_CODEC = (_envelope_to_dict, _envelope_from_dict)
+_ARTIFACT_CODECS: Dict[str, Tuple[Callable[[object], object], Callable[[object], object]]] = {
+    "ingress_envelope": _ENVELOPE_CODEC,
+    "ledger": (_ledger_to_dict, _ledger_from_dict),
+    "p_block": (_p_block_to_dict, _p_block_from_dict),
+    "i_block": (_i_block_to_dict, _i_block_from_dict),
+    "manifest": (_manifest_to_dict, _manifest_from_dict),
+    "apxi_view": (lambda view: view.to_dict(), _apxi_view_from_dict),
+    "scene": (_fields_to_dict, _scene_from_dict),
+    "envelope": _ENVELOPE_CODEC,
+    "governance_envelope": _ENVELOPE_CODEC,
+    "u_ledger_entry": (_fields_to_dict, _u_ledger_entry_from_dict),
+    "egress_envelope": _ENVELOPE_CODEC,
+}
+
+
+def encode_tick_loop_artifact(kind: str, value: object) -> object:
+    """Return JSON-ready data for a tick loop artefact of ``kind``."""
+
+    if kind not in _ARTIFACT_CODECS:
+        raise ValueError(f"Tick loop artefacts of kind {kind!r} cannot be checkpointed")
+    return _ARTIFACT_CODECS[kind][0](value)
+
+
+def decode_tick_loop_artifact(kind: str, data: object) -> object:
+    """Rebuild an artefact encoded by :func:`encode_tick_loop_artifact`."""
+
+    if kind not in _ARTIFACT_CODECS:
+        raise ValueError(f"Tick loop artefacts of kind {kind!r} cannot be checkpointed")
+    return _ARTIFACT_CODECS[kind][1](data)
+
+
+def open_tick_loop_artifact_log(
+    directory: Union[str, Path], resume: Optional[TickLoopCheckpointV1] = None
+) -> BinaryIO:
+    """Open the artefact log in ``directory`` for appending.
+
+    A fresh run starts an empty log. A resumed run keeps the part of the
+    checkpoint's log written up to that checkpoint and drops the rest.
+    """
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / ARTIFACT_LOG_NAME
+    if resume is None:
+        return open(path, "wb")
+    source = _artifact_log_path(resume)
+    if source.resolve() != path.resolve():
+        shutil.copyfile(source, path)
+    handle = open(path, "r+b")
+    handle.truncate(resume.artifact_log_size)
+    handle.seek(resume.artifact_log_size)
+    return handle
+
+
+def write_tick_loop_artifact(
+    handle: BinaryIO, kind: str, value: object, *, tick: int | None, window_id: str | None
+) -> None:
+    """Append one artefact to an artefact log opened by :func:`open_tick_loop_artifact_log`."""
+
+    line = json.dumps(
+        {
+            "kind": kind,
+            "tick": tick,
+            "window_id": window_id,
+            "value": encode_tick_loop_artifact(kind, value),
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    handle.write(line.encode("utf-8") + b"\n")
+
+
+def read_tick_loop_artifact_log(checkpoint: TickLoopCheckpointV1) -> Iterator[Dict[str, object]]:
+    """Yield the artefacts logged before ``checkpoint`` in order.
+
+    Each item holds the artefact's ``kind``, decoded ``value``, ``tick`` and
+    ``window_id``.
+    """
+
+    remaining = checkpoint.artifact_log_size
+    with open(_artifact_log_path(checkpoint), "rb") as handle:
+        for line in handle:
+            remaining -= len(line)
+            if remaining < 0:
+                break
+            entry = json.loads(line)
+            entry["value"] = decode_tick_loop_artifact(entry["kind"], entry["value"])
+            yield entry
+
+
+def _artifact_log_path(checkpoint: TickLoopCheckpointV1) -> Path:
+    if checkpoint.artifact_log is None:
+        raise ValueError(
+            "resume_from checkpoint has no artefact log; write checkpoints with "
+            "artifact_log=True to resume collected per-tick artefacts"
+        )
+    return Path(checkpoint.artifact_log)
+
+
+def _checkpoint_path(directory: Path, tick: int) -> Path:
+    return directory / f"checkpoint_{tick:012d}.json"
+
+
+def write_tick_loop_checkpoint(
+    checkpoint: TickLoopCheckpointV1, directory: Union[str, Path], *, keep: int | None = None
+) -> Path:
+    """Atomically write ``checkpoint`` into ``directory`` and prune old files.
+
+    The file and the directory entry are synced to disk before older
+    checkpoints are pruned, so a power loss always leaves one usable
+    checkpoint. Only the newest ``keep`` checkpoints are retained, or every
+    file when ``keep`` is None.
+    """
+
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    path = _checkpoint_path(directory, checkpoint.tick)
+    partial = path.with_suffix(".json.partial")
+    with partial.open("w", encoding="utf-8") as handle:
+        handle.write(checkpoint.to_json())
+        handle.flush()
+        os.fsync(handle.fileno())
+    os.replace(partial, path)
+    _fsync_directory(directory)
+    if keep is not None:
+        for stale in _checkpoint_files(directory)[:-keep]:
+            stale.unlink(missing_ok=True)
+    return path
+
+
+def _fsync_directory(directory: Path) -> None:
+    # Directories cannot be opened for syncing on Windows; NTFS journals renames.
+    if os.name == "nt":
+        return
+    fd = os.open(directory, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _checkpoint_files(directory: Path) -> List[Path]:
+    return sorted(directory.glob(_CHECKPOINT_GLOB))
+
+
+def latest_tick_loop_checkpoint(directory: Union[str, Path]) -> Optional[TickLoopCheckpointV1]:
+    """Return the newest checkpoint in ``directory``, or None if there is none yet."""
+
+    directory = Path(directory)
+    files = _checkpoint_files(directory) if directory.is_dir() else []
+    if not files:
+        return None
+    return TickLoopCheckpointV1.from_json(files[-1].read_text(encoding="utf-8"))
+
+
+def load_tick_loop_checkpoint(
+    source: Union[TickLoopCheckpointV1, str, Path],
+) -> TickLoopCheckpointV1:
+    """Resolve a ``resume_from`` argument: a checkpoint, a checkpoint file or a directory.
+
+    A directory resolves to its newest checkpoint.
+    """
+
+    if isinstance(source, TickLoopCheckpointV1):
+        return source
+    path = Path(source)
+    if path.is_dir():
+        checkpoint = latest_tick_loop_checkpoint(path)
+        if checkpoint is None:
+            raise ValueError(f"No tick loop checkpoint found in {path}")
+        return checkpoint
+    return TickLoopCheckpointV1.from_json(path.read_text(encoding="utf-8"))
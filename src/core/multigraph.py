@@ -4,6 +4,7 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
+from time import perf_counter_ns
 from typing import (
     Callable,
     Dict,
@@ -17,6 +18,7 @@ from typing import (
 
 from core.slp import SLPEventV1, apply_slp_events
 from loom.run_context import LoomRunContext
+from ops import StageProfiler
 from umx.profile_cmp0 import ProfileCMP0V1
 from umx.run_context import UMXRunContext
 from umx.topology_profile import TopologyProfileV1, load_topology_profile
@@ -142,7 +144,11 @@ class TopologyRegistry:
 
 
 class MultiGraphRunContext:
-    """Coordinate multiple UMX/Loom contexts under a shared session tick."""
+    """Coordinate multiple UMX/Loom contexts under a shared session tick.
+
+    An optional ``profiler`` times SLP application and each graph's UMX and
+    Loom stages in :meth:`step_all`, summed over graphs per session tick.
+    """
 
     def __init__(
         self,
@@ -150,6 +156,7 @@ class MultiGraphRunContext:
         registry: TopologyRegistry,
         *,
         schedule_hook: Optional[Callable[[str, int], bool]] = None,
+        profiler: Optional[StageProfiler] = None,
     ) -> None:
         self.config = config
         self.registry = registry
@@ -162,6 +169,7 @@ class MultiGraphRunContext:
         self._slp_queue: MutableMapping[int, List[SLPEventV1]] = {}
         self._last_tick_results: Dict[str, TickResult] = {}
         self._schedule_hook = schedule_hook or (lambda _gid, _tick: True)
+        self.profiler = profiler
         self._init_contexts()
 
     def _init_contexts(self) -> None:
@@ -213,17 +221,30 @@ class MultiGraphRunContext:
         self, *, skip_gids: Optional[Sequence[str]] = None
     ) -> Dict[str, Tuple[UMXRunContext, LoomRunContext]]:
         next_tick = self.tick + 1
+        profiler = self.profiler
+        if profiler is not None:
+            started = perf_counter_ns()
         self._apply_pending_events(next_tick)
+        if profiler is not None:
+            profiler.record("slp", next_tick, perf_counter_ns() - started)
         results: Dict[str, Tuple[UMXRunContext, LoomRunContext]] = {}
         skip = set(skip_gids or [])
         self._last_tick_results = {}
         for gid, umx_ctx in self.umx.items():
             if gid in skip or not self._schedule_hook(gid, next_tick):
                 continue
+            if profiler is not None:
+                started = perf_counter_ns()
             ledger = umx_ctx.step()
+            if profiler is not None:
+                profiler.record("umx", next_tick, perf_counter_ns() - started)
             loom_ctx = self.loom[gid]
             chain_before = loom_ctx.C_t
+            if profiler is not None:
+                started = perf_counter_ns()
             p_block, maybe_i_block = loom_ctx.ingest_tick(ledger)
+            if profiler is not None:
+                profiler.record("loom", next_tick, perf_counter_ns() - started)
             self._last_tick_results[gid] = TickResult(
                 umx_ctx=umx_ctx,
                 loom_ctx=loom_ctx,
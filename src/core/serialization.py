@@ -6,7 +6,7 @@ so they can be serialised deterministically for regression testing.
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Mapping, TYPE_CHECKING
+from typing import Any, Dict, List, Mapping, Sequence, TYPE_CHECKING
 
 from core.tick_loop import GF01RunResult
 from gate.gate import NAPEnvelopeV1, SceneFrameV1, SessionRunResult
@@ -38,6 +38,13 @@ def _serialize_edge_flux(edge: EdgeFluxV1) -> Dict[str, int]:
     }
 
 
+def _serialize_edge_fluxes(edges: Sequence[EdgeFluxV1]) -> List[Dict[str, int]]:
+    to_rows = getattr(edges, "to_rows", None)
+    if to_rows is not None:
+        return to_rows()
+    return [_serialize_edge_flux(edge) for edge in edges]
+
+
 def serialize_umx_tick_ledger(ledger: UMXTickLedgerV1) -> Dict[str, object]:
     return {
         "tick": ledger.tick,
@@ -45,7 +52,7 @@ def serialize_umx_tick_ledger(ledger: UMXTickLedgerV1) -> Dict[str, object]:
         "sum_post_u": ledger.sum_post_u,
         "z_check": ledger.z_check,
         "pre_u": list(ledger.pre_u),
-        "edges": [_serialize_edge_flux(edge) for edge in ledger.edges],
+        "edges": _serialize_edge_fluxes(ledger.edges),
         "post_u": list(ledger.post_u),
     }
 
@@ -292,6 +299,11 @@ def serialize_gf01_run(result: GF01RunResult) -> Dict[str, object]:
         "u_ledger_entries": [serialize_uledger_entry(entry) for entry in result.u_ledger_entries],
     }
 
+    if getattr(result, "artifact_profile", "full") != "full":
+        payload["artifact_profile"] = result.artifact_profile
+        payload["final_state"] = list(result.final_state)
+        payload["final_chain"] = result.final_chain
+
     if result.codex_motifs:
         payload["codex_motifs"] = [
             _serialize_codex_library_entry(entry) for entry in result.codex_motifs
@@ -5,7 +5,7 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import Dict, List, Mapping, Sequence
 
-from umx.topology_profile import EdgeProfileV1, NodeProfileV1, TopologyProfileV1
+from umx.topology_profile import EdgeColumnsV1, EdgeProfileV1, NodeProfileV1, TopologyProfileV1
 
 
 class SLPEventType(str, Enum):
@@ -89,7 +89,8 @@ def apply_slp_events(
         profile=topo.profile,
         N=len(nodes),
         nodes=nodes,
-        edges=edges,
+        # Keep array-backed topologies compact across SLP growth.
+        edges=EdgeColumnsV1.from_edges(edges) if isinstance(topo.edges, EdgeColumnsV1) else edges,
         SC=topo.SC,
         meta=meta,
     )
@@ -1,35 +1,67 @@
 """Tick loop orchestration for CMP-0 runs backed by SceneFrame_v1."""
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Dict, Iterable, List, Mapping, Optional, Sequence, TYPE_CHECKING
+import os
+import queue
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
+from functools import partial
+from pathlib import Path
+from time import perf_counter_ns
+from typing import (
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    TYPE_CHECKING,
+    Union,
+)
+
+from core.checkpoint import (
+    TickLoopCheckpointConfig,
+    TickLoopCheckpointV1,
+    decode_tick_loop_artifact,
+    encode_tick_loop_artifact,
+    load_tick_loop_checkpoint,
+    open_tick_loop_artifact_log,
+    read_tick_loop_artifact_log,
+    write_tick_loop_artifact,
+    write_tick_loop_checkpoint,
+)
 
 from gate import (
+    ArtifactProfileV1,
+    GateGovernanceFilter,
     NAPEnvelopeV1,
     PFNAInputV0,
     PFNAIngressQueue,
+    PFNAJsonlStreamV0,
     PFNATransformV1,
     PressStreamSpecV1,
     SceneFrameV1,
-    apply_governance_to_envelopes,
     _default_press_stream_specs,
     _pfna_payload_ref,
     build_scene_and_envelope,
+    build_scene_frame,
+    resolve_artifact_profile,
 )
 from governance import BudgetUsage, GovernedActionQueue, GovernanceConfigV1, governed_decision_loop
-from ops import StructuredLogger
+from ops import StageProfiler, StructuredLogger
 from loom.loom import LoomIBlockV1, LoomPBlockV1
-from loom.chain import LoomBlockStore, LoomChainRecorder
+from loom.chain import BackgroundChainRecorder, LoomBlockStore, LoomChainRecorder
 from loom.run_context import LoomRunContext
 from press import APXManifestV1, APXiDescriptorV1, APXiViewV1, PressWindowContextV1
-from uledger import (
-    ULedgerCheckpointV1,
-    ULedgerEntryV1,
-    build_and_validate_uledger,
-)
+from uledger import ULedgerChainBuilder, ULedgerCheckpointV1, ULedgerEntryV1, hash_record
 from umx.profile_cmp0 import ProfileCMP0V1, gf01_profile_cmp0
 from umx.run_context import UMXRunContext
-from umx.tick_ledger import UMXTickLedgerV1
+from umx.tick_ledger import UMXTickLedgerV1, edge_flux_column
 from umx.topology_profile import TopologyProfileV1, gf01_topology_profile
 
 if TYPE_CHECKING:  # pragma: no cover - import guard for typing only
@@ -62,6 +94,9 @@ class GF01RunResult:
     codex_actions: tuple["CodexProposalV1", ...] = ()
     codex_hypothetical_actions: tuple["CodexProposalV1", ...] = ()
     codex_hypothetical_actions: tuple["CodexProposalV1", ...] = ()
+    artifact_profile: str = "full"
+    final_state: tuple[int, ...] = ()
+    final_chain: int = 0
 
 
 @dataclass(frozen=True)
@@ -151,13 +186,7 @@ def _group_pfna_inputs(
     as_mapping: bool = True,
 ) -> Dict[int, List[PFNAInputV0]] | Tuple[PFNAInputV0, ...]:
     grouped: Dict[int, List[PFNAInputV0]] = {}
-    for pfna in pfna_inputs:
-        if pfna.gid != gid:
-            raise ValueError("PFNA gid must match the topology gid")
-        if pfna.run_id != run_id:
-            raise ValueError("PFNA run_id must match the run")
-        if len(pfna.values) != topo.N:
-            raise ValueError("PFNA values length must match topology N")
+    for pfna in _checked_pfna_inputs(pfna_inputs, topo=topo, gid=gid, run_id=run_id):
         grouped.setdefault(pfna.tick, []).append(pfna)
 
     if as_mapping:
@@ -169,6 +198,19 @@ def _group_pfna_inputs(
     return tuple(flattened)
 
 
+def _checked_pfna_inputs(
+    pfna_inputs: Iterable[PFNAInputV0], *, topo: TopologyProfileV1, gid: str, run_id: str
+) -> Iterator[PFNAInputV0]:
+    for pfna in pfna_inputs:
+        if pfna.gid != gid:
+            raise ValueError("PFNA gid must match the topology gid")
+        if pfna.run_id != run_id:
+            raise ValueError("PFNA run_id must match the run")
+        if len(pfna.values) != topo.N:
+            raise ValueError("PFNA values length must match topology N")
+        yield pfna
+
+
 def _apply_pfna_initial_state(base_state: Sequence[int], pfna_inputs: Iterable[PFNAInputV0]) -> List[int]:
     """Apply tick-0 PFNA vectors to the initial state deterministically."""
 
@@ -178,6 +220,326 @@ def _apply_pfna_initial_state(base_state: Sequence[int], pfna_inputs: Iterable[P
     return adjusted
 
 
+@dataclass(frozen=True)
+class TickLoopPipelineConfig:
+    """Pipelined execution settings for :func:`iter_cmp0_tick_loop`.
+
+    ``depth`` bounds how many simulated ticks may wait for the downstream
+    stages, and how many scene/U-ledger jobs may be in flight. ``workers``
+    sizes the thread pool that builds scenes and NAP envelopes and hashes
+    U-ledger inputs (default: the CPU count).
+    """
+
+    depth: int = 64
+    workers: int | None = None
+
+    def __post_init__(self) -> None:
+        if self.depth <= 0:
+            raise ValueError("depth must be a positive integer")
+        if self.workers is not None and self.workers <= 0:
+            raise ValueError("workers must be a positive integer when provided")
+
+
+@dataclass(frozen=True)
+class _SimulatedTick:
+    ledger: UMXTickLedgerV1
+    p_block: LoomPBlockV1
+    i_block: LoomIBlockV1 | None
+    prev_chain: int
+    pfna_refs: List[str]
+    pfna_meta: List[Mapping[str, object]]
+    ingress_envelope: NAPEnvelopeV1 | None = None
+    recorder_state: Mapping[str, object] | None = None
+
+
+def _pending_tick_to_dict(record: _SimulatedTick) -> Dict[str, object]:
+    """Encode a tick still waiting for the primary manifest for a checkpoint."""
+
+    return {
+        "ledger": encode_tick_loop_artifact("ledger", record.ledger),
+        "p_block": encode_tick_loop_artifact("p_block", record.p_block),
+        "prev_chain": record.prev_chain,
+        "pfna_refs": list(record.pfna_refs),
+        "pfna_meta": [dict(meta) for meta in record.pfna_meta],
+    }
+
+
+def _pending_tick_from_dict(data: Mapping[str, object]) -> _SimulatedTick:
+    return _SimulatedTick(
+        ledger=decode_tick_loop_artifact("ledger", data["ledger"]),
+        p_block=decode_tick_loop_artifact("p_block", data["p_block"]),
+        i_block=None,
+        prev_chain=int(data["prev_chain"]),
+        pfna_refs=list(data["pfna_refs"]),
+        pfna_meta=list(data["pfna_meta"]),
+    )
+
+
+def _stage_job(
+    profiler: StageProfiler | None, stage: str, tick: int, fn: Callable
+) -> Callable:
+    """Return ``fn`` timed under ``stage`` when profiling, otherwise ``fn`` itself."""
+
+    if profiler is None:
+        return fn
+    return partial(profiler.call, stage, tick, fn)
+
+
+def _press_tick(
+    contexts: Dict[str, PressWindowContextV1],
+    specs: Dict[str, TickLoopWindowSpec],
+    *,
+    ledger: UMXTickLedgerV1,
+    p_block: LoomPBlockV1,
+    prev_chain: int,
+) -> None:
+    _append_press_values(
+        contexts,
+        specs,
+        tick=ledger.tick,
+        deltas=tuple(post - pre for post, pre in zip(ledger.post_u, ledger.pre_u)),
+        fluxes=tuple(edge_flux_column(ledger.edges, "f_e")),
+        ledger=ledger,
+        p_block=p_block,
+        prev_chain=prev_chain,
+    )
+
+
+def _press_buffers(
+    contexts: Dict[str, PressWindowContextV1],
+) -> Dict[str, Dict[str, List[object]]]:
+    return {window_id: ctx.buffered_values() for window_id, ctx in contexts.items()}
+
+
+def _close_window(
+    ctx: PressWindowContextV1, apx_name: str
+) -> tuple[APXManifestV1, APXiViewV1 | None]:
+    manifest = ctx.close_window(apx_name)
+    return manifest, ctx.get_apxi_view()
+
+
+def _build_scene_job(
+    record: _SimulatedTick,
+    *,
+    gid: str,
+    run_id: str,
+    nid: str,
+    window_id: str,
+    manifest: APXManifestV1,
+    profile: ProfileCMP0V1,
+    artifacts: ArtifactProfileV1,
+    profiler: StageProfiler | None = None,
+) -> tuple[SceneFrameV1 | None, NAPEnvelopeV1 | None, tuple[str, str, str] | None]:
+    """Build one tick's scene and envelope plus the hashes its U-ledger entry needs.
+
+    Only what ``artifacts`` asks for is built; the scene is always needed
+    for the envelope but is only returned when scenes are requested.
+    """
+
+    ledger = record.ledger
+    if profiler is not None:
+        started = perf_counter_ns()
+    scene_kwargs = dict(
+        gid=gid,
+        run_id=run_id,
+        nid=nid,
+        window_id=window_id,
+        ledger=ledger,
+        manifest_check=manifest.manifest_check,
+        p_block_ref=f"loom_p_block_{ledger.tick}",
+        manifest_ref=manifest.apx_name,
+        pfna_refs=record.pfna_refs,
+    )
+    if not artifacts.envelopes:
+        scene = build_scene_frame(C_prev=record.prev_chain, C_t=record.p_block.C_t, **scene_kwargs)
+        if profiler is not None:
+            profiler.record("scenes", ledger.tick, perf_counter_ns() - started)
+        return scene, None, None
+
+    scene, envelope = build_scene_and_envelope(
+        p_block=record.p_block,
+        C_prev=record.prev_chain,
+        profile=profile,
+        meta={"pfna_integerization": record.pfna_meta},
+        **scene_kwargs,
+    )
+    if profiler is not None:
+        profiler.record("scenes", ledger.tick, perf_counter_ns() - started)
+    hashes = None
+    if artifacts.u_ledger:
+        hashes = _stage_job(profiler, "uledger", ledger.tick, _u_ledger_hashes)(
+            ledger, record.p_block, envelope
+        )
+    return scene if artifacts.scenes else None, envelope, hashes
+
+
+def _u_ledger_hashes(
+    ledger: UMXTickLedgerV1, p_block: LoomPBlockV1, envelope: NAPEnvelopeV1
+) -> tuple[str, str, str]:
+    return hash_record(ledger), hash_record(p_block), hash_record(envelope)
+
+
+class _InlineExecutor:
+    """Executor stand-in that runs each job as it is submitted."""
+
+    def submit(self, fn, /, *args, **kwargs) -> Future:
+        future: Future = Future()
+        try:
+            future.set_result(fn(*args, **kwargs))
+        except Exception as exc:
+            future.set_exception(exc)
+        return future
+
+    def shutdown(self, wait: bool = True, *, cancel_futures: bool = False) -> None:
+        return None
+
+
+_PREFETCH_DONE = object()
+
+
+def _prefetch(items: Iterator, depth: int, stop: threading.Event) -> Iterator:
+    """Run ``items`` on a producer thread, buffering at most ``depth`` results."""
+
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+
+    def put(entry) -> bool:
+        while not stop.is_set():
+            try:
+                buffer.put(entry, timeout=0.05)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        try:
+            for item in items:
+                if not put((item, None)):
+                    return
+        except Exception as exc:
+            put((_PREFETCH_DONE, exc))
+        else:
+            put((_PREFETCH_DONE, None))
+
+    producer = threading.Thread(target=produce, name="tick-loop-simulation", daemon=True)
+    producer.start()
+    try:
+        while True:
+            item, error = buffer.get()
+            if item is _PREFETCH_DONE:
+                if error is not None:
+                    raise error
+                return
+            yield item
+    finally:
+        stop.set()
+        producer.join()
+
+
+class _TickLoopLanes:
+    """Executors for the stages of one tick loop run.
+
+    Without a pipeline config every stage runs inline on the calling thread,
+    in tick order. With one, UMX/Loom simulation runs on a producer thread
+    feeding a bounded queue, Loom chain hashing on its own thread, Press
+    accumulation on a single ordered lane, and scene/envelope building plus
+    U-ledger hashing on a worker pool. Results are always consumed in tick
+    order, so the artefacts are identical either way.
+    """
+
+    def __init__(self, pipeline: TickLoopPipelineConfig | None) -> None:
+        self.pipeline = pipeline
+        self._stop = threading.Event()
+        self._ticks: Iterator[_SimulatedTick] | None = None
+        self._recorder: BackgroundChainRecorder | None = None
+        if pipeline is None:
+            self.in_flight = 0
+            self.press = self.scenes = _InlineExecutor()
+        else:
+            self.in_flight = pipeline.depth
+            self.press = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tick-loop-press")
+            self.scenes = ThreadPoolExecutor(
+                max_workers=pipeline.workers or os.cpu_count() or 1,
+                thread_name_prefix="tick-loop-scene",
+            )
+
+    def recorder(self, store: LoomBlockStore | None) -> LoomChainRecorder:
+        if self.pipeline is None:
+            return LoomChainRecorder(store=store)
+        self._recorder = BackgroundChainRecorder(store=store)
+        return self._recorder
+
+    def ticks(self, simulated: Iterator[_SimulatedTick]) -> Iterator[_SimulatedTick]:
+        if self.pipeline is None:
+            return simulated
+        self._ticks = _prefetch(simulated, self.pipeline.depth, self._stop)
+        return self._ticks
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._ticks is not None:
+            self._ticks.close()
+        self.scenes.shutdown(wait=True, cancel_futures=True)
+        self.press.shutdown(wait=True)
+        if self._recorder is not None:
+            self._recorder.close()
+
+
+TICK_LOOP_ARTIFACT_KINDS = (
+    "ingress_envelope",
+    "ledger",
+    "p_block",
+    "i_block",
+    "manifest",
+    "apxi_view",
+    "scene",
+    "envelope",
+    "governance_envelope",
+    "u_ledger_entry",
+    "egress_envelope",
+    "summary",
+)
+
+
+@dataclass(frozen=True)
+class TickLoopArtifactV1:
+    """One artefact yielded by :func:`iter_cmp0_tick_loop`.
+
+    ``kind`` is one of :data:`TICK_LOOP_ARTIFACT_KINDS`; ``tick`` is set for
+    tick-scoped artefacts and ``window_id`` for window manifests/APXi views.
+    """
+
+    kind: str
+    value: object
+    tick: int | None = None
+    window_id: str | None = None
+
+    def __post_init__(self) -> None:
+        if self.kind not in TICK_LOOP_ARTIFACT_KINDS:
+            raise ValueError(f"kind must be one of {TICK_LOOP_ARTIFACT_KINDS}")
+
+
+@dataclass(frozen=True)
+class TickLoopSummaryV1:
+    """End-of-run outputs of a streamed tick loop (the final ``summary`` artefact)."""
+
+    run_id: str
+    profile: ProfileCMP0V1
+    topo: TopologyProfileV1
+    manifests: Dict[str, APXManifestV1]
+    apxi_views: Dict[str, APXiViewV1]
+    governance: GovernanceConfigV1 | None = None
+    governance_budget_usage: BudgetUsage | None = None
+    u_ledger_checkpoint: ULedgerCheckpointV1 | None = None
+    codex_motifs: tuple["CodexLibraryEntryV1", ...] = ()
+    codex_proposals: tuple["CodexProposalV1", ...] = ()
+    codex_actions: tuple["CodexProposalV1", ...] = ()
+    codex_hypothetical_actions: tuple["CodexProposalV1", ...] = ()
+    artifact_profile: str = "full"
+    final_state: tuple[int, ...] = ()
+    final_chain: int = 0
+
+
 def run_cmp0_tick_loop(
     *,
     topo: TopologyProfileV1,
@@ -196,9 +558,263 @@ def run_cmp0_tick_loop(
     codex_ctx: "CodexContext" | None = None,
     codex_proposals: Sequence["CodexProposalV1"] | None = None,
     loom_block_store: LoomBlockStore | None = None,
+    pipeline: TickLoopPipelineConfig | None = None,
+    artifact_profile: ArtifactProfileV1 | str | None = None,
+    checkpoints: TickLoopCheckpointConfig | None = None,
+    resume_from: Union[TickLoopCheckpointV1, str, Path, None] = None,
+    profiler: StageProfiler | None = None,
 ) -> GF01RunResult:
-    """Execute a CMP-0 tick loop and assemble SceneFrame-driven artefacts."""
+    """Execute a CMP-0 tick loop and assemble SceneFrame-driven artefacts.
+
+    This collects everything :func:`iter_cmp0_tick_loop` yields into a
+    :class:`GF01RunResult`; ``pipeline`` enables pipelined execution,
+    ``artifact_profile`` selects which artefacts are built and
+    ``checkpoints``/``resume_from`` write and resume checkpoints, and
+    ``profiler`` collects per-stage timings. A resumed
+    result equals the uninterrupted one: checkpointed runs keep an artefact
+    log next to the checkpoints (see :class:`TickLoopCheckpointConfig`) and
+    a resumed run rebuilds the artefacts collected before the checkpoint
+    from it.
+    """
+
+    specs = list(window_specs)
+    collected: Dict[str, List[object]] = {kind: [] for kind in TICK_LOOP_ARTIFACT_KINDS}
+    if checkpoints is not None:
+        checkpoints = replace(checkpoints, artifact_log=True)
+    if resume_from is not None:
+        resume_from = load_tick_loop_checkpoint(resume_from)
+        for entry in read_tick_loop_artifact_log(resume_from):
+            collected[entry["kind"]].append(entry["value"])
+    for artifact in iter_cmp0_tick_loop(
+        topo=topo,
+        profile=profile,
+        initial_state=initial_state,
+        total_ticks=total_ticks,
+        window_specs=specs,
+        primary_window_id=primary_window_id,
+        run_id=run_id,
+        nid=nid,
+        pfna_inputs=pfna_inputs,
+        pfna_transform=pfna_transform,
+        press_default_streams=press_default_streams,
+        logger=logger,
+        governance=governance,
+        codex_ctx=codex_ctx,
+        codex_proposals=codex_proposals,
+        loom_block_store=loom_block_store,
+        pipeline=pipeline,
+        artifact_profile=artifact_profile,
+        checkpoints=checkpoints,
+        resume_from=resume_from,
+        profiler=profiler,
+    ):
+        collected[artifact.kind].append(artifact.value)
+    summary: TickLoopSummaryV1 = collected["summary"][0]  # type: ignore[assignment]
+
+    return GF01RunResult(
+        run_id=run_id,
+        profile=profile,
+        topo=topo,
+        ledgers=collected["ledger"],  # type: ignore[arg-type]
+        p_blocks=collected["p_block"],  # type: ignore[arg-type]
+        i_blocks=collected["i_block"],  # type: ignore[arg-type]
+        manifests=summary.manifests,
+        scenes=collected["scene"],  # type: ignore[arg-type]
+        envelopes=collected["envelope"],  # type: ignore[arg-type]
+        ingress_envelopes=collected["ingress_envelope"],  # type: ignore[arg-type]
+        egress_envelopes=collected["egress_envelope"],  # type: ignore[arg-type]
+        governance_envelopes=collected["governance_envelope"],  # type: ignore[arg-type]
+        u_ledger_entries=collected["u_ledger_entry"],  # type: ignore[arg-type]
+        u_ledger_checkpoint=summary.u_ledger_checkpoint,
+        apxi_views=summary.apxi_views,
+        governance=summary.governance,
+        governance_budget_usage=summary.governance_budget_usage,
+        codex_motifs=summary.codex_motifs,
+        codex_proposals=summary.codex_proposals,
+        codex_actions=summary.codex_actions,
+        codex_hypothetical_actions=summary.codex_hypothetical_actions,
+        artifact_profile=summary.artifact_profile,
+        final_state=summary.final_state,
+        final_chain=summary.final_chain,
+    )
+
+
+def iter_cmp0_tick_loop(
+    *,
+    topo: TopologyProfileV1,
+    profile: ProfileCMP0V1,
+    initial_state: Sequence[int],
+    total_ticks: int,
+    window_specs: Iterable[TickLoopWindowSpec],
+    primary_window_id: str,
+    run_id: str,
+    nid: str,
+    pfna_inputs: Optional[Iterable[PFNAInputV0]] = None,
+    pfna_transform: PFNATransformV1 | None = None,
+    press_default_streams: Optional[Iterable[PressStreamSpecV1]] = None,
+    logger: Optional[StructuredLogger] = None,
+    governance: GovernanceConfigV1 | None = None,
+    codex_ctx: "CodexContext" | None = None,
+    codex_proposals: Sequence["CodexProposalV1"] | None = None,
+    loom_block_store: LoomBlockStore | None = None,
+    pipeline: TickLoopPipelineConfig | None = None,
+    artifact_profile: ArtifactProfileV1 | str | None = None,
+    checkpoints: TickLoopCheckpointConfig | None = None,
+    resume_from: Union[TickLoopCheckpointV1, str, Path, None] = None,
+    profiler: StageProfiler | None = None,
+) -> Iterator[TickLoopArtifactV1]:
+    """Run a CMP-0 tick loop, yielding artefacts as soon as they are final.
+
+    Takes the same arguments as :func:`run_cmp0_tick_loop` and produces the
+    same artefacts, in :class:`TickLoopArtifactV1` wrappers, ending with one
+    ``summary`` (:class:`TickLoopSummaryV1`). Ledgers, P-/I-blocks and ingress
+    envelopes are yielded every tick. Press windows close as soon as their
+    ``end_tick`` passes. Scenes and NAP envelopes carry the primary window's
+    ``manifest_check``, so they (and the governance decisions and U-ledger
+    entries that follow from them) are yielded once the primary window has
+    closed, and immediately for every later tick.
 
+    Nothing is retained after it has been folded into its window, the
+    U-ledger chain and Codex statistics, so memory is bounded by the widest
+    open window rather than the run length. The exception is a run whose
+    Codex context emits its own proposals: the governance budget stamped on
+    every U-ledger entry is only known once the run ends, so the per-tick
+    artefact hashes are kept until then. PFNA inputs given as a
+    :class:`gate.PFNAJsonlStreamV0` are read lazily, one tick at a time.
+
+    With a :class:`TickLoopPipelineConfig` the run is pipelined: simulation
+    runs ahead on its own thread through a bounded queue while Loom chain
+    hashing, Press accumulation, scene/envelope building and U-ledger
+    hashing run on worker threads. Every artefact is identical to the serial
+    run and each kind is yielded in the same order, but scenes, envelopes and
+    U-ledger entries may trail the per-tick artefacts by up to ``depth``
+    ticks.
+
+    ``artifact_profile`` (an :class:`ArtifactProfileV1` or the name of a
+    built-in profile, default ``"full"``) selects which artefacts are built;
+    kinds it switches off are never yielded. Codex ingest is skipped when the
+    profile excludes Codex, even if ``codex_ctx`` is given.
+
+    ``checkpoints`` writes a :class:`TickLoopCheckpointV1` every
+    ``checkpoints.every`` ticks (see :class:`TickLoopCheckpointConfig`).
+    ``resume_from`` (a checkpoint, a checkpoint file or a checkpoint
+    directory, meaning its newest file) restarts a run after the
+    checkpoint's tick. Call it with the same arguments as the original run,
+    including a fresh ``codex_ctx`` if there was one and the same block
+    store, which is cut back to the checkpoint. The resumed run yields
+    exactly the artefacts that followed the first
+    ``checkpoint.artifact_count`` ones. With ``checkpoints.artifact_log``
+    the yielded artefacts are also logged for resumed collection; a resumed
+    run cuts the log back to the checkpoint before appending.
+
+    A write-behind ``loom_block_store`` (see :class:`loom.chain.LoomWriteBehindConfig`)
+    is flushed before each checkpoint and once the run completes, and asked
+    to commit when a Press window closes if its policy says so. Otherwise
+    the loop never waits on block persistence.
+
+    ``profiler`` (an :class:`ops.StageProfiler`) times every pillar stage
+    per tick: PFNA ingress, UMX flux, Loom ingest, Press buffering and
+    window closes, Codex ingest, scene/envelope building, governance
+    filtering and U-ledger hashing. The totals are logged as a
+    ``stage_profile`` event at the end of the run. In pipelined runs the
+    stages are timed on the threads they run on and background Loom chain
+    recording is not included.
+    """
+
+    resume = load_tick_loop_checkpoint(resume_from) if resume_from is not None else None
+    emitted = resume.artifact_count if resume else 0
+    log = None
+    if checkpoints is not None and checkpoints.artifact_log:
+        log = open_tick_loop_artifact_log(checkpoints.directory, resume)
+    lanes = _TickLoopLanes(pipeline)
+    try:
+        for item in _iter_tick_loop(
+            lanes=lanes,
+            topo=topo,
+            profile=profile,
+            initial_state=initial_state,
+            total_ticks=total_ticks,
+            window_specs=window_specs,
+            primary_window_id=primary_window_id,
+            run_id=run_id,
+            nid=nid,
+            pfna_inputs=pfna_inputs,
+            pfna_transform=pfna_transform,
+            press_default_streams=press_default_streams,
+            logger=logger,
+            governance=governance,
+            codex_ctx=codex_ctx,
+            codex_proposals=codex_proposals,
+            loom_block_store=loom_block_store,
+            artifacts=resolve_artifact_profile(artifact_profile),
+            checkpoint_every=checkpoints.every if checkpoints else None,
+            resume=resume,
+            profiler=profiler,
+        ):
+            if isinstance(item, TickLoopCheckpointV1):
+                if loom_block_store is not None:
+                    loom_block_store.flush()
+                item = replace(item, artifact_count=emitted)
+                if log is not None:
+                    log.flush()
+                    os.fsync(log.fileno())
+                    item = replace(
+                        item,
+                        artifact_log=str(Path(log.name).resolve()),
+                        artifact_log_size=log.tell(),
+                    )
+                write_tick_loop_checkpoint(item, checkpoints.directory, keep=checkpoints.keep)
+                continue
+            emitted += 1
+            if log is not None and item.kind != "summary":
+                write_tick_loop_artifact(
+                    log, item.kind, item.value, tick=item.tick, window_id=item.window_id
+                )
+            yield item
+    finally:
+        lanes.close()
+        if log is not None:
+            log.close()
+    if loom_block_store is not None:
+        loom_block_store.flush()
+
+
+def _iter_tick_loop(
+    *,
+    lanes: _TickLoopLanes,
+    topo: TopologyProfileV1,
+    profile: ProfileCMP0V1,
+    initial_state: Sequence[int],
+    total_ticks: int,
+    window_specs: Iterable[TickLoopWindowSpec],
+    primary_window_id: str,
+    run_id: str,
+    nid: str,
+    pfna_inputs: Optional[Iterable[PFNAInputV0]] = None,
+    pfna_transform: PFNATransformV1 | None = None,
+    press_default_streams: Optional[Iterable[PressStreamSpecV1]] = None,
+    logger: Optional[StructuredLogger] = None,
+    governance: GovernanceConfigV1 | None = None,
+    codex_ctx: "CodexContext" | None = None,
+    codex_proposals: Sequence["CodexProposalV1"] | None = None,
+    loom_block_store: LoomBlockStore | None = None,
+    artifacts: ArtifactProfileV1,
+    checkpoint_every: int | None = None,
+    resume: TickLoopCheckpointV1 | None = None,
+    profiler: StageProfiler | None = None,
+) -> Iterator[TickLoopArtifactV1 | TickLoopCheckpointV1]:
+    if not artifacts.codex:
+        codex_ctx = None
+    if resume is not None:
+        if (resume.run_id, resume.gid, resume.total_ticks, resume.artifact_profile) != (
+            run_id,
+            topo.gid,
+            total_ticks,
+            artifacts.name,
+        ):
+            raise ValueError("resume_from checkpoint was written by a different run")
+        if (codex_ctx is None) != (resume.codex is None):
+            raise ValueError("resume_from checkpoint and codex_ctx must both carry Codex state")
     specs = {spec.window_id: spec for spec in window_specs}
     if primary_window_id not in specs:
         raise ValueError("primary_window_id must match one of the provided window specs")
@@ -227,6 +843,7 @@ def run_cmp0_tick_loop(
         )
         for spec in resolved_specs.values()
     }
+    primary_spec = resolved_specs[primary_window_id]
 
     if logger and logger.enabled:
         logger.log(
@@ -242,7 +859,11 @@ def run_cmp0_tick_loop(
 
     effective_initial_state: List[int] = list(initial_state)
     ingress_queue = PFNAIngressQueue(transform=pfna_transform)
-    if pfna_inputs:
+    if isinstance(pfna_inputs, PFNAJsonlStreamV0):
+        ingress_queue.attach(
+            _checked_pfna_inputs(pfna_inputs, topo=topo, gid=topo.gid, run_id=run_id)
+        )
+    elif pfna_inputs:
         ingress_queue.extend(
             _group_pfna_inputs(
                 pfna_inputs, topo=topo, gid=topo.gid, run_id=run_id, as_mapping=False
@@ -255,62 +876,164 @@ def run_cmp0_tick_loop(
             initial_state, [event.as_pfna_input for event in initial_pfna_events]
         )
 
-    ctx = UMXRunContext(topo=topo, profile=profile, gid=topo.gid, run_id=run_id)
-    ctx.init_state(effective_initial_state)
+    ctx = UMXRunContext(topo=topo, profile=profile, gid=topo.gid, run_id=run_id, columnar=True)
+    if resume is None:
+        ctx.init_state(effective_initial_state)
+    else:
+        if ingress_queue.discard_through(resume.tick) != resume.ingress_cursor:
+            raise ValueError("resume_from checkpoint does not match the PFNA inputs")
+        ctx.init_state(list(resume.umx_state))
+        ctx.tick = resume.tick
+        if loom_block_store is not None:
+            loom_block_store.truncate_after(resume.tick)
     loom_ctx = LoomRunContext(
         profile=profile,
         topo=topo,
         umx_ctx=ctx,
-        recorder=LoomChainRecorder(store=loom_block_store)
-        if loom_block_store
-        else LoomChainRecorder(),
+        recorder=lanes.recorder(loom_block_store),
+        history_limit=1,
     )
+    if resume is not None:
+        loom_ctx.C_t = resume.chain
+        loom_ctx.recorder.restore(resume.loom_recorder)
+        if codex_ctx:
+            codex_ctx.restore_streamed_ingest(resume.codex)
 
-    ledgers: List[UMXTickLedgerV1] = []
-    p_blocks: List[LoomPBlockV1] = []
-    i_blocks: List[LoomIBlockV1] = []
-    tick_cache: List[
-        tuple[UMXTickLedgerV1, LoomPBlockV1, int, List[str], List[Mapping[str, object]]]
-    ] = []
-    ingress_envelopes: List[NAPEnvelopeV1] = []
-    egress_envelopes: List[NAPEnvelopeV1] = []
-
-    for _ in range(total_ticks):
-        next_tick = ctx.tick + 1
-        pfna_refs_for_tick: List[str] = []
-        pfna_batch: List[PFNAInputV0] = []
-        pfna_audit_for_tick: List[Mapping[str, object]] = []
-        pfna_events = ingress_queue.pop_ready(next_tick)
-        pfna_meta_for_tick: List[Mapping[str, object]] = []
-        if pfna_events:
-            pfna_deltas = [0 for _ in range(topo.N)]
-            for event in pfna_events:
-                pfna_refs_for_tick.append(event.pfna.pfna_id)
-                pfna_batch.append(event.as_pfna_input)
-                pfna_audit_for_tick.append(
-                    {
-                        "pfna_id": event.pfna.pfna_id,
-                        "audit": event.audit,
-                        "values": event.integerized,
-                    }
-                )
-                pfna_deltas = [acc + int(delta) for acc, delta in zip(pfna_deltas, event.integerized)]
-            pfna_meta_for_tick = pfna_audit_for_tick or [
-                {"pfna_id": pfna.pfna_id, "values": pfna.values, "audit": ()}
-                for pfna in pfna_batch
-            ]
-            ctx.apply_external_inputs(pfna_deltas)
-
-        if pfna_refs_for_tick and not pfna_meta_for_tick:
-            pfna_meta_for_tick = [
-                {"pfna_id": ref, "values": tuple(), "audit": ()}
-                for ref in pfna_refs_for_tick
-            ]
-
-        prev_chain = loom_ctx.current_chain_value()
-        if pfna_batch:
-            ingress_envelopes.append(
-                NAPEnvelopeV1(
+    # Gate filtering follows the caller's governance config; the decision loop
+    # below may substitute a default config when proposals exist.
+    gate_governance = governance
+    governance_active = governance is not None and governance.codex_action_mode != "OFF"
+    gate_filter = GateGovernanceFilter(
+        governance=gate_governance,
+        window_id=primary_spec.window_id,
+        profile=profile,
+        # Data envelopes use seq == tick, so GOV decisions are numbered after the last tick.
+        seq_offset=total_ticks + 1,
+        logger=logger,
+    )
+
+    decision: GovernedActionQueue | None = None
+    proposals_known = codex_ctx is None or codex_proposals is not None
+
+    def decide(proposals_source: Sequence["CodexProposalV1"] | None) -> None:
+        nonlocal decision, governance
+        if proposals_source:
+            if governance is None:
+                governance = GovernanceConfigV1()
+            decision = governed_decision_loop(
+                proposals=tuple(proposals_source),
+                config=governance,
+                window_id=primary_spec.window_id,
+                evaluated_at_tick=total_ticks,
+            )
+
+    def budget_usage_meta() -> dict[str, object] | None:
+        if decision is None:
+            return None
+        return {"governance_budget": decision.budget_usage.to_dict()}
+
+    def uledger_builder(manifest: APXManifestV1) -> ULedgerChainBuilder:
+        return ULedgerChainBuilder(
+            gid=topo.gid,
+            run_id=run_id,
+            window_id=primary_spec.window_id,
+            manifest=manifest,
+            policy_set_hash=governance.policy_set_hash if governance else None,
+            governance_meta=budget_usage_meta(),
+        )
+
+    if proposals_known:
+        decide(codex_proposals)
+
+    manifests: Dict[str, APXManifestV1] = {}
+    apxi_views: Dict[str, APXiViewV1] = {}
+    primary_manifest: APXManifestV1 | None = None
+    builder: ULedgerChainBuilder | None = None
+    deferred_hashes: List[Dict[str, object]] = []
+    pending_ticks: List[_SimulatedTick] = []
+    scene_jobs: Deque[tuple[_SimulatedTick, Future]] = deque()
+    per_tick_scenes = artifacts.scenes or artifacts.envelopes
+    envelope_count = 0
+    ingress_envelope_count = 0
+    ingress_cursor = 0
+    i_block_count = 0
+    last_chain = profile.C0
+    last_state: tuple[int, ...] = tuple(effective_initial_state)
+
+    if resume is not None:
+        for window_id in list(contexts):
+            if window_id in resume.press_buffers:
+                contexts[window_id].restore_buffered_values(resume.press_buffers[window_id])
+            else:
+                del contexts[window_id]
+        for manifest in resume.manifests:
+            manifests[manifest.apx_name] = manifest
+            if manifest.window_id == primary_window_id:
+                primary_manifest = manifest
+        apxi_views.update((view.apx_name, view) for view in resume.apxi_views)
+        if primary_manifest is not None and proposals_known and artifacts.u_ledger:
+            builder = uledger_builder(primary_manifest)
+            builder.restore_head(resume.u_ledger)
+        deferred_hashes.extend(dict(hashes) for hashes in resume.deferred_u_ledger_hashes)
+        pending_ticks.extend(map(_pending_tick_from_dict, resume.pending_ticks))
+        envelope_count = resume.envelope_count
+        ingress_envelope_count = resume.ingress_envelope_count
+        ingress_cursor = resume.ingress_cursor
+        i_block_count = resume.i_block_count
+        gate_filter.seq_offset = resume.governance_seq
+        last_chain = resume.chain
+        last_state = resume.umx_state
+
+    commit_on_window_close = (
+        loom_block_store is not None
+        and loom_block_store.write_behind is not None
+        and loom_block_store.write_behind.flush_on_window_close
+    )
+
+    def checkpoint_due(tick: int) -> bool:
+        return checkpoint_every is not None and tick % checkpoint_every == 0 and tick < total_ticks
+
+    def simulate() -> Iterator[_SimulatedTick]:
+        for _ in range(total_ticks - ctx.tick):
+            next_tick = ctx.tick + 1
+            if profiler is not None:
+                started = perf_counter_ns()
+            pfna_refs_for_tick: List[str] = []
+            pfna_batch: List[PFNAInputV0] = []
+            pfna_audit_for_tick: List[Mapping[str, object]] = []
+            pfna_events = ingress_queue.pop_ready(next_tick)
+            pfna_meta_for_tick: List[Mapping[str, object]] = []
+            if pfna_events:
+                pfna_deltas = [0 for _ in range(topo.N)]
+                for event in pfna_events:
+                    pfna_refs_for_tick.append(event.pfna.pfna_id)
+                    pfna_batch.append(event.as_pfna_input)
+                    pfna_audit_for_tick.append(
+                        {
+                            "pfna_id": event.pfna.pfna_id,
+                            "audit": event.audit,
+                            "values": event.integerized,
+                        }
+                    )
+                    pfna_deltas = [
+                        acc + int(delta) for acc, delta in zip(pfna_deltas, event.integerized)
+                    ]
+                pfna_meta_for_tick = pfna_audit_for_tick or [
+                    {"pfna_id": pfna.pfna_id, "values": pfna.values, "audit": ()}
+                    for pfna in pfna_batch
+                ]
+                ctx.apply_external_inputs(pfna_deltas)
+
+            if pfna_refs_for_tick and not pfna_meta_for_tick:
+                pfna_meta_for_tick = [
+                    {"pfna_id": ref, "values": tuple(), "audit": ()}
+                    for ref in pfna_refs_for_tick
+                ]
+
+            prev_chain = loom_ctx.current_chain_value()
+            ingress_envelope = None
+            if pfna_batch:
+                ingress_envelope = NAPEnvelopeV1(
                     v=int(profile.nap_defaults.get("v", 1)),
                     tick=next_tick,
                     gid=topo.gid,
@@ -322,30 +1045,149 @@ def run_cmp0_tick_loop(
                     prev_chain=prev_chain,
                     sig="",
                 )
+
+            if profiler is not None:
+                profiler.record("pfna", next_tick, perf_counter_ns() - started)
+                started = perf_counter_ns()
+            ledger = ctx.step()
+            if profiler is not None:
+                profiler.record("umx", next_tick, perf_counter_ns() - started)
+                started = perf_counter_ns()
+            p_block, maybe_i_block = loom_ctx.ingest_tick(ledger)
+            if profiler is not None:
+                profiler.record("loom", next_tick, perf_counter_ns() - started)
+            yield _SimulatedTick(
+                ledger=ledger,
+                p_block=p_block,
+                i_block=maybe_i_block,
+                prev_chain=prev_chain,
+                pfna_refs=pfna_refs_for_tick,
+                pfna_meta=pfna_meta_for_tick,
+                ingress_envelope=ingress_envelope,
+                recorder_state=(
+                    loom_ctx.recorder.snapshot() if checkpoint_due(ledger.tick) else None
+                ),
+            )
+
+    def close_windows(window_ids: Sequence[str], tick: int) -> Iterator[TickLoopArtifactV1]:
+        nonlocal primary_manifest, builder
+        if commit_on_window_close:
+            loom_block_store.commit()
+        close = _stage_job(profiler, "press", tick, _close_window)
+        closing = [
+            (window_id, lanes.press.submit(close, contexts.pop(window_id), apx_name))
+            for window_id, apx_name in (
+                (window_id, resolved_specs[window_id].apx_name) for window_id in window_ids
+            )
+        ]
+        for window_id, job in closing:
+            manifest, apxi_view = job.result()
+            manifests[manifest.apx_name] = manifest
+            yield TickLoopArtifactV1("manifest", manifest, window_id=window_id)
+            if apxi_view:
+                apxi_views[manifest.apx_name] = apxi_view
+                yield TickLoopArtifactV1("apxi_view", apxi_view, window_id=window_id)
+
+            if logger and logger.enabled and logger.config.include_windows:
+                logger.log(
+                    "window_closed",
+                    gid=topo.gid,
+                    run_id=run_id,
+                    window_id=window_id,
+                    payload={
+                        "apx_name": manifest.apx_name,
+                        "manifest_check": manifest.manifest_check,
+                    },
+                )
+            if window_id == primary_window_id:
+                primary_manifest = manifest
+                if proposals_known and artifacts.u_ledger:
+                    builder = uledger_builder(manifest)
+
+    def finish_scene(record: _SimulatedTick, job: Future) -> Iterator[TickLoopArtifactV1]:
+        nonlocal envelope_count
+        scene, envelope, hashes = job.result()
+        tick = record.ledger.tick
+        if scene is not None:
+            yield TickLoopArtifactV1("scene", scene, tick=tick)
+        if envelope is None:
+            return
+        apply_governance = _stage_job(profiler, "governance", tick, gate_filter.apply)
+        kept, governance_envelope, _ = apply_governance(envelope)
+        if kept is not None:
+            envelope_count += 1
+            yield TickLoopArtifactV1("envelope", kept, tick=tick)
+        if governance_envelope is not None and artifacts.governance_envelopes:
+            yield TickLoopArtifactV1("governance_envelope", governance_envelope, tick=tick)
+        if hashes is None:
+            return
+        if kept is None:
+            raise ValueError("ledgers, p_blocks, and envelopes must align one-to-one")
+        ledger_hash, p_block_hash, envelope_hash = hashes
+        hashes = {
+            "tick": tick,
+            "C_t": record.p_block.C_t,
+            "topology_version": record.p_block.topology_version,
+            "nap_envelope_hash": envelope_hash,
+            "umx_ledger_hash": ledger_hash,
+            "loom_block_hash": p_block_hash,
+        }
+        if builder is not None:
+            entry = _stage_job(profiler, "uledger", tick, builder.append_hashes)(**hashes)
+            yield TickLoopArtifactV1("u_ledger_entry", entry, tick=tick)
+        else:
+            deferred_hashes.append(hashes)
+
+    def emit_scenes(*, drain: bool = False) -> Iterator[TickLoopArtifactV1]:
+        for record in pending_ticks:
+            job = lanes.scenes.submit(
+                _build_scene_job,
+                record,
+                gid=topo.gid,
+                run_id=run_id,
+                nid=nid,
+                window_id=primary_spec.window_id,
+                manifest=primary_manifest,
+                profile=profile,
+                artifacts=artifacts,
+                profiler=profiler,
             )
+            scene_jobs.append((record, job))
+        pending_ticks.clear()
+        limit = 0 if drain else lanes.in_flight
+        while len(scene_jobs) > limit:
+            yield from finish_scene(*scene_jobs.popleft())
 
-        ledger, p_block, maybe_i_block = loom_ctx.step()
+    for record in lanes.ticks(simulate()):
+        ledger, p_block = record.ledger, record.p_block
         tick = ledger.tick
-        deltas = tuple(post - pre for post, pre in zip(ledger.post_u, ledger.pre_u))
-        fluxes = tuple(edge.f_e for edge in ledger.edges)
-        _append_press_values(
-            contexts,
+        last_chain = p_block.C_t
+        last_state = tuple(ledger.post_u)
+        ingress_cursor += len(record.pfna_refs)
+        if record.ingress_envelope is not None:
+            ingress_envelope_count += 1
+            yield TickLoopArtifactV1("ingress_envelope", record.ingress_envelope, tick=tick)
+
+        lanes.press.submit(
+            _stage_job(profiler, "press", tick, _press_tick),
+            dict(contexts),
             resolved_specs,
-            tick=tick,
-            deltas=deltas,
-            fluxes=fluxes,
             ledger=ledger,
             p_block=p_block,
-            prev_chain=prev_chain,
+            prev_chain=record.prev_chain,
         )
+        if codex_ctx:
+            _stage_job(profiler, "codex", tick, codex_ctx.ingest_tick)(ledger, p_block)
 
-        ledgers.append(ledger)
-        p_blocks.append(p_block)
-        tick_cache.append(
-            (ledger, p_block, prev_chain, pfna_refs_for_tick, pfna_meta_for_tick)
-        )
-        if maybe_i_block:
-            i_blocks.append(maybe_i_block)
+        if artifacts.history:
+            yield TickLoopArtifactV1("ledger", ledger, tick=tick)
+            yield TickLoopArtifactV1("p_block", p_block, tick=tick)
+        if per_tick_scenes:
+            pending_ticks.append(record)
+        if record.i_block:
+            i_block_count += 1
+            if artifacts.history:
+                yield TickLoopArtifactV1("i_block", record.i_block, tick=tick)
 
         if logger and logger.enabled and logger.config.include_ticks:
             logger.log(
@@ -354,95 +1196,70 @@ def run_cmp0_tick_loop(
                 run_id=run_id,
                 tick=tick,
                 payload={
-                    "pfna_refs": tuple(sorted(pfna_refs_for_tick)),
-                    "prev_chain": prev_chain,
+                    "pfna_refs": tuple(sorted(record.pfna_refs)),
+                    "prev_chain": record.prev_chain,
                     "C_t": p_block.C_t,
                 },
             )
 
-    manifests: Dict[str, APXManifestV1] = {}
-    apxi_views: Dict[str, APXiViewV1] = {}
-    for window_id, ctx in contexts.items():
-        spec = resolved_specs[window_id]
-        manifest = ctx.close_window(spec.apx_name)
-        manifests[spec.apx_name] = manifest
-        apxi_view = ctx.get_apxi_view()
-        if apxi_view:
-            apxi_views[manifest.apx_name] = apxi_view
-
-        if logger and logger.enabled and logger.config.include_windows:
-            logger.log(
-                "window_closed",
-                gid=topo.gid,
+        yield from close_windows(
+            [window_id for window_id in contexts if resolved_specs[window_id].end_tick == tick],
+            tick,
+        )
+        if primary_manifest is not None:
+            yield from emit_scenes()
+
+        if record.recorder_state is not None:
+            if primary_manifest is not None:
+                yield from emit_scenes(drain=True)
+            yield TickLoopCheckpointV1(
                 run_id=run_id,
-                window_id=window_id,
-                payload={
-                    "apx_name": manifest.apx_name,
-                    "manifest_check": manifest.manifest_check,
-                },
+                gid=topo.gid,
+                total_ticks=total_ticks,
+                artifact_profile=artifacts.name,
+                tick=tick,
+                artifact_count=0,
+                umx_state=last_state,
+                chain=last_chain,
+                loom_recorder=record.recorder_state,
+                press_buffers=lanes.press.submit(_press_buffers, dict(contexts)).result(),
+                manifests=tuple(manifests.values()),
+                apxi_views=tuple(apxi_views.values()),
+                ingress_cursor=ingress_cursor,
+                ingress_envelope_count=ingress_envelope_count,
+                envelope_count=envelope_count,
+                i_block_count=i_block_count,
+                governance_seq=gate_filter.seq_offset,
+                u_ledger=builder.head_state() if builder is not None else None,
+                deferred_u_ledger_hashes=tuple(deferred_hashes),
+                codex=codex_ctx.streamed_ingest_state() if codex_ctx else None,
+                pending_ticks=tuple(map(_pending_tick_to_dict, pending_ticks)),
             )
 
-    primary_spec = resolved_specs[primary_window_id]
-    primary_manifest = manifests[primary_spec.apx_name]
-
-    scenes: List[SceneFrameV1] = []
-    envelopes: List[NAPEnvelopeV1] = []
-    for ledger, p_block, prev_chain, pfna_refs, pfna_audit in tick_cache:
-        scene_meta: Dict[str, object] | None = {"pfna_integerization": pfna_audit}
-
-        scene, envelope = build_scene_and_envelope(
-            gid=topo.gid,
-            run_id=run_id,
-            nid=nid,
-            window_id=primary_spec.window_id,
-            ledger=ledger,
-            p_block=p_block,
-            C_prev=prev_chain,
-            manifest_check=primary_manifest.manifest_check,
-            profile=profile,
-            p_block_ref=f"loom_p_block_{ledger.tick}",
-            manifest_ref=primary_manifest.apx_name,
-            pfna_refs=pfna_refs,
-            meta=scene_meta,
-        )
-        scenes.append(scene)
-        envelopes.append(envelope)
-
-    governance_envelopes: list[NAPEnvelopeV1] = []
-    if governance:
-        envelopes, gate_gov_envelopes, _ = apply_governance_to_envelopes(
-            envelopes,
-            governance=governance,
-            window_id=primary_spec.window_id,
-            profile=profile,
-            logger=logger,
-        )
-        governance_envelopes.extend(gate_gov_envelopes)
+    yield from close_windows(list(contexts), total_ticks)
+    yield from emit_scenes(drain=True)
 
     codex_motifs: tuple["CodexLibraryEntryV1", ...] = ()
     codex_proposals_out: tuple["CodexProposalV1", ...] = ()
     codex_actions: tuple["CodexProposalV1", ...] = ()
     codex_hypothetical_actions: tuple["CodexProposalV1", ...] = ()
-    budget_usage_meta: dict[str, object] | None = None
 
     proposals_source: Sequence["CodexProposalV1"] | None = codex_proposals
     if codex_ctx:
-        codex_ctx.ingest(
+        codex_ctx.finish_ingest(
             gid=topo.gid,
             run_id=run_id,
-            ledgers=ledgers,
-            p_blocks=p_blocks,
-            i_blocks=i_blocks,
+            i_block_count=i_block_count,
             manifests=manifests,
-            envelopes=envelopes,
+            envelope_count=envelope_count,
             window_id=primary_spec.window_id,
         )
         codex_motifs = tuple(codex_ctx.learn_edge_flux_motifs(threshold=1))
         if proposals_source is None:
             proposals_source = codex_ctx.emit_proposals(usage_threshold=1)
+            decide(proposals_source)
 
-    governance_active = governance is not None and governance.codex_action_mode != "OFF"
-    if governance_active:
+    if governance_active and artifacts.governance_envelopes:
         policy_ids = sorted(
             {
                 *[p.policy_id for p in governance.topology_policies],
@@ -450,7 +1267,8 @@ def run_cmp0_tick_loop(
                 *[p.policy_id for p in governance.safety_policies],
             }
         )
-        governance_envelopes.append(
+        yield TickLoopArtifactV1(
+            "governance_envelope",
             NAPEnvelopeV1(
                 v=int(profile.nap_defaults.get("v", 1)),
                 tick=1,
@@ -469,29 +1287,19 @@ def run_cmp0_tick_loop(
                     "governance_mode": governance.governance_mode,
                     "codex_action_mode": governance.codex_action_mode,
                 },
-            )
+            ),
+            tick=1,
         )
 
-    if proposals_source:
-        codex_proposals_out = tuple(proposals_source)
-        if governance is None:
-            governance = GovernanceConfigV1()
-        decision: GovernedActionQueue = governed_decision_loop(
-            proposals=codex_proposals_out,
-            config=governance,
-            window_id=primary_spec.window_id,
-            evaluated_at_tick=total_ticks,
-        )
+    governance_budget_usage: BudgetUsage | None = None
+    if decision is not None:
         codex_proposals_out = decision.evaluated
         if decision.dry_run:
             codex_hypothetical_actions = decision.approved
         else:
             codex_actions = decision.approved
-        budget_usage_meta = {
-            "governance_budget": decision.budget_usage.to_dict()
-        }
-        governance_budget_usage: BudgetUsage | None = decision.budget_usage
-        if governance_active:
+        governance_budget_usage = decision.budget_usage
+        if governance_active and artifacts.governance_envelopes:
             caps = [cap.to_dict() for cap in decision.budget_usage.caps]
             exhausted = [cap for cap in caps if cap.get("exhausted")]
             summary_meta = {
@@ -504,7 +1312,8 @@ def run_cmp0_tick_loop(
                 "topology_changes_applied": decision.budget_usage.topology_changes_applied,
                 "caps": caps,
             }
-            governance_envelopes.append(
+            yield TickLoopArtifactV1(
+                "governance_envelope",
                 NAPEnvelopeV1(
                     v=int(profile.nap_defaults.get("v", 1)),
                     tick=total_ticks,
@@ -514,13 +1323,15 @@ def run_cmp0_tick_loop(
                     mode="G",
                     payload_ref=0,
                     seq=total_ticks,
-                    prev_chain=p_blocks[-1].C_t if p_blocks else profile.C0,
+                    prev_chain=last_chain,
                     sig="",
-                meta=summary_meta,
+                    meta=summary_meta,
+                ),
+                tick=total_ticks,
             )
-        )
             if exhausted:
-                governance_envelopes.append(
+                yield TickLoopArtifactV1(
+                    "governance_envelope",
                     NAPEnvelopeV1(
                         v=int(profile.nap_defaults.get("v", 1)),
                         tick=total_ticks,
@@ -530,7 +1341,7 @@ def run_cmp0_tick_loop(
                         mode="G",
                         payload_ref=0,
                         seq=total_ticks + 1,
-                        prev_chain=p_blocks[-1].C_t if p_blocks else profile.C0,
+                        prev_chain=last_chain,
                         sig="",
                         meta={
                             "event": "BUDGET_EXHAUSTION",
@@ -539,25 +1350,23 @@ def run_cmp0_tick_loop(
                             "governance_mode": governance.governance_mode,
                             "exhausted_caps": exhausted,
                         },
-                    )
+                    ),
+                    tick=total_ticks,
                 )
-    else:
-        governance_budget_usage = None
 
-    u_ledger_entries, u_ledger_checkpoint = build_and_validate_uledger(
-        gid=topo.gid,
-        run_id=run_id,
-        window_id=primary_spec.window_id,
-        ledgers=ledgers,
-        p_blocks=p_blocks,
-        envelopes=envelopes,
-        manifest=primary_manifest,
-        policy_set_hash=governance.policy_set_hash if governance else None,
-        governance_meta=budget_usage_meta,
-    )
+    u_ledger_checkpoint: ULedgerCheckpointV1 | None = None
+    if builder is None and artifacts.u_ledger:
+        builder = uledger_builder(primary_manifest)
+        for hashes in deferred_hashes:
+            append = _stage_job(profiler, "uledger", hashes["tick"], builder.append_hashes)
+            entry = append(**hashes)
+            yield TickLoopArtifactV1("u_ledger_entry", entry, tick=entry.tick)
+        deferred_hashes.clear()
+    if builder is not None:
+        u_ledger_checkpoint = builder.checkpoint()
 
-    final_chain = p_blocks[-1].C_t if p_blocks else profile.C0
-    egress_envelopes.append(
+    yield TickLoopArtifactV1(
+        "egress_envelope",
         NAPEnvelopeV1(
             v=int(profile.nap_defaults.get("v", 1)),
             tick=total_ticks,
@@ -567,46 +1376,54 @@ def run_cmp0_tick_loop(
             mode=str(profile.nap_defaults.get("egress_mode", "P")),
             payload_ref=int(primary_manifest.manifest_check),
             seq=total_ticks + 2,
-            prev_chain=final_chain,
+            prev_chain=last_chain,
             sig="",
-        )
+        ),
+        tick=total_ticks,
     )
 
     if logger and logger.enabled:
+        if profiler is not None:
+            logger.log(
+                "stage_profile",
+                gid=topo.gid,
+                run_id=run_id,
+                payload={"stages": profiler.to_dict()},
+            )
         logger.log(
             "tick_loop_end",
             gid=topo.gid,
             run_id=run_id,
             payload={
                 "ticks": total_ticks,
-                "envelopes": len(envelopes),
-                "ingress": len(ingress_envelopes),
-                "egress": len(egress_envelopes),
+                "envelopes": envelope_count,
+                "ingress": ingress_envelope_count,
+                "egress": 1,
             },
         )
 
-    return GF01RunResult(
-        run_id=run_id,
-        profile=profile,
-        topo=topo,
-        ledgers=ledgers,
-        p_blocks=p_blocks,
-        i_blocks=i_blocks,
-        manifests=manifests,
-        scenes=scenes,
-        envelopes=envelopes,
-        ingress_envelopes=ingress_envelopes,
-        egress_envelopes=egress_envelopes,
-        governance_envelopes=governance_envelopes,
-        u_ledger_entries=u_ledger_entries,
-        u_ledger_checkpoint=u_ledger_checkpoint,
-        apxi_views=apxi_views,
-        governance=governance,
-        governance_budget_usage=governance_budget_usage,
-        codex_motifs=codex_motifs,
-        codex_proposals=codex_proposals_out,
-        codex_actions=codex_actions,
-        codex_hypothetical_actions=codex_hypothetical_actions,
+    yield TickLoopArtifactV1(
+        "summary",
+        TickLoopSummaryV1(
+            run_id=run_id,
+            profile=profile,
+            topo=topo,
+            manifests={
+                resolved_specs[window_id].apx_name: manifests[resolved_specs[window_id].apx_name]
+                for window_id in resolved_specs
+            },
+            apxi_views=apxi_views,
+            governance=governance,
+            governance_budget_usage=governance_budget_usage,
+            u_ledger_checkpoint=u_ledger_checkpoint,
+            codex_motifs=codex_motifs,
+            codex_proposals=codex_proposals_out,
+            codex_actions=codex_actions,
+            codex_hypothetical_actions=codex_hypothetical_actions,
+            artifact_profile=artifacts.name,
+            final_state=last_state,
+            final_chain=last_chain,
+        ),
     )
 
 
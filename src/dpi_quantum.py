@@ -699,10 +699,10 @@ def _prepare_pfna_inputs(encoded: Dict[str, object], params: Dict[str, object],
 
 
 def _loom_bytes(store: LoomBlockStore) -> int:
-    if not store or not store.index_path.exists():
+    if not store:
         return 0
     try:
-        index = json.loads(store.index_path.read_text())
+        index = store.replay_index()
         p_bytes = sum(entry.get("bin_size", 0) for entry in index.get("p", []))
         i_bytes = sum(entry.get("bin_size", 0) for entry in index.get("i", []))
         return p_bytes + i_bytes
@@ -3,15 +3,20 @@
 from gate.gate import (
     ALLOWED_NAP_LAYERS,
     ALLOWED_NAP_MODES,
+    ARTIFACT_PROFILES,
+    ArtifactProfileV1,
     NAPEnvelopeV1,
     PFNAIngressQueue,
     PFNAInputV0,
+    PFNAJsonlStreamV0,
     PFNATransformV1,
     PressStreamSpecV1,
     GovernanceDecisionV1,
+    GateGovernanceFilter,
     apply_governance_to_envelopes,
     SessionConfigV1,
     SessionRunResult,
+    resolve_artifact_profile,
     SceneFrameV1,
     validate_scene_frame,
     _default_press_stream_specs,
@@ -22,6 +27,7 @@ from gate.gate import (
     emit_nap_envelope,
     dump_pfna_v0,
     load_pfna_v0,
+    write_pfna_v0_jsonl,
     run_session,
     build_metrics_snapshot,
     build_introspection_view,
@@ -30,15 +36,20 @@ from gate.gate import (
 __all__ = [
     "ALLOWED_NAP_LAYERS",
     "ALLOWED_NAP_MODES",
+    "ARTIFACT_PROFILES",
+    "ArtifactProfileV1",
     "NAPEnvelopeV1",
     "PFNAIngressQueue",
     "PFNAInputV0",
+    "PFNAJsonlStreamV0",
     "PFNATransformV1",
     "PressStreamSpecV1",
     "GovernanceDecisionV1",
+    "GateGovernanceFilter",
     "apply_governance_to_envelopes",
     "SessionConfigV1",
     "SessionRunResult",
+    "resolve_artifact_profile",
     "SceneFrameV1",
     "validate_scene_frame",
     "_default_press_stream_specs",
@@ -49,6 +60,7 @@ __all__ = [
     "emit_nap_envelope",
     "dump_pfna_v0",
     "load_pfna_v0",
+    "write_pfna_v0_jsonl",
     "run_session",
     "build_metrics_snapshot",
     "build_introspection_view",
@@ -1,6 +1,7 @@
 """Minimal Gate/TBP types and helpers for CMP-0 GF-01."""
 from __future__ import annotations
 
+import heapq
 import json
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -8,6 +9,7 @@ from functools import cached_property
 from typing import (
     Dict,
     Iterable,
+    Iterator,
     List,
     Mapping,
     Optional,
@@ -28,11 +30,13 @@ from ops import (
     LoggingConfigV1,
     MetricsConfigV1,
     MetricsSnapshotV1,
+    StageProfiler,
     StructuredLogEntryV1,
     StructuredLogger,
 )
 
 if TYPE_CHECKING:  # pragma: no cover - used for type hints only
+    from core.checkpoint import TickLoopCheckpointConfig, TickLoopCheckpointV1
     from core.tick_loop import GF01RunResult, TickLoopWindowSpec
     from umx.topology_profile import TopologyProfileV1
 
@@ -84,6 +88,64 @@ def _default_press_stream_specs() -> Tuple[PressStreamSpecV1, ...]:
     )
 
 
+@dataclass(frozen=True)
+class ArtifactProfileV1:
+    """Which artefacts a TickLoop_v1 run produces.
+
+    Artefacts that are switched off are never built, not just dropped from
+    the result. Manifests, ingress/egress envelopes and the final state and
+    chain value are always produced. ``history`` keeps the per-tick UMX
+    ledgers and Loom P-/I-blocks; ``envelopes`` builds DATA envelopes (and
+    applies Gate governance to them); ``u_ledger`` chains them into
+    ULedgerEntry_v1 records and therefore needs ``envelopes``.
+    """
+
+    name: str = "full"
+    history: bool = True
+    scenes: bool = True
+    envelopes: bool = True
+    governance_envelopes: bool = True
+    u_ledger: bool = True
+    codex: bool = True
+
+    def __post_init__(self) -> None:
+        if not self.name:
+            raise ValueError("artifact profile name must be provided")
+        if self.u_ledger and not self.envelopes:
+            raise ValueError("u_ledger artefacts require envelopes")
+
+
+#: Built-in artefact profiles: everything, the verifiable audit trail
+#: (no SceneFrames or Codex learning), and final state plus manifests only.
+ARTIFACT_PROFILES: Dict[str, ArtifactProfileV1] = {
+    "full": ArtifactProfileV1(),
+    "audit": ArtifactProfileV1(name="audit", scenes=False, codex=False),
+    "lean": ArtifactProfileV1(
+        name="lean",
+        history=False,
+        scenes=False,
+        envelopes=False,
+        governance_envelopes=False,
+        u_ledger=False,
+        codex=False,
+    ),
+}
+
+
+def resolve_artifact_profile(
+    profile: Union[ArtifactProfileV1, str, None]
+) -> ArtifactProfileV1:
+    """Return ``profile`` itself, the built-in profile it names, or ``full``."""
+
+    if profile is None:
+        return ARTIFACT_PROFILES["full"]
+    if isinstance(profile, ArtifactProfileV1):
+        return profile
+    if profile not in ARTIFACT_PROFILES:
+        raise ValueError(f"artifact_profile must be one of {sorted(ARTIFACT_PROFILES)}")
+    return ARTIFACT_PROFILES[profile]
+
+
 def _default_governance_config() -> GovernanceConfigV1:
     """Default governance config keeps Codex suggestions off."""
 
@@ -102,13 +164,16 @@ class SessionConfigV1:
     primary_window_id: str
     run_id: str = "SESSION"
     nid: str = "N/A"
-    pfna_inputs: Tuple[PFNAInputV0, ...] = field(default_factory=tuple)
+    pfna_inputs: Union[Tuple[PFNAInputV0, ...], "PFNAJsonlStreamV0"] = field(
+        default_factory=tuple
+    )
     governance: GovernanceConfigV1 = field(default_factory=_default_governance_config)
     press_default_streams: Tuple[PressStreamSpecV1, ...] = field(
         default_factory=_default_press_stream_specs
     )
     logging_config: LoggingConfigV1 = field(default_factory=LoggingConfigV1)
     metrics_config: MetricsConfigV1 = field(default_factory=MetricsConfigV1)
+    artifact_profile: ArtifactProfileV1 = field(default_factory=ArtifactProfileV1)
 
     def __post_init__(self) -> None:
         if self.total_ticks < 1:
@@ -122,7 +187,7 @@ class SessionConfigV1:
             raise ValueError("primary_window_id must reference a window spec")
         if not self.run_id:
             raise ValueError("run_id must be provided")
-        if not isinstance(self.pfna_inputs, tuple):
+        if not isinstance(self.pfna_inputs, (tuple, PFNAJsonlStreamV0)):
             object.__setattr__(self, "pfna_inputs", tuple(self.pfna_inputs))
         if not isinstance(self.press_default_streams, tuple):
             object.__setattr__(self, "press_default_streams", tuple(self.press_default_streams))
@@ -132,6 +197,9 @@ class SessionConfigV1:
             raise ValueError("logging_config must be a LoggingConfigV1 instance")
         if not isinstance(self.metrics_config, MetricsConfigV1):
             raise ValueError("metrics_config must be a MetricsConfigV1 instance")
+        object.__setattr__(
+            self, "artifact_profile", resolve_artifact_profile(self.artifact_profile)
+        )
 
 
 @dataclass(frozen=True)
@@ -230,38 +298,85 @@ class PFNAIngressEventV1:
 
 
 class PFNAIngressQueue:
-    """Idempotent PFNA ingress buffer that integerizes on enqueue."""
+    """Idempotent PFNA ingress buffer that integerizes on enqueue.
+
+    Events are bucketed by tick, so :meth:`pop_ready` only touches the
+    events of the requested tick. Inputs enqueued for a tick that was
+    already popped or discarded are ignored. Their idempotence keys have
+    been evicted, so memory stays bounded by the pending events. An
+    attached stream (see :meth:`attach`) is read lazily as ticks are popped.
+    """
 
     def __init__(self, *, transform: Optional[PFNATransformV1] = None) -> None:
         self.transform = transform or PFNATransformV1()
-        self._seen: set[Tuple[int, str]] = set()
-        self._events: List[PFNAIngressEventV1] = []
+        self._seen: Dict[int, set[str]] = {}
+        self._buckets: Dict[int, List[PFNAIngressEventV1]] = {}
+        self._ticks: List[int] = []
+        self._consumed_through = -1
+        self._stream: Optional[Iterator[PFNAInputV0]] = None
+        self._stream_head: Optional[PFNAInputV0] = None
 
     def enqueue(self, pfna: PFNAInputV0) -> None:
-        key = (pfna.tick, pfna.pfna_id)
-        if key in self._seen:
+        if pfna.tick <= self._consumed_through:
+            return
+        seen = self._seen.setdefault(pfna.tick, set())
+        if pfna.pfna_id in seen:
             return
 
         integerized, audit = self.transform.integerize(pfna.values)
         event = PFNAIngressEventV1(pfna=pfna, integerized=integerized, audit=audit)
-        self._events.append(event)
-        self._seen.add(key)
-        self._events.sort(key=lambda item: (item.pfna.tick, item.pfna.pfna_id))
+        bucket = self._buckets.get(pfna.tick)
+        if bucket is None:
+            bucket = self._buckets[pfna.tick] = []
+            heapq.heappush(self._ticks, pfna.tick)
+        bucket.append(event)
+        seen.add(pfna.pfna_id)
 
     def extend(self, pfna_inputs: Iterable[PFNAInputV0]) -> None:
         for pfna in pfna_inputs:
             self.enqueue(pfna)
 
+    def attach(self, stream: Iterable[PFNAInputV0]) -> None:
+        """Read ``stream`` lazily: inputs are enqueued once their tick is requested.
+
+        The stream must yield inputs in non-decreasing tick order.
+        """
+
+        if self._stream is not None:
+            raise ValueError("PFNAIngressQueue already has a stream attached")
+        self._stream = iter(stream)
+        self._stream_head = next(self._stream, None)
+
+    def _pull_through(self, tick: int) -> None:
+        head = self._stream_head
+        while head is not None and head.tick <= tick:
+            self.enqueue(head)
+            following = next(self._stream, None)
+            if following is not None and following.tick < head.tick:
+                raise ValueError("PFNA stream inputs must be ordered by tick")
+            head = following
+        self._stream_head = head
+
     def pop_ready(self, tick: int) -> Tuple[PFNAIngressEventV1, ...]:
-        ready: List[PFNAIngressEventV1] = []
-        remaining: List[PFNAIngressEventV1] = []
-        for event in self._events:
-            if event.pfna.tick == tick:
-                ready.append(event)
-            else:
-                remaining.append(event)
-        self._events = remaining
-        return tuple(ready)
+        self._pull_through(tick)
+        ready = self._buckets.pop(tick, [])
+        self._seen.pop(tick, None)
+        self._consumed_through = max(self._consumed_through, tick)
+        while self._ticks and self._ticks[0] not in self._buckets:
+            heapq.heappop(self._ticks)
+        return tuple(sorted(ready, key=lambda item: item.pfna.pfna_id))
+
+    def discard_through(self, tick: int) -> int:
+        """Drop events for ticks ``<= tick`` (already consumed) and return how many."""
+
+        self._pull_through(tick)
+        dropped = 0
+        while self._ticks and self._ticks[0] <= tick:
+            stale = heapq.heappop(self._ticks)
+            dropped += len(self._buckets.pop(stale, ()))
+            self._seen.pop(stale, None)
+        self._consumed_through = max(self._consumed_through, tick)
+        return dropped
 
 
 def _load_pfna_source(source: Union[str, Path, Mapping[str, object]]) -> Mapping[str, object]:
@@ -283,18 +398,10 @@ def _load_pfna_source(source: Union[str, Path, Mapping[str, object]]) -> Mapping
     raise TypeError("PFNA source must be a mapping, JSON string, or path")
 
 
-def load_pfna_v0(
-    source: Union[str, Path, Mapping[str, object]], *, expected_length: Optional[int] = None
-) -> Tuple[PFNAInputV0, ...]:
-    """Load and validate PFNA V0 inputs deterministically.
-
-    The loader enforces the PFNA V0 schema (see docs/contracts/PFNA_V0_Schema_v1.md):
-    - top-level fields: v=0, pfna_id, gid, run_id, nid, entries
-    - each entry: pfna_id, tick>=0, values (non-empty int sequence), optional description
-    - optional `expected_length` enforces the vector length of each entry.
-    """
-
-    data = _load_pfna_source(source)
+def _parse_pfna_header(
+    data: Mapping[str, object], *, required: Sequence[str]
+) -> Tuple[str, str, str, str]:
+    """Validate the PFNA V0 bundle fields and return ``(pfna_id, gid, run_id, nid)``."""
 
     try:
         version = int(data["v"])
@@ -304,7 +411,7 @@ def load_pfna_v0(
     if version != 0:
         raise ValueError("PFNA V0 requires v == 0")
 
-    for field_name in ("pfna_id", "gid", "run_id", "nid", "entries"):
+    for field_name in required:
         if field_name not in data:
             raise ValueError(f"PFNA V0 document missing required field '{field_name}'")
 
@@ -312,7 +419,6 @@ def load_pfna_v0(
     gid = str(data["gid"])
     run_id = str(data["run_id"])
     nid = str(data["nid"])
-    entries_raw = data["entries"]
 
     if not bundle_id:
         raise ValueError("PFNA bundle pfna_id must be non-empty")
@@ -322,52 +428,127 @@ def load_pfna_v0(
         raise ValueError("PFNA bundle run_id must be non-empty")
     if not nid:
         raise ValueError("PFNA bundle nid must be non-empty")
+    return bundle_id, gid, run_id, nid
+
+
+def _parse_pfna_entry(
+    entry: object,
+    *,
+    gid: str,
+    run_id: str,
+    nid: str,
+    expected_length: Optional[int],
+) -> PFNAInputV0:
+    if not isinstance(entry, Mapping):
+        raise ValueError("PFNA entry must be a mapping")
+    for field_name in ("pfna_id", "tick", "values"):
+        if field_name not in entry:
+            raise ValueError(f"PFNA entry missing required field '{field_name}'")
+
+    pfna_id = str(entry["pfna_id"])
+    description = str(entry.get("description", ""))
+    tick_raw = entry["tick"]
+    values_raw = entry["values"]
+
+    tick = int(tick_raw)
+    if tick < 0:
+        raise ValueError("PFNA entry tick must be >= 0")
+
+    if not isinstance(values_raw, (list, tuple)) or not values_raw:
+        raise ValueError("PFNA entry values must be a non-empty list of integers")
+    try:
+        values = tuple(int(val) for val in values_raw)
+    except Exception as exc:  # pragma: no cover - schema error path
+        raise ValueError("PFNA entry values must be integers") from exc
+
+    if expected_length is not None and len(values) != expected_length:
+        raise ValueError("PFNA entry values length must match expected_length")
+
+    return PFNAInputV0(
+        pfna_id=pfna_id,
+        gid=gid,
+        run_id=run_id,
+        tick=tick,
+        nid=nid,
+        values=values,
+        description=description,
+    )
+
+
+def load_pfna_v0(
+    source: Union[str, Path, Mapping[str, object]], *, expected_length: Optional[int] = None
+) -> Tuple[PFNAInputV0, ...]:
+    """Load and validate PFNA V0 inputs deterministically.
+
+    The loader enforces the PFNA V0 schema (see docs/contracts/PFNA_V0_Schema_v1.md):
+    - top-level fields: v=0, pfna_id, gid, run_id, nid, entries
+    - each entry: pfna_id, tick>=0, values (non-empty int sequence), optional description
+    - optional `expected_length` enforces the vector length of each entry.
+
+    Use :class:`PFNAJsonlStreamV0` to read long schedules lazily instead.
+    """
+
+    data = _load_pfna_source(source)
+    _, gid, run_id, nid = _parse_pfna_header(
+        data, required=("pfna_id", "gid", "run_id", "nid", "entries")
+    )
+    entries_raw = data["entries"]
     if not isinstance(entries_raw, list) or not entries_raw:
         raise ValueError("PFNA entries must be a non-empty list")
 
-    parsed: List[PFNAInputV0] = []
-    for entry in entries_raw:
-        if not isinstance(entry, Mapping):
-            raise ValueError("PFNA entry must be a mapping")
-        for field_name in ("pfna_id", "tick", "values"):
-            if field_name not in entry:
-                raise ValueError(f"PFNA entry missing required field '{field_name}'")
-
-        pfna_id = str(entry["pfna_id"])
-        description = str(entry.get("description", ""))
-        tick_raw = entry["tick"]
-        values_raw = entry["values"]
-
-        tick = int(tick_raw)
-        if tick < 0:
-            raise ValueError("PFNA entry tick must be >= 0")
-
-        if not isinstance(values_raw, (list, tuple)) or not values_raw:
-            raise ValueError("PFNA entry values must be a non-empty list of integers")
-        try:
-            values = tuple(int(val) for val in values_raw)
-        except Exception as exc:  # pragma: no cover - schema error path
-            raise ValueError("PFNA entry values must be integers") from exc
-
-        if expected_length is not None and len(values) != expected_length:
-            raise ValueError("PFNA entry values length must match expected_length")
-
-        parsed.append(
-            PFNAInputV0(
-                pfna_id=pfna_id,
-                gid=gid,
-                run_id=run_id,
-                tick=tick,
-                nid=nid,
-                values=values,
-                description=description,
-            )
+    parsed = [
+        _parse_pfna_entry(
+            entry, gid=gid, run_id=run_id, nid=nid, expected_length=expected_length
         )
-
+        for entry in entries_raw
+    ]
     parsed.sort(key=lambda item: (item.tick, item.pfna_id))
     return tuple(parsed)
 
 
+class PFNAJsonlStreamV0:
+    """PFNA V0 inputs read lazily from a JSON Lines file.
+
+    The first line holds the bundle fields of a PFNA V0 document (``v``,
+    ``pfna_id``, ``gid``, ``run_id``, ``nid``), and every further non-blank
+    line holds one entry. Entries must be in non-decreasing tick order.
+    Only the header is read up front. Each iteration re-opens the file and
+    validates entries as it yields them, so
+    :func:`core.tick_loop.run_cmp0_tick_loop` can consume a schedule of any
+    length one tick at a time.
+    """
+
+    def __init__(self, path: Union[str, Path], *, expected_length: Optional[int] = None) -> None:
+        self.path = Path(path)
+        self.expected_length = expected_length
+        with self.path.open("r", encoding="utf-8") as handle:
+            header = json.loads(handle.readline() or "{}")
+        if not isinstance(header, Mapping):
+            raise ValueError("PFNA JSONL header must be a mapping")
+        self.pfna_id, self.gid, self.run_id, self.nid = _parse_pfna_header(
+            header, required=("pfna_id", "gid", "run_id", "nid")
+        )
+
+    def __iter__(self) -> Iterator[PFNAInputV0]:
+        last_tick = -1
+        with self.path.open("r", encoding="utf-8") as handle:
+            handle.readline()
+            for line in handle:
+                if not line.strip():
+                    continue
+                pfna = _parse_pfna_entry(
+                    json.loads(line),
+                    gid=self.gid,
+                    run_id=self.run_id,
+                    nid=self.nid,
+                    expected_length=self.expected_length,
+                )
+                if pfna.tick < last_tick:
+                    raise ValueError("PFNA JSONL entries must be ordered by tick")
+                last_tick = pfna.tick
+                yield pfna
+
+
 def dump_pfna_v0(
     *,
     bundle_id: str,
@@ -398,6 +579,35 @@ def dump_pfna_v0(
     }
 
 
+def write_pfna_v0_jsonl(
+    path: Union[str, Path],
+    *,
+    bundle_id: str,
+    gid: str,
+    run_id: str,
+    nid: str,
+    entries: Iterable[PFNAInputV0],
+) -> Path:
+    """Write PFNA inputs as the JSON Lines layout read by :class:`PFNAJsonlStreamV0`.
+
+    ``entries`` are written as they come, so they must already be in tick order.
+    """
+
+    path = Path(path)
+    header = {"v": 0, "pfna_id": bundle_id, "gid": gid, "run_id": run_id, "nid": nid}
+    with path.open("w", encoding="utf-8") as handle:
+        handle.write(json.dumps(header, sort_keys=True) + "\n")
+        for pfna in entries:
+            entry = {
+                "pfna_id": pfna.pfna_id,
+                "tick": pfna.tick,
+                "values": list(pfna.values),
+                **({"description": pfna.description} if pfna.description else {}),
+            }
+            handle.write(json.dumps(entry, sort_keys=True) + "\n")
+    return path
+
+
 @dataclass(frozen=True)
 class SceneFrameV1:
     """Minimal tick summary consumed by Gate/TBP."""
@@ -605,49 +815,62 @@ def emit_nap_envelope(
     )
 
 
-def apply_governance_to_envelopes(
-    envelopes: Sequence[NAPEnvelopeV1],
-    *,
-    governance: Optional[GovernanceConfigV1],
-    window_id: str,
-    profile: ProfileCMP0V1,
-    logger: Optional[StructuredLogger] = None,
-) -> Tuple[Tuple[NAPEnvelopeV1, ...], Tuple[NAPEnvelopeV1, ...], Tuple[GovernanceDecisionV1, ...]]:
-    """Apply Gate governance rules to outbound envelopes and emit GOV events.
+class GateGovernanceFilter:
+    """Apply Gate governance rules to outbound envelopes one at a time.
 
-    The rules are intentionally minimal/deterministic for CMP-0:
-    - If governance is OFF/None, envelopes are returned unchanged and no GOV
-      envelopes are emitted.
-    - Allowed layers are drawn from governance.meta["allowed_layers"] when
-      provided; otherwise all CMP-0 layers are accepted.
-    - Optional governance.meta["max_envelopes_per_tick"] caps data envelopes
-      per tick. In ENFORCE mode, envelopes that exceed the cap are dropped;
-      in OBSERVE/DRY_RUN they are retained but logged as rejected.
-    - GOV decision envelopes are emitted with `layer="GOV"` / `mode="G"`
-      carrying structured decision metadata.
+    This is the incremental form of :func:`apply_governance_to_envelopes`
+    for callers that stream envelopes. GOV decision envelopes are numbered
+    from ``seq_offset`` (one past the highest data envelope ``seq``), and
+    each decision is logged as it is made.
     """
 
-    if governance is None or (
-        governance.codex_action_mode == "OFF" and governance.governance_mode == "OFF"
-    ):
-        return tuple(envelopes), tuple(), tuple()
+    def __init__(
+        self,
+        *,
+        governance: Optional[GovernanceConfigV1],
+        window_id: str,
+        profile: ProfileCMP0V1,
+        seq_offset: int,
+        logger: Optional[StructuredLogger] = None,
+    ) -> None:
+        self.governance = governance
+        self.window_id = window_id
+        self.profile = profile
+        self.seq_offset = seq_offset
+        self.logger = logger
+        self._per_tick_counts: dict[int, int] = defaultdict(int)
 
-    allowed_layers = governance.meta.get("allowed_layers", ALLOWED_NAP_LAYERS)
-    max_per_tick = governance.meta.get("max_envelopes_per_tick")
-    enforce = governance.governance_mode == "ENFORCE"
+    @property
+    def active(self) -> bool:
+        """False when governance is absent or fully OFF (envelopes pass through)."""
 
-    per_tick_counts: dict[int, int] = defaultdict(int)
-    filtered: list[NAPEnvelopeV1] = []
-    governance_envelopes: list[NAPEnvelopeV1] = []
-    decisions: list[GovernanceDecisionV1] = []
-    seq_offset = (max((env.seq for env in envelopes), default=0)) + 1
+        governance = self.governance
+        return governance is not None and not (
+            governance.codex_action_mode == "OFF" and governance.governance_mode == "OFF"
+        )
 
-    for envelope in envelopes:
-        per_tick_counts[envelope.tick] += 1
+    def apply(
+        self, envelope: NAPEnvelopeV1
+    ) -> Tuple[Optional[NAPEnvelopeV1], Optional[NAPEnvelopeV1], Optional[GovernanceDecisionV1]]:
+        """Return ``(kept_envelope, gov_envelope, decision)`` for one envelope.
+
+        ``kept_envelope`` is None when ENFORCE mode drops the envelope; the
+        GOV envelope and decision are None when the filter is inactive.
+        """
+
+        if not self.active:
+            return envelope, None, None
+
+        governance = self.governance
+        allowed_layers = governance.meta.get("allowed_layers", ALLOWED_NAP_LAYERS)
+        max_per_tick = governance.meta.get("max_envelopes_per_tick")
+        enforce = governance.governance_mode == "ENFORCE"
+
+        self._per_tick_counts[envelope.tick] += 1
         reasons: list[str] = []
         if envelope.layer not in allowed_layers:
             reasons.append(f"layer {envelope.layer} not allowed")
-        if max_per_tick is not None and per_tick_counts[envelope.tick] > int(max_per_tick):
+        if max_per_tick is not None and self._per_tick_counts[envelope.tick] > int(max_per_tick):
             reasons.append(
                 f"tick {envelope.tick} exceeds cap {int(max_per_tick)}"
             )
@@ -660,41 +883,78 @@ def apply_governance_to_envelopes(
             status=status if enforce else f"{status}_OBSERVED",
             reasons=tuple(reasons),
             policy_set_hash=governance.policy_set_hash,
-            window_id=window_id,
+            window_id=self.window_id,
         )
-        decisions.append(decision)
 
-        if reasons and enforce:
-            # Drop envelope in ENFORCE mode.
-            pass
-        else:
-            filtered.append(envelope)
-
-        governance_envelopes.append(
-            NAPEnvelopeV1(
-                v=int(profile.nap_defaults.get("v", 1)),
-                tick=envelope.tick,
-                gid=envelope.gid,
-                nid=envelope.nid,
-                layer="GOV",
-                mode="G",
-                payload_ref=envelope.payload_ref,
-                seq=seq_offset,
-                prev_chain=envelope.prev_chain,
-                sig="",
-                meta=decision.to_meta(),
-            )
+        # Drop envelope in ENFORCE mode.
+        kept = None if reasons and enforce else envelope
+
+        governance_envelope = NAPEnvelopeV1(
+            v=int(self.profile.nap_defaults.get("v", 1)),
+            tick=envelope.tick,
+            gid=envelope.gid,
+            nid=envelope.nid,
+            layer="GOV",
+            mode="G",
+            payload_ref=envelope.payload_ref,
+            seq=self.seq_offset,
+            prev_chain=envelope.prev_chain,
+            sig="",
+            meta=decision.to_meta(),
         )
-        seq_offset += 1
+        self.seq_offset += 1
 
-    if logger and logger.enabled:
-        for decision in decisions:
-            logger.log(
+        if self.logger and self.logger.enabled:
+            self.logger.log(
                 "gate_governance_decision",
                 gid=governance.gid or "",
                 run_id=governance.run_id or "N/A",
                 payload=decision.to_meta(),
             )
+        return kept, governance_envelope, decision
+
+
+def apply_governance_to_envelopes(
+    envelopes: Sequence[NAPEnvelopeV1],
+    *,
+    governance: Optional[GovernanceConfigV1],
+    window_id: str,
+    profile: ProfileCMP0V1,
+    logger: Optional[StructuredLogger] = None,
+) -> Tuple[Tuple[NAPEnvelopeV1, ...], Tuple[NAPEnvelopeV1, ...], Tuple[GovernanceDecisionV1, ...]]:
+    """Apply Gate governance rules to outbound envelopes and emit GOV events.
+
+    The rules are intentionally minimal/deterministic for CMP-0:
+    - If governance is OFF/None, envelopes are returned unchanged and no GOV
+      envelopes are emitted.
+    - Allowed layers are drawn from governance.meta["allowed_layers"] when
+      provided; otherwise all CMP-0 layers are accepted.
+    - Optional governance.meta["max_envelopes_per_tick"] caps data envelopes
+      per tick. In ENFORCE mode, envelopes that exceed the cap are dropped;
+      in OBSERVE/DRY_RUN they are retained but logged as rejected.
+    - GOV decision envelopes are emitted with `layer="GOV"` / `mode="G"`
+      carrying structured decision metadata.
+    """
+
+    gov_filter = GateGovernanceFilter(
+        governance=governance,
+        window_id=window_id,
+        profile=profile,
+        seq_offset=(max((env.seq for env in envelopes), default=0)) + 1,
+        logger=logger,
+    )
+    if not gov_filter.active:
+        return tuple(envelopes), tuple(), tuple()
+
+    filtered: list[NAPEnvelopeV1] = []
+    governance_envelopes: list[NAPEnvelopeV1] = []
+    decisions: list[GovernanceDecisionV1] = []
+    for envelope in envelopes:
+        kept, governance_envelope, decision = gov_filter.apply(envelope)
+        if kept is not None:
+            filtered.append(kept)
+        governance_envelopes.append(governance_envelope)
+        decisions.append(decision)
 
     return tuple(filtered), tuple(governance_envelopes), tuple(decisions)
 
@@ -852,13 +1112,29 @@ class SessionRunResult:
 
 
 def run_session(
-    config: SessionConfigV1, *, logger: Optional[StructuredLogger] = None
+    config: SessionConfigV1,
+    *,
+    logger: Optional[StructuredLogger] = None,
+    checkpoints: Optional["TickLoopCheckpointConfig"] = None,
+    resume_from: Union["TickLoopCheckpointV1", str, Path, None] = None,
+    profiler: Optional[StageProfiler] = None,
 ) -> SessionRunResult:
-    """Run a CMP-0 session via Gate/TBP and TickLoop_v1."""
+    """Run a CMP-0 session via Gate/TBP and TickLoop_v1.
+
+    ``checkpoints`` and ``resume_from`` are passed to
+    :func:`core.tick_loop.run_cmp0_tick_loop`; a session resumed from a
+    checkpoint serialises exactly like the uninterrupted session.
+
+    ``profiler`` times the tick loop stages; one is created when the
+    metrics config sets ``profile_stages``. Its timings are added to the
+    metrics snapshot.
+    """
 
     from core.tick_loop import run_cmp0_tick_loop
 
     logger = logger or StructuredLogger(config.logging_config)
+    if profiler is None and config.metrics_config.profile_stages:
+        profiler = StageProfiler()
     logger.log(
         "run_start",
         gid=config.topo.gid,
@@ -871,7 +1147,7 @@ def run_session(
     )
 
     codex_ctx = None
-    if config.governance.codex_action_mode != "OFF":
+    if config.governance.codex_action_mode != "OFF" and config.artifact_profile.codex:
         from codex.context import CodexContext
 
         codex_ctx = CodexContext(
@@ -892,6 +1168,10 @@ def run_session(
         logger=logger,
         governance=config.governance,
         codex_ctx=codex_ctx,
+        artifact_profile=config.artifact_profile,
+        checkpoints=checkpoints,
+        resume_from=resume_from,
+        profiler=profiler,
     )
 
     lifecycle: List[NAPEnvelopeV1] = []
@@ -907,7 +1187,7 @@ def run_session(
         )
     )
 
-    final_chain = tick_result.p_blocks[-1].C_t if tick_result.p_blocks else config.profile.C0
+    final_chain = tick_result.final_chain
     payload_ref = tick_result.envelopes[-1].payload_ref if tick_result.envelopes else 0
     lifecycle.append(
         _build_ctrl_envelope(
@@ -938,6 +1218,7 @@ def run_session(
             config=config,
             tick_result=tick_result,
             lifecycle_envelopes=lifecycle,
+            stage_timings=profiler.to_dict() if profiler is not None else None,
         )
 
     return SessionRunResult(
@@ -954,6 +1235,7 @@ def _build_metrics_snapshot(
     config: SessionConfigV1,
     tick_result: "GF01RunResult",
     lifecycle_envelopes: Sequence[NAPEnvelopeV1],
+    stage_timings: Optional[Mapping[str, Mapping[str, int]]] = None,
 ) -> MetricsSnapshotV1:
     """Derive a deterministic metrics snapshot for a completed run."""
 
@@ -985,6 +1267,7 @@ def _build_metrics_snapshot(
         uledger_last_hash=last_hash,
         apx_manifests=len(tick_result.manifests),
         apxi_views=len(tick_result.apxi_views),
+        stage_timings=dict(stage_timings or {}),
     )
 
 
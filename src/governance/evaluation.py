@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, replace
-from typing import Dict, Sequence, Tuple, TYPE_CHECKING
+from typing import Callable, Dict, Mapping, Optional, Sequence, Tuple, TYPE_CHECKING
 
 from governance.config import BudgetPolicyV1, GovernanceConfigV1, TopologyPolicyV1
 
@@ -200,6 +200,21 @@ def _cap_policy_id(policies: Sequence[BudgetPolicyV1], attr: str, value: int | N
     return None
 
 
+ImpactEvaluator = Callable[[Sequence["CodexProposalV1"]], Sequence[Mapping[str, float]]]
+
+
+def _impact_scores(
+    impact_evaluator: Optional[ImpactEvaluator],
+    proposals: Sequence[CodexProposalV1],
+) -> Sequence[Mapping[str, float]]:
+    if impact_evaluator is None:
+        return [{} for _ in proposals]
+    scores = list(impact_evaluator(tuple(proposals)))
+    if len(scores) != len(proposals):
+        raise ValueError("impact_evaluator must return one score mapping per proposal")
+    return scores
+
+
 @dataclass(frozen=True)
 class GovernedActionQueue:
     """Outcome of the TBP governed decision loop for a window."""
@@ -217,8 +232,16 @@ def governed_decision_loop(
     config: GovernanceConfigV1,
     window_id: str,
     evaluated_at_tick: int | None = None,
+    impact_evaluator: Optional[ImpactEvaluator] = None,
 ) -> GovernedActionQueue:
-    """Evaluate proposals and build a governed action queue (P5.3)."""
+    """Evaluate proposals and build a governed action queue (P5.3).
+
+    ``impact_evaluator`` optionally scores proposals by simulated impact: it
+    is called once with every proposal inside the proposal cap (so it can
+    evaluate them as one batch, e.g. with :func:`umx.forking.evaluate_forks`)
+    and returns one score mapping per proposal. Those scores are merged into
+    each proposal's ``governance_scores``; policy checks are unchanged.
+    """
 
     mode = config.codex_action_mode
     dry_run_mode = mode == "DRY_RUN"
@@ -244,6 +267,8 @@ def governed_decision_loop(
 
     proposals_seen = 0
     topology_changes_applied = 0
+    in_cap = proposals if proposal_cap is None else proposals[:proposal_cap]
+    impact_scores = _impact_scores(impact_evaluator, in_cap)
 
     for idx, proposal in enumerate(proposals):
         proposals_seen += 1
@@ -266,6 +291,14 @@ def governed_decision_loop(
             continue
 
         evaluation = evaluate_proposal(proposal=proposal, config=config)
+        if impact_scores[idx]:
+            evaluation = replace(
+                evaluation,
+                scores={
+                    **evaluation.scores,
+                    **{name: float(value) for name, value in impact_scores[idx].items()},
+                },
+            )
         annotated = annotate_proposal(
             proposal=proposal, evaluation=evaluation, evaluated_at_tick=evaluated_at_tick
         )
@@ -8,10 +8,13 @@ from .loom import (
     compute_s_t,
     step,
 )
-from .run_context import LoomRunContext
+from .cycles import LoomCycleSpanV1
+from .run_context import LoomIBlockPolicyV1, LoomRunContext
 
 __all__ = [
     "FluxSummaryV1",
+    "LoomCycleSpanV1",
+    "LoomIBlockPolicyV1",
     "LoomIBlockV1",
     "LoomPBlockV1",
     "LoomRunContext",
@@ -7,14 +7,24 @@ master spec while keeping the implementation small and deterministic.
 """
 from __future__ import annotations
 
+import bisect
 import json
 import os
 import pathlib
 import hashlib
+import queue
 import struct
+import threading
+import time
 import zlib
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+from itertools import islice
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from umx.compiled_topology import CompiledTopologyV1
+from umx.forking import fork_history
 
 from .loom import LoomIBlockV1, LoomPBlockV1
 
@@ -59,12 +69,8 @@ def canonicalize_p_block(p_block: LoomPBlockV1, prev_hash: Optional[str]) -> Dic
     }
 
 
-def canonicalize_i_block(
-    i_block: LoomIBlockV1, merkle_root: str, prev_hash: Optional[str]
-) -> Dict:
-    """Return a deterministic mapping for an I-block including Merkle and prev hash."""
-
-    topo_snapshot = sorted(
+def _canonical_topology_snapshot(edges: Iterable) -> List[Dict]:
+    return sorted(
         (
             {
                 "e_id": edge.e_id,
@@ -75,11 +81,35 @@ def canonicalize_i_block(
                 "SC": edge.SC,
                 "c": edge.c,
             }
-            for edge in i_block.topology_snapshot
+            for edge in edges
         ),
         key=lambda item: item["e_id"],
     )
 
+
+def canonicalize_i_block(
+    i_block: LoomIBlockV1,
+    merkle_root: str,
+    prev_hash: Optional[str],
+    *,
+    compiled: Optional[CompiledTopologyV1] = None,
+) -> Dict:
+    """Return a deterministic mapping for an I-block including Merkle and prev hash.
+
+    When ``compiled`` is the compiled form of the topology the I-block was
+    snapshotted from, its canonical edge list is built once and reused for
+    every I-block of that topology version.
+    """
+
+    if compiled is None:
+        topo_snapshot = _canonical_topology_snapshot(i_block.topology_snapshot)
+    else:
+        cached = compiled.memo.get("loom_canonical_topology_snapshot")
+        if cached is None:
+            cached = _canonical_topology_snapshot(compiled.edges)
+            compiled.memo["loom_canonical_topology_snapshot"] = cached
+        topo_snapshot = list(cached)
+
     return {
         "gid": i_block.gid,
         "tick": i_block.tick,
@@ -94,22 +124,196 @@ def canonicalize_i_block(
     }
 
 
+_EMPTY_MERKLE_ROOT = hashlib.sha256(b"").hexdigest()
+
+
+def _merkle_node(left: bytes, right: bytes) -> bytes:
+    # Nodes hash the hex text of their children, matching roots already on record.
+    return hashlib.sha256((left.hex() + right.hex()).encode("ascii")).digest()
+
+
+class MerkleAccumulator:
+    """Fold leaf hashes into a Merkle root as they arrive.
+
+    Only the root of each complete subtree is kept, one per level, so memory
+    is O(log n) for ``n`` leaves. :meth:`root` equals :func:`merkle_root` of
+    the same leaves, which pairs an odd node at any level with itself.
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self._peaks: List[Optional[bytes]] = []
+
+    def append(self, leaf: str) -> None:
+        node = bytes.fromhex(leaf)
+        level = 0
+        while level < len(self._peaks) and self._peaks[level] is not None:
+            node = _merkle_node(self._peaks[level], node)
+            self._peaks[level] = None
+            level += 1
+        if level == len(self._peaks):
+            self._peaks.append(node)
+        else:
+            self._peaks[level] = node
+        self.count += 1
+
+    def root(self) -> str:
+        if not self.count:
+            return _EMPTY_MERKLE_ROOT
+        count = self.count
+        level = (count & -count).bit_length() - 1
+        node = self._peaks[level]
+        while count != 1 << level:
+            # ``node`` is the last, unpaired node of its level.
+            node = _merkle_node(node, node)
+            count += 1 << level
+            level += 1
+            while not count & (1 << level):
+                node = _merkle_node(self._peaks[level], node)
+                level += 1
+        return node.hex()
+
+    def copy(self) -> "MerkleAccumulator":
+        clone = MerkleAccumulator()
+        clone.count = self.count
+        clone._peaks = list(self._peaks)
+        return clone
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "count": self.count,
+            "peaks": [peak.hex() if peak is not None else None for peak in self._peaks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> "MerkleAccumulator":
+        accumulator = cls()
+        accumulator.count = int(data["count"])
+        accumulator._peaks = [
+            bytes.fromhex(peak) if peak is not None else None for peak in data["peaks"]
+        ]
+        return accumulator
+
+
 def merkle_root(leaves: Iterable[str]) -> str:
     """Compute a simple SHA-256 Merkle root from an iterable of leaf hashes."""
 
-    layer = [leaf for leaf in leaves]
-    if not layer:
-        return hashlib.sha256(b"").hexdigest()
+    accumulator = MerkleAccumulator()
+    for leaf in leaves:
+        accumulator.append(leaf)
+    return accumulator.root()
+
+
+def merkle_proof(leaves: Sequence[str], index: int) -> Tuple[str, ...]:
+    """Return the sibling hashes proving ``leaves[index]``, leaf level first.
 
+    Levels where the node is paired with itself contribute no sibling.
+    """
+
+    layer = [bytes.fromhex(leaf) for leaf in leaves]
+    if not 0 <= index < len(layer):
+        raise ValueError("leaf index out of range")
+    siblings: List[str] = []
     while len(layer) > 1:
-        next_layer: List[str] = []
-        for idx in range(0, len(layer), 2):
-            left = layer[idx]
-            right = layer[idx + 1] if idx + 1 < len(layer) else layer[idx]
-            joined = (left + right).encode("utf-8")
-            next_layer.append(hashlib.sha256(joined).hexdigest())
-        layer = next_layer
-    return layer[0]
+        if index ^ 1 < len(layer):
+            siblings.append(layer[index ^ 1].hex())
+        if len(layer) % 2:
+            layer.append(layer[-1])
+        layer = [_merkle_node(layer[i], layer[i + 1]) for i in range(0, len(layer), 2)]
+        index //= 2
+    return tuple(siblings)
+
+
+def verify_merkle_proof(
+    leaf: str, index: int, count: int, siblings: Sequence[str], root: str
+) -> bool:
+    """Check that ``leaf`` sits at ``index`` of ``count`` leaves under ``root``."""
+
+    if not 0 <= index < count:
+        return False
+    remaining = iter(siblings)
+    try:
+        node = bytes.fromhex(leaf)
+        while count > 1:
+            if index % 2:
+                node = _merkle_node(bytes.fromhex(next(remaining)), node)
+            elif index + 1 < count:
+                node = _merkle_node(node, bytes.fromhex(next(remaining)))
+            else:
+                node = _merkle_node(node, node)
+            index //= 2
+            count = (count + 1) // 2
+    except (StopIteration, ValueError):
+        return False
+    return next(remaining, None) is None and node.hex() == root
+
+
+@dataclass(frozen=True)
+class LoomInclusionProofV1:
+    """Proof that the P-block hash of ``tick`` is in an I-block's Merkle window.
+
+    ``index`` is the P-block's position among the ``count`` window hashes
+    under ``merkle_root``, the root recorded by the I-block at
+    ``i_block_tick``.
+    """
+
+    tick: int
+    p_hash: str
+    i_block_tick: int
+    merkle_root: str
+    index: int
+    count: int
+    siblings: Tuple[str, ...]
+
+    def verify(self) -> bool:
+        return verify_merkle_proof(
+            self.p_hash, self.index, self.count, self.siblings, self.merkle_root
+        )
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "tick": self.tick,
+            "p_hash": self.p_hash,
+            "i_block_tick": self.i_block_tick,
+            "merkle_root": self.merkle_root,
+            "index": self.index,
+            "count": self.count,
+            "siblings": list(self.siblings),
+        }
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, object]) -> "LoomInclusionProofV1":
+        return cls(
+            tick=int(data["tick"]),
+            p_hash=str(data["p_hash"]),
+            i_block_tick=int(data["i_block_tick"]),
+            merkle_root=str(data["merkle_root"]),
+            index=int(data["index"]),
+            count=int(data["count"]),
+            siblings=tuple(str(sibling) for sibling in data["siblings"]),
+        )
+
+
+def _inclusion_proof(
+    tick: int, i_block_tick: int, root: str, first_tick: int, leaves: Sequence[str]
+) -> Optional[LoomInclusionProofV1]:
+    """Build a proof for ``tick`` from window ``leaves`` starting at ``first_tick``.
+
+    Returns None when the leaves do not reproduce ``root``, i.e. the I-block
+    was recorded with explicit window hashes.
+    """
+
+    index = tick - first_tick
+    proof = LoomInclusionProofV1(
+        tick=tick,
+        p_hash=leaves[index],
+        i_block_tick=i_block_tick,
+        merkle_root=root,
+        index=index,
+        count=len(leaves),
+        siblings=merkle_proof(leaves, index),
+    )
+    return proof if proof.verify() else None
 
 
 MAGIC = b"LMB1"
@@ -217,201 +421,919 @@ class LoomChainState:
 
 
 class LoomChainRecorder:
-    """Track P-/I-block hashes and optional persistence for replay/rollback."""
+    """Track P-/I-block hashes and optional persistence for replay/rollback.
 
-    def __init__(self, store: Optional["LoomBlockStore"] = None):
+    ``history_limit`` bounds how many P-block hashes and I-block roots are
+    kept in memory; ``height`` still counts every recorded P-block. P-block
+    hashes are also folded into a :class:`MerkleAccumulator` as they arrive,
+    so an I-block whose window is exactly the P-blocks recorded since the
+    previous one takes its root from there.
+    """
+
+    def __init__(
+        self, store: Optional["LoomBlockStore"] = None, history_limit: Optional[int] = None
+    ):
+        if history_limit is not None and history_limit <= 0:
+            raise ValueError("history_limit must be a positive integer when provided")
         self.store = store
-        self.p_hashes: List[str] = []
+        self.history_limit = history_limit
+        self.p_hashes: Sequence[str] = [] if history_limit is None else deque(maxlen=history_limit)
         self.i_blocks: Dict[int, str] = {}
+        self.height = 0
         self._prev_hash: Optional[str] = None
+        self._tip_tick: Optional[int] = None
+        self._window = MerkleAccumulator()
+        self._window_sizes: Dict[int, int] = {}
+
+    def limit_history(self, history_limit: int) -> None:
+        """Keep only the most recent ``history_limit`` P-block hashes from now on.
+
+        I-block Merkle roots need the last ``W`` hashes, so callers should
+        keep at least that many.
+        """
+
+        if history_limit <= 0:
+            raise ValueError("history_limit must be a positive integer")
+        self.history_limit = history_limit
+        self.p_hashes = deque(self.p_hashes, maxlen=history_limit)
+        self._trim_i_blocks()
+
+    def _trim_i_blocks(self) -> None:
+        if self.history_limit is not None:
+            while len(self.i_blocks) > self.history_limit:
+                oldest = next(iter(self.i_blocks))
+                del self.i_blocks[oldest]
+                self._window_sizes.pop(oldest, None)
+
+    def recent_p_hashes(self, count: int) -> List[str]:
+        """Return the last ``count`` recorded P-block hashes, oldest first."""
+
+        return self._recent_p_hashes(count)
+
+    def _recent_p_hashes(self, count: int) -> List[str]:
+        p_hashes = self.p_hashes
+        if isinstance(p_hashes, deque):
+            return list(islice(p_hashes, max(len(p_hashes) - count, 0), None))
+        return list(p_hashes[-count:])
+
+    def fork(self, store: Optional["LoomBlockStore"] = None) -> "LoomChainRecorder":
+        """Return a recorder continuing from this chain tip.
+
+        The P-block hash history is shared copy-on-write and the (sparse)
+        I-block roots are copied. The fork persists to ``store`` only, so a
+        what-if branch never writes into the parent's block store.
+        """
+
+        child = LoomChainRecorder(store=store)
+        child.history_limit = self.history_limit
+        child.p_hashes = fork_history(self.p_hashes)
+        child.i_blocks = dict(self.i_blocks)
+        child.height = self.height
+        child._prev_hash = self._prev_hash
+        child._tip_tick = self._tip_tick
+        child._window = self._window.copy()
+        child._window_sizes = dict(self._window_sizes)
+        return child
+
+    def snapshot(self) -> Dict[str, object]:
+        """Return the chain tip as JSON-ready data for run checkpoints.
+
+        Only the retained P-block hashes and I-block roots are included, so
+        bound the history (see :meth:`limit_history`) for long runs.
+        """
+
+        return {
+            "height": self.height,
+            "tip_hash": self._prev_hash,
+            "tip_tick": self._tip_tick,
+            "p_hashes": list(self.p_hashes),
+            "i_blocks": [
+                [tick, root, self._window_sizes.get(tick)] for tick, root in self.i_blocks.items()
+            ],
+            "merkle_window": self._window.to_dict(),
+        }
+
+    def restore(self, snapshot: Mapping[str, object]) -> None:
+        """Continue the chain from a :meth:`snapshot` taken by an earlier run."""
+
+        self.height = int(snapshot["height"])
+        self._prev_hash = snapshot["tip_hash"]
+        p_hashes = [str(p_hash) for p_hash in snapshot["p_hashes"]]
+        self.p_hashes = (
+            p_hashes if self.history_limit is None else deque(p_hashes, maxlen=self.history_limit)
+        )
+        self.i_blocks = {int(entry[0]): str(entry[1]) for entry in snapshot["i_blocks"]}
+        self._window_sizes = {
+            int(entry[0]): int(entry[2])
+            for entry in snapshot["i_blocks"]
+            if len(entry) > 2 and entry[2] is not None
+        }
+        self._tip_tick = snapshot.get("tip_tick")
+        window = snapshot.get("merkle_window")
+        # Without a saved accumulator the next I-block rebuilds its root from the hashes.
+        self._window = (
+            MerkleAccumulator.from_dict(window) if window is not None else MerkleAccumulator()
+        )
+        self._trim_i_blocks()
 
     def record_p_block(self, p_block: LoomPBlockV1) -> str:
         canonical = canonicalize_p_block(p_block, prev_hash=self._prev_hash)
         p_hash = _hash_payload(canonical)
         self.p_hashes.append(p_hash)
+        self.height += 1
         self._prev_hash = p_hash
+        self._tip_tick = p_block.tick
+        self._window.append(p_hash)
         if self.store:
             self.store.write_p_block(p_block, canonical, p_hash)
         return p_hash
 
-    def record_i_block(self, i_block: LoomIBlockV1, window_hashes: Iterable[str]) -> str:
-        root = merkle_root(list(window_hashes))
-        canonical = canonicalize_i_block(i_block, merkle_root=root, prev_hash=self._prev_hash)
+    def record_i_block(
+        self,
+        i_block: LoomIBlockV1,
+        window_hashes: Optional[Iterable[str]] = None,
+        compiled: Optional[CompiledTopologyV1] = None,
+    ) -> str:
+        """Record an I-block; ``window_hashes`` defaults to the last ``W`` P-block hashes."""
+
+        if window_hashes is not None:
+            window_hashes = list(window_hashes)
+            root = merkle_root(window_hashes)
+            size = len(window_hashes)
+        else:
+            # The accumulator holds the last ``count`` hashes, usually exactly the window.
+            size = min(i_block.W, len(self.p_hashes))
+            if self._window.count == size:
+                root = self._window.root()
+            else:
+                root = merkle_root(self._recent_p_hashes(size))
+        self._window = MerkleAccumulator()
+        canonical = canonicalize_i_block(
+            i_block, merkle_root=root, prev_hash=self._prev_hash, compiled=compiled
+        )
         i_hash = _hash_payload(canonical)
         self.i_blocks[i_block.tick] = root
+        self._window_sizes[i_block.tick] = size
+        self._trim_i_blocks()
         if self.store:
             self.store.write_i_block(i_block, canonical, i_hash)
         self._prev_hash = i_hash
         return root
 
+    def inclusion_proof(self, tick: int) -> LoomInclusionProofV1:
+        """Prove that the P-block recorded at ``tick`` is in its I-block's Merkle window.
+
+        The window's P-block hashes must still be retained (see
+        :meth:`limit_history`); P-blocks are assumed to carry consecutive
+        ticks, as :class:`LoomRunContext` records them.
+        """
+
+        for i_tick in sorted(self.i_blocks):
+            size = self._window_sizes.get(i_tick)
+            if size and i_tick - size < tick <= i_tick:
+                break
+        else:
+            raise ValueError(f"No recorded I-block covers tick {tick}")
+        end = len(self.p_hashes) - (self._tip_tick - i_tick)
+        if end - size < 0:
+            raise ValueError(f"P-block hashes for tick {tick} are no longer retained")
+        leaves = list(islice(self.p_hashes, end - size, end))
+        proof = _inclusion_proof(tick, i_tick, self.i_blocks[i_tick], i_tick - size + 1, leaves)
+        if proof is None:
+            raise ValueError(f"I-block {i_tick} was not built from the recorded P-block hashes")
+        return proof
+
     def chain_state(self) -> LoomChainState:
         return LoomChainState(
-            height=len(self.p_hashes),
+            height=self.height,
             tip_hash=self._prev_hash,
             latest_merkle_root=self.i_blocks[max(self.i_blocks.keys())] if self.i_blocks else None,
             latest_iblock_tick=max(self.i_blocks.keys()) if self.i_blocks else None,
         )
 
 
+class BackgroundChainRecorder(LoomChainRecorder):
+    """Chain recorder that hashes and persists blocks on a worker thread.
+
+    :meth:`record_p_block` and :meth:`record_i_block` queue their work on a
+    single thread, in call order, and return a ``Future`` of the hash/root
+    instead of waiting for it. The chain only depends on the previous block
+    hash, so the result is identical to a :class:`LoomChainRecorder`. Every
+    other method waits for queued work first; read ``p_hashes``/``i_blocks``
+    only after :meth:`flush`. Call :meth:`close` to stop the worker.
+
+    The first exception raised by any queued call is re-raised by
+    :meth:`flush`, :meth:`close` and every waiting method, and the recorder
+    accepts no further blocks afterwards.
+    """
+
+    def __init__(
+        self, store: Optional["LoomBlockStore"] = None, history_limit: Optional[int] = None
+    ):
+        super().__init__(store=store, history_limit=history_limit)
+        self._lane = ThreadPoolExecutor(max_workers=1, thread_name_prefix="loom-chain")
+        self._pending: Optional[Future] = None
+        self._error: Optional[BaseException] = None
+
+    def _record_failure(self, future: Future) -> None:
+        if self._error is None and not future.cancelled():
+            self._error = future.exception()
+
+    def _raise_failure(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def _submit(self, fn, *args, **kwargs) -> Future:
+        self._raise_failure()
+        self._pending = self._lane.submit(self._guarded, fn, *args, **kwargs)
+        self._pending.add_done_callback(self._record_failure)
+        return self._pending
+
+    def _guarded(self, fn, *args, **kwargs):
+        # Work queued behind a failure must not extend the chain past the gap.
+        self._raise_failure()
+        return fn(*args, **kwargs)
+
+    def flush(self) -> None:
+        """Wait until every queued block has been hashed and recorded."""
+
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            try:
+                pending.result()
+            except BaseException as exc:  # done callbacks may not have run yet
+                if self._error is None:
+                    self._error = exc
+        self._raise_failure()
+
+    def close(self) -> None:
+        """Flush queued work and stop the worker thread."""
+
+        try:
+            self.flush()
+        finally:
+            self._lane.shutdown(wait=True)
+
+    def record_p_block(self, p_block: LoomPBlockV1) -> Future:  # type: ignore[override]
+        return self._submit(super().record_p_block, p_block)
+
+    def record_i_block(  # type: ignore[override]
+        self,
+        i_block: LoomIBlockV1,
+        window_hashes: Optional[Iterable[str]] = None,
+        compiled: Optional[CompiledTopologyV1] = None,
+    ) -> Future:
+        if window_hashes is not None:
+            window_hashes = list(window_hashes)
+        return self._submit(super().record_i_block, i_block, window_hashes, compiled)
+
+    def limit_history(self, history_limit: int) -> None:
+        self.flush()
+        super().limit_history(history_limit)
+
+    def recent_p_hashes(self, count: int) -> List[str]:
+        self.flush()
+        return super().recent_p_hashes(count)
+
+    def fork(self, store: Optional["LoomBlockStore"] = None) -> LoomChainRecorder:
+        self.flush()
+        return super().fork(store)
+
+    def inclusion_proof(self, tick: int) -> LoomInclusionProofV1:
+        self.flush()
+        return super().inclusion_proof(tick)
+
+    def chain_state(self) -> LoomChainState:
+        self.flush()
+        return super().chain_state()
+
+    def snapshot(self) -> Dict[str, object]:
+        self.flush()
+        return super().snapshot()
+
+    def restore(self, snapshot: Mapping[str, object]) -> None:
+        self.flush()
+        super().restore(snapshot)
+
+
+_SEGMENT_RECORD = struct.Struct(">qQI32s32s32s")
+_STORE_MARKER = "store.json"
+_STORE_FORMAT = {"format": "loom-segments", "v": 2}
+DEFAULT_SEGMENT_BLOCKS = 4096
+
+
+@dataclass
+class _Segment:
+    number: int
+    data_path: pathlib.Path
+    index_path: pathlib.Path
+    count: int = 0
+    size: int = 0
+    first_tick: int = 0
+    last_tick: int = 0
+
+
+class _SegmentLog:
+    """Append-only log of one block type split into rolling segment files.
+
+    Each segment is a data file of concatenated binary envelopes plus an
+    index file of fixed-width ``(tick, offset, length, hash, bin_hash,
+    bin_envelope_hash)`` records in tick order. Only the first and last
+    record of every segment are read when the log is opened, after cutting
+    any torn tail left by an interrupted write back to the last complete
+    record.
+    """
+
+    def __init__(self, directory: pathlib.Path, segment_blocks: int, fsync: bool = False) -> None:
+        self.directory = directory
+        self.segment_blocks = segment_blocks
+        self.fsync = fsync
+        self.segments: List[_Segment] = []
+        self.first_ticks: List[int] = []
+        self.floor_tick: Optional[int] = None
+        for index_path in sorted(directory.glob("seg_*.idx")):
+            segment = _Segment(
+                number=int(index_path.stem[4:]),
+                data_path=index_path.with_suffix(".bin"),
+                index_path=index_path,
+            )
+            self._repair(segment)
+            if not segment.count:
+                self._remove(segment)
+                continue
+            segment.first_tick = self._record(segment, 0)[0]
+            segment.last_tick = self._record(segment, segment.count - 1)[0]
+            self.segments.append(segment)
+            self.first_ticks.append(segment.first_tick)
+
+    def _repair(self, segment: _Segment) -> None:
+        """Set ``count``/``size`` from the complete records and drop any torn tail."""
+
+        index_size = segment.index_path.stat().st_size
+        data_size = segment.data_path.stat().st_size if segment.data_path.exists() else 0
+        count = index_size // _SEGMENT_RECORD.size
+        end = 0
+        while count:
+            _, offset, length = self._record(segment, count - 1)[:3]
+            end = offset + length
+            if end <= data_size:
+                break
+            count -= 1
+            end = 0
+        if count * _SEGMENT_RECORD.size != index_size:
+            with segment.index_path.open("r+b") as handle:
+                handle.truncate(count * _SEGMENT_RECORD.size)
+        if count and end != data_size:
+            with segment.data_path.open("r+b") as handle:
+                handle.truncate(end)
+        segment.count = count
+        segment.size = end
+
+    @staticmethod
+    def _record(segment: _Segment, position: int) -> Tuple:
+        with segment.index_path.open("rb") as handle:
+            handle.seek(position * _SEGMENT_RECORD.size)
+            return _SEGMENT_RECORD.unpack(handle.read(_SEGMENT_RECORD.size))
+
+    @staticmethod
+    def _remove(segment: _Segment) -> None:
+        for path in (segment.index_path, segment.data_path):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def clear(self) -> None:
+        for segment in self.segments:
+            self._remove(segment)
+        self.segments.clear()
+        self.first_ticks.clear()
+        self.floor_tick = None
+
+    def append(self, tick: int, blob: bytes, block_hash: str) -> None:
+        self.extend([(tick, blob, block_hash)])
+
+    def extend(self, blocks: Iterable[Tuple[int, bytes, str]]) -> None:
+        """Append ``(tick, blob, hash)`` blocks with one write per touched segment file."""
+
+        segment: Optional[_Segment] = None
+        data: List[bytes] = []
+        records: List[bytes] = []
+        for tick, blob, block_hash in blocks:
+            if self.segments and tick <= self.segments[-1].last_tick:
+                self._write(segment, data, records)
+                data, records = [], []
+                self.truncate_after(tick - 1)
+            tail = self._tail(tick)
+            if tail is not segment:
+                self._write(segment, data, records)
+                data, records = [], []
+                segment = tail
+            records.append(
+                _SEGMENT_RECORD.pack(
+                    tick,
+                    tail.size,
+                    len(blob),
+                    bytes.fromhex(block_hash),
+                    hashlib.sha256(_payload_from_blob(blob)).digest(),
+                    hashlib.sha256(blob).digest(),
+                )
+            )
+            data.append(blob)
+            tail.count += 1
+            tail.size += len(blob)
+            tail.last_tick = tick
+        self._write(segment, data, records)
+
+    def _tail(self, tick: int) -> _Segment:
+        segment = self.segments[-1] if self.segments else None
+        if segment is None or segment.count >= self.segment_blocks:
+            number = segment.number + 1 if segment is not None else 1
+            segment = _Segment(
+                number=number,
+                data_path=self.directory / f"seg_{number:012d}.bin",
+                index_path=self.directory / f"seg_{number:012d}.idx",
+                first_tick=tick,
+            )
+            self.segments.append(segment)
+            self.first_ticks.append(tick)
+        return segment
+
+    def _write(self, segment: Optional[_Segment], data: List[bytes], records: List[bytes]) -> None:
+        if segment is None or not records:
+            return
+        for path, chunks in ((segment.data_path, data), (segment.index_path, records)):
+            with path.open("ab") as handle:
+                handle.write(b"".join(chunks))
+                if self.fsync:
+                    handle.flush()
+                    os.fsync(handle.fileno())
+
+    def prune(self, window: int) -> None:
+        """Keep the newest ``window`` records visible, deleting whole segments only."""
+
+        total = sum(segment.count for segment in self.segments)
+        while self.segments and total - self.segments[0].count >= window:
+            total -= self.segments[0].count
+            self._remove(self.segments.pop(0))
+            self.first_ticks.pop(0)
+        hidden = total - window
+        self.floor_tick = self._record(self.segments[0], hidden)[0] if hidden > 0 else None
+
+    def truncate_after(self, tick: int) -> None:
+        while self.segments and self.segments[-1].first_tick > tick:
+            self._remove(self.segments.pop())
+            self.first_ticks.pop()
+        if not self.segments or self.segments[-1].last_tick <= tick:
+            return
+        segment = self.segments[-1]
+        position = self._search(segment, tick + 1)
+        offset = self._record(segment, position)[1]
+        with segment.index_path.open("r+b") as handle:
+            handle.truncate(position * _SEGMENT_RECORD.size)
+        with segment.data_path.open("r+b") as handle:
+            handle.truncate(offset)
+        segment.count = position
+        segment.size = offset
+        segment.last_tick = self._record(segment, position - 1)[0]
+
+    def _search(self, segment: _Segment, tick: int) -> int:
+        """Position of the first record with a tick ``>= tick`` in ``segment``."""
+
+        low, high = 0, segment.count
+        while low < high:
+            middle = (low + high) // 2
+            if self._record(segment, middle)[0] < tick:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def lookup(self, tick: int) -> Optional[Dict]:
+        if self.floor_tick is not None and tick < self.floor_tick:
+            return None
+        position = bisect.bisect_right(self.first_ticks, tick)
+        if not position:
+            return None
+        segment = self.segments[position - 1]
+        if tick > segment.last_tick:
+            return None
+        # Ticks are usually evenly spaced, so interpolating finds the record directly.
+        span = segment.last_tick - segment.first_tick
+        guess = (tick - segment.first_tick) * (segment.count - 1) // span if span else 0
+        record = self._record(segment, guess)
+        if record[0] != tick:
+            guess = self._search(segment, tick)
+            if guess >= segment.count:
+                return None
+            record = self._record(segment, guess)
+            if record[0] != tick:
+                return None
+        return self._entry(segment, record)
+
+    def ceiling(self, tick: int) -> Optional[int]:
+        """Return the first visible tick at or after ``tick``, if any."""
+
+        if self.floor_tick is not None:
+            tick = max(tick, self.floor_tick)
+        for segment in self.segments[max(bisect.bisect_right(self.first_ticks, tick) - 1, 0) :]:
+            if tick <= segment.last_tick:
+                return self._record(segment, self._search(segment, tick))[0]
+        return None
+
+    def entries(self) -> List[Dict]:
+        entries = []
+        for segment in self.segments:
+            raw = segment.index_path.read_bytes()
+            for record in _SEGMENT_RECORD.iter_unpack(raw[: segment.count * _SEGMENT_RECORD.size]):
+                if self.floor_tick is None or record[0] >= self.floor_tick:
+                    entries.append(self._entry(segment, record))
+        return entries
+
+    @staticmethod
+    def _entry(segment: _Segment, record: Tuple) -> Dict:
+        tick, offset, length, block_hash, bin_hash, envelope_hash = record
+        return {
+            "tick": tick,
+            "hash": block_hash.hex(),
+            "path": str(segment.data_path),
+            "bin_path": str(segment.data_path),
+            "offset": offset,
+            "bin_hash": bin_hash.hex(),
+            "bin_envelope_hash": envelope_hash.hex(),
+            "bin_size": length,
+        }
+
+
+@dataclass(frozen=True)
+class LoomWriteBehindConfig:
+    """Durability policy for a write-behind :class:`LoomBlockStore`.
+
+    Writes are queued (at most ``queue_blocks`` blocks, after which writers
+    wait) and a background thread encodes and appends them in group commits
+    of up to ``batch_blocks`` blocks. A commit is also due once the queued
+    blocks span ``flush_ticks`` ticks, once the oldest has waited
+    ``flush_ms`` milliseconds, or, with ``flush_on_window_close``, when the
+    tick loop closes a Press window. ``fsync`` syncs segment files on every
+    commit.
+    """
+
+    batch_blocks: int = 256
+    queue_blocks: int = 4096
+    flush_ticks: Optional[int] = None
+    flush_ms: Optional[float] = None
+    flush_on_window_close: bool = False
+    fsync: bool = False
+
+    def __post_init__(self) -> None:
+        if self.batch_blocks <= 0:
+            raise ValueError("batch_blocks must be a positive integer")
+        if self.queue_blocks <= 0:
+            raise ValueError("queue_blocks must be a positive integer")
+        if self.flush_ticks is not None and self.flush_ticks <= 0:
+            raise ValueError("flush_ticks must be a positive integer when provided")
+        if self.flush_ms is not None and self.flush_ms <= 0:
+            raise ValueError("flush_ms must be positive when provided")
+
+
+_COMMIT = object()
+_STOP = object()
+
+
 class LoomBlockStore:
-    """Persist Loom blocks to disk with a simple JSON index and rollback pruning."""
+    """Persist Loom blocks to append-only segment files with rollback pruning.
+
+    P- and I-blocks are appended as binary envelopes to rolling segment files
+    of ``segment_blocks`` blocks each, indexed by fixed-width binary records,
+    so a write costs O(1) I/O and a lookup O(1) reads for evenly spaced
+    ticks. ``rollback_window`` keeps the newest blocks visible; older blocks
+    are hidden at once and deleted a whole segment at a time. Writing a tick
+    at or before the newest stored tick replaces it and everything after it.
+
+    Stores written in the earlier JSON-index layout (``index.json`` plus one
+    file per block) stay readable; the first write migrates them in place
+    (see :func:`migrate_loom_block_store`).
+
+    With ``write_behind`` set, writes only queue the block and return; a
+    background thread encodes and commits them in batches (see
+    :class:`LoomWriteBehindConfig`). Reads wait for queued blocks first.
+    :meth:`flush` waits until everything queued is on disk, :meth:`close`
+    also stops the thread, and both re-raise a failed write. After a failure
+    the store accepts no further writes.
+    """
 
-    def __init__(self, root: pathlib.Path, rollback_window: Optional[int] = None):
+    def __init__(
+        self,
+        root: pathlib.Path,
+        rollback_window: Optional[int] = None,
+        *,
+        segment_blocks: int = DEFAULT_SEGMENT_BLOCKS,
+        write_behind: Optional[LoomWriteBehindConfig] = None,
+    ):
+        if segment_blocks <= 0:
+            raise ValueError("segment_blocks must be a positive integer")
         self.root = pathlib.Path(root)
         self.rollback_window = rollback_window
+        self.segment_blocks = segment_blocks
+        self.write_behind = write_behind
         self.p_dir = self.root / "pblocks"
         self.i_dir = self.root / "iblocks"
-        self.index_path = self.root / "index.json"
         self.root.mkdir(parents=True, exist_ok=True)
         self.p_dir.mkdir(exist_ok=True)
         self.i_dir.mkdir(exist_ok=True)
-        if not self.index_path.exists():
-            self.index_path.write_text(_stable_dumps({"p": [], "i": []}))
-
-    def _load_index(self) -> Dict[str, List[Dict]]:
-        return json.loads(self.index_path.read_text())
-
-    def _write_index(self, data: Dict[str, List[Dict]]) -> None:
-        self.index_path.write_text(_stable_dumps(data))
+        self._legacy_index_path = self.root / "index.json"
+        self._legacy: Optional[Dict[str, Dict[int, Dict]]] = None
+        marker = self.root / _STORE_MARKER
+        if not marker.exists():
+            if self._legacy_index_path.exists():
+                self._legacy = _load_legacy_index(self._legacy_index_path)
+            else:
+                marker.write_text(_stable_dumps(_STORE_FORMAT))
+        fsync = write_behind is not None and write_behind.fsync
+        self._logs = {
+            "p": _SegmentLog(self.p_dir, segment_blocks, fsync),
+            "i": _SegmentLog(self.i_dir, segment_blocks, fsync),
+        }
+        if rollback_window is not None:
+            for log in self._logs.values():
+                log.prune(rollback_window)
+        self._lock = threading.Lock()
+        self._error: Optional[BaseException] = None
+        self._queue: Optional[queue.Queue] = None
+        self._writer: Optional[threading.Thread] = None
+        if write_behind is not None:
+            self._queue = queue.Queue(maxsize=write_behind.queue_blocks)
+            self._writer = threading.Thread(
+                target=self._write_behind, name="loom-store-writer", daemon=True
+            )
+            self._writer.start()
+
+    @property
+    def is_legacy(self) -> bool:
+        """True while the store still uses the JSON-index layout."""
+
+        return self._legacy is not None
+
+    def _commit(self, blocks: Sequence[Tuple[str, int, Mapping, str]]) -> None:
+        if self._legacy is not None:
+            _migrate_legacy_store(self)
+        for key, encode in (("p", encode_p_block_binary), ("i", encode_i_block_binary)):
+            items = [
+                (tick, encode(canonical), block_hash)
+                for block_key, tick, canonical, block_hash in blocks
+                if block_key == key
+            ]
+            if items:
+                log = self._logs[key]
+                log.extend(items)
+                if self.rollback_window is not None:
+                    log.prune(self.rollback_window)
+
+    def _write(self, key: str, tick: int, canonical: Mapping, block_hash: str) -> None:
+        if self._queue is None:
+            with self._lock:
+                self._commit([(key, tick, canonical, block_hash)])
+            return
+        self._raise_write_error()
+        if not self._writer.is_alive():
+            raise ValueError("LoomBlockStore writer is closed")
+        self._queue.put((key, tick, canonical, block_hash))
+
+    def _write_behind(self) -> None:
+        config = self.write_behind
+        batch: List[Tuple[str, int, Mapping, str]] = []
+        deadline: Optional[float] = None
+        while True:
+            try:
+                timeout = None if deadline is None else max(deadline - time.monotonic(), 0.0)
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _COMMIT
+            if isinstance(item, tuple):
+                batch.append(item)
+                if deadline is None and config.flush_ms is not None:
+                    deadline = time.monotonic() + config.flush_ms / 1000
+                if len(batch) < config.batch_blocks and (
+                    config.flush_ticks is None or item[1] - batch[0][1] < config.flush_ticks - 1
+                ):
+                    continue
+            if batch and self._error is None:
+                try:
+                    with self._lock:
+                        self._commit(batch)
+                except BaseException as exc:  # surfaced by the next write/flush/close
+                    self._error = exc
+            batch, deadline = [], None
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is _STOP:
+                return
+
+    def _raise_write_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
+    def commit(self) -> None:
+        """Ask the write-behind thread to commit queued blocks now, without waiting."""
+
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_COMMIT)
+
+    def flush(self) -> None:
+        """Wait until every queued block is written; re-raise a failed write."""
+
+        if self._writer is not None and self._writer.is_alive():
+            done = threading.Event()
+            self._queue.put(done)
+            done.wait()
+        self._raise_write_error()
+
+    def close(self) -> None:
+        """Flush queued blocks and stop the write-behind thread."""
+
+        if self._writer is not None and self._writer.is_alive():
+            self._queue.put(_STOP)
+            self._writer.join()
+        self._raise_write_error()
 
     def write_p_block(self, p_block: LoomPBlockV1, canonical: Mapping, p_hash: str) -> None:
-        json_path = self.p_dir / f"tick_{p_block.tick}.json"
-        bin_path = self.p_dir / f"tick_{p_block.tick}.bin"
-
-        payload = {
-            "type": "P",
-            "hash": p_hash,
-            "block": canonical,
-        }
-        json_path.write_text(_stable_dumps(payload))
-
-        bin_blob = encode_p_block_binary(canonical)
-        bin_path.write_bytes(bin_blob)
-        payload_hash = _hash_bytes(_payload_from_blob(bin_blob))
-        envelope_hash = _hash_bytes(bin_blob)
-
-        index = self._load_index()
-        index_entry = {
-            "tick": p_block.tick,
-            "hash": p_hash,
-            "path": str(json_path),
-            "bin_path": str(bin_path),
-            "bin_hash": payload_hash,
-            "bin_envelope_hash": envelope_hash,
-            "bin_size": len(bin_blob),
-        }
-        index["p"].append(index_entry)
-        index["p"] = sorted(index["p"], key=lambda item: item["tick"])
-        index["p"] = self._prune(index["p"], self.rollback_window)
-        self._write_index(index)
+        self._write("p", p_block.tick, canonical, p_hash)
 
     def write_i_block(self, i_block: LoomIBlockV1, canonical: Mapping, i_hash: str) -> None:
-        json_path = self.i_dir / f"tick_{i_block.tick}.json"
-        bin_path = self.i_dir / f"tick_{i_block.tick}.bin"
+        self._write("i", i_block.tick, canonical, i_hash)
+
+    def truncate_after(self, tick: int) -> None:
+        """Drop blocks recorded after ``tick``, e.g. before resuming a run there."""
+
+        self.flush()
+        with self._lock:
+            if self._legacy is not None:
+                _migrate_legacy_store(self)
+            for log in self._logs.values():
+                log.truncate_after(tick)
+
+    def _entry(self, key: str, tick: int) -> Optional[Dict]:
+        self.flush()
+        return self._lookup(key, tick)
+
+    def _lookup(self, key: str, tick: int) -> Optional[Dict]:
+        if self._legacy is not None:
+            return self._legacy[key].get(tick)
+        with self._lock:
+            return self._logs[key].lookup(tick)
+
+    def _ceiling(self, key: str, tick: int) -> Optional[int]:
+        if self._legacy is not None:
+            return min((stored for stored in self._legacy[key] if stored >= tick), default=None)
+        with self._lock:
+            return self._logs[key].ceiling(tick)
+
+    def inclusion_proof(self, tick: int) -> Optional[LoomInclusionProofV1]:
+        """Prove the stored P-block at ``tick`` against the first I-block covering it.
+
+        Returns None while no stored I-block covers the tick, or when the
+        window's P-blocks are no longer stored.
+        """
 
-        payload = {
-            "type": "I",
-            "hash": i_hash,
-            "block": canonical,
-        }
-        json_path.write_text(_stable_dumps(payload))
-
-        bin_blob = encode_i_block_binary(canonical)
-        bin_path.write_bytes(bin_blob)
-        payload_hash = _hash_bytes(_payload_from_blob(bin_blob))
-        envelope_hash = _hash_bytes(bin_blob)
-
-        index = self._load_index()
-        index_entry = {
-            "tick": i_block.tick,
-            "hash": i_hash,
-            "path": str(json_path),
-            "bin_path": str(bin_path),
-            "bin_hash": payload_hash,
-            "bin_envelope_hash": envelope_hash,
-            "bin_size": len(bin_blob),
-        }
-        index["i"].append(index_entry)
-        index["i"] = sorted(index["i"], key=lambda item: item["tick"])
-        index["i"] = self._prune(index["i"], self.rollback_window)
-        self._write_index(index)
-
-    def _prune(self, entries: List[Dict], window: Optional[int]) -> List[Dict]:
-        if window is None:
-            return entries
-        if len(entries) <= window:
-            return entries
-        # Drop the oldest entries beyond the window and delete their files.
-        to_remove = entries[:-window]
-        for entry in to_remove:
-            try:
-                os.remove(entry["path"])
-            except FileNotFoundError:
-                pass
-            bin_path = entry.get("bin_path")
-            if bin_path:
-                try:
-                    os.remove(bin_path)
-                except FileNotFoundError:
-                    pass
-        return entries[-window:]
+        self.flush()
+        i_tick = self._ceiling("i", tick)
+        if i_tick is None:
+            return None
+        i_block = self._load_block("i", i_tick)["block"]
+        first_tick = max(i_tick - int(i_block["W"]) + 1, 1)
+        if tick < first_tick:
+            return None
+        leaves = []
+        for p_tick in range(first_tick, i_tick + 1):
+            entry = self._lookup("p", p_tick)
+            if entry is None:
+                return None
+            leaves.append(entry["hash"])
+        return _inclusion_proof(tick, i_tick, i_block["merkle_root"], first_tick, leaves)
+
+    @staticmethod
+    def _read_blob(entry: Mapping) -> bytes:
+        with open(entry["bin_path"], "rb") as handle:
+            handle.seek(entry.get("offset", 0))
+            return handle.read(entry["bin_size"]) if "offset" in entry else handle.read()
+
+    def _load_block(self, key: str, tick: int) -> Mapping:
+        entry = self._entry(key, tick)
+        if entry is None:
+            raise FileNotFoundError(f"No stored {key.upper()}-block for tick {tick}")
+        if "offset" not in entry:
+            return json.loads(pathlib.Path(entry["path"]).read_text())
+        canonical, _ = _decode_block(self._read_blob(entry), key.upper())
+        return {"type": key.upper(), "hash": entry["hash"], "block": canonical}
+
+    def _load_binary(self, key: str, tick: int) -> Tuple[Mapping, str]:
+        entry = self._entry(key, tick)
+        if entry is None:
+            raise FileNotFoundError(f"No stored {key.upper()}-block binary for tick {tick}")
+        return _decode_block(self._read_blob(entry), key.upper())
 
     def load_p_block(self, tick: int) -> Mapping:
-        index = self._load_index()["p"]
-        for entry in index:
-            if entry["tick"] == tick:
-                return json.loads(pathlib.Path(entry["path"]).read_text())
-        raise FileNotFoundError(f"No stored P-block for tick {tick}")
+        return self._load_block("p", tick)
 
     def load_i_block(self, tick: int) -> Mapping:
-        index = self._load_index()["i"]
-        for entry in index:
-            if entry["tick"] == tick:
-                return json.loads(pathlib.Path(entry["path"]).read_text())
-        raise FileNotFoundError(f"No stored I-block for tick {tick}")
+        return self._load_block("i", tick)
 
     def load_p_block_binary(self, tick: int) -> Tuple[Mapping, str]:
-        index = self._load_index()["p"]
-        for entry in index:
-            if entry["tick"] == tick:
-                blob = pathlib.Path(entry["bin_path"]).read_bytes()
-                return decode_p_block_binary(blob)
-        raise FileNotFoundError(f"No stored P-block binary for tick {tick}")
+        return self._load_binary("p", tick)
 
     def load_i_block_binary(self, tick: int) -> Tuple[Mapping, str]:
-        index = self._load_index()["i"]
-        for entry in index:
-            if entry["tick"] == tick:
-                blob = pathlib.Path(entry["bin_path"]).read_bytes()
-                return decode_i_block_binary(blob)
-        raise FileNotFoundError(f"No stored I-block binary for tick {tick}")
+        return self._load_binary("i", tick)
 
     def press_pointer(self, block_type: str, tick: int) -> Mapping:
         """Return a Press-ready pointer for the requested block.
 
-        The pointer exposes the deterministic binary path and hash so Press
-        manifests can reference the stored Loom block without re-encoding.
+        The pointer exposes the deterministic binary path, offset and hash so
+        Press manifests can reference the stored Loom block without
+        re-encoding. P-block pointers also carry the block's Merkle
+        ``inclusion_proof`` (see :meth:`inclusion_proof`), or None.
         """
 
         if block_type not in {"P", "I"}:
             raise ValueError("block_type must be 'P' or 'I'")
 
-        key = "p" if block_type == "P" else "i"
-        index = self._load_index()[key]
-        for entry in index:
-            if entry["tick"] == tick:
-                return {
-                    "tick": entry["tick"],
-                    "type": block_type,
-                    "hash": entry["hash"],
-                    "binary_hash": entry["bin_hash"],
-                    "binary_envelope_hash": entry.get("bin_envelope_hash"),
-                    "binary_path": entry["bin_path"],
-                    "binary_size": entry["bin_size"],
-                    "schema_version": VERSION,
-                    "compressed": True,
-                }
-        raise FileNotFoundError(f"No stored {block_type}-block for tick {tick}")
+        entry = self._entry(block_type.lower(), tick)
+        if entry is None:
+            raise FileNotFoundError(f"No stored {block_type}-block for tick {tick}")
+        pointer = {
+            "tick": entry["tick"],
+            "type": block_type,
+            "hash": entry["hash"],
+            "binary_hash": entry["bin_hash"],
+            "binary_envelope_hash": entry.get("bin_envelope_hash"),
+            "binary_path": entry["bin_path"],
+            "binary_offset": entry.get("offset", 0),
+            "binary_size": entry["bin_size"],
+            "schema_version": VERSION,
+            "compressed": True,
+        }
+        if block_type == "P":
+            proof = self.inclusion_proof(tick)
+            pointer["inclusion_proof"] = proof.to_dict() if proof is not None else None
+        return pointer
 
     def replay_index(self) -> Dict[str, List[Dict]]:
-        return self._load_index()
+        self.flush()
+        if self._legacy is not None:
+            return {key: list(entries.values()) for key, entries in self._legacy.items()}
+        with self._lock:
+            return {key: log.entries() for key, log in self._logs.items()}
+
+
+def _load_legacy_index(path: pathlib.Path) -> Dict[str, Dict[int, Dict]]:
+    """Read a JSON ``index.json``; the first entry wins for duplicate ticks."""
+
+    index = json.loads(path.read_text())
+    legacy: Dict[str, Dict[int, Dict]] = {}
+    for key in ("p", "i"):
+        entries: Dict[int, Dict] = {}
+        for entry in sorted(index.get(key, []), key=lambda item: item["tick"]):
+            entries.setdefault(entry["tick"], entry)
+        legacy[key] = entries
+    return legacy
+
+
+def _migrate_legacy_store(store: LoomBlockStore) -> None:
+    legacy = store._legacy
+    for log in store._logs.values():
+        log.clear()
+    for key, entries in legacy.items():
+        encode = encode_p_block_binary if key == "p" else encode_i_block_binary
+        for tick, entry in entries.items():
+            bin_path = entry.get("bin_path")
+            if bin_path and os.path.exists(bin_path):
+                blob = pathlib.Path(bin_path).read_bytes()
+            else:
+                blob = encode(json.loads(pathlib.Path(entry["path"]).read_text())["block"])
+            store._logs[key].append(tick, blob, entry["hash"])
+    (store.root / _STORE_MARKER).write_text(_stable_dumps(_STORE_FORMAT))
+    for entries in legacy.values():
+        for entry in entries.values():
+            for path_key in ("path", "bin_path"):
+                if entry.get(path_key):
+                    try:
+                        os.remove(entry[path_key])
+                    except FileNotFoundError:
+                        pass
+    store._legacy_index_path.unlink(missing_ok=True)
+    store._legacy = None
+
+
+def migrate_loom_block_store(
+    root: pathlib.Path, *, segment_blocks: int = DEFAULT_SEGMENT_BLOCKS
+) -> LoomBlockStore:
+    """Convert a JSON-index block store under ``root`` to the segment layout in place.
+
+    Every indexed block keeps its tick, hash and binary envelope; the per-block
+    files and ``index.json`` are removed once the segments are written. A store
+    that is already segmented is returned unchanged.
+    """
+
+    store = LoomBlockStore(root, segment_blocks=segment_blocks)
+    if store.is_legacy:
+        _migrate_legacy_store(store)
+    return store
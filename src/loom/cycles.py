@@ -0,0 +1,126 @@
+"""Analytic fast-forward of the Loom chain across UMX fixed points and cycles.
+
+Once the UMX state repeats, later ticks replay the same ledgers (up to the
+tick number) and, with ``seq = tick``, the chain update
+``C_t = (17 * C_{t-1} + 23 * s_t + seq) mod M`` becomes an affine recurrence.
+On the vector ``(C_t, t, 1)`` one tick with chain input ``s`` is the matrix::
+
+    [[17, 1, 23 * s + 1],
+     [ 0, 1,          1],
+     [ 0, 0,          1]]
+
+so ``n`` ticks of a ``p``-periodic span are one matrix power and a short
+prefix product, evaluated in ``O(p + log n)`` modular operations.
+:class:`LoomCycleSpanV1` records such a span so blocks inside it can be built
+on demand instead of simulated.
+"""
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+from umx.tick_ledger import UMXTickLedgerV1
+
+Matrix = Tuple[Tuple[int, int, int], Tuple[int, int, int], Tuple[int, int, int]]
+
+_IDENTITY: Matrix = ((1, 0, 0), (0, 1, 0), (0, 0, 1))
+
+
+def _mat_mul(left: Matrix, right: Matrix, modulus: int) -> Matrix:
+    return tuple(
+        tuple(
+            sum(left[row][k] * right[k][col] for k in range(3)) % modulus for col in range(3)
+        )
+        for row in range(3)
+    )  # type: ignore[return-value]
+
+
+def _mat_pow(matrix: Matrix, exponent: int, modulus: int) -> Matrix:
+    result = _IDENTITY
+    base = matrix
+    while exponent:
+        if exponent & 1:
+            result = _mat_mul(base, result, modulus)
+        base = _mat_mul(base, base, modulus)
+        exponent >>= 1
+    return result
+
+
+def chain_tick_matrix(s_t: int, modulus: int) -> Matrix:
+    """Return the ``(C, t, 1)`` transition for one tick with ``seq = tick``."""
+
+    return ((17, 1, (23 * s_t + 1) % modulus), (0, 1, 1), (0, 0, 1))
+
+
+@dataclass(frozen=True)
+class LoomCycleSpanV1:
+    """Ticks ``start_tick..end_tick`` that replay a ``p``-tick UMX cycle.
+
+    ``ledgers[m]`` and ``s_values[m]`` are the ledger and chain input for the
+    ticks ``start_tick + m + k * p``; ``C_before`` is the chain value after
+    ``start_tick - 1``. A fixed point is the ``p == 1`` case.
+    """
+
+    start_tick: int
+    end_tick: int
+    C_before: int
+    modulus: int
+    ledgers: Tuple[UMXTickLedgerV1, ...]
+    s_values: Tuple[int, ...]
+    _prefixes: Tuple[Matrix, ...] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.ledgers or len(self.ledgers) != len(self.s_values):
+            raise ValueError("A cycle span needs one s_t value per cycle ledger")
+        if self.end_tick < self.start_tick - 1:
+            raise ValueError("end_tick must not precede start_tick - 1")
+        prefixes: List[Matrix] = [_IDENTITY]
+        for s_t in self.s_values:
+            prefixes.append(
+                _mat_mul(chain_tick_matrix(s_t, self.modulus), prefixes[-1], self.modulus)
+            )
+        object.__setattr__(self, "_prefixes", tuple(prefixes))
+
+    @property
+    def period(self) -> int:
+        return len(self.ledgers)
+
+    def contains(self, tick: int) -> bool:
+        return self.start_tick <= tick <= self.end_tick
+
+    def phase(self, tick: int) -> int:
+        return (tick - self.start_tick) % self.period
+
+    def ledger_at(self, tick: int) -> UMXTickLedgerV1:
+        """Return the ledger that tick ``tick`` would have emitted."""
+
+        return dataclasses.replace(self.ledgers[self.phase(tick)], tick=tick)
+
+    def s_t_at(self, tick: int) -> int:
+        return self.s_values[self.phase(tick)]
+
+    def state_at(self, tick: int) -> List[int]:
+        """Return the UMX state after ``tick``."""
+
+        return list(self.ledgers[self.phase(tick)].post_u)
+
+    def chain_at(self, tick: int) -> int:
+        """Return ``C_t`` after ``tick`` (``start_tick - 1`` gives ``C_before``)."""
+
+        count = tick - self.start_tick + 1
+        if count < 0:
+            raise ValueError("tick precedes the cycle span")
+        cycles, remainder = divmod(count, self.period)
+        transform = _mat_mul(
+            self._prefixes[remainder],
+            _mat_pow(self._prefixes[-1], cycles, self.modulus),
+            self.modulus,
+        )
+        t_prev = (self.start_tick - 1) % self.modulus
+        return (
+            transform[0][0] * self.C_before + transform[0][1] * t_prev + transform[0][2]
+        ) % self.modulus
+
+    def extended_to(self, end_tick: int) -> "LoomCycleSpanV1":
+        return dataclasses.replace(self, end_tick=end_tick)
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from typing import List, Optional, Sequence, Tuple
 
+from umx.compiled_topology import compile_topology
 from umx.profile_cmp0 import ProfileCMP0V1
-from umx.tick_ledger import EdgeFluxV1, UMXTickLedgerV1
+from umx.tick_ledger import EdgeFluxV1, UMXTickLedgerV1, edge_flux_column
 from umx.topology_profile import TopologyProfileV1
 
 
@@ -107,7 +108,7 @@ def compute_s_t(ledger: UMXTickLedgerV1, profile: ProfileCMP0V1) -> int:
         if not isinstance(offset, int) or not isinstance(scale, int):
             raise ValueError("sum_abs_flux offset and scale must be integers")
 
-        total_abs_flux = sum(abs(edge.f_e) for edge in ledger.edges)
+        total_abs_flux = sum(map(abs, edge_flux_column(ledger.edges, "f_e")))
         value = offset + scale * total_abs_flux
 
         if max_value is not None:
@@ -126,23 +127,31 @@ def compute_chain_value(C_prev: int, s_t: int, seq: int, profile: ProfileCMP0V1)
     return (17 * C_prev + 23 * s_t + seq) % profile.modulus_M
 
 
-def _summarize_fluxes(edges: List[EdgeFluxV1]) -> List[FluxSummaryV1]:
-    return [FluxSummaryV1(e_id=edge.e_id, f_e=edge.f_e) for edge in edges]
+def _summarize_fluxes(edges: Sequence[EdgeFluxV1]) -> List[FluxSummaryV1]:
+    return [
+        FluxSummaryV1(e_id=e_id, f_e=f_e)
+        for e_id, f_e in zip(edge_flux_column(edges, "e_id"), edge_flux_column(edges, "f_e"))
+    ]
 
 
 def _snapshot_topology(topo: TopologyProfileV1) -> List[TopologyEdgeSnapshotV1]:
-    return [
-        TopologyEdgeSnapshotV1(
-            e_id=edge.e_id,
-            i=edge.i,
-            j=edge.j,
-            k=edge.k,
-            cap=edge.cap,
-            SC=edge.SC,
-            c=edge.c,
+    compiled = compile_topology(topo)
+    snapshot = compiled.memo.get("loom_topology_snapshot")
+    if snapshot is None:
+        snapshot = tuple(
+            TopologyEdgeSnapshotV1(
+                e_id=edge.e_id,
+                i=edge.i,
+                j=edge.j,
+                k=edge.k,
+                cap=edge.cap,
+                SC=edge.SC,
+                c=edge.c,
+            )
+            for edge in compiled.edges
         )
-        for edge in topo.edges
-    ]
+        compiled.memo["loom_topology_snapshot"] = snapshot
+    return list(snapshot)
 
 
 def step(
@@ -155,11 +164,14 @@ def step(
     s_t: Optional[int] = None,
     gid: Optional[str] = None,
     topology_version: Optional[str] = None,
+    emit_i_block: Optional[bool] = None,
 ) -> Tuple[LoomPBlockV1, int, Optional[LoomIBlockV1]]:
     """Process one tick through the Loom chain.
 
     Returns the P-block, the updated chain value C_t, and optionally
     an I-block when the tick hits the configured window spacing.
+    ``emit_i_block`` overrides that spacing rule when given; the I-block
+    then records ``W`` as the spacing the caller chose.
     """
 
     W = profile.I_block_spacing_W if W is None else W
@@ -176,7 +188,9 @@ def step(
     )
 
     i_block: Optional[LoomIBlockV1] = None
-    if ledger.tick % W == 0:
+    if emit_i_block is None:
+        emit_i_block = ledger.tick % W == 0
+    if emit_i_block:
         i_block = LoomIBlockV1(
             gid=gid or topo.gid,
             tick=ledger.tick,
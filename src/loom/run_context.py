@@ -1,9 +1,15 @@
 """LoomRunContext to manage the CMP-0 time axis alongside UMX."""
 from __future__ import annotations
 
+import bisect
+from collections import OrderedDict, deque
 from dataclasses import dataclass, field
-from typing import Callable, List, Optional, Tuple
+from operator import attrgetter
+from time import perf_counter_ns
+from typing import Callable, Deque, Dict, Iterable, List, Optional, Sequence, Tuple
 
+from umx.compiled_topology import compile_topology
+from umx.forking import fork_history
 from umx.profile_cmp0 import ProfileCMP0V1
 from umx.run_context import UMXRunContext
 from umx.tick_ledger import UMXTickLedgerV1
@@ -11,11 +17,14 @@ from umx.topology_profile import TopologyProfileV1
 
 from .loom import LoomIBlockV1, LoomPBlockV1, compute_s_t, step as loom_step
 from .chain import LoomChainRecorder, LoomChainState
+from .cycles import LoomCycleSpanV1
 
 
 SeqRule = Callable[[UMXTickLedgerV1], int]
 STRule = Callable[[UMXTickLedgerV1, ProfileCMP0V1], int]
 
+_block_tick = attrgetter("tick")
+
 
 def _default_seq_rule(ledger: UMXTickLedgerV1) -> int:
     """Use the ledger tick as the sequence value by default."""
@@ -23,13 +32,61 @@ def _default_seq_rule(ledger: UMXTickLedgerV1) -> int:
     return ledger.tick
 
 
+@dataclass(frozen=True)
+class LoomIBlockPolicyV1:
+    """Adaptive I-block placement for :class:`LoomRunContext`.
+
+    An I-block is emitted once replaying the ticks since the previous one
+    would cost at least ``replay_budget_ns`` (ticks times the per-tick
+    cost), but never sooner than ``min_spacing`` ticks and at the latest
+    after ``max_spacing``. With ``on_topology_change`` the first tick on a
+    new topology (an SLP update replacing ``topo``) always gets one. The
+    per-tick cost is ``tick_cost_ns`` when given, which keeps placement
+    reproducible across runs; otherwise it is a running average of measured
+    UMX step times. Each I-block records the ticks it covers as ``W``.
+    """
+
+    replay_budget_ns: int
+    min_spacing: int = 1
+    max_spacing: int = 4096
+    tick_cost_ns: Optional[int] = None
+    on_topology_change: bool = True
+
+    def __post_init__(self) -> None:
+        if self.replay_budget_ns <= 0:
+            raise ValueError("replay_budget_ns must be a positive integer")
+        if not 1 <= self.min_spacing <= self.max_spacing:
+            raise ValueError("spacing bounds must satisfy 1 <= min_spacing <= max_spacing")
+        if self.tick_cost_ns is not None and self.tick_cost_ns <= 0:
+            raise ValueError("tick_cost_ns must be a positive integer when provided")
+
+
+def _recent(history: Sequence, count: int) -> Tuple:
+    """Return the last ``count`` items of a list- or deque-backed history."""
+
+    if isinstance(history, deque):
+        return tuple(history)[-count:]
+    return tuple(history[-count:])
+
+
 @dataclass
 class LoomRunContext:
     """Manage Loom chain/block generation for one run.
 
     The context can either drive its own :class:`UMXRunContext` or ingest
     external ledgers. It tracks the evolving chain value ``C_t`` and stores the
-    emitted P-/I-blocks for replay or inspection.
+    emitted P-/I-blocks for replay or inspection. ``history_limit`` keeps only
+    the most recent blocks and ledgers (and at least ``W`` chain hashes) for
+    long streamed runs; lookups and replays then only reach that far back.
+
+    Blocks are kept in tick order, so lookups index them by tick directly
+    (falling back to a bisect). Replayed states are kept in an LRU cache of
+    ``replay_cache_size`` ticks, and a replay starts from the nearest cached
+    state when that is later than the nearest I-block.
+
+    I-blocks are emitted every ``W`` ticks unless an ``i_block_policy``
+    (see :class:`LoomIBlockPolicyV1`) places them adaptively; cycle skipping
+    is then disabled.
     """
 
     profile: ProfileCMP0V1
@@ -39,10 +96,21 @@ class LoomRunContext:
     seq_rule: SeqRule = _default_seq_rule
     s_t_rule: STRule = compute_s_t
     C_t: int = field(init=False)
-    p_blocks: List[LoomPBlockV1] = field(default_factory=list, init=False)
-    i_blocks: List[LoomIBlockV1] = field(default_factory=list, init=False)
-    ledgers: List[UMXTickLedgerV1] = field(default_factory=list, init=False)
+    p_blocks: Sequence[LoomPBlockV1] = field(default_factory=list, init=False)
+    i_blocks: Sequence[LoomIBlockV1] = field(default_factory=list, init=False)
+    ledgers: Sequence[UMXTickLedgerV1] = field(default_factory=list, init=False)
     recorder: LoomChainRecorder = field(default_factory=LoomChainRecorder)
+    history_limit: Optional[int] = None
+    replay_cache_size: int = 256
+    i_block_policy: Optional[LoomIBlockPolicyV1] = None
+    pending_span: Optional[LoomCycleSpanV1] = field(default=None, init=False, repr=False)
+    _replay_cache: "OrderedDict[int, Tuple[int, ...]]" = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+    _replay_ticks: List[int] = field(default_factory=list, init=False, repr=False)
+    _ticks_since_i_block: int = field(default=0, init=False, repr=False)
+    _i_block_topo: Optional[TopologyProfileV1] = field(default=None, init=False, repr=False)
+    _tick_cost_ns: Optional[int] = field(default=None, init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.umx_ctx:
@@ -57,26 +125,91 @@ class LoomRunContext:
         self.W = self.profile.I_block_spacing_W if self.W is None else self.W
         if self.W <= 0:
             raise ValueError("I-block spacing W must be a positive integer")
+        if self.replay_cache_size < 0:
+            raise ValueError("replay_cache_size must be a non-negative integer")
 
         self.C_t = self.profile.C0
-
-    def ingest_tick(self, ledger: UMXTickLedgerV1) -> Tuple[LoomPBlockV1, Optional[LoomIBlockV1]]:
-        """Consume a tick ledger and emit the corresponding Loom blocks."""
-
+        self._i_block_topo = self.topo
+        if self.history_limit is not None:
+            if self.history_limit <= 0:
+                raise ValueError("history_limit must be a positive integer when provided")
+            self.p_blocks = deque(self.p_blocks, maxlen=self.history_limit)
+            self.i_blocks = deque(self.i_blocks, maxlen=self.history_limit)
+            self.ledgers = deque(self.ledgers, maxlen=self.history_limit)
+            # I-block Merkle roots need every P-block hash since the previous I-block.
+            max_window = self.i_block_policy.max_spacing if self.i_block_policy else self.W
+            self.recorder.limit_history(max(self.history_limit, max_window))
+
+    def fork(self) -> "LoomRunContext":
+        """Return a copy-on-write branch of this run at the current tick.
+
+        Emitted blocks, ledgers and chain hashes are shared with this context
+        rather than copied, the bound UMX context is forked (see
+        :meth:`UMXRunContext.fork`) and a pending cycle span carries over.
+        Blocks emitted by the branch are not persisted to this run's store.
+        """
+
+        child = LoomRunContext(
+            profile=self.profile,
+            topo=self.topo,
+            umx_ctx=self.umx_ctx.fork() if self.umx_ctx else None,
+            W=self.W,
+            seq_rule=self.seq_rule,
+            s_t_rule=self.s_t_rule,
+            recorder=self.recorder.fork(),
+            history_limit=self.history_limit,
+            replay_cache_size=self.replay_cache_size,
+            i_block_policy=self.i_block_policy,
+        )
+        child.C_t = self.C_t
+        child._ticks_since_i_block = self._ticks_since_i_block
+        child._i_block_topo = self._i_block_topo
+        child._tick_cost_ns = self._tick_cost_ns
+        child._replay_cache = OrderedDict(self._replay_cache)
+        child._replay_ticks = list(self._replay_ticks)
+        child.p_blocks = fork_history(self.p_blocks)
+        child.i_blocks = fork_history(self.i_blocks)
+        child.ledgers = fork_history(self.ledgers)
+        child.pending_span = self.pending_span
+        return child
+
+    def ingest_tick(
+        self, ledger: UMXTickLedgerV1, *, step_ns: Optional[int] = None
+    ) -> Tuple[LoomPBlockV1, Optional[LoomIBlockV1]]:
+        """Consume a tick ledger and emit the corresponding Loom blocks.
+
+        ``step_ns`` is how long the UMX step producing ``ledger`` took; an
+        adaptive ``i_block_policy`` uses it to estimate replay cost.
+        """
+
+        self.materialize()
+        return self._ingest(ledger, step_ns)
+
+    def _ingest(
+        self, ledger: UMXTickLedgerV1, step_ns: Optional[int] = None
+    ) -> Tuple[LoomPBlockV1, Optional[LoomIBlockV1]]:
         seq = self.seq_rule(ledger)
         s_t = self.s_t_rule(ledger, self.profile)
         prev_chain = self.C_t
+        W, emit_i_block = self.W, None
+        if self.i_block_policy is not None:
+            self._ticks_since_i_block += 1
+            W, emit_i_block = self._ticks_since_i_block, self._i_block_due(step_ns)
         p_block, C_t, maybe_i_block = loom_step(
             ledger=ledger,
             C_prev=prev_chain,
             seq=seq,
             topo=self.topo,
             profile=self.profile,
-            W=self.W,
+            W=W,
             s_t=s_t,
             gid=self.topo.gid,
             topology_version=str(self.topo.meta.get("version", "v1")),
+            emit_i_block=emit_i_block,
         )
+        if maybe_i_block:
+            self._ticks_since_i_block = 0
+            self._i_block_topo = self.topo
 
         self.C_t = C_t
         self.p_blocks.append(p_block)
@@ -84,32 +217,155 @@ class LoomRunContext:
         self.ledgers.append(ledger)
         if maybe_i_block:
             self.i_blocks.append(maybe_i_block)
-            window_hashes = self.recorder.p_hashes[-maybe_i_block.W :]
-            self.recorder.record_i_block(maybe_i_block, window_hashes)
+            self.recorder.record_i_block(maybe_i_block, compiled=compile_topology(self.topo))
         return p_block, maybe_i_block
 
+    def _i_block_due(self, step_ns: Optional[int]) -> bool:
+        policy = self.i_block_policy
+        if step_ns is not None:
+            previous = self._tick_cost_ns
+            self._tick_cost_ns = step_ns if previous is None else (3 * previous + step_ns) // 4
+        if policy.on_topology_change and self.topo is not self._i_block_topo:
+            return True
+        ticks = self._ticks_since_i_block
+        if ticks < policy.min_spacing:
+            return False
+        tick_cost = policy.tick_cost_ns or self._tick_cost_ns or 0
+        return ticks >= policy.max_spacing or ticks * tick_cost >= policy.replay_budget_ns
+
     def step(self) -> Tuple[UMXTickLedgerV1, LoomPBlockV1, Optional[LoomIBlockV1]]:
         """Advance the bound UMX context and ingest its ledger."""
 
         if not self.umx_ctx:
             raise ValueError("No UMXRunContext bound; use ingest_tick for external ledgers")
+        policy = self.i_block_policy
+        if policy is None or policy.tick_cost_ns is not None:
+            ledger = self.umx_ctx.step()
+            p_block, maybe_i_block = self.ingest_tick(ledger)
+            return ledger, p_block, maybe_i_block
+        started = perf_counter_ns()
         ledger = self.umx_ctx.step()
-        p_block, maybe_i_block = self.ingest_tick(ledger)
+        p_block, maybe_i_block = self.ingest_tick(ledger, step_ns=perf_counter_ns() - started)
         return ledger, p_block, maybe_i_block
 
-    def run_until(self, t_max: int) -> Tuple[List[UMXTickLedgerV1], List[LoomPBlockV1], List[LoomIBlockV1]]:
-        """Step through ticks until reaching ``t_max`` using the bound UMX context."""
+    def run_until(
+        self,
+        t_max: int,
+        *,
+        skip_cycles: bool = False,
+        max_cycle_length: int = 8,
+    ) -> Tuple[List[UMXTickLedgerV1], List[LoomPBlockV1], List[LoomIBlockV1]]:
+        """Step through ticks until reaching ``t_max`` using the bound UMX context.
+
+        With ``skip_cycles=True`` the run watches for the UMX state returning to
+        one of the last ``max_cycle_length`` pre-tick states (a fixed point is
+        a cycle of length one). From then on the remaining ticks are recorded
+        as a :class:`LoomCycleSpanV1` in :attr:`pending_span` instead of being
+        simulated: the chain value and UMX state jump straight to ``t_max``,
+        block lookups inside the span are answered on demand, and
+        :meth:`materialize` (called automatically before the next ingest or
+        ``chain_state``) emits and records the skipped blocks. The returned
+        lists only hold materialized blocks. Skipping requires the default
+        ``seq``/``s_t`` rules and disabled UMX diagnostics; otherwise every
+        tick is simulated.
+        """
 
         if not self.umx_ctx:
             raise ValueError("No UMXRunContext bound; cannot auto-step without it")
         if t_max < self.umx_ctx.tick:
             raise ValueError("t_max must be greater than or equal to the current tick")
+        if max_cycle_length <= 0:
+            raise ValueError("max_cycle_length must be a positive integer")
+
+        skip_cycles = skip_cycles and self._can_skip_cycles(max_cycle_length)
+        if skip_cycles and self._extend_pending_span(t_max):
+            return list(self.ledgers), list(self.p_blocks), list(self.i_blocks)
 
+        recent: Deque[Tuple[Tuple[int, ...], int]] = deque()
+        seen: Dict[Tuple[int, ...], int] = {}
         while self.umx_ctx.tick < t_max:
-            self.step()
+            ledger, _, _ = self.step()
+            if not skip_cycles:
+                continue
+            pre_key = tuple(ledger.pre_u)
+            seen[pre_key] = ledger.tick
+            recent.append((pre_key, ledger.tick))
+            if len(recent) > max_cycle_length:
+                old_key, old_tick = recent.popleft()
+                if seen.get(old_key) == old_tick:
+                    del seen[old_key]
+            cycle_start = seen.get(tuple(ledger.post_u))
+            if cycle_start is not None and ledger.tick < t_max:
+                self._skip_cycle(cycle_start, ledger.tick, t_max)
+                break
 
         return list(self.ledgers), list(self.p_blocks), list(self.i_blocks)
 
+    def _can_skip_cycles(self, max_cycle_length: int) -> bool:
+        diag = self.umx_ctx.diag_config if self.umx_ctx else None
+        return (
+            self.umx_ctx is not None
+            and self.i_block_policy is None
+            and (self.history_limit is None or self.history_limit >= max_cycle_length)
+            and self.seq_rule is _default_seq_rule
+            and self.s_t_rule is compute_s_t
+            and not (diag and diag.enabled)
+        )
+
+    def _skip_cycle(self, cycle_start: int, cycle_end: int, t_max: int) -> None:
+        period = cycle_end - cycle_start + 1
+        span = LoomCycleSpanV1(
+            start_tick=cycle_end + 1,
+            end_tick=t_max,
+            C_before=self.C_t,
+            modulus=self.profile.modulus_M,
+            ledgers=_recent(self.ledgers, period),
+            s_values=tuple(p_block.s_t for p_block in _recent(self.p_blocks, period)),
+        )
+        self._jump_to(span)
+
+    def _extend_pending_span(self, t_max: int) -> bool:
+        span = self.pending_span
+        if span is None or self.umx_ctx.tick != span.end_tick:
+            return False
+        if self.umx_ctx.state != span.state_at(span.end_tick):
+            return False
+        self._jump_to(span.extended_to(t_max))
+        return True
+
+    def _jump_to(self, span: LoomCycleSpanV1) -> None:
+        self.pending_span = span
+        self.C_t = span.chain_at(span.end_tick)
+        self.umx_ctx.state = span.state_at(span.end_tick)
+        self.umx_ctx.tick = span.end_tick
+
+    def materialize(self) -> None:
+        """Emit and record the blocks of a skipped cycle span, if any."""
+
+        span = self.pending_span
+        if span is None:
+            return
+        self.pending_span = None
+        self.C_t = span.C_before
+        for tick in range(span.start_tick, span.end_tick + 1):
+            self._ingest(span.ledger_at(tick))
+
+    def _span_blocks(
+        self, span: LoomCycleSpanV1, tick: int
+    ) -> Tuple[LoomPBlockV1, Optional[LoomIBlockV1]]:
+        p_block, _, maybe_i_block = loom_step(
+            ledger=span.ledger_at(tick),
+            C_prev=span.chain_at(tick - 1),
+            seq=tick,
+            topo=self.topo,
+            profile=self.profile,
+            W=self.W,
+            s_t=span.s_t_at(tick),
+            gid=self.topo.gid,
+            topology_version=str(self.topo.meta.get("version", "v1")),
+        )
+        return p_block, maybe_i_block
+
     def current_chain_value(self) -> int:
         """Return the latest chain value (``C_t``)."""
 
@@ -118,40 +374,110 @@ class LoomRunContext:
     def get_pblock(self, tick: int) -> LoomPBlockV1:
         """Return the P-block for a given tick."""
 
-        for p_block in self.p_blocks:
-            if p_block.tick == tick:
-                return p_block
+        if self.pending_span and self.pending_span.contains(tick):
+            return self._span_blocks(self.pending_span, tick)[0]
+        p_blocks = self.p_blocks
+        if p_blocks:
+            # Ticks are usually consecutive, so the offset from the first block is the index.
+            position = tick - p_blocks[0].tick
+            if not 0 <= position < len(p_blocks) or p_blocks[position].tick != tick:
+                position = bisect.bisect_left(p_blocks, tick, key=_block_tick)
+            if position < len(p_blocks) and p_blocks[position].tick == tick:
+                return p_blocks[position]
         raise ValueError(f"No P-block recorded for tick {tick}")
 
     def get_chain_at(self, tick: int) -> int:
         """Return the chain value ``C_t`` for a given tick."""
 
+        if self.pending_span and self.pending_span.contains(tick):
+            return self.pending_span.chain_at(tick)
         return self.get_pblock(tick).C_t
 
     def get_iblock_for(self, tick: int) -> LoomIBlockV1:
         """Return the nearest prior I-block for the requested tick."""
 
-        eligible = [i_block for i_block in self.i_blocks if i_block.tick <= tick]
-        if not eligible:
+        span = self.pending_span
+        if span and tick >= span.start_tick:
+            latest = min(tick, span.end_tick)
+            i_tick = latest - latest % self.W
+            if i_tick >= span.start_tick:
+                return self._span_blocks(span, i_tick)[1]
+        position = bisect.bisect_right(self.i_blocks, tick, key=_block_tick)
+        if not position:
             raise ValueError(f"No I-blocks available at or before tick {tick}")
-        return eligible[-1]
+        return self.i_blocks[position - 1]
 
     def replay_state_at(self, tick: int) -> List[int]:
-        """Reconstruct the UMX state at ``tick`` using the nearest prior I-block."""
+        """Reconstruct the UMX state at ``tick`` using the nearest prior I-block.
+
+        Replay resumes from the nearest cached state instead when that is
+        later, so scrubbing through adjacent ticks costs one tick each.
+        """
+
+        return self.replay_states([tick])[0]
+
+    def replay_states(self, ticks: Iterable[int]) -> List[List[int]]:
+        """Reconstruct the UMX state at each of ``ticks`` in one forward sweep.
+
+        States are returned in the order of ``ticks`` and match a replay of
+        each tick from its nearest prior I-block. Ticks are answered in
+        ascending order so each replay continues from the previous one.
+        """
 
+        ticks = list(ticks)
         if not self.p_blocks:
             raise ValueError("No P-blocks recorded; cannot replay")
-        if tick > self.p_blocks[-1].tick:
-            raise ValueError("Requested tick exceeds recorded range")
+        span = self.pending_span
+        last_tick = span.end_tick if span else self.p_blocks[-1].tick
+        states: Dict[int, Tuple[int, ...]] = {}
+        replay_ctx: Optional[UMXRunContext] = None
+        for tick in sorted(set(ticks)):
+            if tick > last_tick:
+                raise ValueError("Requested tick exceeds recorded range")
+            if span and span.contains(tick):
+                states[tick] = tuple(span.state_at(tick))
+                continue
+            base_tick, base_state = self._replay_base(tick)
+            if base_tick == tick:
+                states[tick] = base_state
+                continue
+            if replay_ctx is None or replay_ctx.tick < base_tick:
+                replay_ctx = UMXRunContext(
+                    topo=self.topo,
+                    profile=self.profile,
+                    backend=self.umx_ctx.backend if self.umx_ctx else "python",
+                )
+                replay_ctx.init_state(list(base_state))
+                replay_ctx.tick = base_tick
+            replay_ctx.fast_forward(tick, check_every=None)
+            states[tick] = tuple(replay_ctx.current_state())
+            self._cache_replayed(tick, states[tick])
+        return [list(states[tick]) for tick in ticks]
+
+    def _replay_base(self, tick: int) -> Tuple[int, Tuple[int, ...]]:
+        """Return the latest known ``(tick, state)`` at or before ``tick`` to replay from."""
 
         checkpoint = self.get_iblock_for(tick)
-        replay_ctx = UMXRunContext(topo=self.topo, profile=self.profile)
-        replay_ctx.init_state(list(checkpoint.post_u))
-        replay_ctx.tick = checkpoint.tick
-        replay_ctx.run_until(tick)
-        return replay_ctx.current_state()
+        position = bisect.bisect_right(self._replay_ticks, tick)
+        if position and self._replay_ticks[position - 1] >= checkpoint.tick:
+            cached_tick = self._replay_ticks[position - 1]
+            self._replay_cache.move_to_end(cached_tick)
+            return cached_tick, self._replay_cache[cached_tick]
+        return checkpoint.tick, tuple(checkpoint.post_u)
+
+    def _cache_replayed(self, tick: int, state: Tuple[int, ...]) -> None:
+        if not self.replay_cache_size:
+            return
+        if tick not in self._replay_cache:
+            bisect.insort(self._replay_ticks, tick)
+        self._replay_cache[tick] = state
+        self._replay_cache.move_to_end(tick)
+        while len(self._replay_cache) > self.replay_cache_size:
+            evicted, _ = self._replay_cache.popitem(last=False)
+            del self._replay_ticks[bisect.bisect_left(self._replay_ticks, evicted)]
 
     def chain_state(self) -> LoomChainState:
         """Export chain tip information for NAP envelopes or diagnostics."""
 
+        self.materialize()
         return self.recorder.chain_state()
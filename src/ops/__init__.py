@@ -8,8 +8,9 @@ from .introspection import (
     build_introspection_view,
 )
 from .metrics import MetricsConfigV1, MetricsSnapshotV1
+from .profiling import StageProfiler, StageTimingV1
 from .run_summaries import RunSummary, append_run_summaries, ensure_logs_dir
-from .sweeps import SweepConfig, iter_points, load_sweep_config
+from .sweeps import SweepConfig, build_ensemble, iter_points, load_sweep_config
 from .structured_logging import LoggingConfigV1, StructuredLogEntryV1, StructuredLogger
 
 __all__ = [
@@ -18,12 +19,15 @@ __all__ = [
     "StructuredLogger",
     "MetricsConfigV1",
     "MetricsSnapshotV1",
+    "StageProfiler",
+    "StageTimingV1",
     "RunSummary",
     "append_run_summaries",
     "ensure_logs_dir",
     "compute_emulation_metrics",
     "SweepConfig",
     "iter_points",
+    "build_ensemble",
     "load_sweep_config",
     "IntrospectionViewV1",
     "GovernanceSummaryView",
@@ -11,13 +11,19 @@ class MetricsConfigV1:
 
     The Phase 3 surface keeps this intentionally small: a single enable flag
     that callers can toggle via config files or programmatic construction.
+    ``profile_stages`` additionally times each pillar stage of the tick loop
+    (see :class:`ops.profiling.StageProfiler`); wall-clock timings differ
+    between runs, so snapshots carrying them are not deterministic.
     """
 
     enabled: bool = False
+    profile_stages: bool = False
 
     def __post_init__(self) -> None:
         if not isinstance(self.enabled, bool):
             raise ValueError("enabled must be a boolean")
+        if not isinstance(self.profile_stages, bool):
+            raise ValueError("profile_stages must be a boolean")
 
 
 @dataclass(frozen=True)
@@ -37,6 +43,7 @@ class MetricsSnapshotV1:
     apx_manifests: int
     apxi_views: int
     codex_motif_counts: Dict[str, int] = field(default_factory=dict)
+    stage_timings: Dict[str, Dict[str, int]] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         if self.total_ticks < 0:
@@ -53,6 +60,8 @@ class MetricsSnapshotV1:
             raise ValueError("manifest/view counts must be >= 0")
         if not isinstance(self.codex_motif_counts, Mapping):
             raise ValueError("codex_motif_counts must be a mapping")
+        if not isinstance(self.stage_timings, Mapping):
+            raise ValueError("stage_timings must be a mapping")
 
     def to_dict(self) -> Dict[str, object]:
         payload: Dict[str, object] = {
@@ -71,5 +80,9 @@ class MetricsSnapshotV1:
         }
         if self.codex_motif_counts:
             payload["codex_motif_counts"] = dict(self.codex_motif_counts)
+        if self.stage_timings:
+            payload["stage_timings"] = {
+                stage: dict(timing) for stage, timing in self.stage_timings.items()
+            }
         return payload
 
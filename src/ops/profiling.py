@@ -0,0 +1,169 @@
+"""Opt-in per-stage wall-clock profiling for tick loop hot paths."""
+from __future__ import annotations
+
+import threading
+from array import array
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Callable, Dict, Tuple, TypeVar
+
+_T = TypeVar("_T")
+
+# Canonical pillar order used when reporting; unknown stages sort after these.
+STAGE_ORDER = ("slp", "pfna", "umx", "loom", "press", "codex", "scenes", "governance", "uledger")
+
+
+@dataclass(frozen=True)
+class StageTimingV1:
+    """Accumulated wall-clock time of one stage.
+
+    ``count`` is the number of timed calls and ``total_ns`` their summed
+    duration. ``ticks`` is the number of ticks the stage ran in, and
+    ``p50_ns``/``p99_ns`` are percentiles of its per-tick time.
+    """
+
+    stage: str
+    count: int
+    total_ns: int
+    ticks: int
+    p50_ns: int
+    p99_ns: int
+
+    def to_dict(self) -> Dict[str, int]:
+        return {
+            "count": self.count,
+            "total_ns": self.total_ns,
+            "ticks": self.ticks,
+            "p50_ns": self.p50_ns,
+            "p99_ns": self.p99_ns,
+        }
+
+
+# Histogram layout: values below ``2 ** (_SUB_BITS + 1)`` get exact buckets;
+# above that each power of two is split into ``2 ** _SUB_BITS`` buckets, so a
+# bucket spans at most 1/16 of its value. 960 buckets cover every int64.
+_SUB_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BITS
+_BUCKETS = (64 - _SUB_BITS) * _SUB_BUCKETS
+
+
+def _bucket(value: int) -> int:
+    shift = max(value.bit_length() - _SUB_BITS - 1, 0)
+    return shift * _SUB_BUCKETS + (value >> shift)
+
+
+def _bucket_high(index: int) -> int:
+    """Largest value that falls into bucket ``index``."""
+
+    if index < 2 * _SUB_BUCKETS:
+        return index
+    shift, offset = divmod(index - _SUB_BUCKETS, _SUB_BUCKETS)
+    return ((_SUB_BUCKETS + offset + 1) << shift) - 1
+
+
+class _StageStats:
+    __slots__ = ("count", "total", "ticks", "max", "tick", "tick_total", "histogram")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.ticks = 0
+        self.max = 0
+        self.tick: int | None = None
+        self.tick_total = 0
+        self.histogram = array("q", bytes(8 * _BUCKETS))
+
+    def fold(self, value: int) -> None:
+        self.ticks += 1
+        self.max = max(self.max, value)
+        self.histogram[_bucket(max(value, 0))] += 1
+
+
+class StageProfiler:
+    """Accumulate ``perf_counter_ns`` durations per stage and per tick.
+
+    Callers hold ``None`` instead of a profiler when profiling is off and
+    guard each measurement with a single ``is not None`` check, so disabled
+    runs pay next to nothing. Recording is thread-safe, which lets pipelined
+    runs time stages on their worker threads. Per-tick totals are folded into
+    a fixed-size log-bucketed histogram per stage, so memory does not grow
+    with the run length; reported percentiles are the upper bound of their
+    bucket (capped at the largest tick seen), within 1/16 of the exact value.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stages: Dict[str, _StageStats] = {}
+
+    def record(self, stage: str, tick: int, elapsed_ns: int) -> None:
+        """Add ``elapsed_ns`` spent in ``stage`` while processing ``tick``."""
+
+        with self._lock:
+            stats = self._stages.get(stage)
+            if stats is None:
+                stats = self._stages[stage] = _StageStats()
+            stats.count += 1
+            stats.total += elapsed_ns
+            if stats.tick == tick:
+                stats.tick_total += elapsed_ns
+                return
+            if stats.tick is not None:
+                stats.fold(stats.tick_total)
+            stats.tick = tick
+            stats.tick_total = elapsed_ns
+
+    def call(self, stage: str, tick: int, fn: Callable[..., _T], /, *args, **kwargs) -> _T:
+        """Call ``fn`` and record its duration under ``stage``."""
+
+        started = perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.record(stage, tick, perf_counter_ns() - started)
+
+    def timings(self) -> Tuple[StageTimingV1, ...]:
+        """Return one :class:`StageTimingV1` per recorded stage, in pillar order."""
+
+        with self._lock:
+            stages = sorted(
+                self._stages,
+                key=lambda name: (
+                    STAGE_ORDER.index(name) if name in STAGE_ORDER else len(STAGE_ORDER),
+                    name,
+                ),
+            )
+            timings = []
+            for stage in stages:
+                stats = self._stages[stage]
+                # Report the still-open tick without folding it, so later
+                # records for that tick keep accumulating into one sample.
+                histogram = array("q", stats.histogram)
+                histogram[_bucket(max(stats.tick_total, 0))] += 1
+                ticks = stats.ticks + 1
+                largest = max(stats.max, stats.tick_total)
+                timings.append(
+                    StageTimingV1(
+                        stage=stage,
+                        count=stats.count,
+                        total_ns=stats.total,
+                        ticks=ticks,
+                        p50_ns=_percentile(histogram, ticks, largest, 50),
+                        p99_ns=_percentile(histogram, ticks, largest, 99),
+                    )
+                )
+        return tuple(timings)
+
+    def to_dict(self) -> Dict[str, Dict[str, int]]:
+        return {timing.stage: timing.to_dict() for timing in self.timings()}
+
+
+def _percentile(histogram: array, ticks: int, largest: int, percent: int) -> int:
+    """Nearest-rank percentile of the per-tick samples counted in ``histogram``."""
+
+    rank = max(-(-ticks * percent // 100), 1)
+    seen = 0
+    for index, hits in enumerate(histogram):
+        seen += hits
+        if seen >= rank:
+            return min(_bucket_high(index), largest)
+    return largest
@@ -11,7 +11,7 @@ import json
 from dataclasses import dataclass, field
 from itertools import product
 from pathlib import Path
-from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple
 
 
 try:  # pragma: no cover - optional dependency
@@ -19,6 +19,11 @@ try:  # pragma: no cover - optional dependency
 except Exception:  # pragma: no cover - fallback when PyYAML is absent
     yaml = None
 
+if TYPE_CHECKING:  # pragma: no cover - import guard for typing only
+    from umx.ensemble import UMXEnsembleContext
+    from umx.profile_cmp0 import ProfileCMP0V1
+    from umx.topology_profile import TopologyProfileV1
+
 
 SUPPORTED_KINDS = {
     "ingest",
@@ -95,3 +100,35 @@ def iter_points(config: SweepConfig) -> Iterator[SweepPoint]:
         params.update({key: value for key, value in zip(keys, combo)})
         yield SweepPoint(index=index, params=params)
 
+
+
+def build_ensemble(
+    config: SweepConfig,
+    topo: "TopologyProfileV1",
+    profile: "ProfileCMP0V1",
+    *,
+    state_param: str = "initial_state",
+    backend: str = "python",
+    limit: Optional[int] = None,
+) -> Tuple[List[SweepPoint], "UMXEnsembleContext"]:
+    """Turn a sweep grid over initial states into one batched UMX ensemble.
+
+    Each point from :func:`iter_points` becomes one ensemble member seeded with
+    ``params[state_param]``; member ``m`` corresponds to ``points[m]``. Grid
+    keys other than ``state_param`` are left for the caller (the ensemble only
+    varies initial states).
+    """
+
+    from umx.ensemble import UMXEnsembleContext
+
+    points: List[SweepPoint] = []
+    for point in iter_points(config):
+        if limit is not None and point.index >= limit:
+            break
+        if state_param not in point.params:
+            raise ValueError(f"Sweep point {point.index} is missing '{state_param}'")
+        points.append(point)
+
+    ensemble = UMXEnsembleContext(topo=topo, profile=profile, backend=backend)
+    ensemble.init_states(point.params[state_param] for point in points)
+    return points, ensemble
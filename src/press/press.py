@@ -329,6 +329,23 @@ class PressWindowContextV1:
         self.streams[name].append_value(value)
         self._expected_tick[name] += 1
 
+    def buffered_values(self) -> Dict[str, List[object]]:
+        """Return every stream's buffered values as JSON-ready lists."""
+
+        return {
+            name: [list(value) if isinstance(value, tuple) else value for value in stream.values]
+            for name, stream in self.streams.items()
+        }
+
+    def restore_buffered_values(self, buffered: Mapping[str, Sequence[object]]) -> None:
+        """Re-append values captured by :meth:`buffered_values` into empty streams."""
+
+        for name, values in buffered.items():
+            if name not in self.streams or self.streams[name].values:
+                raise ValueError(f"Stream '{name}' must be registered and empty to restore")
+            for value in values:
+                self.append(name, tuple(value) if isinstance(value, list) else value)
+
     def close_window(self, apx_name: str) -> APXManifestV1:
         expected_entries = self.end_tick - self.start_tick + 1
         for name, stream in self.streams.items():
@@ -12,6 +12,7 @@ __all__ = [
     "canonical_json_dumps",
     "hash_record",
     "ULedgerEntryV1",
+    "ULedgerChainBuilder",
     "build_uledger_entries",
     "build_and_validate_uledger",
     "validate_uledger_chain",
@@ -22,12 +23,14 @@ __all__ = [
 def __getattr__(name):  # pragma: no cover - thin lazy import helper
     if name in {
         "ULedgerEntryV1",
+        "ULedgerChainBuilder",
         "build_uledger_entries",
         "build_and_validate_uledger",
         "validate_uledger_chain",
         "ULedgerCheckpointV1",
     }:
         from .entry import (
+            ULedgerChainBuilder,
             ULedgerCheckpointV1,
             ULedgerEntryV1,
             build_and_validate_uledger,
@@ -37,6 +40,7 @@ def __getattr__(name):  # pragma: no cover - thin lazy import helper
 
         return {
             "ULedgerEntryV1": ULedgerEntryV1,
+            "ULedgerChainBuilder": ULedgerChainBuilder,
             "build_uledger_entries": build_uledger_entries,
             "build_and_validate_uledger": build_and_validate_uledger,
             "validate_uledger_chain": validate_uledger_chain,
@@ -24,12 +24,21 @@ def _normalize(obj: Any) -> Any:
     - ``bool``
     - ``None``
 
-    Dataclasses are converted via ``dataclasses.asdict``. Any other type raises
+    Dataclasses are converted field by field, matching ``dataclasses.asdict``
+    without its deep copy. Columnar sequences exposing ``to_rows`` (such as
+    ``EdgeFluxColumnsV1``) are read column-wise. Any other type raises
     ``TypeError`` to keep the serialisation predictable.
     """
 
-    if dataclasses.is_dataclass(obj):
-        obj = dataclasses.asdict(obj)
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return {
+            item.name: _normalize(getattr(obj, item.name))
+            for item in sorted(dataclasses.fields(obj), key=lambda item: item.name)
+        }
+
+    to_rows = getattr(obj, "to_rows", None)
+    if to_rows is not None:
+        return to_rows()
 
     if isinstance(obj, dict):
         normalized: Dict[str, Any] = {}
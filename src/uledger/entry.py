@@ -78,6 +78,145 @@ def _validate_alignment(
             raise ValueError("ledger, p_block, and envelope ticks must match")
 
 
+class ULedgerChainBuilder:
+    """Append ULedgerEntry_v1 records to a hash chain one tick at a time.
+
+    This is the incremental form of :func:`build_uledger_entries`: each
+    :meth:`append` hashes one tick's ledger, P-block and envelope and links
+    the new entry to the previous one, so callers streaming a run never need
+    the full artefact lists. :meth:`append_hashes` accepts precomputed
+    artefact hashes for callers that fold artefacts before the chain's
+    ``governance_meta`` is known. Entries are not retained; :meth:`checkpoint`
+    summarises everything appended so far.
+    """
+
+    def __init__(
+        self,
+        *,
+        gid: str,
+        run_id: str,
+        window_id: str,
+        manifest: APXManifestV1,
+        start_prev_hash: Optional[str] = None,
+        slp_events_by_tick: Optional[Mapping[int, Sequence[str]]] = None,
+        policy_set_hash: Optional[str] = None,
+        governance_meta: Optional[Mapping[str, object]] = None,
+    ) -> None:
+        self.gid = gid
+        self.run_id = run_id
+        self.window_id = window_id
+        self.manifest = manifest
+        self.manifest_hash = hash_record(_manifest_hash_payload(manifest))
+        self.slp_events_by_tick = slp_events_by_tick
+        self.policy_set_hash = policy_set_hash
+        self.governance_meta = governance_meta
+        self.head_hash = start_prev_hash
+        self.start_tick: Optional[int] = None
+        self.last_tick = 0
+        self.entry_count = 0
+
+    def append(
+        self, ledger: UMXTickLedgerV1, p_block: LoomPBlockV1, envelope: NAPEnvelopeV1
+    ) -> ULedgerEntryV1:
+        """Link one tick's artefacts into the chain and return its entry."""
+
+        _validate_alignment((ledger,), (p_block,), (envelope,))
+        return self.append_hashes(
+            tick=ledger.tick,
+            C_t=p_block.C_t,
+            topology_version=p_block.topology_version,
+            nap_envelope_hash=hash_record(envelope),
+            umx_ledger_hash=hash_record(ledger),
+            loom_block_hash=hash_record(p_block),
+        )
+
+    def append_hashes(
+        self,
+        *,
+        tick: int,
+        C_t: int,
+        topology_version: str,
+        nap_envelope_hash: str,
+        umx_ledger_hash: str,
+        loom_block_hash: str,
+    ) -> ULedgerEntryV1:
+        """Link one tick given the canonical hashes of its artefacts."""
+
+        if tick <= self.last_tick:
+            raise ValueError("ledgers must be in strictly increasing tick order")
+        slp_refs = (
+            tuple(sorted(self.slp_events_by_tick.get(tick, ())))
+            if self.slp_events_by_tick
+            else tuple()
+        )
+        entry = ULedgerEntryV1(
+            gid=self.gid,
+            run_id=self.run_id,
+            tick=tick,
+            window_id=self.window_id,
+            C_t=C_t,
+            manifest_check=self.manifest.manifest_check,
+            nap_envelope_hash=nap_envelope_hash,
+            umx_ledger_hash=umx_ledger_hash,
+            loom_block_hash=loom_block_hash,
+            apx_manifest_hash=self.manifest_hash,
+            prev_entry_hash=self.head_hash,
+            slp_event_refs=slp_refs,
+            topology_version=topology_version,
+            policy_set_hash=self.policy_set_hash,
+            meta=dict(self.governance_meta or {}),
+        )
+        self.head_hash = hash_record(entry)
+        if self.start_tick is None:
+            self.start_tick = tick
+        self.last_tick = tick
+        self.entry_count += 1
+        return entry
+
+    def head_state(self) -> Dict[str, object]:
+        """Return the chain head as JSON-ready data, for resuming with :meth:`restore_head`."""
+
+        return {
+            "head_hash": self.head_hash,
+            "start_tick": self.start_tick,
+            "last_tick": self.last_tick,
+            "entry_count": self.entry_count,
+        }
+
+    def restore_head(self, state: Mapping[str, object]) -> None:
+        """Continue appending after the head captured by :meth:`head_state`."""
+
+        self.head_hash = state["head_hash"]
+        self.start_tick = state["start_tick"]
+        self.last_tick = int(state["last_tick"])
+        self.entry_count = int(state["entry_count"])
+
+    def checkpoint(self, *, require_contiguous_ticks: bool = True) -> "ULedgerCheckpointV1":
+        """Return the checkpoint :func:`validate_uledger_chain` would report.
+
+        Entries built here are linked by construction, so only the tick range
+        needs checking.
+        """
+
+        if not self.entry_count:
+            raise ValueError("entries must not be empty")
+        if require_contiguous_ticks and (
+            self.start_tick != 1 or self.last_tick - self.start_tick + 1 != self.entry_count
+        ):
+            raise ValueError("ledger ticks must be contiguous and increasing")
+        return ULedgerCheckpointV1(
+            gid=self.gid,
+            run_id=self.run_id,
+            window_id=self.window_id,
+            start_tick=self.start_tick,
+            end_tick=self.last_tick,
+            entry_count=self.entry_count,
+            head_hash=self.head_hash,
+            manifest_hash=self.manifest_hash,
+            policy_set_hash=self.policy_set_hash,
+        )
+
+
 def build_uledger_entries(
     *,
     gid: str,
@@ -103,38 +242,20 @@ def build_uledger_entries(
 
     _validate_alignment(ledgers, p_blocks, envelopes)
 
-    manifest_hash = hash_record(_manifest_hash_payload(manifest))
-    prev_hash = start_prev_hash
-    entries: List[ULedgerEntryV1] = []
-    last_tick = 0
-
-    for ledger, p_block, envelope in zip(ledgers, p_blocks, envelopes):
-        if ledger.tick <= last_tick:
-            raise ValueError("ledgers must be in strictly increasing tick order")
-        last_tick = ledger.tick
-        slp_refs = tuple(sorted(slp_events_by_tick.get(ledger.tick, ()))) if slp_events_by_tick else tuple()
-        entry = ULedgerEntryV1(
-            gid=gid,
-            run_id=run_id,
-            tick=ledger.tick,
-            window_id=window_id,
-            C_t=p_block.C_t,
-            manifest_check=manifest.manifest_check,
-            nap_envelope_hash=hash_record(envelope),
-            umx_ledger_hash=hash_record(ledger),
-            loom_block_hash=hash_record(p_block),
-            apx_manifest_hash=manifest_hash,
-            prev_entry_hash=prev_hash,
-            slp_event_refs=slp_refs,
-            topology_version=p_block.topology_version,
-            policy_set_hash=policy_set_hash,
-            meta=dict(governance_meta or {}),
-        )
-
-        prev_hash = hash_record(entry)
-        entries.append(entry)
-
-    return entries
+    builder = ULedgerChainBuilder(
+        gid=gid,
+        run_id=run_id,
+        window_id=window_id,
+        manifest=manifest,
+        start_prev_hash=start_prev_hash,
+        slp_events_by_tick=slp_events_by_tick,
+        policy_set_hash=policy_set_hash,
+        governance_meta=governance_meta,
+    )
+    return [
+        builder.append(ledger, p_block, envelope)
+        for ledger, p_block, envelope in zip(ledgers, p_blocks, envelopes)
+    ]
 
 
 @dataclass(frozen=True)
@@ -1,9 +1,12 @@
 """UMX pillar package for the Aether engine."""
 
+from .compiled_topology import CompiledTopologyV1, compile_topology
 from .engine import step
-from .diagnostics import UMXDiagnosticsConfig, UMXDiagnosticsRecord
-from .tick_ledger import EdgeFluxV1, UMXTickLedgerV1
+from .diagnostics import UMXDiagnosticsConfig, UMXDiagnosticsRecord, UMXDiagnosticsSummary
+from .tick_ledger import EdgeFluxColumnsV1, EdgeFluxV1, UMXTickLedgerV1
 from .topology_profile import (
+    EMPTY_ATTRS,
+    EdgeColumnsV1,
     EdgeProfileV1,
     NodeProfileV1,
     TopologyProfileV1,
@@ -12,20 +15,36 @@ from .topology_profile import (
     topology_profile_from_dict,
 )
 from .run_context import UMXRunContext
+from .ensemble import UMXEnsembleContext, UMXEnsembleMemberSummaryV1
+from .forking import ForkedHistory, ForkOutcomeV1, evaluate_forks
+from .partitioned import PartitionedExecutor, PartitionPlanV1
 from .profile_cmp0 import ProfileCMP0V1, gf01_profile_cmp0
 
 __all__ = [
     "NodeProfileV1",
     "EdgeProfileV1",
+    "EdgeColumnsV1",
+    "EMPTY_ATTRS",
     "TopologyProfileV1",
+    "CompiledTopologyV1",
+    "compile_topology",
     "load_topology_profile",
     "topology_profile_from_dict",
     "ProfileCMP0V1",
     "UMXTickLedgerV1",
     "EdgeFluxV1",
+    "EdgeFluxColumnsV1",
     "UMXRunContext",
+    "UMXEnsembleContext",
+    "UMXEnsembleMemberSummaryV1",
+    "ForkedHistory",
+    "ForkOutcomeV1",
+    "evaluate_forks",
+    "PartitionedExecutor",
+    "PartitionPlanV1",
     "UMXDiagnosticsConfig",
     "UMXDiagnosticsRecord",
+    "UMXDiagnosticsSummary",
     "step",
     "gf01_topology_profile",
     "gf01_profile_cmp0",
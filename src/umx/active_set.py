@@ -0,0 +1,250 @@
+"""Active-set (dirty-node) CMP-0 stepping.
+
+An edge's flux depends only on the states of its two endpoints, so when
+neither endpoint changed since the previous tick the edge's ``du``, ``raw`` and
+``f_e`` are exactly what they were last tick. :class:`ActiveSetStepper` keeps
+the previous tick's per-edge results and node net flows and re-evaluates only
+the edges incident to nodes whose state changed, so per-tick work scales with
+activity rather than with ``E``. Ledgers are identical to
+:func:`umx.engine.step`.
+"""
+from __future__ import annotations
+
+from typing import List, Optional, Sequence, Set, Tuple
+
+from .compiled_topology import CompiledTopologyV1, compile_topology
+from .engine import BIGINT_PATH, _static_flux_columns, policy_notes
+from .profile_cmp0 import ProfileCMP0V1
+from .tick_ledger import EdgeFluxColumnsV1, EdgeFluxV1, UMXTickLedgerV1
+from .topology_profile import TopologyProfileV1
+
+
+def incident_edges(compiled: CompiledTopologyV1) -> Tuple[Tuple[int, ...], ...]:
+    """Return, per 0-based node index, the positions of its incident edges."""
+
+    incidence = compiled.memo.get("incident_edges")
+    if incidence is None:
+        buckets: List[List[int]] = [[] for _ in range(compiled.N)]
+        for position, (i_idx, j_idx) in enumerate(zip(compiled.i_idx, compiled.j_idx)):
+            buckets[i_idx].append(position)
+            if j_idx != i_idx:
+                buckets[j_idx].append(position)
+        incidence = tuple(tuple(bucket) for bucket in buckets)
+        compiled.memo["incident_edges"] = incidence
+    return incidence
+
+
+class ActiveSetStepper:
+    """Stateful step/advance kernel that only re-evaluates edges near changes.
+
+    The stepper caches the last tick it evaluated. When called with the
+    state it produced (the usual case inside a run) only the nodes that moved
+    are re-examined; external inputs, a new topology or a new profile are
+    detected by comparing against the cache, falling back to a full
+    evaluation when needed. Instances are not thread-safe and should be
+    owned by a single run.
+    """
+
+    #: Re-evaluate every edge when more than this fraction of nodes changed.
+    full_refresh_ratio = 0.25
+    numeric_path = BIGINT_PATH
+
+    def __init__(self) -> None:
+        self._topo: Optional[TopologyProfileV1] = None
+        self._profile: Optional[ProfileCMP0V1] = None
+        self._pre: List[int] = []
+        self._post: List[int] = []
+        self._du: List[int] = []
+        self._raw: List[int] = []
+        self._f_e: List[int] = []
+        self._causal: bytearray = bytearray()
+        self._epsilon: bytearray = bytearray()
+        self._net: List[int] = []
+        self._moving: Set[int] = set()
+        self._causal_count = 0
+        self._epsilon_count = 0
+
+    def __call__(
+        self,
+        tick: int,
+        state: List[int],
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+        *,
+        columnar: bool = False,
+    ) -> UMXTickLedgerV1:
+        return self.step(tick, state, topo, profile, columnar=columnar)
+
+    def step(
+        self,
+        tick: int,
+        state: List[int],
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+        *,
+        columnar: bool = False,
+    ) -> UMXTickLedgerV1:
+        """Run one CMP-0 tick and return a ledger identical to ``engine.step``."""
+
+        compiled = self._update(state, topo, profile)
+        fluxes: Sequence[EdgeFluxV1]
+        if columnar:
+            fluxes = EdgeFluxColumnsV1(
+                **_static_flux_columns(compiled), du=self._du, raw=self._raw, f_e=self._f_e
+            )
+        else:
+            fluxes = [
+                EdgeFluxV1(e_id=e_id, i=i, j=j, du=du, raw=raw, cap=cap, f_e=f_e)
+                for e_id, i, j, du, raw, cap, f_e in zip(
+                    compiled.e_ids,
+                    compiled.i_nodes,
+                    compiled.j_nodes,
+                    self._du,
+                    self._raw,
+                    compiled.caps,
+                    self._f_e,
+                )
+            ]
+        causal_applied = self._causal_count > 0
+        epsilon_applied = self._epsilon_count > 0
+        sum_pre_u = sum(self._pre)
+        return UMXTickLedgerV1(
+            tick=tick,
+            sum_pre_u=sum_pre_u,
+            sum_post_u=sum(self._post),
+            z_check=sum_pre_u,
+            pre_u=list(self._pre),
+            edges=fluxes,
+            post_u=list(self._post),
+            nap_ref=topo.nap_ref or "",
+            causal_radius_applied=causal_applied,
+            epsilon_applied=epsilon_applied,
+            policy_notes=policy_notes(causal_applied, epsilon_applied),
+        )
+
+    def advance(
+        self, state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+    ) -> Tuple[List[int], bool, bool]:
+        """State-only counterpart of :meth:`step` (see ``engine.advance_state``)."""
+
+        self._update(state, topo, profile)
+        return list(self._post), self._causal_count > 0, self._epsilon_count > 0
+
+    def _update(
+        self, state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+    ) -> CompiledTopologyV1:
+        if len(state) != topo.N:
+            raise ValueError("State length must equal topology N")
+        compiled = compile_topology(topo)
+        changed = self._changed_nodes(state, topo, profile)
+        if changed is None or len(changed) > self.full_refresh_ratio * topo.N:
+            self._evaluate_all(state, compiled, topo, profile)
+        elif changed:
+            self._evaluate_frontier(state, changed, compiled, topo, profile)
+        self._pre = list(state)
+        post = list(state)
+        net = self._net
+        for node in self._moving:
+            post[node] += net[node]
+        self._post = post
+        return compiled
+
+    def _changed_nodes(
+        self, state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+    ) -> Optional[Set[int]]:
+        """Return nodes whose state may differ from the cached tick, or ``None``."""
+
+        if topo is not self._topo or profile is not self._profile:
+            return None
+        changed = set(self._moving)
+        if state != self._post:
+            changed.update(
+                idx for idx, (new, old) in enumerate(zip(state, self._pre)) if new != old
+            )
+        return changed
+
+    def _evaluate_all(
+        self,
+        state: List[int],
+        compiled: CompiledTopologyV1,
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+    ) -> None:
+        size = compiled.E
+        self._topo = topo
+        self._profile = profile
+        self._du = [0] * size
+        self._raw = [0] * size
+        self._f_e = [0] * size
+        self._causal = bytearray(size)
+        self._epsilon = bytearray(size)
+        self._net = [0] * topo.N
+        self._causal_count = 0
+        self._epsilon_count = 0
+        for position in range(size):
+            self._evaluate_edge(position, state, compiled, topo.SC, profile.epsilon_cap)
+        self._moving = {node for node, delta in enumerate(self._net) if delta}
+
+    def _evaluate_frontier(
+        self,
+        state: List[int],
+        changed: Set[int],
+        compiled: CompiledTopologyV1,
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+    ) -> None:
+        incidence = incident_edges(compiled)
+        positions: Set[int] = set()
+        for node in changed:
+            positions.update(incidence[node])
+        touched: Set[int] = set()
+        for position in positions:
+            self._evaluate_edge(position, state, compiled, topo.SC, profile.epsilon_cap)
+            touched.add(compiled.i_idx[position])
+            touched.add(compiled.j_idx[position])
+        net = self._net
+        for node in touched:
+            if net[node]:
+                self._moving.add(node)
+            else:
+                self._moving.discard(node)
+
+    def _evaluate_edge(
+        self,
+        position: int,
+        state: List[int],
+        compiled: CompiledTopologyV1,
+        scale: int,
+        epsilon_cap: Optional[int],
+    ) -> None:
+        i_idx = compiled.i_idx[position]
+        j_idx = compiled.j_idx[position]
+        radius = compiled.radii[position]
+        du = state[i_idx] - state[j_idx]
+        magnitude = abs(du)
+        causal = 0
+        if radius and magnitude > radius:
+            magnitude = radius
+            causal = 1
+        raw = (compiled.k[position] * magnitude) // scale
+        epsilon = 0
+        if epsilon_cap is not None and raw > epsilon_cap:
+            raw = epsilon_cap
+            epsilon = 1
+        f_e = 0
+        if du:
+            f_e = min(raw, compiled.caps[position], magnitude)
+            if du < 0:
+                f_e = -f_e
+
+        delta = f_e - self._f_e[position]
+        if delta:
+            self._net[i_idx] -= delta
+            self._net[j_idx] += delta
+        self._causal_count += causal - self._causal[position]
+        self._epsilon_count += epsilon - self._epsilon[position]
+        self._causal[position] = causal
+        self._epsilon[position] = epsilon
+        self._du[position] = du
+        self._raw[position] = raw
+        self._f_e[position] = f_e
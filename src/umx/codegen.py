@@ -0,0 +1,217 @@
+"""Topology-specialised CMP-0 kernels generated as straight-line Python.
+
+Small topologies that are stepped many times spend most of each tick in the
+generic engine's loop machinery: tuple unpacking, radius/cap/epsilon checks
+and list appends per edge. :class:`CodegenKernel` instead emits one Python
+function per topology version and epsilon cap with every edge unrolled and
+its ``k``, cap, causal radius and endpoints inlined as constants. Clamps that
+can never fire (no radius, no epsilon cap, ``k <= SC`` making the
+``abs(du)`` bound redundant) are left out of the source altogether.
+
+The source is compiled once with :func:`compile` and cached process-wide by a
+content hash of the compiled topology, so sessions that rebuild the same
+topology reuse the generated code. Ledgers are assembled exactly as in
+:func:`umx.engine.step`.
+"""
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .compiled_topology import CompiledTopologyV1, compile_topology
+from .engine import BIGINT_PATH, _tick_ledger, advance_state, step
+from .profile_cmp0 import ProfileCMP0V1
+from .tick_ledger import UMXTickLedgerV1
+from .topology_profile import TopologyProfileV1
+
+#: Topologies with more edges than this run on the generic engine instead.
+CODEGEN_MAX_EDGES = 256
+#: Generated kernels kept in the process-wide cache (oldest evicted first).
+MAX_CACHED_KERNELS = 128
+
+StepKernel = Callable[[List[int]], Tuple[List[int], List[int], List[int], List[int], bool, bool]]
+AdvanceKernel = Callable[[List[int]], Tuple[List[int], bool, bool]]
+
+_KERNEL_CACHE: "OrderedDict[Tuple[str, Optional[int]], Tuple[StepKernel, AdvanceKernel]]" = (
+    OrderedDict()
+)
+
+
+def topology_content_hash(compiled: CompiledTopologyV1) -> str:
+    """Return a SHA-256 over everything a generated kernel depends on."""
+
+    digest = compiled.memo.get("codegen_hash")
+    if digest is None:
+        payload = repr(
+            (
+                compiled.N,
+                compiled.SC,
+                compiled.i_idx,
+                compiled.j_idx,
+                compiled.k,
+                compiled.caps,
+                compiled.radii,
+            )
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        compiled.memo["codegen_hash"] = digest
+    return digest
+
+
+def _edge_lines(
+    position: int,
+    i_idx: int,
+    j_idx: int,
+    k: int,
+    cap: int,
+    radius: int,
+    scale: int,
+    epsilon_cap: Optional[int],
+) -> List[str]:
+    d, m, r, f = f"d{position}", f"m{position}", f"r{position}", f"f{position}"
+    lines = [
+        f"{d} = u{i_idx} - u{j_idx}",
+        f"{m} = -{d} if {d} < 0 else {d}",
+    ]
+    if radius:
+        lines += [f"if {m} > {radius}:", f"    {m} = {radius}", "    causal = True"]
+    lines.append(f"{r} = {k} * {m} // {scale}")
+    if epsilon_cap is not None:
+        lines += [f"if {r} > {epsilon_cap}:", f"    {r} = {epsilon_cap}", "    epsilon = True"]
+    lines.append(f"{f} = {r} if {r} < {cap} else {cap}")
+    if k > scale:
+        # raw can exceed abs(du) only when k > SC.
+        lines.append(f"{f} = {f} if {f} < {m} else {m}")
+    if cap >= 0:
+        # du == 0 already gives raw == 0, hence f == 0; only the sign remains.
+        lines.append(f"{f} = -{f} if {d} < 0 else {f}")
+    else:
+        lines.append(f"{f} = (({d} > 0) - ({d} < 0)) * {f}")
+    return lines
+
+
+def generate_kernel_source(compiled: CompiledTopologyV1, epsilon_cap: Optional[int]) -> str:
+    """Return the Python source of the ``step_kernel``/``advance_kernel`` pair."""
+
+    nodes = ", ".join(f"u{idx}" for idx in range(compiled.N))
+    body: List[str] = ["causal = False", "epsilon = False"]
+    inflow: List[List[str]] = [[] for _ in range(compiled.N)]
+    for position, (i_idx, j_idx, k, cap, radius) in enumerate(
+        zip(compiled.i_idx, compiled.j_idx, compiled.k, compiled.caps, compiled.radii)
+    ):
+        body += _edge_lines(position, i_idx, j_idx, k, cap, radius, compiled.SC, epsilon_cap)
+        inflow[i_idx].append(f" - f{position}")
+        inflow[j_idx].append(f" + f{position}")
+    post = ", ".join(f"u{idx}{''.join(terms)}" for idx, terms in enumerate(inflow))
+    columns = {
+        name: ", ".join(f"{name[0]}{position}" for position in range(compiled.E))
+        for name in ("du", "raw", "f_e")
+    }
+
+    def function(name: str, result: str) -> List[str]:
+        lines = [f"def {name}(u):", f"    {nodes}{',' if compiled.N == 1 else ''} = u"]
+        lines += [f"    {line}" for line in body]
+        lines.append(f"    return {result}")
+        return lines
+
+    source = function(
+        "step_kernel",
+        f"[{columns['du']}], [{columns['raw']}], [{columns['f_e']}], [{post}], causal, epsilon",
+    )
+    source.append("")
+    source += function("advance_kernel", f"[{post}], causal, epsilon")
+    return "\n".join(source) + "\n"
+
+
+def generated_kernels(
+    compiled: CompiledTopologyV1, epsilon_cap: Optional[int]
+) -> Tuple[StepKernel, AdvanceKernel]:
+    """Return the (cached) generated kernels for one topology and epsilon cap.
+
+    Kernels live only in the process-wide cache, never in ``compiled.memo``:
+    generated functions cannot be pickled, and compiled topologies travel to
+    worker processes.
+    """
+
+    cache_key = (topology_content_hash(compiled), epsilon_cap)
+    kernels = _KERNEL_CACHE.get(cache_key)
+    if kernels is None:
+        source = generate_kernel_source(compiled, epsilon_cap)
+        namespace: Dict[str, object] = {}
+        code = compile(source, f"<umx-codegen {compiled.gid} {cache_key[0][:12]}>", "exec")
+        exec(code, namespace)
+        kernels = (namespace["step_kernel"], namespace["advance_kernel"])
+        _KERNEL_CACHE[cache_key] = kernels
+        if len(_KERNEL_CACHE) > MAX_CACHED_KERNELS:
+            _KERNEL_CACHE.popitem(last=False)
+    else:
+        _KERNEL_CACHE.move_to_end(cache_key)
+    return kernels  # type: ignore[return-value]
+
+
+class CodegenKernel:
+    """Step/advance kernel running generated straight-line code per topology.
+
+    Topologies with more than ``max_edges`` edges (or no edges) use the
+    generic engine, where unrolled source would only cost compile time.
+    Arithmetic is on exact Python integers, so ``numeric_path`` is always
+    ``"bigint"``.
+    """
+
+    numeric_path: Optional[str] = BIGINT_PATH
+
+    def __init__(self, *, max_edges: int = CODEGEN_MAX_EDGES) -> None:
+        if max_edges <= 0:
+            raise ValueError("max_edges must be a positive integer")
+        self.max_edges = max_edges
+
+    def _kernels(
+        self, topo: TopologyProfileV1, profile: ProfileCMP0V1
+    ) -> Tuple[CompiledTopologyV1, Optional[Tuple[StepKernel, AdvanceKernel]]]:
+        compiled = compile_topology(topo)
+        if not 0 < compiled.E <= self.max_edges:
+            return compiled, None
+        return compiled, generated_kernels(compiled, profile.epsilon_cap)
+
+    def __call__(
+        self,
+        tick: int,
+        state: List[int],
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+        *,
+        columnar: bool = False,
+    ) -> UMXTickLedgerV1:
+        if len(state) != topo.N:
+            raise ValueError("State length must equal topology N")
+        compiled, kernels = self._kernels(topo, profile)
+        if kernels is None:
+            return step(tick, state, topo, profile, columnar=columnar)
+        pre_u = list(state)
+        du, raw, f_e, post_u, causal_applied, epsilon_applied = kernels[0](pre_u)
+        return _tick_ledger(
+            tick,
+            topo,
+            compiled,
+            pre_u=pre_u,
+            post_u=post_u,
+            du=du,
+            raw=raw,
+            f_e=f_e,
+            causal_applied=causal_applied,
+            epsilon_applied=epsilon_applied,
+            columnar=columnar,
+        )
+
+    step = __call__
+
+    def advance(
+        self, state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+    ) -> Tuple[List[int], bool, bool]:
+        if len(state) != topo.N:
+            raise ValueError("State length must equal topology N")
+        _, kernels = self._kernels(topo, profile)
+        if kernels is None:
+            return advance_state(state, topo, profile)
+        return kernels[1](state)
@@ -0,0 +1,119 @@
+"""Compiled, per-version view of a CMP-0 topology.
+
+``TopologyProfileV1`` is frozen, yet every tick used to re-sort its edges and
+re-resolve the effective causal radius and cap of each edge. A
+:class:`CompiledTopologyV1` resolves those values once and is memoised on the
+topology object itself, so a new topology (for example one produced by
+``core.slp.apply_slp_events``) automatically gets a fresh compilation while
+repeated ticks over the same topology reuse it.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from .topology_profile import EdgeColumnsV1, EdgeProfileV1, TopologyProfileV1
+
+_COMPILED_ATTR = "_compiled"
+
+
+@dataclass(frozen=True)
+class CompiledTopologyV1:
+    """Pre-resolved edge columns for one topology version.
+
+    All edge columns are ordered by ``e_id``. ``radii`` holds the effective
+    causal radius (``edge.causal_radius or edge.c or topo.causal_radius``)
+    with ``0`` meaning "no clamp", and ``caps`` holds
+    ``min(edge.cap, topo.max_edge_cap)``. ``memo`` lets other pillars cache
+    artefacts derived from this topology version (array forms, I-block
+    snapshots) without recomputing them per tick.
+    """
+
+    gid: str
+    N: int
+    SC: int
+    nap_ref: str
+    version: str
+    edges: Tuple[EdgeProfileV1, ...]
+    e_ids: Tuple[int, ...]
+    i_nodes: Tuple[int, ...]
+    j_nodes: Tuple[int, ...]
+    i_idx: Tuple[int, ...]
+    j_idx: Tuple[int, ...]
+    k: Tuple[int, ...]
+    caps: Tuple[int, ...]
+    radii: Tuple[int, ...]
+    memo: Dict[str, object] = field(default_factory=dict, compare=False, repr=False)
+
+    @property
+    def E(self) -> int:
+        return len(self.e_ids)
+
+
+def _compile_columns(topo: TopologyProfileV1, edges: EdgeColumnsV1) -> CompiledTopologyV1:
+    # Validation guarantees e_id == 1..E, so the columns are already in order.
+    max_edge_cap = topo.max_edge_cap
+    return CompiledTopologyV1(
+        gid=topo.gid,
+        N=topo.N,
+        SC=topo.SC,
+        nap_ref=topo.nap_ref or "",
+        version=str(topo.meta.get("version", "v1")),
+        edges=edges,  # type: ignore[arg-type]
+        e_ids=tuple(edges.e_id),
+        i_nodes=tuple(edges.i),
+        j_nodes=tuple(edges.j),
+        i_idx=tuple(i - 1 for i in edges.i),
+        j_idx=tuple(j - 1 for j in edges.j),
+        k=tuple(edges.k),
+        caps=tuple(
+            edges.cap if max_edge_cap is None else (min(cap, max_edge_cap) for cap in edges.cap)
+        ),
+        radii=tuple(
+            radius or c or topo.causal_radius or 0
+            for radius, c in zip(edges.causal_radius, edges.c)
+        ),
+    )
+
+
+def _compile(topo: TopologyProfileV1) -> CompiledTopologyV1:
+    if isinstance(topo.edges, EdgeColumnsV1):
+        return _compile_columns(topo, topo.edges)
+    edges = tuple(sorted(topo.edges, key=lambda e: e.e_id))
+    max_edge_cap = topo.max_edge_cap
+    return CompiledTopologyV1(
+        gid=topo.gid,
+        N=topo.N,
+        SC=topo.SC,
+        nap_ref=topo.nap_ref or "",
+        version=str(topo.meta.get("version", "v1")),
+        edges=edges,
+        e_ids=tuple(edge.e_id for edge in edges),
+        i_nodes=tuple(edge.i for edge in edges),
+        j_nodes=tuple(edge.j for edge in edges),
+        i_idx=tuple(edge.i - 1 for edge in edges),
+        j_idx=tuple(edge.j - 1 for edge in edges),
+        k=tuple(edge.k for edge in edges),
+        caps=tuple(
+            edge.cap if max_edge_cap is None else min(edge.cap, max_edge_cap)
+            for edge in edges
+        ),
+        radii=tuple(edge.causal_radius or edge.c or topo.causal_radius or 0 for edge in edges),
+    )
+
+
+def compile_topology(topo: TopologyProfileV1) -> CompiledTopologyV1:
+    """Return the memoised :class:`CompiledTopologyV1` for ``topo``.
+
+    The compilation is stored on the frozen topology instance, so it lives
+    exactly as long as that topology version; it is not pickled or copied
+    with the topology. Topologies are treated as immutable: mutating
+    ``topo.edges`` in place after compiling is not supported; build a new
+    profile instead.
+    """
+
+    compiled = topo.__dict__.get(_COMPILED_ATTR)
+    if compiled is None:
+        compiled = _compile(topo)
+        object.__setattr__(topo, _COMPILED_ATTR, compiled)
+    return compiled
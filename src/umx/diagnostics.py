@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Sequence
+from typing import List, Optional, Sequence, Tuple
 
 
 @dataclass
@@ -14,9 +14,22 @@ class UMXDiagnosticsConfig:
     overflow. Violations are surfaced via the returned diagnostics record and
     can optionally raise an exception when ``raise_on_violation`` is True.
 
+    ``overflow_limit`` flags state values whose magnitude exceeds the limit;
+    independently, every record carries the ``numeric_path`` (``"int64"`` or
+    ``"bigint"``) the engine used for that tick.
+
     Additional policy hooks can enforce causal-radius and epsilon-cap handling
     reported by the tick ledger. Setting ``kill_on_violation`` allows a caller
     to halt the run as soon as a violation is detected.
+
+    ``sample_every`` evaluates full records only on ticks divisible by it;
+    other ticks run a cheap screen and get a full record only when it flags
+    a violation. The screen checks conservation and policy notes from the
+    ledger sums and notes, plus a min/max pass over the state vectors when
+    ``allow_negative`` is False or ``overflow_limit`` is set, so every
+    violation still reaches the record history and the kill switch.
+    ``history_limit`` bounds how many records a run context retains; running
+    totals are kept in :class:`UMXDiagnosticsSummary` either way.
     """
 
     enabled: bool = False
@@ -27,6 +40,54 @@ class UMXDiagnosticsConfig:
     enforce_epsilon_cap: bool = False
     raise_on_violation: bool = False
     kill_on_violation: bool = False
+    sample_every: int = 1
+    history_limit: Optional[int] = None
+
+    def __post_init__(self) -> None:
+        if self.sample_every <= 0:
+            raise ValueError("sample_every must be a positive integer")
+        if self.history_limit is not None and self.history_limit <= 0:
+            raise ValueError("history_limit must be a positive integer when provided")
+
+    def is_sampled(self, tick: int) -> bool:
+        """Return True when ``tick`` falls on the sampling cadence."""
+
+        return tick % self.sample_every == 0
+
+    def screen_tick(
+        self,
+        *,
+        sum_pre_u: int,
+        sum_post_u: int,
+        z_check: int,
+        policy_notes: Sequence[str],
+        pre_u: Sequence[int] = (),
+        post_u: Sequence[int] = (),
+    ) -> bool:
+        """Return True when the cheap checks already flag a violation.
+
+        Sums and notes are checked in O(1); ``pre_u``/``post_u`` are only
+        scanned for their extrema when negatives or an overflow limit are
+        being enforced.
+        """
+
+        if self.check_conservation and not sum_pre_u == sum_post_u == z_check:
+            return True
+        if self.enforce_causal_radius and "causal_radius_clamped" in policy_notes:
+            return True
+        if self.enforce_epsilon_cap and "epsilon_cap_applied" in policy_notes:
+            return True
+        if self.allow_negative and self.overflow_limit is None:
+            return False
+        for values in (pre_u, post_u):
+            if len(values) == 0:
+                continue
+            low, high = min(values), max(values)
+            if not self.allow_negative and low < 0:
+                return True
+            if self.overflow_limit is not None and max(high, -low) > self.overflow_limit:
+                return True
+        return False
 
     def evaluate_tick(
         self,
@@ -38,6 +99,7 @@ class UMXDiagnosticsConfig:
         sum_post_u: Optional[int] = None,
         z_check: Optional[int] = None,
         policy_notes: Optional[Sequence[str]] = None,
+        numeric_path: Optional[str] = None,
     ) -> "UMXDiagnosticsRecord":
         """Evaluate invariants for a single tick and return diagnostics."""
 
@@ -49,6 +111,7 @@ class UMXDiagnosticsConfig:
             sum_post_u=sum_post_u,
             z_check=z_check,
             policy_notes=policy_notes,
+            numeric_path=numeric_path,
             config=self,
         )
         if self.raise_on_violation and record.violations:
@@ -58,6 +121,19 @@ class UMXDiagnosticsConfig:
         return record
 
 
+def _reduce(values: Sequence[int], known_sum: Optional[int]) -> Tuple[int, int, int]:
+    """Return ``(sum, min, max)`` of ``values`` (zeros when empty).
+
+    Uses the C-level builtins and skips the sum when the ledger already
+    supplies it.
+    """
+
+    if len(values) == 0:
+        return (0 if known_sum is None else known_sum), 0, 0
+    total = sum(values) if known_sum is None else known_sum
+    return total, min(values), max(values)
+
+
 @dataclass
 class UMXDiagnosticsRecord:
     """Per-tick diagnostic summary for a UMX run."""
@@ -78,6 +154,7 @@ class UMXDiagnosticsRecord:
     policy_notes: List[str] = field(default_factory=list)
     policy_violations: List[str] = field(default_factory=list)
     violations: List[str] = field(default_factory=list)
+    numeric_path: Optional[str] = None
 
     @classmethod
     def from_arrays(
@@ -91,31 +168,27 @@ class UMXDiagnosticsRecord:
         sum_post_u: Optional[int] = None,
         z_check: Optional[int] = None,
         policy_notes: Optional[Sequence[str]] = None,
+        numeric_path: Optional[str] = None,
     ) -> "UMXDiagnosticsRecord":
         """Create a diagnostics record from state arrays and config."""
 
-        computed_sum_pre = sum(pre_u)
-        computed_sum_post = sum(post_u)
-        sum_pre_val = computed_sum_pre if sum_pre_u is None else sum_pre_u
-        sum_post_val = computed_sum_post if sum_post_u is None else sum_post_u
+        sum_pre_val, min_pre, max_pre = _reduce(pre_u, sum_pre_u)
+        sum_post_val, min_post, max_post = _reduce(post_u, sum_post_u)
         z_target = sum_pre_val if z_check is None else z_check
 
         conservation_ok = sum_pre_val == sum_post_val == z_target
 
-        min_pre = min(pre_u) if pre_u else 0
-        max_pre = max(pre_u) if pre_u else 0
-        min_post = min(post_u) if post_u else 0
-        max_post = max(post_u) if post_u else 0
-
-        has_negative_pre = any(value < 0 for value in pre_u)
-        has_negative_post = any(value < 0 for value in post_u)
+        # Sign and magnitude checks follow from the extrema (one builtin min and
+        # max pass per vector) instead of rescanning the vector per check.
+        has_negative_pre = min_pre < 0
+        has_negative_post = min_post < 0
 
         overflow_pre = False
         overflow_post = False
         if config.overflow_limit is not None:
             limit = config.overflow_limit
-            overflow_pre = any(abs(value) > limit for value in pre_u)
-            overflow_post = any(abs(value) > limit for value in post_u)
+            overflow_pre = max(max_pre, -min_pre) > limit
+            overflow_post = max(max_post, -min_post) > limit
 
         notes = list(policy_notes or [])
         policy_violations: List[str] = []
@@ -154,4 +227,48 @@ class UMXDiagnosticsRecord:
             policy_notes=notes,
             policy_violations=policy_violations,
             violations=violations,
+            numeric_path=numeric_path,
         )
+
+
+@dataclass
+class UMXDiagnosticsSummary:
+    """Running aggregates over every tick a run context has checked.
+
+    Unlike the (possibly bounded) record history, these totals cover the
+    whole run: how many ticks were screened, how many got a full record on
+    the sampling cadence (``ticks_sampled``) or off it because the O(1)
+    screen flagged them (``ticks_flagged``), how many had violations (with
+    the first and latest such tick), and the extreme state values seen on
+    recorded ticks.
+    """
+
+    ticks_checked: int = 0
+    ticks_sampled: int = 0
+    ticks_flagged: int = 0
+    violation_ticks: int = 0
+    first_violation_tick: Optional[int] = None
+    last_violation_tick: Optional[int] = None
+    min_value: Optional[int] = None
+    max_value: Optional[int] = None
+
+    def add(self, record: UMXDiagnosticsRecord, *, sampled: bool = True) -> None:
+        """Fold one evaluated record into the aggregates.
+
+        ``sampled`` is False for records taken off the sampling cadence
+        because the screen flagged the tick.
+        """
+
+        if sampled:
+            self.ticks_sampled += 1
+        else:
+            self.ticks_flagged += 1
+        low = min(record.min_pre, record.min_post)
+        high = max(record.max_pre, record.max_post)
+        self.min_value = low if self.min_value is None else min(self.min_value, low)
+        self.max_value = high if self.max_value is None else max(self.max_value, high)
+        if record.violations:
+            self.violation_ticks += 1
+            if self.first_violation_tick is None:
+                self.first_violation_tick = record.tick
+            self.last_violation_tick = record.tick
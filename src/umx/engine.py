@@ -5,11 +5,21 @@ that emits `UMXTickLedger_v1` records.
 """
 from __future__ import annotations
 
-from typing import List
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
 
+from .compiled_topology import CompiledTopologyV1, compile_topology
 from .profile_cmp0 import ProfileCMP0V1
-from .tick_ledger import EdgeFluxV1, UMXTickLedgerV1
-from .topology_profile import EdgeProfileV1, TopologyProfileV1
+from .tick_ledger import EdgeFluxColumnsV1, EdgeFluxV1, IntColumn, UMXTickLedgerV1, int_column
+from .topology_profile import TopologyProfileV1
+
+StepFn = Callable[..., UMXTickLedgerV1]
+AdvanceFn = Callable[[List[int], TopologyProfileV1, ProfileCMP0V1], Tuple[List[int], bool, bool]]
+BACKENDS = ("auto", "python", "numpy", "active", "codegen")
+INT64_PATH = "int64"
+BIGINT_PATH = "bigint"
+# ``backend="auto"`` keeps topologies smaller than this on the Python path,
+# where NumPy's per-tick array set-up costs more than it saves.
+AUTO_NUMPY_MIN_EDGES = 64
 
 
 def _sign(value: int) -> int:
@@ -20,74 +30,121 @@ def _sign(value: int) -> int:
     return 0
 
 
-def _compute_flux(
-    edge: EdgeProfileV1,
-    pre_u: List[int],
-    scale: int,
-    *,
-    epsilon_cap: int | None,
-    causal_radius: int | None,
-    max_edge_cap: int | None,
-) -> tuple[EdgeFluxV1, bool, bool]:
-    i_idx = edge.i - 1
-    j_idx = edge.j - 1
-    du = pre_u[i_idx] - pre_u[j_idx]
-    magnitude = abs(du)
-    causal_applied = False
-    if causal_radius and magnitude > causal_radius:
-        magnitude = causal_radius
-        causal_applied = True
-    raw = (edge.k * magnitude) // scale
-    epsilon_applied = False
-    if epsilon_cap is not None and raw > epsilon_cap:
-        raw = epsilon_cap
-        epsilon_applied = True
-    effective_cap = edge.cap if max_edge_cap is None else min(edge.cap, max_edge_cap)
-    f_e = _sign(du) * min(raw, effective_cap, magnitude)
-    flux = EdgeFluxV1(
-        e_id=edge.e_id,
-        i=edge.i,
-        j=edge.j,
-        du=du,
-        raw=raw,
-        cap=effective_cap,
-        f_e=f_e,
-    )
-    return flux, causal_applied, epsilon_applied
+def _static_flux_columns(compiled: CompiledTopologyV1) -> Dict[str, IntColumn]:
+    """Return the per-topology ``e_id/i/j/cap`` columns shared by columnar ledgers."""
+
+    columns = compiled.memo.get("flux_static_columns")
+    if columns is None:
+        columns = {
+            "e_id": int_column(compiled.e_ids),
+            "i": int_column(compiled.i_nodes),
+            "j": int_column(compiled.j_nodes),
+            "cap": int_column(compiled.caps),
+        }
+        compiled.memo["flux_static_columns"] = columns
+    return columns
 
 
-def step(tick: int, state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1) -> UMXTickLedgerV1:
-    """Run one CMP-0 tick and return a UMX tick ledger."""
+def step(
+    tick: int,
+    state: List[int],
+    topo: TopologyProfileV1,
+    profile: ProfileCMP0V1,
+    *,
+    columnar: bool = False,
+) -> UMXTickLedgerV1:
+    """Run one CMP-0 tick and return a UMX tick ledger.
+
+    With ``columnar=True`` the ledger's ``edges`` is an
+    :class:`EdgeFluxColumnsV1` instead of a list of ``EdgeFluxV1`` objects.
+    """
 
     if len(state) != topo.N:
         raise ValueError("State length must equal topology N")
     pre_u = list(state)
     net = [0 for _ in pre_u]
-    fluxes: List[EdgeFluxV1] = []
+    du_column: List[int] = []
+    raw_column: List[int] = []
+    f_e_column: List[int] = []
 
     causal_applied = False
     epsilon_applied = False
 
-    sorted_edges = sorted(topo.edges, key=lambda e: e.e_id)
-    for edge in sorted_edges:
-        edge_radius = edge.causal_radius or edge.c or topo.causal_radius or None
-        flux, applied_causal, applied_epsilon = _compute_flux(
-            edge,
-            pre_u,
-            topo.SC,
-            epsilon_cap=profile.epsilon_cap,
-            causal_radius=edge_radius,
-            max_edge_cap=topo.max_edge_cap,
-        )
-        causal_applied = causal_applied or applied_causal
-        epsilon_applied = epsilon_applied or applied_epsilon
-        fluxes.append(flux)
-        i_idx = edge.i - 1
-        j_idx = edge.j - 1
-        net[i_idx] -= flux.f_e
-        net[j_idx] += flux.f_e
+    compiled = compile_topology(topo)
+    scale = topo.SC
+    epsilon_cap = profile.epsilon_cap
+    for i_idx, j_idx, k, cap, radius in zip(
+        compiled.i_idx,
+        compiled.j_idx,
+        compiled.k,
+        compiled.caps,
+        compiled.radii,
+    ):
+        du = pre_u[i_idx] - pre_u[j_idx]
+        magnitude = abs(du)
+        if radius and magnitude > radius:
+            magnitude = radius
+            causal_applied = True
+        raw = (k * magnitude) // scale
+        if epsilon_cap is not None and raw > epsilon_cap:
+            raw = epsilon_cap
+            epsilon_applied = True
+        f_e = _sign(du) * min(raw, cap, magnitude)
+        du_column.append(du)
+        raw_column.append(raw)
+        f_e_column.append(f_e)
+        net[i_idx] -= f_e
+        net[j_idx] += f_e
 
     post_u = [pre + delta for pre, delta in zip(pre_u, net)]
+    return _tick_ledger(
+        tick,
+        topo,
+        compiled,
+        pre_u=pre_u,
+        post_u=post_u,
+        du=du_column,
+        raw=raw_column,
+        f_e=f_e_column,
+        causal_applied=causal_applied,
+        epsilon_applied=epsilon_applied,
+        columnar=columnar,
+    )
+
+
+def _tick_ledger(
+    tick: int,
+    topo: TopologyProfileV1,
+    compiled: CompiledTopologyV1,
+    *,
+    pre_u: List[int],
+    post_u: List[int],
+    du: List[int],
+    raw: List[int],
+    f_e: List[int],
+    causal_applied: bool,
+    epsilon_applied: bool,
+    columnar: bool,
+) -> UMXTickLedgerV1:
+    """Assemble a tick ledger from per-edge columns ordered by ``e_id``."""
+
+    fluxes: Sequence[EdgeFluxV1]
+    if columnar:
+        fluxes = EdgeFluxColumnsV1(**_static_flux_columns(compiled), du=du, raw=raw, f_e=f_e)
+    else:
+        fluxes = [
+            EdgeFluxV1(e_id=e_id, i=i, j=j, du=du_e, raw=raw_e, cap=cap, f_e=f_e_e)
+            for e_id, i, j, du_e, raw_e, cap, f_e_e in zip(
+                compiled.e_ids,
+                compiled.i_nodes,
+                compiled.j_nodes,
+                du,
+                raw,
+                compiled.caps,
+                f_e,
+            )
+        ]
+
     sum_pre_u = sum(pre_u)
     sum_post_u = sum(post_u)
     z_check = sum_pre_u
@@ -103,8 +160,161 @@ def step(tick: int, state: List[int], topo: TopologyProfileV1, profile: ProfileC
         nap_ref=topo.nap_ref or "",
         causal_radius_applied=causal_applied,
         epsilon_applied=epsilon_applied,
-        policy_notes=[note for note in [
-            "causal_radius_clamped" if causal_applied else None,
-            "epsilon_cap_applied" if epsilon_applied else None,
-        ] if note],
+        policy_notes=policy_notes(causal_applied, epsilon_applied),
     )
+
+
+def policy_notes(causal_applied: bool, epsilon_applied: bool) -> List[str]:
+    """Return the ledger ``policy_notes`` for the given policy flags."""
+
+    return [note for note in [
+        "causal_radius_clamped" if causal_applied else None,
+        "epsilon_cap_applied" if epsilon_applied else None,
+    ] if note]
+
+
+def advance_state(
+    state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+) -> Tuple[List[int], bool, bool]:
+    """Advance ``state`` by one CMP-0 tick without building a ledger.
+
+    Returns ``(post_u, causal_radius_applied, epsilon_applied)``; ``post_u``
+    matches ``step(...).post_u`` exactly.
+    """
+
+    if len(state) != topo.N:
+        raise ValueError("State length must equal topology N")
+    net = [0] * len(state)
+    causal_applied = False
+    epsilon_applied = False
+
+    compiled = compile_topology(topo)
+    scale = topo.SC
+    epsilon_cap = profile.epsilon_cap
+    for i_idx, j_idx, k, cap, radius in zip(
+        compiled.i_idx,
+        compiled.j_idx,
+        compiled.k,
+        compiled.caps,
+        compiled.radii,
+    ):
+        du = state[i_idx] - state[j_idx]
+        magnitude = abs(du)
+        if radius and magnitude > radius:
+            magnitude = radius
+            causal_applied = True
+        raw = (k * magnitude) // scale
+        if epsilon_cap is not None and raw > epsilon_cap:
+            raw = epsilon_cap
+            epsilon_applied = True
+        if du:
+            f_e = min(raw, cap, magnitude)
+            if du < 0:
+                f_e = -f_e
+            net[i_idx] -= f_e
+            net[j_idx] += f_e
+
+    return [pre + delta for pre, delta in zip(state, net)], causal_applied, epsilon_applied
+
+
+class PythonKernel:
+    """Reference step/advance kernel on exact Python integers."""
+
+    numeric_path: Optional[str] = BIGINT_PATH
+
+    def __call__(
+        self,
+        tick: int,
+        state: List[int],
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+        *,
+        columnar: bool = False,
+    ) -> UMXTickLedgerV1:
+        return step(tick, state, topo, profile, columnar=columnar)
+
+    step = __call__
+
+    def advance(
+        self, state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+    ) -> Tuple[List[int], bool, bool]:
+        return advance_state(state, topo, profile)
+
+
+def resolve_kernel(name: str):
+    """Return a kernel object for backend ``name``.
+
+    Kernels expose ``step`` (a :data:`StepFn`), ``advance`` (an
+    :data:`AdvanceFn`) and ``numeric_path``, the numeric path (``"int64"``
+    or ``"bigint"``) taken by their most recent tick. ``"auto"`` selects the
+    int64 NumPy kernel when NumPy is installed, falling back to exact Python
+    integers per tick, and the Python kernel otherwise. ``"codegen"`` runs
+    straight-line code generated per topology (see :mod:`umx.codegen`).
+    """
+
+    if name == "python":
+        return PythonKernel()
+    if name in ("numpy", "auto"):
+        from .numpy_backend import NUMPY_AVAILABLE, NumpyKernel
+
+        if name == "numpy":
+            return NumpyKernel()
+        if NUMPY_AVAILABLE:
+            return NumpyKernel(min_edges=AUTO_NUMPY_MIN_EDGES)
+        return PythonKernel()
+    if name == "active":
+        from .active_set import ActiveSetStepper
+
+        return ActiveSetStepper()
+    if name == "codegen":
+        from .codegen import CodegenKernel
+
+        return CodegenKernel()
+    raise ValueError(f"Unknown UMX backend '{name}' (expected one of {list(BACKENDS)})")
+
+
+def resolve_backend(name: str) -> StepFn:
+    """Return the step implementation registered for backend ``name``.
+
+    ``"python"`` is the reference engine above. ``"numpy"`` selects the
+    vectorised implementation in :mod:`umx.numpy_backend`, which requires NumPy
+    to be installed and produces identical ledgers. ``"active"`` returns a fresh
+    :class:`umx.active_set.ActiveSetStepper`, which caches the previous tick
+    and only re-evaluates edges around nodes that changed; each run should
+    resolve its own. ``"auto"`` and ``"codegen"`` are described in
+    :func:`resolve_kernel`.
+    """
+
+    if name in ("auto", "codegen"):
+        return resolve_kernel(name).step
+    if name == "python":
+        return step
+    if name == "numpy":
+        from .numpy_backend import _require_numpy, step_numpy
+
+        _require_numpy()
+        return step_numpy
+    if name == "active":
+        from .active_set import ActiveSetStepper
+
+        return ActiveSetStepper()
+    raise ValueError(f"Unknown UMX backend '{name}' (expected one of {list(BACKENDS)})")
+
+
+def resolve_state_kernel(name: str) -> AdvanceFn:
+    """Return the state-only :func:`advance_state` kernel for backend ``name``."""
+
+    if name in ("auto", "codegen"):
+        return resolve_kernel(name).advance
+    if name == "python":
+        return advance_state
+    if name == "numpy":
+        from .numpy_backend import _require_numpy, advance_state_numpy
+
+        _require_numpy()
+        return advance_state_numpy
+    if name == "active":
+        from .active_set import ActiveSetStepper
+
+        return ActiveSetStepper().advance
+    raise ValueError(f"Unknown UMX backend '{name}' (expected one of {list(BACKENDS)})")
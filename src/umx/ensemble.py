@@ -0,0 +1,228 @@
+"""Batched CMP-0 stepping for many initial states over one topology.
+
+:class:`UMXEnsembleContext` holds a ``[members x N]`` state matrix and advances
+every member per tick with one shared compiled topology. Members never
+interact, so each row evolves exactly as an independent
+:class:`~umx.run_context.UMXRunContext` would; full tick ledgers are only
+built for the members a caller asks for.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from .compiled_topology import compile_topology
+from .engine import BACKENDS, AdvanceFn, advance_state, resolve_state_kernel, step
+from .profile_cmp0 import ProfileCMP0V1
+from .tick_ledger import UMXTickLedgerV1
+from .topology_profile import TopologyProfileV1
+
+_INT64_SAFE = 2**62
+
+
+@dataclass(frozen=True)
+class UMXEnsembleMemberSummaryV1:
+    """Compact per-member view of an ensemble run at its current tick."""
+
+    member: int
+    tick: int
+    sum_u: int
+    min_u: int
+    max_u: int
+    conservation_ok: bool
+    causal_radius_ticks: int
+    epsilon_ticks: int
+
+
+@dataclass
+class UMXEnsembleContext:
+    """Advance many independent CMP-0 states over one topology in lock-step.
+
+    ``backend="numpy"`` steps the whole state matrix with int64 array
+    operations (falling back to exact Python integers for any tick that cannot
+    be proven to fit in int64); ``"python"`` loops over members with the shared
+    compiled topology and ``"active"`` gives each member its own active-set
+    kernel, ``"codegen"`` shares one generated kernel (see
+    :mod:`umx.codegen`); ``"auto"`` resolves to ``"numpy"`` when NumPy is installed.
+    Per-member ledgers are built on demand via
+    :meth:`step`/:meth:`run_until` and match ``UMXRunContext`` exactly.
+    """
+
+    topo: TopologyProfileV1
+    profile: ProfileCMP0V1
+    backend: str = "python"
+    columnar: bool = False
+    tick: int = 0
+    _rows: Optional[List[List[int]]] = field(default=None, init=False, repr=False)
+    _matrix: Optional[object] = field(default=None, init=False, repr=False)
+    _initial_sums: List[int] = field(default_factory=list, init=False, repr=False)
+    _causal_ticks: List[int] = field(default_factory=list, init=False, repr=False)
+    _epsilon_ticks: List[int] = field(default_factory=list, init=False, repr=False)
+    _kernels: List[AdvanceFn] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.backend not in BACKENDS:
+            raise ValueError(
+                f"Unknown UMX backend '{self.backend}' (expected one of {list(BACKENDS)})"
+            )
+        if self.backend == "auto":
+            from .numpy_backend import NUMPY_AVAILABLE
+
+            self.backend = "numpy" if NUMPY_AVAILABLE else "python"
+        if self.backend == "numpy":
+            from .numpy_backend import _require_numpy
+
+            _require_numpy()
+        compile_topology(self.topo)
+
+    @property
+    def members(self) -> int:
+        return len(self._initial_sums)
+
+    def init_states(self, states: Iterable[Sequence[int]]) -> None:
+        """Set one initial state per member and reset the tick counter."""
+
+        rows = [[int(value) for value in state] for state in states]
+        if not rows:
+            raise ValueError("At least one ensemble member is required")
+        if any(len(row) != self.topo.N for row in rows):
+            raise ValueError("Initial state length must match topology N")
+        self._rows = rows
+        self._matrix = None
+        self._initial_sums = [sum(row) for row in rows]
+        self._causal_ticks = [0 for _ in rows]
+        self._epsilon_ticks = [0 for _ in rows]
+        self._kernels = [
+            resolve_state_kernel(self.backend)
+            if self.backend in ("active", "codegen")
+            else advance_state
+            for _ in rows
+        ]
+        self.tick = 0
+
+    def member_state(self, member: int) -> List[int]:
+        """Return a copy of one member's current state vector."""
+
+        self._require_member(member)
+        if self._matrix is not None:
+            return self._matrix[member].tolist()
+        return list(self._rows[member])
+
+    def current_states(self) -> List[List[int]]:
+        """Return copies of every member's current state vector."""
+
+        self._require_states()
+        if self._matrix is not None:
+            return self._matrix.tolist()
+        return [list(row) for row in self._rows]
+
+    def step(self, members: Optional[Sequence[int]] = None) -> Dict[int, UMXTickLedgerV1]:
+        """Advance every member by one tick.
+
+        Returns tick ledgers for the requested ``members`` (none by default),
+        keyed by member index.
+        """
+
+        self._require_states()
+        for member in members or ():
+            self._require_member(member)
+        next_tick = self.tick + 1
+        ledgers = {
+            member: step(
+                next_tick,
+                self.member_state(member),
+                self.topo,
+                self.profile,
+                columnar=self.columnar,
+            )
+            for member in members or ()
+        }
+        causal_flags, epsilon_flags = self._advance()
+        for member, (causal, epsilon) in enumerate(zip(causal_flags, epsilon_flags)):
+            if causal:
+                self._causal_ticks[member] += 1
+            if epsilon:
+                self._epsilon_ticks[member] += 1
+        self.tick = next_tick
+        return ledgers
+
+    def run_until(
+        self, t_max: int, *, members: Optional[Sequence[int]] = None
+    ) -> Dict[int, List[UMXTickLedgerV1]]:
+        """Run all members to ``tick == t_max``.
+
+        Returns the ledgers of the requested ``members`` for every tick run.
+        """
+
+        if t_max < self.tick:
+            raise ValueError("t_max must be greater than or equal to current tick")
+        collected: Dict[int, List[UMXTickLedgerV1]] = {member: [] for member in members or ()}
+        while self.tick < t_max:
+            for member, ledger in self.step(members).items():
+                collected[member].append(ledger)
+        return collected
+
+    def summaries(self) -> List[UMXEnsembleMemberSummaryV1]:
+        """Return a summary for every member at the current tick."""
+
+        states = self.current_states()
+        return [
+            UMXEnsembleMemberSummaryV1(
+                member=member,
+                tick=self.tick,
+                sum_u=sum(state),
+                min_u=min(state),
+                max_u=max(state),
+                conservation_ok=sum(state) == self._initial_sums[member],
+                causal_radius_ticks=self._causal_ticks[member],
+                epsilon_ticks=self._epsilon_ticks[member],
+            )
+            for member, state in enumerate(states)
+        ]
+
+    def _advance(self) -> tuple[List[bool], List[bool]]:
+        if self.backend == "numpy":
+            flags = self._advance_matrix()
+            if flags is not None:
+                return flags
+        rows = self._rows if self._matrix is None else self._matrix.tolist()
+        advanced: List[List[int]] = []
+        causal_flags: List[bool] = []
+        epsilon_flags: List[bool] = []
+        for row, kernel in zip(rows, self._kernels):
+            post_u, causal, epsilon = kernel(row, self.topo, self.profile)
+            advanced.append(post_u)
+            causal_flags.append(causal)
+            epsilon_flags.append(epsilon)
+        self._rows = advanced
+        self._matrix = None
+        return causal_flags, epsilon_flags
+
+    def _advance_matrix(self) -> Optional[tuple[List[bool], List[bool]]]:
+        import numpy as np
+
+        from .numpy_backend import advance_states_numpy
+
+        matrix = self._matrix
+        if matrix is None:
+            if any(abs(value) >= _INT64_SAFE for row in self._rows for value in row):
+                return None
+            matrix = np.asarray(self._rows, dtype=np.int64)
+        result = advance_states_numpy(matrix, self.topo, self.profile)
+        if result is None:
+            self._rows = matrix.tolist()
+            self._matrix = None
+            return None
+        post, causal_any, epsilon_any = result
+        self._matrix = post
+        self._rows = None
+        return causal_any.tolist(), epsilon_any.tolist()
+
+    def _require_states(self) -> None:
+        if self._rows is None and self._matrix is None:
+            raise ValueError("Call init_states(states) before stepping the ensemble")
+
+    def _require_member(self, member: int) -> None:
+        self._require_states()
+        if not 0 <= member < self.members:
+            raise ValueError(f"Unknown ensemble member {member}")
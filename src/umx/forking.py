@@ -0,0 +1,216 @@
+"""Copy-on-write forks of run contexts for what-if evaluation.
+
+``fork()`` on :class:`UMXRunContext`, ``LoomRunContext`` and
+``LoomChainRecorder`` returns a branch that shares the parent's recorded
+history instead of copying it. Histories are append-only, so a branch only
+needs the parent's sequence and the length it had at the fork point; anything
+either side appends afterwards stays private to that side. State vectors are
+shared the same way: run contexts replace ``state`` on every tick rather than
+mutating it, so the first tick of a branch is what gives it its own copy.
+
+:func:`evaluate_forks` runs many branches of one context to a target tick,
+optionally in a process pool, and collects a small measurement from each.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from itertools import islice
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+Scenario = Callable[[Any], None]
+Measure = Callable[[Any], Any]
+
+
+class ForkedHistory(Sequence):
+    """Append-only sequence that shares a frozen prefix with its parent.
+
+    The first ``base_len`` items are read from ``base`` (which may keep
+    growing without affecting this view); appended items live in a private
+    tail. Integer and slice indexing, iteration and equality behave like a
+    list. Pickling materialises a plain list.
+    """
+
+    __slots__ = ("_base", "_base_len", "_tail")
+
+    def __init__(self, base: Sequence = (), base_len: Optional[int] = None) -> None:
+        self._base = base
+        self._base_len = len(base) if base_len is None else base_len
+        self._tail: List[Any] = []
+
+    def __len__(self) -> int:
+        return self._base_len + len(self._tail)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self._item(pos) for pos in range(*index.indices(len(self)))]
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("history index out of range")
+        return self._item(index)
+
+    def _item(self, index: int) -> Any:
+        if index < self._base_len:
+            return self._base[index]
+        return self._tail[index - self._base_len]
+
+    def __iter__(self) -> Iterator[Any]:
+        yield from islice(self._base, self._base_len)
+        yield from self._tail
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Sequence) or isinstance(other, (str, bytes)):
+            return NotImplemented
+        return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ForkedHistory({list(self)!r})"
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+    def append(self, item: Any) -> None:
+        self._tail.append(item)
+
+    def extend(self, items) -> None:
+        self._tail.extend(items)
+
+
+def fork_history(history: Sequence) -> Sequence:
+    """Return a branch of ``history`` that shares its current items.
+
+    Bounded ``deque`` histories are small by construction and are copied
+    (keeping ``maxlen``); everything else becomes a :class:`ForkedHistory`.
+    Forking an untouched fork reuses its base so fork-of-fork chains stay
+    one level deep.
+    """
+
+    if isinstance(history, deque):
+        return deque(history, maxlen=history.maxlen)
+    if isinstance(history, ForkedHistory) and not history._tail:
+        return ForkedHistory(history._base, history._base_len)
+    return ForkedHistory(history)
+
+
+@dataclass(frozen=True)
+class ForkOutcomeV1:
+    """Result of running one scenario on a fork.
+
+    ``result`` is whatever the measure returned; ``error`` holds the message
+    of a ``ValueError`` raised while applying the scenario or advancing the
+    fork (for example a diagnostics kill-switch), in which case ``result`` is
+    ``None``.
+    """
+
+    index: int
+    tick: int
+    result: Any = None
+    error: Optional[str] = None
+
+
+def _umx_ctx(ctx: Any) -> Any:
+    return getattr(ctx, "umx_ctx", None) or ctx
+
+
+def final_state(fork: Any) -> Tuple[int, ...]:
+    """Default measure: the fork's UMX state vector after the run."""
+
+    return tuple(_umx_ctx(fork).current_state())
+
+
+def _advance(fork: Any, t_max: int) -> None:
+    fast_forward = getattr(fork, "fast_forward", None)
+    if fast_forward is not None:
+        fast_forward(t_max)
+    else:
+        fork.run_until(t_max)
+
+
+def _run_scenario(
+    base: Any, index: int, scenario: Optional[Scenario], t_max: int, measure: Measure
+) -> ForkOutcomeV1:
+    fork = base.fork()
+    try:
+        if scenario is not None:
+            scenario(fork)
+        _advance(fork, t_max)
+    except ValueError as exc:
+        return ForkOutcomeV1(index=index, tick=_umx_ctx(fork).tick, error=str(exc))
+    return ForkOutcomeV1(index=index, tick=_umx_ctx(fork).tick, result=measure(fork))
+
+
+_WORKER_BASE: Any = None
+_WORKER_MEASURE: Optional[Measure] = None
+
+
+def _init_worker(base: Any, measure: Measure) -> None:
+    global _WORKER_BASE, _WORKER_MEASURE
+    _WORKER_BASE = base
+    _WORKER_MEASURE = measure
+
+
+def _worker_run(index: int, scenario: Optional[Scenario], t_max: int) -> ForkOutcomeV1:
+    return _run_scenario(_WORKER_BASE, index, scenario, t_max, _WORKER_MEASURE)
+
+
+def _default_start_method() -> Optional[str]:
+    # Forked workers inherit the base context through copy-on-write pages, so
+    # nothing but the scenarios and measurements crosses the process boundary.
+    return "fork" if "fork" in multiprocessing.get_all_start_methods() else None
+
+
+def evaluate_forks(
+    ctx: Any,
+    scenarios: Sequence[Optional[Scenario]],
+    t_max: int,
+    *,
+    measure: Optional[Measure] = None,
+    workers: Optional[int] = None,
+    start_method: Optional[str] = None,
+) -> List[ForkOutcomeV1]:
+    """Run each scenario on its own fork of ``ctx`` up to ``t_max``.
+
+    ``ctx`` is any context with ``fork()`` (a :class:`UMXRunContext` or
+    ``LoomRunContext``). Each scenario is called with a fresh fork before it
+    is advanced (``None`` runs the unchanged baseline); ``measure`` maps the
+    advanced fork to its result and defaults to :func:`final_state`.
+    ``ctx`` itself is never modified. Outcomes come back in scenario order.
+
+    With ``workers`` greater than one (default: the CPU count) the scenarios
+    run in a process pool. Scenarios, the measure and its results must then be
+    picklable; under the default ``fork`` start method the base context is
+    inherited by the workers rather than serialised.
+    """
+
+    if workers is not None and workers <= 0:
+        raise ValueError("workers must be a positive integer when provided")
+    if t_max < _umx_ctx(ctx).tick:
+        raise ValueError("t_max must be greater than or equal to the current tick")
+    measure = measure or final_state
+    workers = min(workers or os.cpu_count() or 1, len(scenarios))
+
+    if workers <= 1:
+        return [
+            _run_scenario(ctx, index, scenario, t_max, measure)
+            for index, scenario in enumerate(scenarios)
+        ]
+
+    context = multiprocessing.get_context(start_method or _default_start_method())
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_worker,
+        initargs=(ctx, measure),
+    ) as pool:
+        futures = [
+            pool.submit(_worker_run, index, scenario, t_max)
+            for index, scenario in enumerate(scenarios)
+        ]
+        return [future.result() for future in futures]
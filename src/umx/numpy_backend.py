@@ -0,0 +1,402 @@
+"""Vectorised NumPy backend for the CMP-0 UMX step.
+
+The backend evaluates the CMP-0 flux rule with whole-array ``int64``
+operations instead of walking ``topo.edges`` in Python. Ledgers are rebuilt as
+plain Python integers so they are bit-for-bit identical to
+:func:`umx.engine.step`, including the causal-radius/epsilon policy flags.
+
+NumPy is optional: :data:`NUMPY_AVAILABLE` reports whether the backend can be
+used, and callers should fall back to the pure-Python engine otherwise. When a
+tick cannot be proven to stay inside the exact ``int64`` range the backend
+delegates to the pure-Python ``step`` so results never depend on machine-word
+overflow. :class:`NumpyKernel` wraps both entry points and records which
+numeric path (``"int64"`` or ``"bigint"``) the last tick took.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np  # type: ignore
+except Exception:  # pragma: no cover - fallback when NumPy is absent
+    np = None
+
+from .compiled_topology import CompiledTopologyV1, compile_topology
+from .engine import (
+    BIGINT_PATH,
+    INT64_PATH,
+    _static_flux_columns,
+    advance_state as python_advance_state,
+    policy_notes,
+    step as python_step,
+)
+from .profile_cmp0 import ProfileCMP0V1
+from .tick_ledger import EdgeFluxColumnsV1, EdgeFluxV1, UMXTickLedgerV1
+from .topology_profile import TopologyProfileV1
+
+NUMPY_AVAILABLE = np is not None
+
+# Largest magnitude that intermediate values may reach while staying exact in
+# int64 (``_INT64_SAFE``) or in the float64 weights used by ``np.bincount``
+# (``_FLOAT64_EXACT``).
+_INT64_SAFE = 2**62
+_FLOAT64_EXACT = 2**53
+_ARRAYS_KEY = "numpy_edge_arrays"
+
+
+@dataclass(frozen=True)
+class _EdgeArrays:
+    """Per-topology int64 edge columns ordered by ``e_id``."""
+
+    e_id: "np.ndarray"
+    i: "np.ndarray"
+    j: "np.ndarray"
+    i_idx: "np.ndarray"
+    j_idx: "np.ndarray"
+    k: "np.ndarray"
+    cap: "np.ndarray"
+    radius: "np.ndarray"
+    max_abs_k: int
+    max_abs_cap: int
+    max_abs_radius: int
+    max_degree: int
+    nonnegative: bool
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError(
+            "NumPy is required for the 'numpy' UMX backend; install it (e.g.,"
+            " python -m pip install numpy) or use backend='python'"
+        )
+
+
+def _build_edge_arrays(compiled: CompiledTopologyV1) -> Optional[_EdgeArrays]:
+    caps = compiled.caps
+    radii = compiled.radii
+    ks = compiled.k
+    if any(abs(value) >= _INT64_SAFE for value in (*caps, *radii, *ks)):
+        return None
+
+    i_nodes = np.asarray(compiled.i_nodes, dtype=np.int64)
+    j_nodes = np.asarray(compiled.j_nodes, dtype=np.int64)
+    degree = np.bincount(np.concatenate((i_nodes, j_nodes)), minlength=compiled.N + 1)
+    return _EdgeArrays(
+        e_id=np.asarray(compiled.e_ids, dtype=np.int64),
+        i=i_nodes,
+        j=j_nodes,
+        i_idx=i_nodes - 1,
+        j_idx=j_nodes - 1,
+        k=np.asarray(ks, dtype=np.int64),
+        cap=np.asarray(caps, dtype=np.int64),
+        radius=np.asarray(radii, dtype=np.int64),
+        max_abs_k=max((abs(value) for value in ks), default=0),
+        max_abs_cap=max((abs(value) for value in caps), default=0),
+        max_abs_radius=max((abs(value) for value in radii), default=0),
+        max_degree=int(degree.max()) if degree.size else 0,
+        nonnegative=min((*ks, *caps, *radii), default=0) >= 0,
+    )
+
+
+def _edge_arrays(topo: TopologyProfileV1) -> Optional[_EdgeArrays]:
+    """Return memoised edge arrays for ``topo`` (``None`` when not int64-safe)."""
+
+    compiled = compile_topology(topo)
+    if _ARRAYS_KEY not in compiled.memo:
+        compiled.memo[_ARRAYS_KEY] = _build_edge_arrays(compiled)
+    return compiled.memo[_ARRAYS_KEY]
+
+
+def _int64_column(values: "np.ndarray") -> array:
+    column = array("q")
+    column.frombytes(values.astype(np.int64, copy=False).tobytes())
+    return column
+
+
+@dataclass(frozen=True)
+class _TickArrays:
+    """Int64 intermediate results of one vectorised tick."""
+
+    arrays: _EdgeArrays
+    u: "np.ndarray"
+    du: "np.ndarray"
+    raw: "np.ndarray"
+    f_e: "np.ndarray"
+    net: "np.ndarray"
+    causal_applied: bool
+    epsilon_applied: bool
+    sums_int64: bool
+
+
+def _f_e_bound(
+    arrays: _EdgeArrays, max_abs_u: int, topo: TopologyProfileV1, profile: ProfileCMP0V1
+) -> Optional[int]:
+    """Bound ``|f_e|`` for states with ``max |u| == max_abs_u`` (``None`` if not int64-safe)."""
+
+    epsilon_cap = profile.epsilon_cap
+    if topo.SC >= _INT64_SAFE or (epsilon_cap is not None and epsilon_cap >= _INT64_SAFE):
+        return None
+    magnitude_bound = 2 * max_abs_u
+    if arrays.max_abs_radius:
+        magnitude_bound = max(magnitude_bound, arrays.max_abs_radius)
+    raw_bound = magnitude_bound * max(arrays.max_abs_k, 1)
+    f_e_bound = magnitude_bound
+    if not arrays.nonnegative:
+        f_e_bound = max(raw_bound, arrays.max_abs_cap, magnitude_bound)
+    net_bound = max_abs_u + arrays.max_degree * f_e_bound
+    if raw_bound >= _INT64_SAFE or net_bound >= _INT64_SAFE:
+        return None
+    return f_e_bound
+
+
+def _flux_arrays(
+    u: "np.ndarray",
+    arrays: _EdgeArrays,
+    topo: TopologyProfileV1,
+    profile: ProfileCMP0V1,
+    f_e_bound: int,
+) -> Tuple["np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray", "np.ndarray"]:
+    """Evaluate the flux rule over the last axis of ``u``.
+
+    ``u`` is either one state vector ``[N]`` or a member-by-node matrix
+    ``[M, N]``. Returns ``du, raw, f_e, net`` plus the causal-radius and
+    epsilon flags reduced over the edge axis.
+    """
+
+    epsilon_cap = profile.epsilon_cap
+    du = u[..., arrays.i_idx] - u[..., arrays.j_idx]
+    magnitude = np.abs(du)
+    causal_mask = (arrays.radius != 0) & (magnitude > arrays.radius)
+    magnitude = np.where(causal_mask, arrays.radius, magnitude)
+    raw = (arrays.k * magnitude) // topo.SC
+    epsilon_any = np.zeros(u.shape[:-1], dtype=bool)
+    if epsilon_cap is not None:
+        epsilon_mask = raw > epsilon_cap
+        epsilon_any = epsilon_mask.any(axis=-1)
+        raw = np.where(epsilon_mask, epsilon_cap, raw)
+    f_e = np.sign(du) * np.minimum(np.minimum(raw, arrays.cap), magnitude)
+
+    members = int(np.prod(u.shape[:-1], dtype=np.int64))
+    offsets = (np.arange(members, dtype=np.int64) * topo.N).reshape(u.shape[:-1] + (1,))
+    i_flat = (arrays.i_idx + offsets).ravel()
+    j_flat = (arrays.j_idx + offsets).ravel()
+    f_flat = f_e.ravel()
+    if arrays.max_degree * f_e_bound < _FLOAT64_EXACT:
+        net = np.bincount(j_flat, weights=f_flat, minlength=members * topo.N) - np.bincount(
+            i_flat, weights=f_flat, minlength=members * topo.N
+        )
+        net = net.astype(np.int64)
+    else:
+        net = np.zeros(members * topo.N, dtype=np.int64)
+        np.subtract.at(net, i_flat, f_flat)
+        np.add.at(net, j_flat, f_flat)
+
+    return du, raw, f_e, net.reshape(u.shape), causal_mask.any(axis=-1), epsilon_any
+
+
+def _compute_tick(
+    pre_u: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+) -> Optional[_TickArrays]:
+    """Evaluate the flux rule with int64 arrays, or ``None`` when not provably exact."""
+
+    arrays = _edge_arrays(topo)
+    if arrays is None or not pre_u:
+        return None
+    max_abs_u = max(max(pre_u), -min(pre_u))
+    f_e_bound = _f_e_bound(arrays, max_abs_u, topo, profile)
+    if f_e_bound is None:
+        return None
+
+    u = np.asarray(pre_u, dtype=np.int64)
+    du, raw, f_e, net, causal_any, epsilon_any = _flux_arrays(u, arrays, topo, profile, f_e_bound)
+    return _TickArrays(
+        arrays=arrays,
+        u=u,
+        du=du,
+        raw=raw,
+        f_e=f_e,
+        net=net,
+        causal_applied=bool(causal_any),
+        epsilon_applied=bool(epsilon_any),
+        # Every pre/post value is bounded by the net bound, so both state sums
+        # are exact in int64 when N copies of it still fit.
+        sums_int64=topo.N * (max_abs_u + arrays.max_degree * f_e_bound) < _INT64_SAFE,
+    )
+
+
+def _step(
+    tick: int,
+    state: List[int],
+    topo: TopologyProfileV1,
+    profile: ProfileCMP0V1,
+    columnar: bool,
+) -> Tuple[UMXTickLedgerV1, str]:
+    if len(state) != topo.N:
+        raise ValueError("State length must equal topology N")
+    pre_u = list(state)
+    result = _compute_tick(pre_u, topo, profile)
+    if result is None:
+        return python_step(tick, pre_u, topo, profile, columnar=columnar), BIGINT_PATH
+
+    arrays = result.arrays
+    fluxes: Sequence[EdgeFluxV1]
+    if columnar:
+        fluxes = EdgeFluxColumnsV1(
+            **_static_flux_columns(compile_topology(topo)),
+            du=_int64_column(result.du),
+            raw=_int64_column(result.raw),
+            f_e=_int64_column(result.f_e),
+        )
+    else:
+        fluxes = [
+            EdgeFluxV1(e_id=e_id, i=i, j=j, du=d, raw=r, cap=c, f_e=f)
+            for e_id, i, j, d, r, c, f in zip(
+                arrays.e_id.tolist(),
+                arrays.i.tolist(),
+                arrays.j.tolist(),
+                result.du.tolist(),
+                result.raw.tolist(),
+                arrays.cap.tolist(),
+                result.f_e.tolist(),
+            )
+        ]
+    post = result.u + result.net
+    post_u = post.tolist()
+    if result.sums_int64:
+        sum_pre_u = int(result.u.sum())
+        sum_post_u = int(post.sum())
+    else:
+        sum_pre_u = sum(pre_u)
+        sum_post_u = sum(post_u)
+
+    ledger = UMXTickLedgerV1(
+        tick=tick,
+        sum_pre_u=sum_pre_u,
+        sum_post_u=sum_post_u,
+        z_check=sum_pre_u,
+        pre_u=pre_u,
+        edges=fluxes,
+        post_u=post_u,
+        nap_ref=topo.nap_ref or "",
+        causal_radius_applied=result.causal_applied,
+        epsilon_applied=result.epsilon_applied,
+        policy_notes=policy_notes(result.causal_applied, result.epsilon_applied),
+    )
+    return ledger, INT64_PATH
+
+
+def _advance(
+    state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+) -> Tuple[Tuple[List[int], bool, bool], str]:
+    if len(state) != topo.N:
+        raise ValueError("State length must equal topology N")
+    result = _compute_tick(list(state), topo, profile)
+    if result is None:
+        return python_advance_state(state, topo, profile), BIGINT_PATH
+    post_u = (result.u + result.net).tolist()
+    return (post_u, result.causal_applied, result.epsilon_applied), INT64_PATH
+
+
+def step_numpy(
+    tick: int,
+    state: List[int],
+    topo: TopologyProfileV1,
+    profile: ProfileCMP0V1,
+    *,
+    columnar: bool = False,
+) -> UMXTickLedgerV1:
+    """Run one CMP-0 tick with NumPy arrays and return a UMX tick ledger.
+
+    ``columnar=True`` copies the flux arrays straight into an
+    :class:`EdgeFluxColumnsV1` instead of building ``EdgeFluxV1`` objects.
+    """
+
+    _require_numpy()
+    return _step(tick, state, topo, profile, columnar)[0]
+
+
+def advance_state_numpy(
+    state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+) -> Tuple[List[int], bool, bool]:
+    """State-only counterpart of :func:`step_numpy` (see ``engine.advance_state``)."""
+
+    _require_numpy()
+    return _advance(state, topo, profile)[0]
+
+
+class NumpyKernel:
+    """Step/advance kernel on the int64 fast path with exact big-int fallback.
+
+    Every tick first proves from ``max |u|`` and the compiled topology's
+    ``max |k|``, caps, radii and degree that ``k * |du|``, the node net flows
+    and the state sums fit in int64; only then are arrays used, otherwise the
+    tick runs on exact Python integers. :attr:`numeric_path` reports the path
+    of the most recent tick (``None`` before the first one). Topologies with
+    fewer than ``min_edges`` edges always take the Python path, where array
+    set-up costs more than it saves.
+    """
+
+    def __init__(self, *, min_edges: int = 0) -> None:
+        _require_numpy()
+        self.min_edges = min_edges
+        self.numeric_path: Optional[str] = None
+
+    def __call__(
+        self,
+        tick: int,
+        state: List[int],
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+        *,
+        columnar: bool = False,
+    ) -> UMXTickLedgerV1:
+        return self.step(tick, state, topo, profile, columnar=columnar)
+
+    def step(
+        self,
+        tick: int,
+        state: List[int],
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+        *,
+        columnar: bool = False,
+    ) -> UMXTickLedgerV1:
+        if compile_topology(topo).E < self.min_edges:
+            self.numeric_path = BIGINT_PATH
+            return python_step(tick, state, topo, profile, columnar=columnar)
+        ledger, self.numeric_path = _step(tick, state, topo, profile, columnar)
+        return ledger
+
+    def advance(
+        self, state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+    ) -> Tuple[List[int], bool, bool]:
+        if compile_topology(topo).E < self.min_edges:
+            self.numeric_path = BIGINT_PATH
+            return python_advance_state(state, topo, profile)
+        result, self.numeric_path = _advance(state, topo, profile)
+        return result
+
+
+def advance_states_numpy(
+    states: "np.ndarray", topo: TopologyProfileV1, profile: ProfileCMP0V1
+) -> Optional[Tuple["np.ndarray", "np.ndarray", "np.ndarray"]]:
+    """Advance an int64 ``[members, N]`` state matrix by one tick.
+
+    Returns ``(post, causal_applied, epsilon_applied)`` with one flag per
+    member, or ``None`` when the tick cannot be proven exact in int64 (callers
+    then fall back to per-member :func:`engine.advance_state`).
+    """
+
+    _require_numpy()
+    if states.ndim != 2 or states.shape[1] != topo.N:
+        raise ValueError("State matrix must have shape [members, N]")
+    arrays = _edge_arrays(topo)
+    if arrays is None or states.size == 0:
+        return None
+    f_e_bound = _f_e_bound(arrays, int(np.abs(states).max()), topo, profile)
+    if f_e_bound is None:
+        return None
+    _, _, _, net, causal_any, epsilon_any = _flux_arrays(states, arrays, topo, profile, f_e_bound)
+    return states + net, causal_any, epsilon_any
@@ -0,0 +1,447 @@
+"""Graph-partitioned, multi-process CMP-0 stepping.
+
+Nodes are split into contiguous, degree-balanced partitions and every edge is
+owned by the partition of its ``i`` endpoint; edges whose ``j`` endpoint lives
+elsewhere are *cut* edges and read that node from the shared state (the halo).
+:class:`PartitionedExecutor` keeps the state vector and the per-edge
+``du/raw/f_e`` columns in one :mod:`multiprocessing.shared_memory` block of
+int64 words, runs one worker process per partition, and reduces the
+per-partition net flows in the parent. Integer addition is exact, so the
+reduction order does not matter and ledgers (including edge order) are
+identical to :func:`umx.engine.step`. Ticks whose values cannot be proven to
+fit in int64 fall back to the exact single-process engine.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import weakref
+from array import array
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from .compiled_topology import CompiledTopologyV1, compile_topology
+from .engine import (
+    BIGINT_PATH,
+    INT64_PATH,
+    _static_flux_columns,
+    advance_state,
+    policy_notes,
+    step,
+)
+from .profile_cmp0 import ProfileCMP0V1
+from .tick_ledger import EdgeFluxColumnsV1, EdgeFluxV1, UMXTickLedgerV1
+from .topology_profile import TopologyProfileV1
+
+_INT64_SAFE = 2**62
+_WORD_BYTES = 8
+
+
+@dataclass(frozen=True)
+class PartitionPlanV1:
+    """Deterministic assignment of nodes and edges to ``parts`` partitions.
+
+    ``node_owner[n]`` is the partition of 0-based node ``n``;
+    ``edge_positions[p]`` lists (in ``e_id`` order) the edge positions owned by
+    partition ``p`` and ``halo_nodes[p]`` the nodes it reads but does not own.
+    """
+
+    parts: int
+    node_owner: Tuple[int, ...]
+    edge_positions: Tuple[Tuple[int, ...], ...]
+    halo_nodes: Tuple[Tuple[int, ...], ...]
+    cut_edges: int
+
+
+def partition_nodes(topo: TopologyProfileV1, parts: int) -> Tuple[int, ...]:
+    """Split node ids into ``parts`` contiguous ranges of similar degree.
+
+    Each node weighs ``1 + degree`` so partitions carry comparable edge work;
+    the result only depends on the topology, never on process state.
+    """
+
+    if parts <= 0:
+        raise ValueError("parts must be a positive integer")
+    compiled = compile_topology(topo)
+    weights = [1] * compiled.N
+    for i_idx, j_idx in zip(compiled.i_idx, compiled.j_idx):
+        weights[i_idx] += 1
+        weights[j_idx] += 1
+    total = sum(weights)
+    owners: List[int] = []
+    before = 0
+    for weight in weights:
+        owners.append(min(parts - 1, before * parts // total))
+        before += weight
+    return tuple(owners)
+
+
+def plan_partitions(topo: TopologyProfileV1, parts: int) -> PartitionPlanV1:
+    """Return the :class:`PartitionPlanV1` used by :class:`PartitionedExecutor`."""
+
+    compiled = compile_topology(topo)
+    parts = max(1, min(parts, compiled.N))
+    owners = partition_nodes(topo, parts)
+    positions: List[List[int]] = [[] for _ in range(parts)]
+    halos: List[set] = [set() for _ in range(parts)]
+    cut_edges = 0
+    for position, (i_idx, j_idx) in enumerate(zip(compiled.i_idx, compiled.j_idx)):
+        owner = owners[i_idx]
+        positions[owner].append(position)
+        if owners[j_idx] != owner:
+            halos[owner].add(j_idx)
+            cut_edges += 1
+    return PartitionPlanV1(
+        parts=parts,
+        node_owner=owners,
+        edge_positions=tuple(tuple(bucket) for bucket in positions),
+        halo_nodes=tuple(tuple(sorted(halo)) for halo in halos),
+        cut_edges=cut_edges,
+    )
+
+
+@dataclass(frozen=True)
+class _PartitionSpec:
+    """Static inputs shipped once to the worker that owns one partition."""
+
+    nodes: Tuple[int, ...]
+    positions: Tuple[int, ...]
+    local_i: Tuple[int, ...]
+    local_j: Tuple[int, ...]
+    k: Tuple[int, ...]
+    caps: Tuple[int, ...]
+    radii: Tuple[int, ...]
+    N: int
+    E: int
+    net_offset: int
+
+
+def _partition_specs(compiled: CompiledTopologyV1, plan: PartitionPlanV1) -> List[_PartitionSpec]:
+    specs: List[_PartitionSpec] = []
+    net_offset = compiled.N + 3 * compiled.E
+    for positions in plan.edge_positions:
+        nodes = sorted(
+            {compiled.i_idx[pos] for pos in positions} | {compiled.j_idx[pos] for pos in positions}
+        )
+        local = {node: index for index, node in enumerate(nodes)}
+        specs.append(
+            _PartitionSpec(
+                nodes=tuple(nodes),
+                positions=positions,
+                local_i=tuple(local[compiled.i_idx[pos]] for pos in positions),
+                local_j=tuple(local[compiled.j_idx[pos]] for pos in positions),
+                k=tuple(compiled.k[pos] for pos in positions),
+                caps=tuple(compiled.caps[pos] for pos in positions),
+                radii=tuple(compiled.radii[pos] for pos in positions),
+                N=compiled.N,
+                E=compiled.E,
+                net_offset=net_offset,
+            )
+        )
+        net_offset += len(nodes)
+    return specs
+
+
+def _evaluate_partition(
+    words: memoryview, spec: _PartitionSpec, scale: int, epsilon_cap: Optional[int]
+) -> Tuple[bool, bool]:
+    """Evaluate one partition's edges against the shared state ``words``."""
+
+    state = [words[node] for node in spec.nodes]
+    net = [0] * len(spec.nodes)
+    du_offset = spec.N
+    raw_offset = du_offset + spec.E
+    f_e_offset = raw_offset + spec.E
+    causal_applied = False
+    epsilon_applied = False
+    for position, i_local, j_local, k, cap, radius in zip(
+        spec.positions, spec.local_i, spec.local_j, spec.k, spec.caps, spec.radii
+    ):
+        du = state[i_local] - state[j_local]
+        magnitude = abs(du)
+        if radius and magnitude > radius:
+            magnitude = radius
+            causal_applied = True
+        raw = (k * magnitude) // scale
+        if epsilon_cap is not None and raw > epsilon_cap:
+            raw = epsilon_cap
+            epsilon_applied = True
+        f_e = 0
+        if du:
+            f_e = min(raw, cap, magnitude)
+            if du < 0:
+                f_e = -f_e
+            net[i_local] -= f_e
+            net[j_local] += f_e
+        words[du_offset + position] = du
+        words[raw_offset + position] = raw
+        words[f_e_offset + position] = f_e
+    words[spec.net_offset : spec.net_offset + len(net)] = array("q", net)
+    return causal_applied, epsilon_applied
+
+
+def _worker_main(connection: Any, shm_name: str, spec: _PartitionSpec) -> None:
+    block = shared_memory.SharedMemory(name=shm_name)
+    words = block.buf.cast("q")
+    try:
+        while True:
+            message = connection.recv()
+            if message is None:
+                break
+            try:
+                connection.send(_evaluate_partition(words, spec, *message))
+            except Exception as exc:  # pragma: no cover - surfaced in the parent
+                connection.send(exc)
+    finally:
+        words.release()
+        block.close()
+        connection.close()
+
+
+def _shutdown(
+    processes: List[Any], connections: List[Any], block: Any, views: List[memoryview]
+) -> None:
+    for connection in connections:
+        try:
+            connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+    for process in processes:
+        process.join(timeout=5)
+        if process.is_alive():  # pragma: no cover - defensive
+            process.terminate()
+    for connection in connections:
+        connection.close()
+    for view in views:
+        view.release()
+    block.close()
+    block.unlink()
+
+
+class _WorkerPool:
+    """Worker processes plus the shared int64 block for one topology version."""
+
+    def __init__(
+        self, compiled: CompiledTopologyV1, plan: PartitionPlanV1, context: Any
+    ) -> None:
+        specs = _partition_specs(compiled, plan)
+        words = compiled.N + 3 * compiled.E + sum(len(spec.nodes) for spec in specs)
+        self.compiled = compiled
+        self.specs = specs
+        self.block = shared_memory.SharedMemory(create=True, size=max(words, 1) * _WORD_BYTES)
+        self.words = self.block.buf.cast("q")
+        self.connections: List[Any] = []
+        processes: List[Any] = []
+        for spec in specs:
+            parent_end, child_end = context.Pipe()
+            process = context.Process(
+                target=_worker_main, args=(child_end, self.block.name, spec), daemon=True
+            )
+            process.start()
+            child_end.close()
+            self.connections.append(parent_end)
+            processes.append(process)
+        self._finalizer = weakref.finalize(
+            self, _shutdown, processes, list(self.connections), self.block, [self.words]
+        )
+
+    def run(
+        self, state: Sequence[int], scale: int, epsilon_cap: Optional[int]
+    ) -> Tuple[List[int], bool, bool]:
+        """Evaluate one tick; returns ``(net, causal_applied, epsilon_applied)``."""
+
+        N = self.compiled.N
+        self.words[0:N] = array("q", state)
+        for connection in self.connections:
+            connection.send((scale, epsilon_cap))
+        causal_applied = False
+        epsilon_applied = False
+        for part, connection in enumerate(self.connections):
+            reply = connection.recv()
+            if isinstance(reply, BaseException):
+                raise RuntimeError(f"UMX partition worker {part} failed: {reply!r}") from reply
+            causal_applied = causal_applied or reply[0]
+            epsilon_applied = epsilon_applied or reply[1]
+        net = [0] * N
+        for spec in self.specs:
+            partial = self.words[spec.net_offset : spec.net_offset + len(spec.nodes)].tolist()
+            for node, delta in zip(spec.nodes, partial):
+                net[node] += delta
+        return net, causal_applied, epsilon_applied
+
+    def column(self, index: int) -> List[int]:
+        """Return the ``du`` (0), ``raw`` (1) or ``f_e`` (2) column of the last tick."""
+
+        start = self.compiled.N + index * self.compiled.E
+        return self.words[start : start + self.compiled.E].tolist()
+
+    def close(self) -> None:
+        self._finalizer()
+
+
+def _static_bounds(compiled: CompiledTopologyV1) -> Optional[Dict[str, int]]:
+    bounds = compiled.memo.get("partitioned_bounds", False)
+    if bounds is False:
+        statics = (*compiled.k, *compiled.caps, *compiled.radii)
+        bounds = None
+        if all(abs(value) < _INT64_SAFE for value in statics):
+            degree = [0] * compiled.N
+            for i_idx, j_idx in zip(compiled.i_idx, compiled.j_idx):
+                degree[i_idx] += 1
+                degree[j_idx] += 1
+            bounds = {
+                "max_abs_k": max((abs(value) for value in compiled.k), default=0),
+                "max_abs_cap": max((abs(value) for value in compiled.caps), default=0),
+                "max_abs_radius": max((abs(value) for value in compiled.radii), default=0),
+                "max_degree": max(degree, default=0),
+                "nonnegative": int(min(statics, default=0) >= 0),
+            }
+        compiled.memo["partitioned_bounds"] = bounds
+    return bounds
+
+
+def int64_safe(state: Sequence[int], topo: TopologyProfileV1, profile: ProfileCMP0V1) -> bool:
+    """Return True when one tick from ``state`` provably stays within int64."""
+
+    bounds = _static_bounds(compile_topology(topo))
+    epsilon_cap = profile.epsilon_cap
+    if bounds is None or topo.SC >= _INT64_SAFE:
+        return False
+    if epsilon_cap is not None and epsilon_cap >= _INT64_SAFE:
+        return False
+    max_abs_u = max((abs(value) for value in state), default=0)
+    magnitude_bound = max(2 * max_abs_u, bounds["max_abs_radius"])
+    raw_bound = magnitude_bound * max(bounds["max_abs_k"], 1)
+    f_e_bound = magnitude_bound
+    if not bounds["nonnegative"]:
+        f_e_bound = max(raw_bound, bounds["max_abs_cap"], magnitude_bound)
+    net_bound = max_abs_u + bounds["max_degree"] * f_e_bound
+    return raw_bound < _INT64_SAFE and net_bound < _INT64_SAFE
+
+
+class PartitionedExecutor:
+    """Multi-process step/advance kernel over a partitioned topology.
+
+    ``workers`` partitions are evaluated by as many worker processes; the pool
+    is started lazily for the first topology it sees and rebuilt when a new
+    topology version arrives (e.g. after SLP growth). Use it as a context
+    manager or call :meth:`close` to stop the workers and free the shared
+    memory. Pass an instance as ``UMXRunContext(executor=...)`` to use it as a
+    run's execution strategy.
+    """
+
+    def __init__(self, workers: int = 2, *, start_method: Optional[str] = None) -> None:
+        if workers <= 0:
+            raise ValueError("workers must be a positive integer")
+        self.workers = workers
+        self.start_method = start_method
+        self.fallback_ticks = 0
+        self.numeric_path: Optional[str] = None
+        self._pool: Optional[_WorkerPool] = None
+        self._plan: Optional[PartitionPlanV1] = None
+
+    def __enter__(self) -> "PartitionedExecutor":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def __call__(
+        self,
+        tick: int,
+        state: List[int],
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+        *,
+        columnar: bool = False,
+    ) -> UMXTickLedgerV1:
+        return self.step(tick, state, topo, profile, columnar=columnar)
+
+    @property
+    def plan(self) -> Optional[PartitionPlanV1]:
+        """Partition plan for the current topology (``None`` before first use)."""
+
+        return self._plan
+
+    def step(
+        self,
+        tick: int,
+        state: List[int],
+        topo: TopologyProfileV1,
+        profile: ProfileCMP0V1,
+        *,
+        columnar: bool = False,
+    ) -> UMXTickLedgerV1:
+        """Run one CMP-0 tick and return a ledger identical to ``engine.step``."""
+
+        if len(state) != topo.N:
+            raise ValueError("State length must equal topology N")
+        if not int64_safe(state, topo, profile):
+            self.fallback_ticks += 1
+            self.numeric_path = BIGINT_PATH
+            return step(tick, state, topo, profile, columnar=columnar)
+        self.numeric_path = INT64_PATH
+        pool = self._pool_for(topo)
+        net, causal_applied, epsilon_applied = pool.run(state, topo.SC, profile.epsilon_cap)
+        compiled = pool.compiled
+        du, raw, f_e = pool.column(0), pool.column(1), pool.column(2)
+        fluxes: Sequence[EdgeFluxV1]
+        if columnar:
+            fluxes = EdgeFluxColumnsV1(**_static_flux_columns(compiled), du=du, raw=raw, f_e=f_e)
+        else:
+            fluxes = [
+                EdgeFluxV1(e_id=e_id, i=i, j=j, du=du_e, raw=raw_e, cap=cap, f_e=f_e_e)
+                for e_id, i, j, du_e, raw_e, cap, f_e_e in zip(
+                    compiled.e_ids, compiled.i_nodes, compiled.j_nodes, du, raw, compiled.caps, f_e
+                )
+            ]
+        pre_u = list(state)
+        post_u = [value + delta for value, delta in zip(pre_u, net)]
+        sum_pre_u = sum(pre_u)
+        return UMXTickLedgerV1(
+            tick=tick,
+            sum_pre_u=sum_pre_u,
+            sum_post_u=sum(post_u),
+            z_check=sum_pre_u,
+            pre_u=pre_u,
+            edges=fluxes,
+            post_u=post_u,
+            nap_ref=topo.nap_ref or "",
+            causal_radius_applied=causal_applied,
+            epsilon_applied=epsilon_applied,
+            policy_notes=policy_notes(causal_applied, epsilon_applied),
+        )
+
+    def advance(
+        self, state: List[int], topo: TopologyProfileV1, profile: ProfileCMP0V1
+    ) -> Tuple[List[int], bool, bool]:
+        """State-only counterpart of :meth:`step` (see ``engine.advance_state``)."""
+
+        if len(state) != topo.N:
+            raise ValueError("State length must equal topology N")
+        if not int64_safe(state, topo, profile):
+            self.fallback_ticks += 1
+            self.numeric_path = BIGINT_PATH
+            return advance_state(state, topo, profile)
+        self.numeric_path = INT64_PATH
+        net, causal_applied, epsilon_applied = self._pool_for(topo).run(
+            state, topo.SC, profile.epsilon_cap
+        )
+        return [value + delta for value, delta in zip(state, net)], causal_applied, epsilon_applied
+
+    def close(self) -> None:
+        """Stop the worker processes and release the shared memory block."""
+
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def _pool_for(self, topo: TopologyProfileV1) -> _WorkerPool:
+        compiled = compile_topology(topo)
+        if self._pool is None or self._pool.compiled is not compiled:
+            self.close()
+            self._plan = plan_partitions(topo, self.workers)
+            self._pool = _WorkerPool(
+                compiled, self._plan, multiprocessing.get_context(self.start_method)
+            )
+        return self._pool
@@ -6,11 +6,13 @@ one process without relying on globals or GF-01-specific wiring.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import List, Optional, Sequence
+from collections import deque
+from dataclasses import dataclass, field, replace
+from typing import Any, List, MutableSequence, Optional, Sequence
 
-from .engine import step as umx_step
-from .diagnostics import UMXDiagnosticsConfig, UMXDiagnosticsRecord
+from .engine import AdvanceFn, StepFn, policy_notes, resolve_kernel
+from .diagnostics import UMXDiagnosticsConfig, UMXDiagnosticsRecord, UMXDiagnosticsSummary
+from .forking import fork_history
 from .profile_cmp0 import ProfileCMP0V1
 from .tick_ledger import UMXTickLedgerV1
 from .topology_profile import TopologyProfileV1
@@ -22,8 +24,19 @@ class UMXRunContext:
 
     The context holds the static configuration (topology and CMP-0 profile),
     mutable simulation state, and simple run metadata. It exposes convenience
-    methods to initialise the state, advance one tick, or run to a target tick
-    while returning the emitted ledgers.
+    methods to initialise the state, advance one tick, run to a target tick
+    while returning the emitted ledgers, or fast-forward the state without
+    building ledgers. ``backend`` selects the step implementation
+    (``"auto"``, ``"python"``, ``"numpy"``, ``"active"`` or ``"codegen"``); all
+    backends emit identical ledgers. The default ``"auto"`` runs each tick on the int64
+    fast path when it can be proven exact and on Python integers otherwise;
+    ``numeric_path`` records the path of the latest tick and is copied into
+    diagnostics records.
+    ``columnar`` makes ledgers carry :class:`EdgeFluxColumnsV1` edges instead
+    of per-edge ``EdgeFluxV1`` objects. ``executor`` plugs in a stateful
+    execution strategy exposing ``step``/``advance`` (for example
+    :class:`umx.partitioned.PartitionedExecutor`) in place of ``backend``;
+    the caller owns its lifecycle.
     """
 
     topo: TopologyProfileV1
@@ -33,17 +46,34 @@ class UMXRunContext:
     tick: int = 0
     state: Optional[List[int]] = field(default=None, repr=False)
     diag_config: Optional[UMXDiagnosticsConfig] = None
-    diagnostics: List[UMXDiagnosticsRecord] = field(default_factory=list, repr=False)
+    diagnostics: MutableSequence[UMXDiagnosticsRecord] = field(
+        default_factory=list, repr=False
+    )
+    diagnostics_summary: UMXDiagnosticsSummary = field(
+        default_factory=UMXDiagnosticsSummary, repr=False
+    )
     killed: bool = False
     kill_reason: Optional[str] = None
+    backend: str = "auto"
+    columnar: bool = False
+    executor: Optional[Any] = field(default=None, repr=False, compare=False)
+    numeric_path: Optional[str] = field(default=None, init=False, compare=False)
+    _kernel: Any = field(init=False, repr=False, compare=False)
+    _step_fn: StepFn = field(init=False, repr=False, compare=False)
+    _advance_fn: AdvanceFn = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
+        self._kernel = self.executor if self.executor is not None else resolve_kernel(self.backend)
+        self._step_fn = self._kernel.step
+        self._advance_fn = self._kernel.advance
         if not self.gid:
             self.gid = self.topo.gid
         if not self.run_id:
             self.run_id = self.topo.gid
         if self.diag_config is None:
             self.diag_config = UMXDiagnosticsConfig(enabled=False)
+        if self.diag_config.history_limit is not None:
+            self.diagnostics = deque(self.diagnostics, maxlen=self.diag_config.history_limit)
 
     def init_state(self, u0: List[int]) -> None:
         """Set the initial state vector and reset the tick counter.
@@ -59,6 +89,40 @@ class UMXRunContext:
         self.killed = False
         self.kill_reason = None
 
+    def fork(
+        self,
+        *,
+        topo: Optional[TopologyProfileV1] = None,
+        profile: Optional[ProfileCMP0V1] = None,
+    ) -> "UMXRunContext":
+        """Return a copy-on-write branch of this run at the current tick.
+
+        The branch shares the state vector and diagnostics history with this
+        context; both sides replace rather than mutate them, so neither sees
+        the other's later ticks. ``topo``/``profile`` override the static
+        configuration for what-if runs (the node count must not change). The
+        branch runs on ``backend``; an ``executor`` is not shared.
+        """
+
+        topo = self.topo if topo is None else topo
+        if self.state is not None and len(self.state) != topo.N:
+            raise ValueError("Forked topology must keep the state length N")
+        return UMXRunContext(
+            topo=topo,
+            profile=self.profile if profile is None else profile,
+            gid=self.gid,
+            run_id=self.run_id,
+            tick=self.tick,
+            state=self.state,
+            diag_config=self.diag_config,
+            diagnostics=fork_history(self.diagnostics),
+            diagnostics_summary=replace(self.diagnostics_summary),
+            killed=self.killed,
+            kill_reason=self.kill_reason,
+            backend=self.backend,
+            columnar=self.columnar,
+        )
+
     def apply_external_inputs(self, deltas: Sequence[int]) -> List[int]:
         """Apply a vector of external inputs to the current state.
 
@@ -86,28 +150,65 @@ class UMXRunContext:
             )
 
         next_tick = self.tick + 1
-        ledger = umx_step(next_tick, self.state, self.topo, self.profile)
-        if self.diag_config and self.diag_config.enabled:
-            diagnostics = self.diag_config.evaluate_tick(
-                tick=ledger.tick,
-                pre_u=ledger.pre_u,
-                post_u=ledger.post_u,
-                sum_pre_u=ledger.sum_pre_u,
-                sum_post_u=ledger.sum_post_u,
-                z_check=ledger.z_check,
-                policy_notes=ledger.policy_notes,
-            )
-            self.diagnostics.append(diagnostics)
-            if self.diag_config.kill_on_violation and diagnostics.violations:
-                self.killed = True
-                self.kill_reason = "; ".join(diagnostics.violations)
-                raise ValueError(
-                    f"UMX run killed at tick {ledger.tick}: {self.kill_reason}"
-                )
+        ledger = self._step_fn(
+            next_tick, self.state, self.topo, self.profile, columnar=self.columnar
+        )
+        self.numeric_path = getattr(self._kernel, "numeric_path", None)
+        self._run_diagnostics(
+            tick=ledger.tick,
+            pre_u=ledger.pre_u,
+            post_u=ledger.post_u,
+            sum_pre_u=ledger.sum_pre_u,
+            sum_post_u=ledger.sum_post_u,
+            z_check=ledger.z_check,
+            policy_notes=ledger.policy_notes,
+        )
         self.state = ledger.post_u
         self.tick = ledger.tick
         return ledger
 
+    def _run_diagnostics(
+        self,
+        *,
+        tick: int,
+        pre_u: Sequence[int],
+        post_u: Sequence[int],
+        sum_pre_u: int,
+        sum_post_u: int,
+        z_check: int,
+        policy_notes: Sequence[str],
+    ) -> None:
+        config = self.diag_config
+        if not (config and config.enabled):
+            return
+        self.diagnostics_summary.ticks_checked += 1
+        sampled = config.is_sampled(tick)
+        if not sampled and not config.screen_tick(
+            sum_pre_u=sum_pre_u,
+            sum_post_u=sum_post_u,
+            z_check=z_check,
+            policy_notes=policy_notes,
+            pre_u=pre_u,
+            post_u=post_u,
+        ):
+            return
+        diagnostics = config.evaluate_tick(
+            tick=tick,
+            pre_u=pre_u,
+            post_u=post_u,
+            sum_pre_u=sum_pre_u,
+            sum_post_u=sum_post_u,
+            z_check=z_check,
+            policy_notes=policy_notes,
+            numeric_path=self.numeric_path,
+        )
+        self.diagnostics.append(diagnostics)
+        self.diagnostics_summary.add(diagnostics, sampled=sampled)
+        if config.kill_on_violation and diagnostics.violations:
+            self.killed = True
+            self.kill_reason = "; ".join(diagnostics.violations)
+            raise ValueError(f"UMX run killed at tick {tick}: {self.kill_reason}")
+
     def run_until(self, t_max: int) -> List[UMXTickLedgerV1]:
         """Run ticks until ``tick == t_max`` and return emitted ledgers."""
 
@@ -118,6 +219,71 @@ class UMXRunContext:
             ledgers.append(self.step())
         return ledgers
 
+    def fast_forward(
+        self,
+        t_max: int,
+        *,
+        emit_every: Optional[int] = None,
+        emit_final: bool = False,
+        check_every: Optional[int] = 1,
+    ) -> List[UMXTickLedgerV1]:
+        """Advance to ``tick == t_max`` without building a ledger for every tick.
+
+        Intermediate ticks only update the state vector. Ledgers are built (via
+        :meth:`step`) for ticks divisible by ``emit_every`` and, when
+        ``emit_final`` is True, for ``t_max``; those are returned in order.
+        Every ``check_every``-th state-only tick is checked for conservation and
+        run through the diagnostics config (if enabled) exactly like
+        :meth:`step`; ``check_every=None`` skips intermediate checks. The final
+        state is identical to ``run_until(t_max)``.
+        """
+
+        if self.state is None:
+            raise ValueError("Call init_state(u0) before stepping the run")
+        if t_max < self.tick:
+            raise ValueError("t_max must be greater than or equal to current tick")
+        if emit_every is not None and emit_every <= 0:
+            raise ValueError("emit_every must be a positive integer when provided")
+        if check_every is not None and check_every <= 0:
+            raise ValueError("check_every must be a positive integer when provided")
+
+        ledgers: List[UMXTickLedgerV1] = []
+        while self.tick < t_max:
+            next_tick = self.tick + 1
+            if (emit_every is not None and next_tick % emit_every == 0) or (
+                emit_final and next_tick == t_max
+            ):
+                ledgers.append(self.step())
+                continue
+            if self.killed:
+                raise ValueError(
+                    f"Run halted by kill-switch: {self.kill_reason or 'violation recorded'}"
+                )
+            pre_u = self.state
+            post_u, causal_applied, epsilon_applied = self._advance_fn(
+                pre_u, self.topo, self.profile
+            )
+            self.numeric_path = getattr(self._kernel, "numeric_path", None)
+            if check_every is not None and next_tick % check_every == 0:
+                sum_pre_u = sum(pre_u)
+                sum_post_u = sum(post_u)
+                if sum_pre_u != sum_post_u:
+                    raise ValueError(
+                        "Conservation failed: sum_pre_u, sum_post_u, z_check must match"
+                    )
+                self._run_diagnostics(
+                    tick=next_tick,
+                    pre_u=pre_u,
+                    post_u=post_u,
+                    sum_pre_u=sum_pre_u,
+                    sum_post_u=sum_post_u,
+                    z_check=sum_pre_u,
+                    policy_notes=policy_notes(causal_applied, epsilon_applied),
+                )
+            self.state = post_u
+            self.tick = next_tick
+        return ledgers
+
     def current_state(self) -> List[int]:
         """Return a copy of the current state vector."""
 
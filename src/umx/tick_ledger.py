@@ -2,12 +2,15 @@
 
 Implements the `EdgeFlux_v1` and `UMXTickLedger_v1` shapes from the
 contracts. These are light dataclasses that carry per-tick state and
-flux details.
+flux details. :class:`EdgeFluxColumnsV1` is a columnar stand-in for the
+``edges`` list that stores one integer column per ``EdgeFlux_v1`` field and only
+builds :class:`EdgeFluxV1` objects when individual edges are accessed.
 """
 from __future__ import annotations
 
+from array import array
 from dataclasses import dataclass, field
-from typing import List
+from typing import Dict, Iterator, List, Sequence, Union, overload
 
 
 @dataclass(frozen=True)
@@ -23,16 +26,160 @@ class EdgeFluxV1:
     f_e: int
 
 
+EDGE_FLUX_FIELDS = ("e_id", "i", "j", "du", "raw", "cap", "f_e")
+
+IntColumn = Union[array, List[int]]
+
+
+def int_column(values: Sequence[int]) -> IntColumn:
+    """Pack ``values`` into an ``array('q')``, keeping a list beyond int64."""
+
+    if isinstance(values, array) and values.typecode == "q":
+        return values
+    try:
+        return array("q", values)
+    except OverflowError:
+        return list(values)
+
+
+class EdgeFluxColumnsV1(Sequence[EdgeFluxV1]):
+    """Struct-of-arrays view over the per-edge fluxes of one tick.
+
+    Behaves like a read-only ``List[EdgeFluxV1]`` (indexing, iteration,
+    equality with lists) but keeps ``e_id/i/j/du/raw/cap/f_e`` as integer
+    columns. Consumers that only need a few fields should read the columns
+    via :meth:`column` or the matching attributes instead of iterating.
+    Columns may be shared between ticks (the static ``e_id/i/j/cap`` columns
+    usually are) and must not be mutated.
+    """
+
+    __slots__ = EDGE_FLUX_FIELDS
+    __hash__ = None  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        *,
+        e_id: Sequence[int],
+        i: Sequence[int],
+        j: Sequence[int],
+        du: Sequence[int],
+        raw: Sequence[int],
+        cap: Sequence[int],
+        f_e: Sequence[int],
+    ) -> None:
+        columns = (e_id, i, j, du, raw, cap, f_e)
+        size = len(e_id)
+        if any(len(column) != size for column in columns):
+            raise ValueError("EdgeFluxColumnsV1 columns must have the same length")
+        for name, column in zip(EDGE_FLUX_FIELDS, columns):
+            object.__setattr__(self, name, int_column(column))
+
+    @classmethod
+    def from_edges(cls, edges: Sequence[EdgeFluxV1]) -> "EdgeFluxColumnsV1":
+        return cls(**{name: [getattr(edge, name) for edge in edges] for name in EDGE_FLUX_FIELDS})
+
+    def column(self, name: str) -> IntColumn:
+        if name not in EDGE_FLUX_FIELDS:
+            raise ValueError(f"Unknown EdgeFlux_v1 column '{name}'")
+        return getattr(self, name)
+
+    def to_rows(self) -> List[Dict[str, int]]:
+        """Return the plain ``EdgeFlux_v1`` mappings without building dataclasses."""
+
+        return [
+            {"e_id": e_id, "i": i, "j": j, "du": du, "raw": raw, "cap": cap, "f_e": f_e}
+            for e_id, i, j, du, raw, cap, f_e in zip(
+                self.e_id, self.i, self.j, self.du, self.raw, self.cap, self.f_e
+            )
+        ]
+
+    def __len__(self) -> int:
+        return len(self.e_id)
+
+    @overload
+    def __getitem__(self, index: int) -> EdgeFluxV1: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EdgeFluxV1]: ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[idx] for idx in range(*index.indices(len(self)))]
+        return EdgeFluxV1(
+            e_id=self.e_id[index],
+            i=self.i[index],
+            j=self.j[index],
+            du=self.du[index],
+            raw=self.raw[index],
+            cap=self.cap[index],
+            f_e=self.f_e[index],
+        )
+
+    def __iter__(self) -> Iterator[EdgeFluxV1]:
+        for e_id, i, j, du, raw, cap, f_e in zip(
+            self.e_id, self.i, self.j, self.du, self.raw, self.cap, self.f_e
+        ):
+            yield EdgeFluxV1(e_id=e_id, i=i, j=j, du=du, raw=raw, cap=cap, f_e=f_e)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EdgeFluxColumnsV1):
+            return all(
+                _same_values(getattr(self, name), getattr(other, name))
+                for name in EDGE_FLUX_FIELDS
+            )
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(
+                mine == theirs for mine, theirs in zip(self, other)
+            )
+        return NotImplemented
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("EdgeFluxColumnsV1 is read-only")
+
+    def __reduce__(self):
+        return (_restore_edge_flux_columns, tuple(getattr(self, name) for name in EDGE_FLUX_FIELDS))
+
+    def __repr__(self) -> str:
+        return f"EdgeFluxColumnsV1(E={len(self)})"
+
+
+def _restore_edge_flux_columns(*columns: IntColumn) -> EdgeFluxColumnsV1:
+    return EdgeFluxColumnsV1(**dict(zip(EDGE_FLUX_FIELDS, columns)))
+
+
+def _same_values(left: IntColumn, right: IntColumn) -> bool:
+    if type(left) is type(right):
+        return left == right
+    return len(left) == len(right) and all(a == b for a, b in zip(left, right))
+
+
+def edge_flux_column(edges: Sequence[EdgeFluxV1], name: str) -> Sequence[int]:
+    """Return one ``EdgeFlux_v1`` field across ``edges``.
+
+    Reads the column directly for :class:`EdgeFluxColumnsV1` (or any object
+    exposing ``column``) and falls back to walking ``EdgeFluxV1`` objects.
+    """
+
+    column = getattr(edges, "column", None)
+    if column is not None:
+        return column(name)
+    return [getattr(edge, name) for edge in edges]
+
+
 @dataclass(frozen=True)
 class UMXTickLedgerV1:
-    """Full per-tick ledger emitted by the UMX engine."""
+    """Full per-tick ledger emitted by the UMX engine.
+
+    ``edges`` is a ``List[EdgeFluxV1]`` or, for columnar runs, an
+    :class:`EdgeFluxColumnsV1`; both compare equal for the same fluxes.
+    """
 
     tick: int
     sum_pre_u: int
     sum_post_u: int
     z_check: int
     pre_u: List[int]
-    edges: List[EdgeFluxV1] = field(default_factory=list)
+    edges: Sequence[EdgeFluxV1] = field(default_factory=list)
     post_u: List[int] = field(default_factory=list)
     nap_ref: str = ""
     causal_radius_applied: bool = False
@@ -0,0 +1,430 @@
+"""Binary, memory-mappable storage for CMP-0 topologies.
+
+JSON topologies build one ``EdgeProfileV1`` per edge and validate them in
+Python, which dominates start-up for large graphs. The binary format keeps the
+same data as fixed-width little-endian int64 columns::
+
+    header   80 bytes  magic, format version, flags, N, E, SC, causal_radius,
+                       max_edge_cap, header JSON length, side table length
+    columns  8 x E x 8 e_id, i, j, k, cap, SC, c, causal_radius (0 = unset)
+    header JSON        gid, profile, nap_ref, meta
+    side table JSON    node labels plus non-empty node/edge ``attrs``
+
+:func:`load_topology_binary` maps the file read-only and returns a
+:class:`BinaryTopologyV1` whose :class:`~umx.compiled_topology.CompiledTopologyV1`
+is built directly from the mapped columns, so the engine can step it without
+creating per-edge objects. ``nodes``/``edges`` are lazy views for callers that
+still need profile records, and :meth:`BinaryTopologyV1.to_topology_profile`
+converts back to a regular :class:`TopologyProfileV1`.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from array import array
+from dataclasses import dataclass, field
+from functools import cached_property
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union, overload
+
+from .compiled_topology import _COMPILED_ATTR, CompiledTopologyV1
+from .topology_profile import (
+    EdgeProfileV1,
+    NodeProfileV1,
+    TopologyProfileV1,
+    load_topology_profile,
+)
+
+try:  # pragma: no cover - optional dependency
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment]
+
+MAGIC = b"UMXTOPO1"
+FORMAT_VERSION = 1
+SUFFIX = ".umxtopo"
+COLUMNS = ("e_id", "i", "j", "k", "cap", "SC", "c", "causal_radius")
+
+_HEADER = struct.Struct("<8sIIqqqqqqqq")
+_FLAG_MAX_EDGE_CAP = 1
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+
+
+def _int64_column(values: Sequence[int], name: str) -> array:
+    if any(not _INT64_MIN <= value <= _INT64_MAX for value in values):
+        raise ValueError(f"edge.{name} exceeds the int64 range; keep this topology in JSON")
+    column = array("q", values)
+    if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+        column.byteswap()
+    return column
+
+
+def _dumps(payload: Any) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def write_topology_binary(topo: TopologyProfileV1, path: Union[str, Path]) -> str:
+    """Write ``topo`` in the binary format and return its content hash."""
+
+    edges = sorted(topo.edges, key=lambda edge: edge.e_id)
+    columns = {
+        "e_id": [edge.e_id for edge in edges],
+        "i": [edge.i for edge in edges],
+        "j": [edge.j for edge in edges],
+        "k": [edge.k for edge in edges],
+        "cap": [edge.cap for edge in edges],
+        "SC": [edge.SC for edge in edges],
+        "c": [edge.c for edge in edges],
+        "causal_radius": [edge.causal_radius or 0 for edge in edges],
+    }
+    header_json = _dumps(
+        {"gid": topo.gid, "profile": topo.profile, "nap_ref": topo.nap_ref, "meta": topo.meta}
+    )
+    side_table = _dumps(
+        {
+            "node_labels": [node.label for node in topo.nodes],
+            "node_attrs": {str(node.node_id): node.attrs for node in topo.nodes if node.attrs},
+            "edge_attrs": {str(edge.e_id): edge.attrs for edge in edges if edge.attrs},
+        }
+    )
+    for value, name in (
+        (topo.N, "N"),
+        (topo.SC, "SC"),
+        (topo.causal_radius, "causal_radius"),
+        (topo.max_edge_cap or 0, "max_edge_cap"),
+    ):
+        if not _INT64_MIN <= value <= _INT64_MAX:
+            raise ValueError(f"{name} exceeds the int64 range; keep this topology in JSON")
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        _FLAG_MAX_EDGE_CAP if topo.max_edge_cap is not None else 0,
+        topo.N,
+        len(edges),
+        topo.SC,
+        topo.causal_radius,
+        topo.max_edge_cap or 0,
+        len(header_json),
+        len(side_table),
+        0,
+    )
+    digest = hashlib.sha256()
+    with Path(path).open("wb") as handle:
+        for chunk in (
+            header,
+            *(_int64_column(columns[name], name).tobytes() for name in COLUMNS),
+            header_json,
+            side_table,
+        ):
+            handle.write(chunk)
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def convert_topology_json(
+    source: Union[str, Path], destination: Optional[Union[str, Path]] = None
+) -> Path:
+    """Convert a JSON ``TopologyProfile_v1`` file to the binary format.
+
+    ``destination`` defaults to ``source`` with the ``.umxtopo`` suffix.
+    """
+
+    source_path = Path(source)
+    target = Path(destination) if destination is not None else source_path.with_suffix(SUFFIX)
+    write_topology_binary(load_topology_profile(source_path), target)
+    return target
+
+
+class _EdgesView(Sequence[EdgeProfileV1]):
+    """Read-only ``EdgeProfileV1`` view that builds records on access."""
+
+    __slots__ = ("_topology",)
+
+    def __init__(self, topology: "BinaryTopologyV1") -> None:
+        self._topology = topology
+
+    def __len__(self) -> int:
+        return self._topology.E
+
+    @overload
+    def __getitem__(self, index: int) -> EdgeProfileV1: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EdgeProfileV1]: ...
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        return self._topology._edge(index)
+
+    def __iter__(self) -> Iterator[EdgeProfileV1]:
+        for position in range(len(self)):
+            yield self._topology._edge(position)
+
+
+class _NodesView(Sequence[NodeProfileV1]):
+    """Read-only ``NodeProfileV1`` view backed by the side table."""
+
+    __slots__ = ("_topology",)
+
+    def __init__(self, topology: "BinaryTopologyV1") -> None:
+        self._topology = topology
+
+    def __len__(self) -> int:
+        return self._topology.N
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        return self._topology._node(index)
+
+
+@dataclass(frozen=True, eq=False)
+class BinaryTopologyV1:
+    """Memory-mapped topology usable wherever the engine takes a topology.
+
+    Scalar fields mirror :class:`TopologyProfileV1`; ``nodes`` and ``edges``
+    are lazy views and ``columns`` exposes the raw mapped int64 columns by
+    name. The file stays mapped for the lifetime of the object.
+    """
+
+    gid: str
+    profile: str
+    N: int
+    E: int
+    SC: int
+    causal_radius: int
+    max_edge_cap: Optional[int]
+    nap_ref: Optional[str]
+    meta: Dict[str, object]
+    path: Path
+    columns: Mapping[str, memoryview] = field(repr=False)
+    _buffer: memoryview = field(repr=False)
+    _side_table_span: tuple = field(repr=False)
+
+    @property
+    def nodes(self) -> _NodesView:
+        return _NodesView(self)
+
+    @property
+    def edges(self) -> _EdgesView:
+        return _EdgesView(self)
+
+    @cached_property
+    def content_hash(self) -> str:
+        """SHA-256 of the file bytes; stable across loads, suitable as a cache key."""
+
+        return hashlib.sha256(self._buffer).hexdigest()
+
+    @cached_property
+    def _side_table(self) -> Dict[str, Any]:
+        start, end = self._side_table_span
+        return json.loads(bytes(self._buffer[start:end]).decode("utf-8"))
+
+    def _edge(self, position: int) -> EdgeProfileV1:
+        if position < 0:
+            position += self.E
+        if not 0 <= position < self.E:
+            raise IndexError("edge index out of range")
+        columns = self.columns
+        e_id = columns["e_id"][position]
+        return EdgeProfileV1(
+            e_id=e_id,
+            i=columns["i"][position],
+            j=columns["j"][position],
+            k=columns["k"][position],
+            cap=columns["cap"][position],
+            SC=columns["SC"][position],
+            c=columns["c"][position],
+            causal_radius=columns["causal_radius"][position] or None,
+            attrs=dict(self._side_table["edge_attrs"].get(str(e_id), {})),
+        )
+
+    def _node(self, position: int) -> NodeProfileV1:
+        if position < 0:
+            position += self.N
+        if not 0 <= position < self.N:
+            raise IndexError("node index out of range")
+        node_id = position + 1
+        return NodeProfileV1(
+            node_id=node_id,
+            label=self._side_table["node_labels"][position],
+            attrs=dict(self._side_table["node_attrs"].get(str(node_id), {})),
+        )
+
+    def to_topology_profile(self) -> TopologyProfileV1:
+        """Materialise a regular (validated) :class:`TopologyProfileV1`."""
+
+        return TopologyProfileV1(
+            gid=self.gid,
+            profile=self.profile,
+            N=self.N,
+            nodes=list(self.nodes),
+            edges=list(self.edges),
+            SC=self.SC,
+            causal_radius=self.causal_radius,
+            max_edge_cap=self.max_edge_cap,
+            nap_ref=self.nap_ref,
+            meta=dict(self.meta),
+        )
+
+
+def _validate_columns(
+    columns: Mapping[str, memoryview], N: int, SC: int
+) -> None:
+    """Apply ``TopologyProfileV1`` edge validation to whole columns at once."""
+
+    E = len(columns["e_id"])
+    if np is not None:
+        arrays = {name: np.frombuffer(columns[name], dtype="<i8") for name in COLUMNS}
+        ids_ok = bool(np.array_equal(arrays["e_id"], np.arange(1, E + 1, dtype=np.int64)))
+        endpoints_ok = E == 0 or (
+            int(min(arrays["i"].min(), arrays["j"].min())) >= 1
+            and int(max(arrays["i"].max(), arrays["j"].max())) <= N
+        )
+        sc_ok = bool(np.all(arrays["SC"] == SC))
+        radius_ok = bool(np.all(arrays["causal_radius"] >= 0))
+    else:
+        ids_ok = all(e_id == expected for expected, e_id in enumerate(columns["e_id"], start=1))
+        endpoints_ok = E == 0 or (
+            min(min(columns["i"]), min(columns["j"])) >= 1
+            and max(max(columns["i"]), max(columns["j"])) <= N
+        )
+        sc_ok = all(value == SC for value in columns["SC"])
+        radius_ok = E == 0 or min(columns["causal_radius"]) >= 0
+    if not ids_ok:
+        raise ValueError("Edges must be contiguous from 1..E in ascending order")
+    if not endpoints_ok:
+        raise ValueError("Edge endpoints must reference valid node IDs")
+    if not sc_ok:
+        raise ValueError("Each edge SC must match the topology SC")
+    if not radius_ok:
+        raise ValueError("edge.causal_radius must be a positive integer when provided")
+
+
+def _compile_columns(topology: BinaryTopologyV1) -> CompiledTopologyV1:
+    columns = topology.columns
+    max_edge_cap = topology.max_edge_cap
+    if np is not None:
+        i_nodes = np.frombuffer(columns["i"], dtype="<i8")
+        j_nodes = np.frombuffer(columns["j"], dtype="<i8")
+        caps = np.frombuffer(columns["cap"], dtype="<i8")
+        if max_edge_cap is not None:
+            caps = np.minimum(caps, max_edge_cap)
+        radii = np.frombuffer(columns["causal_radius"], dtype="<i8")
+        radii = np.where(radii != 0, radii, np.frombuffer(columns["c"], dtype="<i8"))
+        radii = np.where(radii != 0, radii, topology.causal_radius)
+
+        def _column(values: "np.ndarray") -> array:
+            return array("q", values.astype(np.int64).tobytes())
+
+        i_idx, j_idx = _column(i_nodes - 1), _column(j_nodes - 1)
+        caps_column, radii_column = _column(caps), _column(radii)
+    else:
+        i_idx = array("q", (value - 1 for value in columns["i"]))
+        j_idx = array("q", (value - 1 for value in columns["j"]))
+        caps_column = (
+            columns["cap"]
+            if max_edge_cap is None
+            else array("q", (min(cap, max_edge_cap) for cap in columns["cap"]))
+        )
+        radii_column = array(
+            "q",
+            (
+                radius or c or topology.causal_radius
+                for radius, c in zip(columns["causal_radius"], columns["c"])
+            ),
+        )
+    return CompiledTopologyV1(
+        gid=topology.gid,
+        N=topology.N,
+        SC=topology.SC,
+        nap_ref=topology.nap_ref or "",
+        version=str(topology.meta.get("version", "v1")),
+        edges=topology.edges,  # type: ignore[arg-type]
+        e_ids=columns["e_id"],  # type: ignore[arg-type]
+        i_nodes=columns["i"],  # type: ignore[arg-type]
+        j_nodes=columns["j"],  # type: ignore[arg-type]
+        i_idx=i_idx,  # type: ignore[arg-type]
+        j_idx=j_idx,  # type: ignore[arg-type]
+        k=columns["k"],  # type: ignore[arg-type]
+        caps=caps_column,  # type: ignore[arg-type]
+        radii=radii_column,  # type: ignore[arg-type]
+    )
+
+
+def load_topology_binary(path: Union[str, Path]) -> BinaryTopologyV1:
+    """Map a binary topology file and return it with its compiled form attached.
+
+    Raises ``ValueError`` for files that are not in this format or that fail
+    the same structural checks as :class:`TopologyProfileV1`.
+    """
+
+    file_path = Path(path)
+    with file_path.open("rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    buffer = memoryview(mapped)
+    if len(buffer) < _HEADER.size:
+        raise ValueError("Binary topology file is truncated")
+    (
+        magic,
+        version,
+        flags,
+        N,
+        E,
+        SC,
+        causal_radius,
+        max_edge_cap,
+        header_len,
+        side_len,
+        _reserved,
+    ) = _HEADER.unpack_from(buffer)
+    if magic != MAGIC:
+        raise ValueError("Not a binary UMX topology file (bad magic)")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported binary topology format version {version}")
+    columns_start = _HEADER.size
+    header_start = columns_start + len(COLUMNS) * E * 8
+    side_start = header_start + header_len
+    if E < 0 or len(buffer) != side_start + side_len:
+        raise ValueError("Binary topology file is truncated or has trailing data")
+    if N < 0 or SC <= 0:
+        raise ValueError("SC must be a positive integer")
+    if causal_radius < 0:
+        raise ValueError("causal_radius must be non-negative")
+    if flags & _FLAG_MAX_EDGE_CAP and max_edge_cap <= 0:
+        raise ValueError("max_edge_cap must be a positive integer when provided")
+
+    columns: Dict[str, memoryview] = {}
+    for index, name in enumerate(COLUMNS):
+        start = columns_start + index * E * 8
+        column = buffer[start : start + E * 8]
+        if sys.byteorder != "little":  # pragma: no cover - big-endian hosts
+            swapped = array("q", bytes(column))
+            swapped.byteswap()
+            column = memoryview(swapped.tobytes())
+        columns[name] = column.cast("q")
+    _validate_columns(columns, N, SC)
+
+    header = json.loads(bytes(buffer[header_start:side_start]).decode("utf-8"))
+    topology = BinaryTopologyV1(
+        gid=str(header["gid"]),
+        profile=str(header["profile"]),
+        N=N,
+        E=E,
+        SC=SC,
+        causal_radius=causal_radius,
+        max_edge_cap=max_edge_cap if flags & _FLAG_MAX_EDGE_CAP else None,
+        nap_ref=header.get("nap_ref"),
+        meta=dict(header.get("meta") or {}),
+        path=file_path,
+        columns=columns,
+        _buffer=buffer,
+        _side_table_span=(side_start, side_start + side_len),
+    )
+    object.__setattr__(topology, _COMPILED_ATTR, _compile_columns(topology))
+    return topology
@@ -3,16 +3,57 @@
 Implements `TopologyProfile_v1`, `NodeProfile_v1`, and `EdgeProfile_v1`
 as described in the contracts. Includes a helper for the GF-01 topology
 card so tests can consume a single canonical definition.
+
+Node and edge records use ``__slots__`` and share one immutable empty
+``attrs`` mapping, and :class:`EdgeColumnsV1` lets a topology hold its edges
+as int columns (``topology_profile_from_dict(..., compact=True)``) so large
+graphs do not pay for one record object per edge.
 """
 from __future__ import annotations
 
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Mapping, Union
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Sequence, Union, overload
 
+from .tick_ledger import IntColumn, int_column
 
-@dataclass(frozen=True)
+
+class _EmptyAttrs(dict):
+    """Immutable, hashable empty mapping shared by records without ``attrs``."""
+
+    __slots__ = ()
+
+    def _readonly(self, *args: object, **kwargs: object) -> None:
+        raise TypeError("EMPTY_ATTRS is shared and read-only; pass a new dict instead")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(())
+
+    def __copy__(self) -> "_EmptyAttrs":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, object]) -> "_EmptyAttrs":
+        return self
+
+    def __reduce__(self) -> str:
+        return "EMPTY_ATTRS"
+
+    def __repr__(self) -> str:
+        return "{}"
+
+
+EMPTY_ATTRS: Mapping[str, object] = _EmptyAttrs()
+
+
+def _attrs_or_empty(attrs: Mapping[str, object]) -> Mapping[str, object]:
+    return dict(attrs) if attrs else EMPTY_ATTRS
+
+
+@dataclass(frozen=True, slots=True)
 class NodeProfileV1:
     """Per-node profile information.
 
@@ -21,10 +62,10 @@ class NodeProfileV1:
 
     node_id: int
     label: str = ""
-    attrs: Dict[str, object] = field(default_factory=dict)
+    attrs: Mapping[str, object] = EMPTY_ATTRS
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EdgeProfileV1:
     """Per-edge profile information matching the CMP-0 contract."""
 
@@ -36,18 +77,139 @@ class EdgeProfileV1:
     SC: int
     c: int = 0
     causal_radius: int | None = None
-    attrs: Dict[str, object] = field(default_factory=dict)
+    attrs: Mapping[str, object] = EMPTY_ATTRS
+
+
+EDGE_COLUMNS = ("e_id", "i", "j", "k", "cap", "SC", "c", "causal_radius")
+
+
+class EdgeColumnsV1(Sequence[EdgeProfileV1]):
+    """Array-backed, read-only view of a topology's edges.
+
+    Behaves like ``List[EdgeProfileV1]`` (indexing, iteration, ``len``,
+    equality with lists) but stores one int column per field, with
+    ``causal_radius`` ``0`` meaning "not set", and only the non-empty ``attrs``
+    keyed by ``e_id``. ``EdgeProfileV1`` records are built on access.
+    """
+
+    __slots__ = (*EDGE_COLUMNS, "_attrs")
+
+    def __init__(
+        self,
+        *,
+        attrs: Optional[Mapping[int, Mapping[str, object]]] = None,
+        **columns: Sequence[int],
+    ) -> None:
+        if set(columns) != set(EDGE_COLUMNS):
+            raise ValueError(f"EdgeColumnsV1 requires the columns {list(EDGE_COLUMNS)}")
+        size = len(columns["e_id"])
+        if any(len(values) != size for values in columns.values()):
+            raise ValueError("EdgeColumnsV1 columns must have equal lengths")
+        for name in EDGE_COLUMNS:
+            object.__setattr__(self, name, int_column(columns[name]))
+        object.__setattr__(
+            self, "_attrs", {e_id: dict(value) for e_id, value in (attrs or {}).items() if value}
+        )
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError("EdgeColumnsV1 is read-only")
+
+    @classmethod
+    def from_edges(cls, edges: Sequence[EdgeProfileV1]) -> "EdgeColumnsV1":
+        return cls(
+            e_id=[edge.e_id for edge in edges],
+            i=[edge.i for edge in edges],
+            j=[edge.j for edge in edges],
+            k=[edge.k for edge in edges],
+            cap=[edge.cap for edge in edges],
+            SC=[edge.SC for edge in edges],
+            c=[edge.c for edge in edges],
+            causal_radius=[edge.causal_radius or 0 for edge in edges],
+            attrs={edge.e_id: edge.attrs for edge in edges if edge.attrs},
+        )
+
+    def column(self, name: str) -> IntColumn:
+        """Return the int column for one ``EdgeProfileV1`` field."""
+
+        if name not in EDGE_COLUMNS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __len__(self) -> int:
+        return len(self.e_id)
+
+    @overload
+    def __getitem__(self, index: int) -> EdgeProfileV1: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[EdgeProfileV1]: ...
+
+    def __getitem__(self, index):  # type: ignore[override]
+        if isinstance(index, slice):
+            return [self._row(position) for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("edge index out of range")
+        return self._row(index)
+
+    def __iter__(self) -> Iterator[EdgeProfileV1]:
+        for position in range(len(self)):
+            yield self._row(position)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, EdgeColumnsV1):
+            return all(
+                list(getattr(self, name)) == list(getattr(other, name)) for name in EDGE_COLUMNS
+            ) and self._attrs == other._attrs
+        if isinstance(other, (list, tuple)):
+            return len(other) == len(self) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"EdgeColumnsV1(E={len(self)})"
+
+    def __reduce__(self):
+        columns = {name: list(getattr(self, name)) for name in EDGE_COLUMNS}
+        return (_restore_edge_columns, (columns, self._attrs))
+
+    def _row(self, position: int) -> EdgeProfileV1:
+        e_id = self.e_id[position]
+        attrs = self._attrs.get(e_id)
+        return EdgeProfileV1(
+            e_id=e_id,
+            i=self.i[position],
+            j=self.j[position],
+            k=self.k[position],
+            cap=self.cap[position],
+            SC=self.SC[position],
+            c=self.c[position],
+            causal_radius=self.causal_radius[position] or None,
+            attrs=dict(attrs) if attrs else EMPTY_ATTRS,
+        )
+
+
+def _restore_edge_columns(
+    columns: Dict[str, List[int]], attrs: Mapping[int, Mapping[str, object]]
+) -> EdgeColumnsV1:
+    return EdgeColumnsV1(attrs=attrs, **columns)
 
 
 @dataclass(frozen=True)
 class TopologyProfileV1:
-    """Static graph structure used by the UMX engine."""
+    """Static graph structure used by the UMX engine.
+
+    ``edges`` is either a list of ``EdgeProfileV1`` records or an
+    :class:`EdgeColumnsV1`; both are validated and compiled identically.
+    """
 
     gid: str
     profile: str
     N: int
     nodes: List[NodeProfileV1]
-    edges: List[EdgeProfileV1]
+    edges: Sequence[EdgeProfileV1]
     SC: int
     causal_radius: int = 0
     max_edge_cap: int | None = None
@@ -66,6 +228,13 @@ class TopologyProfileV1:
         ):
             raise ValueError("max_edge_cap must be a positive integer when provided")
 
+    def __getstate__(self) -> Dict[str, object]:
+        # The compiled view (and everything memoised on it) is a per-process
+        # cache; it is rebuilt on first use after unpickling or copying.
+        state = dict(self.__dict__)
+        state.pop("_compiled", None)
+        return state
+
     def _validate_nodes(self) -> None:
         node_ids = [_ensure_int(node.node_id, "node.node_id") for node in self.nodes]
         expected = list(range(1, self.N + 1))
@@ -73,6 +242,9 @@ class TopologyProfileV1:
             raise ValueError("Nodes must be contiguous from 1..N in ascending order")
 
     def _validate_edges(self) -> None:
+        if isinstance(self.edges, EdgeColumnsV1):
+            self._validate_edge_columns(self.edges)
+            return
         edge_ids = [edge.e_id for edge in self.edges]
         expected_ids = list(range(1, len(self.edges) + 1))
         if edge_ids != expected_ids:
@@ -97,6 +269,20 @@ class TopologyProfileV1:
             ):
                 raise ValueError("edge.causal_radius must be a positive integer when provided")
 
+    def _validate_edge_columns(self, edges: EdgeColumnsV1) -> None:
+        if any(e_id != expected for expected, e_id in enumerate(edges.e_id, start=1)):
+            raise ValueError("Edges must be contiguous from 1..E in ascending order")
+        if len(edges) and (
+            min(min(edges.i), min(edges.j)) < 1 or max(max(edges.i), max(edges.j)) > self.N
+        ):
+            raise ValueError("Edge endpoints must reference valid node IDs")
+        if any(sc != self.SC for sc in edges.SC):
+            if min(edges.SC) <= 0:
+                raise ValueError("Edge SC must be positive")
+            raise ValueError("Each edge SC must match the topology SC")
+        if len(edges) and min(edges.causal_radius) < 0:
+            raise ValueError("edge.causal_radius must be a positive integer when provided")
+
 
 def gf01_topology_profile() -> TopologyProfileV1:
     """Return the canonical GF-01 topology for CMP-0.
@@ -137,10 +323,10 @@ def _load_node(entry: Mapping[str, Any]) -> NodeProfileV1:
     attrs = entry.get("attrs", {})
     if not isinstance(attrs, Mapping):
         raise ValueError("node.attrs must be an object if provided")
-    return NodeProfileV1(node_id=node_id, label=label, attrs=dict(attrs))
+    return NodeProfileV1(node_id=node_id, label=label, attrs=_attrs_or_empty(attrs))
 
 
-def _load_edge(entry: Mapping[str, Any]) -> EdgeProfileV1:
+def _load_edge_fields(entry: Mapping[str, Any]) -> tuple:
     e_id = _ensure_int(entry.get("e_id"), "edge.e_id")
     i = _ensure_int(entry.get("i"), "edge.i")
     j = _ensure_int(entry.get("j"), "edge.j")
@@ -156,6 +342,11 @@ def _load_edge(entry: Mapping[str, Any]) -> EdgeProfileV1:
     attrs = entry.get("attrs", {})
     if not isinstance(attrs, Mapping):
         raise ValueError("edge.attrs must be an object if provided")
+    return e_id, i, j, k, cap, sc, c, causal_radius, attrs
+
+
+def _load_edge(entry: Mapping[str, Any]) -> EdgeProfileV1:
+    e_id, i, j, k, cap, sc, c, causal_radius, attrs = _load_edge_fields(entry)
     return EdgeProfileV1(
         e_id=e_id,
         i=i,
@@ -165,17 +356,33 @@ def _load_edge(entry: Mapping[str, Any]) -> EdgeProfileV1:
         SC=sc,
         c=c,
         causal_radius=causal_radius,
-        attrs=dict(attrs),
+        attrs=_attrs_or_empty(attrs),
     )
 
 
-def topology_profile_from_dict(data: Mapping[str, Any]) -> TopologyProfileV1:
+def _load_edge_columns(entries: Sequence[Mapping[str, Any]]) -> EdgeColumnsV1:
+    columns: Dict[str, List[int]] = {name: [] for name in EDGE_COLUMNS}
+    appenders = [columns[name].append for name in EDGE_COLUMNS]
+    attrs: Dict[int, Mapping[str, object]] = {}
+    for entry in entries:
+        fields = _load_edge_fields(entry)
+        for append, value in zip(appenders, fields[:-1]):
+            append(value or 0)
+        if fields[-1]:
+            attrs[fields[0]] = fields[-1]
+    return EdgeColumnsV1(attrs=attrs, **columns)
+
+
+def topology_profile_from_dict(
+    data: Mapping[str, Any], *, compact: bool = False
+) -> TopologyProfileV1:
     """Construct a :class:`TopologyProfileV1` from a mapping.
 
     The loader is strict and will raise ``ValueError`` with descriptive
     messages when required fields are missing or contain the wrong type. The
     resulting dataclass runs the built-in structural validation to ensure
-    contiguity and endpoint correctness.
+    contiguity and endpoint correctness. ``compact=True`` stores the edges as
+    an :class:`EdgeColumnsV1` instead of one record per edge.
     """
 
     if not isinstance(data, Mapping):
@@ -198,7 +405,11 @@ def topology_profile_from_dict(data: Mapping[str, Any]) -> TopologyProfileV1:
         raise ValueError("edges must be a list")
 
     nodes = [_load_node(entry) for entry in nodes_raw]
-    edges = [_load_edge(entry) for entry in edges_raw]
+    edges: Sequence[EdgeProfileV1]
+    if compact:
+        edges = _load_edge_columns(edges_raw)
+    else:
+        edges = [_load_edge(entry) for entry in edges_raw]
 
     meta = data.get("meta", {})
     if meta is None:
@@ -230,15 +441,18 @@ def topology_profile_from_dict(data: Mapping[str, Any]) -> TopologyProfileV1:
     )
 
 
-def load_topology_profile(path: Union[str, Path]) -> TopologyProfileV1:
+def load_topology_profile(
+    path: Union[str, Path], *, compact: bool = False
+) -> TopologyProfileV1:
     """Load ``TopologyProfile_v1`` from a JSON file.
 
     JSON is used to keep the loader dependency-free. If a YAML file is
     provided, a ``ValueError`` is raised with guidance to convert it.
+    ``compact`` is forwarded to :func:`topology_profile_from_dict`.
     """
 
     file_path = Path(path)
     if file_path.suffix.lower() in {".yaml", ".yml"}:
         raise ValueError("Topology loader only supports JSON; please convert YAML to JSON")
     raw_data = json.loads(file_path.read_text())
-    return topology_profile_from_dict(raw_data)
+    return topology_profile_from_dict(raw_data, compact=compact)
@@ -0,0 +1,106 @@
+"""Tests for tick loop artefact profiles."""
+from __future__ import annotations
+
+import json
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+import core.tick_loop as tick_loop
+from codex.context import CodexContext
+from config import build_session_config_from_run_config, run_config_from_mapping
+from core.serialization import serialize_gf01_run
+from core.tick_loop import TickLoopWindowSpec, run_cmp0_tick_loop
+from gate import ArtifactProfileV1, run_session
+from governance import GovernanceConfigV1
+from umx.profile_cmp0 import gf01_profile_cmp0
+from umx.topology_profile import gf01_topology_profile
+
+CONFIGS_ROOT = Path(__file__).resolve().parents[2] / "docs" / "fixtures" / "configs"
+CONFIG_PATH = CONFIGS_ROOT / "gf01_run_config_metrics.json"
+
+
+def _run(**overrides):
+    kwargs = dict(
+        topo=gf01_topology_profile(),
+        profile=gf01_profile_cmp0(),
+        initial_state=[3, 1, 0, 0, 0, 0],
+        total_ticks=8,
+        window_specs=[
+            TickLoopWindowSpec(window_id="W", apx_name="APX", start_tick=1, end_tick=8),
+        ],
+        primary_window_id="W",
+        run_id="PROFILES",
+        nid="N/A",
+        governance=GovernanceConfigV1(codex_action_mode="OBSERVE", governance_mode="OBSERVE"),
+    )
+    kwargs.update(overrides)
+    return run_cmp0_tick_loop(**kwargs)
+
+
+def test_lean_profile_skips_per_tick_artifacts(monkeypatch):
+    full = _run()
+
+    def unexpected(*args, **kwargs):
+        raise AssertionError("lean runs must not build scenes or envelopes")
+
+    monkeypatch.setattr(tick_loop, "build_scene_and_envelope", unexpected)
+    monkeypatch.setattr(tick_loop, "build_scene_frame", unexpected)
+    lean = _run(artifact_profile="lean", codex_ctx=CodexContext(library_id="LIB"))
+
+    assert lean.artifact_profile == "lean"
+    assert lean.manifests == full.manifests
+    assert lean.final_state == tuple(full.ledgers[-1].post_u) == full.final_state
+    assert lean.final_chain == full.p_blocks[-1].C_t
+    assert not (lean.ledgers or lean.p_blocks or lean.scenes or lean.envelopes)
+    assert not (lean.governance_envelopes or lean.u_ledger_entries or lean.codex_motifs)
+    assert lean.u_ledger_checkpoint is None
+    assert serialize_gf01_run(lean)["artifact_profile"] == "lean"
+    assert "artifact_profile" not in serialize_gf01_run(full)
+
+
+def test_audit_profile_keeps_the_verifiable_trail_only():
+    full = _run()
+    codex_ctx = CodexContext(library_id="LIB")
+    audit = _run(artifact_profile="audit", codex_ctx=codex_ctx)
+
+    assert audit.envelopes == full.envelopes
+    assert audit.u_ledger_entries == full.u_ledger_entries
+    assert audit.governance_envelopes == full.governance_envelopes
+    assert audit.ledgers == full.ledgers and audit.i_blocks == full.i_blocks
+    assert audit.scenes == [] and audit.codex_motifs == ()
+    assert codex_ctx.runtime_stats.total_ticks == 0
+
+
+def test_custom_profile_validation():
+    scenes_only = ArtifactProfileV1(
+        name="scenes", envelopes=False, u_ledger=False, governance_envelopes=False
+    )
+    result = _run(artifact_profile=scenes_only)
+    assert len(result.scenes) == 8 and result.envelopes == []
+
+    with pytest.raises(ValueError, match="require envelopes"):
+        ArtifactProfileV1(name="broken", envelopes=False)
+    with pytest.raises(ValueError, match="artifact_profile"):
+        _run(artifact_profile="tiny")
+
+
+def test_run_config_selects_profile_and_metrics_follow_it():
+    data = json.loads(CONFIG_PATH.read_text())
+    data["artifact_profile"] = "lean"
+    run_config = run_config_from_mapping(data)
+    session_config = build_session_config_from_run_config(
+        run_config, config_base_dir=CONFIG_PATH.parent
+    )
+    assert session_config.artifact_profile.name == "lean"
+
+    result = run_session(session_config)
+    full = run_session(replace(session_config, artifact_profile="full"))
+    assert result.tick_result.artifact_profile == "lean"
+    assert result.metrics.nap_data == 0 and result.metrics.uledger_entries == 0
+    assert result.metrics.apx_manifests == full.metrics.apx_manifests
+    assert result.lifecycle_envelopes[1].prev_chain == full.lifecycle_envelopes[1].prev_chain
+
+    with pytest.raises(ValueError, match="artifact_profile"):
+        run_config_from_mapping({**data, "artifact_profile": "tiny"})
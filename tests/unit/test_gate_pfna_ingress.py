@@ -6,8 +6,10 @@ from core.tick_loop import TickLoopWindowSpec, run_cmp0_tick_loop
 from gate import (
     PFNAIngressQueue,
     PFNAInputV0,
+    PFNAJsonlStreamV0,
     PFNATransformV1,
     build_pfna_placeholder,
+    write_pfna_v0_jsonl,
 )
 from umx.profile_cmp0 import gf01_profile_cmp0
 from umx.topology_profile import gf01_topology_profile, load_topology_profile
@@ -97,3 +99,80 @@ def test_tick_loop_attaches_pfna_integerization_meta():
     assert pfna_meta[0]["pfna_id"] == pfna.pfna_id
     assert pfna_meta[0]["values"] in ((2, 0, 0, 0), ())
     assert result.ledgers[0].pre_u[0] == 3  # initial 1 + integerized delta 2
+
+
+def _pfna(pfna_id: str, tick: int, value: int = 1) -> PFNAInputV0:
+    return PFNAInputV0(pfna_id=pfna_id, gid="G", run_id="R", tick=tick, nid="N", values=(value,))
+
+
+def test_pfna_ingress_queue_evicts_consumed_ticks():
+    queue = PFNAIngressQueue()
+    queue.extend([_pfna("b", 3), _pfna("a", 3), _pfna("c", 5), _pfna("d", 7)])
+
+    assert [event.pfna.pfna_id for event in queue.pop_ready(3)] == ["a", "b"]
+    assert queue._seen.keys() == {5, 7}
+    # Late or replayed inputs for a consumed tick are ignored.
+    queue.enqueue(_pfna("a", 3))
+    queue.enqueue(_pfna("e", 2))
+    assert queue.pop_ready(3) == () and queue.pop_ready(2) == ()
+
+    assert queue.discard_through(5) == 1
+    assert [event.pfna.pfna_id for event in queue.pop_ready(7)] == ["d"]
+    assert queue._buckets == {} and queue._ticks == [] and queue._seen == {}
+
+
+def test_pfna_ingress_queue_reads_attached_stream_lazily():
+    pulled = []
+
+    def stream():
+        for pfna in (_pfna("x", 1), _pfna("y", 1), _pfna("y", 1, 9), _pfna("z", 4), _pfna("w", 2)):
+            pulled.append(pfna.pfna_id)
+            yield pfna
+
+    queue = PFNAIngressQueue()
+    queue.attach(stream())
+    assert pulled == ["x"]
+    assert [event.pfna.pfna_id for event in queue.pop_ready(1)] == ["x", "y"]
+    assert pulled == ["x", "y", "y", "z"]
+    assert queue.pop_ready(2) == ()
+    with pytest.raises(ValueError, match="ordered by tick"):
+        queue.pop_ready(4)
+    with pytest.raises(ValueError, match="already has a stream"):
+        queue.attach([])
+
+
+def test_tick_loop_streams_pfna_jsonl_inputs(tmp_path):
+    topo = load_topology_profile("docs/fixtures/topologies/line_4_topology_profile.json")
+    inputs = [
+        build_pfna_placeholder(
+            pfna_id=f"ext_{tick}_{index}", gid=topo.gid, run_id="LINE_PFNA", tick=tick,
+            nid="ext-source", values=[index, 0, 1, 0],
+        )
+        for tick in (0, 2, 2, 5)
+        for index in (1, 2)
+    ]
+    path = write_pfna_v0_jsonl(
+        tmp_path / "pfna.jsonl", bundle_id="B", gid=topo.gid, run_id="LINE_PFNA",
+        nid="ext-source", entries=inputs,
+    )
+
+    def run(pfna_inputs):
+        return run_cmp0_tick_loop(
+            topo=topo,
+            profile=gf01_profile_cmp0(),
+            initial_state=[1, 1, 1, 1],
+            total_ticks=6,
+            window_specs=[
+                TickLoopWindowSpec(window_id="W", apx_name="APX", start_tick=1, end_tick=6)
+            ],
+            primary_window_id="W",
+            run_id="LINE_PFNA",
+            nid="engine-line",
+            pfna_inputs=pfna_inputs,
+        )
+
+    streamed = run(PFNAJsonlStreamV0(path, expected_length=topo.N))
+    eager = run(inputs)
+    assert streamed.ledgers == eager.ledgers
+    assert streamed.envelopes == eager.envelopes
+    assert streamed.ingress_envelopes == eager.ingress_envelopes
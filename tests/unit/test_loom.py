@@ -1,4 +1,10 @@
-from loom.loom import compute_chain_value, compute_s_t
+from dataclasses import replace
+
+import pytest
+
+from loom import LoomIBlockPolicyV1
+from loom.chain import LoomBlockStore, LoomChainRecorder, merkle_root
+from loom.loom import compute_chain_value, compute_s_t, step as loom_step
 from loom.run_context import LoomRunContext
 from umx.engine import step as umx_step
 from umx.profile_cmp0 import ProfileCMP0V1, gf01_profile_cmp0
@@ -148,3 +154,105 @@ def test_loom_replay_reconstructs_state_from_iblocks():
 
     for t in range(2, 6):
         assert loom_ctx.replay_state_at(t) == ledgers[t - 1].post_u
+
+
+def test_loom_indexed_lookups_and_cached_replay(monkeypatch):
+    profile = ProfileCMP0V1(I_block_spacing_W=8)
+    topo = gf01_topology_profile()
+    umx_ctx = UMXRunContext(topo=topo, profile=profile)
+    umx_ctx.init_state([3, 1, 0, 0, 0, 0])
+    loom_ctx = LoomRunContext(profile=profile, topo=topo, umx_ctx=umx_ctx, replay_cache_size=4)
+    ledgers, p_blocks, i_blocks = loom_ctx.run_until(40)
+
+    assert [loom_ctx.get_pblock(t) for t in range(1, 41)] == p_blocks
+    assert [loom_ctx.get_iblock_for(t).tick for t in (8, 15, 16, 40)] == [8, 8, 16, 40]
+
+    replayed = []
+    original = UMXRunContext.fast_forward
+
+    def counting_fast_forward(self, t_max, **kwargs):
+        replayed.append(t_max - self.tick)
+        return original(self, t_max, **kwargs)
+
+    monkeypatch.setattr(UMXRunContext, "fast_forward", counting_fast_forward)
+
+    # Scrubbing forward replays one tick per step once the first state is cached.
+    for t in range(10, 16):
+        assert loom_ctx.replay_state_at(t) == ledgers[t - 1].post_u
+    assert replayed == [2, 1, 1, 1, 1, 1]
+    replayed.clear()
+    assert loom_ctx.replay_state_at(13) == ledgers[12].post_u
+    assert replayed == []
+
+    ticks = [39, 20, 9, 20, 31, 17, 40]
+    assert loom_ctx.replay_states(ticks) == [ledgers[t - 1].post_u for t in ticks]
+    # Ticks 17 and 20 share one sweep from I-block 16; tick 40 is an I-block itself.
+    assert replayed == [1, 1, 3, 7, 7]
+    assert loom_ctx.fork().replay_states([17]) == [ledgers[16].post_u]
+
+    bounded_ctx = LoomRunContext(
+        profile=profile, topo=topo, umx_ctx=UMXRunContext(topo=topo, profile=profile),
+        history_limit=10,
+    )
+    bounded_ctx.umx_ctx.init_state([3, 1, 0, 0, 0, 0])
+    bounded_ctx.run_until(40)
+    assert bounded_ctx.get_pblock(31) == p_blocks[30]
+    with pytest.raises(ValueError, match="No P-block recorded for tick 30"):
+        bounded_ctx.get_pblock(30)
+
+
+def test_step_emit_i_block_overrides_the_spacing_rule():
+    profile = gf01_profile_cmp0()
+    topo = gf01_topology_profile()
+    umx_ctx = UMXRunContext(topo=topo, profile=profile)
+    umx_ctx.init_state([3, 1, 0, 0, 0, 0])
+    ledger = umx_ctx.step()
+
+    assert loom_step(ledger, 0, 1, topo, profile, W=1, emit_i_block=False)[2] is None
+    forced = loom_step(ledger, 0, 1, topo, profile, W=3, emit_i_block=True)[2]
+    assert (forced.tick, forced.W, forced.post_u) == (1, 3, list(ledger.post_u))
+
+
+def test_adaptive_i_block_policy_records_spacing_and_replays(tmp_path):
+    profile = gf01_profile_cmp0()
+    topo = gf01_topology_profile()
+    umx_ctx = UMXRunContext(topo=topo, profile=profile)
+    umx_ctx.init_state([3, 1, 0, 0, 0, 0])
+    store = LoomBlockStore(tmp_path)
+    loom_ctx = LoomRunContext(
+        profile=profile,
+        topo=topo,
+        umx_ctx=umx_ctx,
+        recorder=LoomChainRecorder(store=store),
+        i_block_policy=LoomIBlockPolicyV1(
+            replay_budget_ns=50, tick_cost_ns=10, min_spacing=2, max_spacing=6
+        ),
+    )
+    loom_ctx.run_until(12)
+
+    # An SLP update swaps the topology; the first tick on it gets an I-block.
+    new_topo = replace(topo, meta={**topo.meta, "version": "v2"})
+    umx_ctx.topo = loom_ctx.topo = new_topo
+    ledgers, p_blocks, i_blocks = loom_ctx.run_until(20, skip_cycles=True)
+
+    assert [(block.tick, block.W) for block in i_blocks] == [(5, 5), (10, 5), (13, 3), (18, 5)]
+    assert i_blocks[2].topology_version == "v2"
+    recorder = loom_ctx.recorder
+    assert recorder.i_blocks[13] == merkle_root(recorder.p_hashes[10:13])
+    assert all(recorder.inclusion_proof(tick).verify() for tick in range(1, 19))
+    assert store.press_pointer("P", 12)["inclusion_proof"]["i_block_tick"] == 13
+    assert loom_ctx.replay_states(range(5, 21)) == [ledger.post_u for ledger in ledgers[4:]]
+
+    # A huge budget falls back to max_spacing; measured step times drive the estimate.
+    measured = LoomRunContext(
+        profile=profile,
+        topo=topo,
+        umx_ctx=UMXRunContext(topo=topo, profile=profile),
+        i_block_policy=LoomIBlockPolicyV1(replay_budget_ns=10**15, max_spacing=6),
+    )
+    measured.umx_ctx.init_state([3, 1, 0, 0, 0, 0])
+    _, _, measured_i_blocks = measured.run_until(14)
+    assert [block.tick for block in measured_i_blocks] == [6, 12]
+    assert measured._tick_cost_ns > 0
+    with pytest.raises(ValueError, match="spacing bounds"):
+        LoomIBlockPolicyV1(replay_budget_ns=1, min_spacing=4, max_spacing=2)
@@ -0,0 +1,130 @@
+"""Tests for Loom fixed-point/cycle detection and analytic fast-forward."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from loom.cycles import LoomCycleSpanV1
+from loom.loom import compute_chain_value
+from loom.run_context import LoomRunContext
+from umx.profile_cmp0 import ProfileCMP0V1, gf01_profile_cmp0
+from umx.run_context import UMXRunContext
+from umx.topology_profile import gf01_topology_profile, topology_profile_from_dict
+
+
+def _swap_topology():
+    # k == SC moves the whole difference each tick, so (2, 0) <-> (0, 2) forever.
+    return topology_profile_from_dict(
+        {
+            "gid": "SWAP",
+            "profile": "CMP-0",
+            "N": 2,
+            "nodes": [{"node_id": 1, "label": "a"}, {"node_id": 2, "label": "b"}],
+            "edges": [{"e_id": 1, "i": 1, "j": 2, "k": 10, "cap": 50, "SC": 10, "c": 0}],
+            "SC": 10,
+        }
+    )
+
+
+def _loom(topo, profile, state, **kwargs):
+    umx_ctx = UMXRunContext(topo=topo, profile=profile)
+    umx_ctx.init_state(state)
+    return LoomRunContext(profile=profile, umx_ctx=umx_ctx, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "topo_factory, profile, state, period",
+    [
+        (gf01_topology_profile, gf01_profile_cmp0(), [3, 1, 0, 0, 0, 0], 1),
+        (
+            _swap_topology,
+            ProfileCMP0V1(SC=10, s_t_rule={"mode": "sum_abs_flux", "offset": 1}),
+            [2, 0],
+            2,
+        ),
+    ],
+    ids=["fixed_point", "two_cycle"],
+)
+def test_skipped_cycles_match_full_simulation(topo_factory, profile, state, period):
+    topo = topo_factory()
+    reference = _loom(topo, profile, state, W=4)
+    reference.run_until(60)
+
+    skipped = _loom(topo, profile, state, W=4)
+    skipped.run_until(60, skip_cycles=True)
+
+    span = skipped.pending_span
+    assert span is not None and span.end_tick == 60
+    assert span.period == period
+    assert len(skipped.p_blocks) < 60
+    assert skipped.current_chain_value() == reference.current_chain_value()
+    assert skipped.umx_ctx.current_state() == reference.umx_ctx.current_state()
+    for tick in (span.start_tick, 37, 60):
+        assert skipped.get_pblock(tick) == reference.get_pblock(tick)
+        assert skipped.get_chain_at(tick) == reference.get_chain_at(tick)
+    for tick in (37, 60):
+        assert skipped.get_iblock_for(tick) == reference.get_iblock_for(tick)
+        assert skipped.replay_state_at(tick) == reference.replay_state_at(tick)
+
+    assert skipped.chain_state() == reference.chain_state()
+    assert skipped.pending_span is None
+    assert skipped.p_blocks == reference.p_blocks
+    assert skipped.i_blocks == reference.i_blocks
+    assert skipped.recorder.p_hashes == reference.recorder.p_hashes
+
+
+def test_skipped_span_extends_and_materializes_before_new_ticks():
+    topo = gf01_topology_profile()
+    profile = gf01_profile_cmp0()
+    reference = _loom(topo, profile, [3, 1, 0, 0, 0, 0])
+    reference.run_until(40)
+
+    skipped = _loom(topo, profile, [3, 1, 0, 0, 0, 0])
+    skipped.run_until(20, skip_cycles=True)
+    skipped.run_until(30, skip_cycles=True)
+    assert skipped.pending_span.end_tick == 30
+    skipped.run_until(40)
+
+    assert skipped.pending_span is None
+    assert skipped.p_blocks == reference.p_blocks
+    assert skipped.recorder.chain_state() == reference.recorder.chain_state()
+
+
+def test_long_horizon_fixed_point_finishes_quickly():
+    ctx = _loom(gf01_topology_profile(), gf01_profile_cmp0(), [3, 1, 0, 0, 0, 0])
+    start = time.perf_counter()
+    ctx.run_until(10**9, skip_cycles=True)
+
+    assert time.perf_counter() - start < 1.0
+    assert ctx.umx_ctx.tick == 10**9
+    assert ctx.get_pblock(10**9).C_t == ctx.current_chain_value()
+
+
+def test_cycle_span_chain_matches_iterated_rule():
+    profile = gf01_profile_cmp0()
+    reference = _loom(_swap_topology(), ProfileCMP0V1(SC=10), [2, 0])
+    ledgers, _, _ = reference.run_until(2)
+    span = LoomCycleSpanV1(
+        start_tick=5,
+        end_tick=200,
+        C_before=777,
+        modulus=profile.modulus_M,
+        ledgers=tuple(ledgers),
+        s_values=(9, 4),
+    )
+
+    chain = 777
+    for tick in range(5, 201):
+        chain = compute_chain_value(chain, (9, 4)[(tick - 5) % 2], tick, profile)
+        assert span.chain_at(tick) == chain
+
+
+def test_custom_rules_disable_cycle_skipping():
+    topo = gf01_topology_profile()
+    ctx = _loom(topo, gf01_profile_cmp0(), [3, 1, 0, 0, 0, 0], seq_rule=lambda ledger: ledger.tick)
+
+    ctx.run_until(30, skip_cycles=True)
+
+    assert ctx.pending_span is None
+    assert len(ctx.p_blocks) == 30
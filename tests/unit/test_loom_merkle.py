@@ -0,0 +1,107 @@
+"""Tests for the incremental Loom Merkle accumulator and inclusion proofs."""
+from __future__ import annotations
+
+import hashlib
+import json
+
+import pytest
+
+from loom.chain import (
+    LoomBlockStore,
+    LoomChainRecorder,
+    LoomInclusionProofV1,
+    MerkleAccumulator,
+    merkle_proof,
+    merkle_root,
+    verify_merkle_proof,
+)
+from loom.run_context import LoomRunContext
+from umx.profile_cmp0 import ProfileCMP0V1
+from umx.run_context import UMXRunContext
+from umx.topology_profile import gf01_topology_profile
+
+
+def _reference_root(leaves):
+    """The original list-rebuilding implementation of ``merkle_root``."""
+
+    layer = list(leaves)
+    if not layer:
+        return hashlib.sha256(b"").hexdigest()
+    while len(layer) > 1:
+        layer = [
+            hashlib.sha256(
+                (layer[idx] + (layer[idx + 1] if idx + 1 < len(layer) else layer[idx])).encode()
+            ).hexdigest()
+            for idx in range(0, len(layer), 2)
+        ]
+    return layer[0]
+
+
+def test_accumulator_roots_and_proofs_match_the_reference_tree():
+    leaves = [hashlib.sha256(str(n).encode()).hexdigest() for n in range(100)]
+    assert merkle_root([]) == _reference_root([])
+    accumulator = MerkleAccumulator()
+    for count in range(1, 101):
+        accumulator.append(leaves[count - 1])
+        root = _reference_root(leaves[:count])
+        assert accumulator.root() == merkle_root(leaves[:count]) == root
+        assert accumulator.count == count
+        assert len([peak for peak in accumulator._peaks if peak]) == bin(count).count("1")
+        for index in range(count):
+            siblings = merkle_proof(leaves[:count], index)
+            assert len(siblings) <= max(count - 1, 0).bit_length()
+            assert verify_merkle_proof(leaves[index], index, count, siblings, root)
+            if count > 1:
+                assert not verify_merkle_proof(leaves[index], index ^ 1, count, siblings, root)
+                assert not verify_merkle_proof(leaves[(index + 1) % count], index, count,
+                                               siblings, root)
+    restored = MerkleAccumulator.from_dict(json.loads(json.dumps(accumulator.to_dict())))
+    assert restored.root() == accumulator.root()
+    with pytest.raises(ValueError, match="out of range"):
+        merkle_proof(leaves[:3], 3)
+
+
+def _run(recorder: LoomChainRecorder, ticks: int, W: int = 4) -> LoomRunContext:
+    topo = gf01_topology_profile()
+    profile = ProfileCMP0V1(I_block_spacing_W=W)
+    umx_ctx = UMXRunContext(topo=topo, profile=profile)
+    umx_ctx.init_state([3, 1, 0, 0, 0, 0])
+    loom_ctx = LoomRunContext(profile=profile, topo=topo, umx_ctx=umx_ctx, recorder=recorder)
+    loom_ctx.run_until(ticks)
+    return loom_ctx
+
+
+def test_recorder_and_store_prove_p_blocks_against_i_block_roots(tmp_path):
+    store = LoomBlockStore(tmp_path, segment_blocks=5)
+    recorder = LoomChainRecorder(store=store)
+    _run(recorder, 14)
+
+    p_hashes = list(recorder.p_hashes)
+    assert recorder.i_blocks == {
+        tick: merkle_root(p_hashes[tick - 4 : tick]) for tick in (4, 8, 12)
+    }
+    for tick in range(1, 13):
+        proof = recorder.inclusion_proof(tick)
+        assert proof.verify() and proof.p_hash == p_hashes[tick - 1]
+        assert proof.i_block_tick == (tick + 3) // 4 * 4
+        assert proof.merkle_root == recorder.i_blocks[proof.i_block_tick]
+        assert LoomInclusionProofV1.from_dict(proof.to_dict()) == proof
+        assert store.press_pointer("P", tick)["inclusion_proof"] == proof.to_dict()
+    assert store.press_pointer("P", 13)["inclusion_proof"] is None
+    assert "inclusion_proof" not in store.press_pointer("I", 8)
+    with pytest.raises(ValueError, match="No recorded I-block covers tick 13"):
+        recorder.inclusion_proof(13)
+
+    limited = LoomChainRecorder(history_limit=6)
+    _run(limited, 10)
+    assert [limited.inclusion_proof(tick) for tick in (5, 8)] == [
+        recorder.inclusion_proof(tick) for tick in (5, 8)
+    ]
+    with pytest.raises(ValueError, match="no longer retained"):
+        limited.inclusion_proof(4)
+
+    # Restored recorders keep folding into the saved accumulator.
+    resumed = LoomChainRecorder(history_limit=6)
+    resumed.restore(json.loads(json.dumps(limited.snapshot())))
+    assert resumed.snapshot() == limited.snapshot()
+    assert resumed._window.root() == merkle_root(p_hashes[8:10])
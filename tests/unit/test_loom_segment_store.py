@@ -0,0 +1,225 @@
+"""Tests for the segmented Loom block store, write-behind and legacy migration."""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from cli import main as cli_main
+from core.tick_loop import TickLoopWindowSpec, run_cmp0_tick_loop
+from loom.chain import (
+    LoomBlockStore,
+    LoomChainRecorder,
+    LoomWriteBehindConfig,
+    migrate_loom_block_store,
+)
+from loom.loom import LoomPBlockV1
+from loom.run_context import LoomRunContext
+from umx.profile_cmp0 import ProfileCMP0V1, gf01_profile_cmp0
+from umx.run_context import UMXRunContext
+from umx.topology_profile import gf01_topology_profile
+
+
+def _record(store: LoomBlockStore | None, ticks: int) -> LoomChainRecorder:
+    topo = gf01_topology_profile()
+    profile = ProfileCMP0V1(I_block_spacing_W=3)
+    umx_ctx = UMXRunContext(topo=topo, profile=profile)
+    umx_ctx.init_state([3, 1, 0, 0, 0, 0])
+    recorder = LoomChainRecorder(store=store)
+    LoomRunContext(profile=profile, topo=topo, umx_ctx=umx_ctx, recorder=recorder).run_until(ticks)
+    return recorder
+
+
+def _segment_files(root: Path, kind: str = "pblocks") -> list[str]:
+    return sorted(path.name for path in (root / kind).iterdir())
+
+
+def test_segments_roll_prune_whole_segments_and_truncate(tmp_path):
+    root = tmp_path / "store"
+    store = LoomBlockStore(root, rollback_window=5, segment_blocks=4)
+    recorder = _record(store, 20)
+
+    index = store.replay_index()
+    assert [entry["tick"] for entry in index["p"]] == [16, 17, 18, 19, 20]
+    assert [entry["hash"] for entry in index["p"]] == list(recorder.p_hashes)[-5:]
+    assert [entry["tick"] for entry in index["i"]] == [6, 9, 12, 15, 18]
+    # Ticks 13-15 are hidden by the window but share a segment with tick 16.
+    assert _segment_files(root) == [
+        "seg_000000000004.bin", "seg_000000000004.idx",
+        "seg_000000000005.bin", "seg_000000000005.idx",
+    ]
+    with pytest.raises(FileNotFoundError, match="No stored P-block for tick 15"):
+        store.load_p_block(15)
+
+    stored = store.load_p_block(18)
+    assert stored["type"] == "P" and stored["block"]["tick"] == 18
+    assert stored["hash"] == index["p"][2]["hash"]
+    decoded, bin_hash = store.load_p_block_binary(18)
+    assert decoded == stored["block"]
+    pointer = store.press_pointer("P", 18)
+    assert pointer["binary_hash"] == bin_hash
+    assert pointer["binary_offset"] == index["p"][2]["offset"] > 0
+    assert store.load_i_block(12)["block"]["merkle_root"] == recorder.i_blocks[12]
+
+    reopened = LoomBlockStore(root, rollback_window=5, segment_blocks=4)
+    assert reopened.replay_index() == index
+    reopened.truncate_after(17)
+    assert [entry["tick"] for entry in reopened.replay_index()["p"]] == [16, 17]
+    with pytest.raises(FileNotFoundError, match="binary for tick 18"):
+        reopened.load_p_block_binary(18)
+
+    # Re-recording ticks replaces them instead of duplicating entries.
+    rerun = LoomBlockStore(tmp_path / "rerun", segment_blocks=4)
+    _record(rerun, 6)
+    _record(rerun, 6)
+    assert [entry["tick"] for entry in rerun.replay_index()["p"]] == [1, 2, 3, 4, 5, 6]
+
+
+def _write_legacy_store(source: LoomBlockStore, root: Path) -> None:
+    """Rewrite ``source``'s blocks in the JSON-index layout (one file per block)."""
+
+    index = {"p": [], "i": []}
+    for key, directory in (("p", "pblocks"), ("i", "iblocks")):
+        (root / directory).mkdir(parents=True)
+        for entry in source.replay_index()[key]:
+            tick = entry["tick"]
+            json_path = root / directory / f"tick_{tick}.json"
+            bin_path = root / directory / f"tick_{tick}.bin"
+            load = source.load_p_block if key == "p" else source.load_i_block
+            json_path.write_text(json.dumps(load(tick)))
+            with open(entry["bin_path"], "rb") as handle:
+                handle.seek(entry["offset"])
+                bin_path.write_bytes(handle.read(entry["bin_size"]))
+            index[key].append(
+                {
+                    **{name: entry[name] for name in ("tick", "hash", "bin_hash", "bin_size")},
+                    "bin_envelope_hash": entry["bin_envelope_hash"],
+                    "path": str(json_path),
+                    "bin_path": str(bin_path),
+                }
+            )
+    (root / "index.json").write_text(json.dumps(index))
+
+
+def test_legacy_stores_stay_readable_and_migrate(tmp_path, capsys):
+    source = LoomBlockStore(tmp_path / "source")
+    _record(source, 9)
+    expected = source.replay_index()
+
+    legacy_root = tmp_path / "legacy"
+    _write_legacy_store(source, legacy_root)
+    legacy = LoomBlockStore(legacy_root)
+    assert legacy.is_legacy
+    assert legacy.load_p_block(4) == source.load_p_block(4)
+    assert legacy.load_i_block_binary(6) == source.load_i_block_binary(6)
+    assert legacy.press_pointer("P", 2)["binary_path"].endswith("tick_2.bin")
+
+    cli_main(["loom", "migrate", str(legacy_root), "--segment-blocks", "4"])
+    assert json.loads(capsys.readouterr().out)["p_blocks"] == 9
+    migrated = LoomBlockStore(legacy_root)
+    assert not migrated.is_legacy
+    assert not (legacy_root / "index.json").exists()
+    assert _segment_files(legacy_root)[-1] == "seg_000000000003.idx"
+    for key in ("p", "i"):
+        assert [
+            (entry["tick"], entry["hash"], entry["bin_hash"]) for entry in migrated.replay_index()[key]
+        ] == [(entry["tick"], entry["hash"], entry["bin_hash"]) for entry in expected[key]]
+    assert migrated.load_p_block(7) == source.load_p_block(7)
+
+    # Writing into a legacy store migrates it first.
+    legacy_root = tmp_path / "legacy_write"
+    _write_legacy_store(source, legacy_root)
+    _record(LoomBlockStore(legacy_root), 12)
+    assert [entry["tick"] for entry in LoomBlockStore(legacy_root).replay_index()["p"]] == list(
+        range(1, 13)
+    )
+    assert migrate_loom_block_store(legacy_root).is_legacy is False
+
+
+def _segment_bytes(root: Path) -> dict:
+    return {
+        f"{kind}/{path.name}": path.read_bytes()
+        for kind in ("pblocks", "iblocks")
+        for path in sorted((root / kind).iterdir())
+    }
+
+
+def test_write_behind_store_matches_synchronous_writes(tmp_path):
+    reference = LoomBlockStore(tmp_path / "sync", rollback_window=7, segment_blocks=4)
+    _record(reference, 25)
+    for config in (
+        LoomWriteBehindConfig(batch_blocks=3, queue_blocks=2),
+        LoomWriteBehindConfig(batch_blocks=1000, flush_ticks=5, flush_ms=1, fsync=True),
+    ):
+        root = tmp_path / f"behind_{config.batch_blocks}"
+        store = LoomBlockStore(root, rollback_window=7, segment_blocks=4, write_behind=config)
+        _record(store, 25)
+        assert store.replay_index()["p"][-1]["tick"] == 25
+        store.close()
+        assert _segment_bytes(root) == _segment_bytes(tmp_path / "sync")
+        with pytest.raises(ValueError, match="writer is closed"):
+            _record(store, 1)
+
+    windows = [
+        TickLoopWindowSpec(window_id=f"W{start}", apx_name=f"APX{start}", start_tick=start,
+                           end_tick=start + 4)
+        for start in (1, 6, 11)
+    ]
+    written = []
+    for config in (None, LoomWriteBehindConfig(batch_blocks=64, flush_on_window_close=True)):
+        root = tmp_path / f"loop_{config is None}"
+        store = LoomBlockStore(root, write_behind=config)
+        run_cmp0_tick_loop(
+            topo=gf01_topology_profile(), profile=gf01_profile_cmp0(),
+            initial_state=[3, 1, 0, 0, 0, 0], total_ticks=15, window_specs=windows,
+            primary_window_id="W1", run_id="WB", nid="N/A", loom_block_store=store,
+        )
+        # The tick loop flushes on completion, so the files are complete before close().
+        written.append(_segment_bytes(root))
+        store.close()
+    assert written[0] and written[1] == written[0]
+
+
+def test_write_behind_errors_surface_to_the_caller(tmp_path):
+    store = LoomBlockStore(tmp_path, write_behind=LoomWriteBehindConfig(batch_blocks=2))
+    recorder = _record(store, 3)
+    block = LoomPBlockV1(gid="GF01", tick=4, seq=4, s_t=0, C_t=0)
+    store.write_p_block(block, {"unserialisable": object()}, recorder.p_hashes[-1])
+    with pytest.raises(TypeError):
+        store.flush()
+    with pytest.raises(TypeError):
+        store.write_p_block(block, {}, recorder.p_hashes[-1])
+    with pytest.raises(TypeError):
+        store.close()
+    assert [entry["tick"] for entry in LoomBlockStore(tmp_path).replay_index()["p"]] == [1, 2, 3]
+
+
+def test_reopening_cuts_a_torn_segment_tail(tmp_path):
+    reference = LoomBlockStore(tmp_path / "reference", segment_blocks=4)
+    _record(reference, 12)
+    root = tmp_path / "torn"
+    _record(LoomBlockStore(root, segment_blocks=4), 10)
+
+    # An interrupted write: the last index record is cut in half and the
+    # data file carries bytes no complete record points at.
+    index_path = root / "pblocks" / "seg_000000000003.idx"
+    index_path.write_bytes(index_path.read_bytes()[:-40])
+    with open(root / "pblocks" / "seg_000000000003.bin", "ab") as handle:
+        handle.write(b"torn")
+
+    store = LoomBlockStore(root, segment_blocks=4)
+    assert [entry["tick"] for entry in store.replay_index()["p"]] == list(range(1, 10))
+    assert store.load_p_block(9) == reference.load_p_block(9)
+    for tick in (10, 11, 12):
+        stored = reference.load_p_block(tick)
+        block = LoomPBlockV1(gid="GF01", tick=tick, seq=tick, s_t=0, C_t=0)
+        store.write_p_block(block, stored["block"], stored["hash"])
+    assert store.load_p_block(12) == reference.load_p_block(12)
+    assert {
+        name: data for name, data in _segment_bytes(root).items() if name.startswith("pblocks")
+    } == {
+        name: data
+        for name, data in _segment_bytes(tmp_path / "reference").items()
+        if name.startswith("pblocks")
+    }
@@ -3,7 +3,7 @@ from pathlib import Path
 
 import pytest
 
-from gate import PFNAInputV0, dump_pfna_v0, load_pfna_v0
+from gate import PFNAInputV0, PFNAJsonlStreamV0, dump_pfna_v0, load_pfna_v0, write_pfna_v0_jsonl
 
 
 @pytest.fixture
@@ -71,3 +71,31 @@ def test_pfna_round_trip_serialise_and_parse(pfna_dict):
     # Sorting ensures deterministic ordering for the comparison
     reloaded = load_pfna_v0(dumped, expected_length=3)
     assert reloaded == loaded
+
+
+def test_pfna_jsonl_stream_matches_document_loader(tmp_path: Path, pfna_dict):
+    loaded = load_pfna_v0(pfna_dict, expected_length=3)
+    path = write_pfna_v0_jsonl(
+        tmp_path / "pfna.jsonl",
+        bundle_id="BUNDLE_A",
+        gid="LINE_PFNA",
+        run_id="RUN01",
+        nid="N1",
+        entries=loaded,
+    )
+
+    stream = PFNAJsonlStreamV0(path, expected_length=3)
+    assert (stream.pfna_id, stream.gid, stream.run_id, stream.nid) == (
+        "BUNDLE_A", "LINE_PFNA", "RUN01", "N1",
+    )
+    assert tuple(stream) == loaded
+    assert tuple(stream) == loaded  # each iteration re-reads the file
+
+    with pytest.raises(ValueError, match="values length must match expected_length"):
+        list(PFNAJsonlStreamV0(path, expected_length=2))
+    path.write_text(path.read_text().replace('"tick": 1', '"tick": 5'))
+    with pytest.raises(ValueError, match="ordered by tick"):
+        list(PFNAJsonlStreamV0(path))
+    path.write_text('{"v": 0, "pfna_id": "B", "gid": "", "run_id": "R", "nid": "N"}\n')
+    with pytest.raises(ValueError, match="gid must be non-empty"):
+        PFNAJsonlStreamV0(path)
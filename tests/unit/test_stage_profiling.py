@@ -0,0 +1,154 @@
+"""Tests for opt-in per-stage profiling."""
+from __future__ import annotations
+
+from dataclasses import replace
+from pathlib import Path
+
+from codex.context import CodexContext
+from config import metrics_config_from_mapping
+from core.multigraph import (
+    GraphRunConfigV1,
+    MultiGraphRunConfigV1,
+    MultiGraphRunContext,
+    TopologyRegistry,
+)
+from core.tick_loop import TickLoopPipelineConfig, TickLoopWindowSpec, run_cmp0_tick_loop
+from gate import PFNAInputV0, SessionConfigV1, run_session
+from governance import GovernanceConfigV1
+from ops import LoggingConfigV1, MetricsConfigV1, StageProfiler, StructuredLogger
+from umx.profile_cmp0 import gf01_profile_cmp0
+from umx.topology_profile import gf01_topology_profile
+
+FIXTURES = Path("docs/fixtures")
+TOPO = gf01_topology_profile()
+WINDOW = TickLoopWindowSpec(window_id="W", apx_name="APX", start_tick=1, end_tick=12)
+
+
+def _run(**overrides):
+    kwargs = dict(
+        topo=TOPO,
+        profile=gf01_profile_cmp0(),
+        initial_state=[3, 1, 0, 0, 0, 0],
+        total_ticks=12,
+        window_specs=[WINDOW],
+        primary_window_id="W",
+        run_id="PROF",
+        nid="N/A",
+        pfna_inputs=[
+            PFNAInputV0(
+                pfna_id="P3", gid=TOPO.gid, run_id="PROF", tick=3, nid="N/A",
+                values=(1, 0, 0, 0, 0, 0),
+            )
+        ],
+        governance=GovernanceConfigV1(codex_action_mode="OBSERVE", governance_mode="OBSERVE"),
+    )
+    kwargs.update(overrides)
+    return run_cmp0_tick_loop(**kwargs)
+
+
+def test_profiler_accumulates_per_tick_samples():
+    profiler = StageProfiler()
+    for tick, elapsed in enumerate([5, 1, 3, 100], start=1):
+        profiler.record("umx", tick, elapsed)
+    profiler.record("umx", 4, 20)
+    profiler.record("custom", 1, 7)
+    profiler.record("loom", 1, 2)
+
+    umx, loom, custom = profiler.timings()
+    assert [umx.stage, loom.stage, custom.stage] == ["umx", "loom", "custom"]
+    assert (umx.count, umx.total_ns, umx.ticks) == (5, 129, 4)
+    assert (umx.p50_ns, umx.p99_ns) == (3, 120)
+    assert profiler.to_dict()["loom"] == {
+        "count": 1, "total_ns": 2, "ticks": 1, "p50_ns": 2, "p99_ns": 2,
+    }
+    assert profiler.call("press", 1, max, 2, 9) == 9
+    assert profiler.to_dict()["press"]["count"] == 1
+
+
+def test_profiler_histogram_is_fixed_size_and_within_bucket_precision():
+    profiler = StageProfiler()
+    samples = [1_000 + 37 * tick for tick in range(1, 20_001)]
+    for tick, elapsed in enumerate(samples, start=1):
+        profiler.record("umx", tick, elapsed)
+    stats = profiler._stages["umx"]
+    assert stats.ticks == 19_999 and len(stats.histogram) == 960
+
+    (umx,) = profiler.timings()
+    ordered = sorted(samples)
+    assert umx.ticks == 20_000 and umx.total_ns == sum(samples)
+    for reported, exact in ((umx.p50_ns, ordered[9_999]), (umx.p99_ns, ordered[19_799])):
+        assert exact <= reported <= exact * 17 // 16
+
+
+def test_profiled_tick_loop_matches_unprofiled_run():
+    reference = _run(codex_ctx=CodexContext(library_id="LIB"))
+    for pipeline in (None, TickLoopPipelineConfig(depth=4, workers=2)):
+        profiler = StageProfiler()
+        logger = StructuredLogger(LoggingConfigV1(enabled=True, include_ticks=False))
+        result = _run(
+            codex_ctx=CodexContext(library_id="LIB"),
+            profiler=profiler,
+            pipeline=pipeline,
+            logger=logger,
+        )
+        assert result.envelopes == reference.envelopes
+        assert result.u_ledger_entries == reference.u_ledger_entries
+
+        timings = profiler.to_dict()
+        assert list(timings) == [
+            "pfna", "umx", "loom", "press", "codex", "scenes", "governance", "uledger",
+        ]
+        assert all(timings[stage]["ticks"] == 12 for stage in ("umx", "loom", "codex"))
+        # Twelve ticks of buffering plus the window close on the last tick.
+        assert timings["press"]["count"] == 13 and timings["press"]["ticks"] == 12
+        events = [entry for entry in logger.entries if entry.event == "stage_profile"]
+        assert len(events) == 1 and set(events[0].payload["stages"]) == set(timings)
+
+
+def test_session_metrics_and_multigraph_report_stage_timings():
+    metrics_config = metrics_config_from_mapping({"enabled": True, "profile_stages": True})
+    assert metrics_config == MetricsConfigV1(enabled=True, profile_stages=True)
+    session = SessionConfigV1(
+        topo=TOPO,
+        profile=gf01_profile_cmp0(),
+        initial_state=[3, 1, 0, 0, 0, 0],
+        total_ticks=8,
+        window_specs=(replace(WINDOW, end_tick=8),),
+        primary_window_id="W",
+        run_id="PROF",
+        metrics_config=metrics_config,
+    )
+    metrics = run_session(session).metrics
+    assert metrics.stage_timings["umx"]["ticks"] == 8
+    assert metrics.to_dict()["stage_timings"] == metrics.stage_timings
+    plain = run_session(replace(session, metrics_config=MetricsConfigV1(enabled=True)))
+    assert "stage_timings" not in plain.metrics.to_dict()
+
+    config = MultiGraphRunConfigV1(
+        v=1,
+        graphs=(
+            GraphRunConfigV1(
+                gid="LINE4",
+                topology_path="topologies/line_4_topology_profile.json",
+                profile_path="profiles/profile_cmp1.json",
+                initial_state=(1, 2, 3, 4),
+                ticks=3,
+            ),
+            GraphRunConfigV1(
+                gid="RING5",
+                topology_path="topologies/ring_5_topology_profile.json",
+                profile_path="profiles/profile_cmp2.json",
+                initial_state=(0, 0, 0, 0, 0),
+                ticks=3,
+            ),
+        ),
+    )
+    profiler = StageProfiler()
+    ctx = MultiGraphRunContext(
+        config, TopologyRegistry.from_config(config, base_dir=FIXTURES), profiler=profiler
+    )
+    for _ in range(3):
+        ctx.step_all()
+    timings = profiler.to_dict()
+    assert list(timings) == ["slp", "umx", "loom"]
+    assert timings["umx"]["count"] == 6 and timings["umx"]["ticks"] == 3
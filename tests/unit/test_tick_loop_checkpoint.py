@@ -0,0 +1,214 @@
+"""Tests for tick loop checkpoints and resumed runs."""
+from __future__ import annotations
+
+import os
+from dataclasses import replace
+from itertools import islice
+from pathlib import Path
+
+import pytest
+
+from codex.context import CodexContext
+from core import (
+    TickLoopCheckpointConfig,
+    TickLoopCheckpointV1,
+    latest_tick_loop_checkpoint,
+    load_tick_loop_checkpoint,
+)
+from core.checkpoint import write_tick_loop_checkpoint
+from core.serialization import dumps_session_run
+from core.tick_loop import (
+    TickLoopPipelineConfig,
+    TickLoopWindowSpec,
+    iter_cmp0_tick_loop,
+    run_cmp0_tick_loop,
+)
+from gate import PFNAInputV0, SessionConfigV1, run_session
+from governance import GovernanceConfigV1
+from loom.chain import LoomBlockStore
+from umx.profile_cmp0 import gf01_profile_cmp0
+from umx.topology_profile import gf01_topology_profile
+
+TOPO = gf01_topology_profile()
+WINDOWS = (
+    TickLoopWindowSpec(window_id="FULL", apx_name="APX_FULL", start_tick=1, end_tick=30),
+    TickLoopWindowSpec(window_id="HEAD", apx_name="APX_HEAD", start_tick=1, end_tick=4),
+    TickLoopWindowSpec(window_id="MID", apx_name="APX_MID", start_tick=5, end_tick=17),
+)
+PFNA = tuple(
+    PFNAInputV0(
+        pfna_id=f"PFNA_{tick}", gid=TOPO.gid, run_id="CKPT", tick=tick, nid="N/A",
+        values=(1, 0, 0, 0, 0, 2),
+    )
+    for tick in (0, 3, 9, 12, 25)
+)
+
+
+def _kwargs(store_dir, **overrides):
+    kwargs = dict(
+        topo=TOPO,
+        profile=gf01_profile_cmp0(),
+        initial_state=[3, 1, 0, 0, 0, 0],
+        total_ticks=30,
+        window_specs=WINDOWS,
+        primary_window_id="HEAD",
+        run_id="CKPT",
+        nid="N/A",
+        pfna_inputs=PFNA,
+        governance=GovernanceConfigV1(
+            codex_action_mode="GOVERNED_APPLY", governance_mode="OBSERVE"
+        ),
+        codex_ctx=CodexContext(library_id="CE_MAIN"),
+        loom_block_store=LoomBlockStore(store_dir),
+    )
+    kwargs.update(overrides)
+    return kwargs
+
+
+def _store_hashes(store_dir):
+    index = LoomBlockStore(store_dir).replay_index()
+    return {kind: [entry["hash"] for entry in index[kind]] for kind in ("p", "i")}
+
+
+@pytest.mark.parametrize("pipeline", [None, TickLoopPipelineConfig(depth=3, workers=2)])
+def test_resumed_stream_continues_an_interrupted_run(tmp_path, pipeline):
+    checkpoints = TickLoopCheckpointConfig(tmp_path / "ckpt", every=5)
+    reference_codex = CodexContext(library_id="CE_MAIN")
+    reference = list(
+        iter_cmp0_tick_loop(
+            **_kwargs(tmp_path / "reference", codex_ctx=reference_codex, pipeline=pipeline),
+            checkpoints=TickLoopCheckpointConfig(tmp_path / "unused", every=5),
+        )
+    )
+
+    # Stop part-way through the run, after the tick-15 checkpoint was written.
+    crashed = iter_cmp0_tick_loop(
+        **_kwargs(tmp_path / "resumed", pipeline=pipeline), checkpoints=checkpoints
+    )
+    partial = list(islice(crashed, 95))
+    crashed.close()
+    checkpoint = latest_tick_loop_checkpoint(checkpoints.directory)
+    assert checkpoint.tick == 15
+    assert partial[: checkpoint.artifact_count] == reference[: checkpoint.artifact_count]
+
+    resumed_codex = CodexContext(library_id="CE_MAIN")
+    resumed = list(
+        iter_cmp0_tick_loop(
+            **_kwargs(tmp_path / "resumed", codex_ctx=resumed_codex, pipeline=pipeline),
+            checkpoints=checkpoints,
+            resume_from=checkpoints.directory,
+        )
+    )
+    assert partial[: checkpoint.artifact_count] + resumed == reference
+    assert resumed_codex.runtime_stats == reference_codex.runtime_stats
+    assert _store_hashes(tmp_path / "resumed") == _store_hashes(tmp_path / "reference")
+    assert sorted(path.name for path in checkpoints.directory.iterdir()) == [
+        "checkpoint_000000000020.json",
+        "checkpoint_000000000025.json",
+    ]
+
+
+def test_resumed_lean_session_serialises_identically(tmp_path):
+    config = SessionConfigV1(
+        topo=TOPO,
+        profile=gf01_profile_cmp0(),
+        initial_state=[3, 1, 0, 0, 0, 0],
+        total_ticks=30,
+        window_specs=WINDOWS,
+        primary_window_id="FULL",
+        run_id="CKPT",
+        pfna_inputs=PFNA,
+        artifact_profile="lean",
+    )
+    checkpoints = TickLoopCheckpointConfig(tmp_path, every=4, keep=None)
+    uninterrupted = dumps_session_run(run_session(config, checkpoints=checkpoints))
+
+    for path in sorted(tmp_path.glob("checkpoint_*.json")):
+        resumed = run_session(config, resume_from=path)
+        assert dumps_session_run(resumed) == uninterrupted
+    latest = load_tick_loop_checkpoint(tmp_path)
+    assert latest.tick == 28
+    # Ingress envelopes are counted, not carried: the artefact log holds them.
+    assert latest.ingress_envelope_count == 4
+    assert "ingress_envelopes" not in latest.to_dict()
+
+
+@pytest.mark.parametrize("artifact_profile", ["full", "audit"])
+def test_resumed_session_with_an_open_primary_window_serialises_identically(
+    tmp_path, artifact_profile
+):
+    config = SessionConfigV1(
+        topo=TOPO,
+        profile=gf01_profile_cmp0(),
+        initial_state=[3, 1, 0, 0, 0, 0],
+        total_ticks=30,
+        window_specs=WINDOWS,
+        primary_window_id="FULL",
+        run_id="CKPT",
+        pfna_inputs=PFNA,
+        governance=GovernanceConfigV1(codex_action_mode="OBSERVE", governance_mode="OBSERVE"),
+        artifact_profile=artifact_profile,
+    )
+    checkpoints = TickLoopCheckpointConfig(tmp_path, every=7, keep=None)
+    uninterrupted = dumps_session_run(run_session(config, checkpoints=checkpoints))
+    log = (tmp_path / "artifacts.jsonl").read_bytes()
+
+    paths = sorted(tmp_path.glob("checkpoint_*.json"))
+    assert [load_tick_loop_checkpoint(path).tick for path in paths] == [7, 14, 21, 28]
+    # The primary window spans the run, so every checkpoint carries unbuilt scenes.
+    assert len(load_tick_loop_checkpoint(paths[1]).pending_ticks) == 14
+    for path in paths:
+        assert dumps_session_run(run_session(config, resume_from=path)) == uninterrupted
+
+    resumed = run_session(config, checkpoints=checkpoints, resume_from=paths[1])
+    assert dumps_session_run(resumed) == uninterrupted
+    assert (tmp_path / "artifacts.jsonl").read_bytes() == log
+
+
+def test_checkpoint_round_trip_and_validation(tmp_path):
+    run_cmp0_tick_loop(
+        **_kwargs(tmp_path / "store"),
+        checkpoints=TickLoopCheckpointConfig(tmp_path / "ckpt", every=10),
+    )
+    checkpoint = load_tick_loop_checkpoint(tmp_path / "ckpt")
+    assert TickLoopCheckpointV1.from_json(checkpoint.to_json()) == checkpoint
+    assert checkpoint.press_buffers.keys() == {"FULL"}
+    assert [manifest.window_id for manifest in checkpoint.manifests] == ["HEAD", "MID"]
+
+    with pytest.raises(ValueError, match="different run"):
+        list(iter_cmp0_tick_loop(**_kwargs(tmp_path / "store", run_id="OTHER"),
+                                 resume_from=checkpoint))
+    with pytest.raises(ValueError, match="PFNA inputs"):
+        list(iter_cmp0_tick_loop(**_kwargs(tmp_path / "store", pfna_inputs=PFNA[:2]),
+                                 resume_from=checkpoint))
+    assert checkpoint.artifact_log.endswith("artifacts.jsonl") and checkpoint.artifact_log_size
+    streamed = TickLoopCheckpointConfig(tmp_path / "streamed", every=10)
+    list(iter_cmp0_tick_loop(**_kwargs(tmp_path / "store"), checkpoints=streamed))
+    with pytest.raises(ValueError, match="no artefact log"):
+        run_cmp0_tick_loop(**_kwargs(tmp_path / "store"), resume_from=streamed.directory)
+    with pytest.raises(ValueError, match="No tick loop checkpoint"):
+        load_tick_loop_checkpoint(tmp_path / "store")
+    with pytest.raises(ValueError):
+        TickLoopCheckpointConfig(tmp_path, every=0)
+
+
+def test_checkpoints_are_synced_before_older_ones_are_pruned(tmp_path, monkeypatch):
+    run_cmp0_tick_loop(
+        **_kwargs(tmp_path / "store"),
+        checkpoints=TickLoopCheckpointConfig(tmp_path / "ckpt", every=10),
+    )
+    checkpoint = load_tick_loop_checkpoint(tmp_path / "ckpt")
+
+    events = []
+    real_fsync, real_replace, real_unlink = os.fsync, os.replace, Path.unlink
+    monkeypatch.setattr(os, "fsync", lambda fd: events.append("fsync") or real_fsync(fd))
+    monkeypatch.setattr(
+        os, "replace", lambda *args: events.append("replace") or real_replace(*args)
+    )
+    monkeypatch.setattr(
+        Path, "unlink", lambda self, **kw: events.append("unlink") or real_unlink(self, **kw)
+    )
+    write_tick_loop_checkpoint(replace(checkpoint, tick=25), tmp_path / "ckpt", keep=1)
+    # Both older checkpoints (ticks 10 and 20) go only after the new one is durable.
+    assert events == ["fsync", "replace", "fsync", "unlink", "unlink"]
+    assert latest_tick_loop_checkpoint(tmp_path / "ckpt").tick == 25
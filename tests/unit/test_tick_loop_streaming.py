@@ -0,0 +1,252 @@
+"""Tests for the streaming CMP-0 tick loop and its incremental helpers."""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from codex.context import CodexContext
+from core.tick_loop import (
+    TickLoopPipelineConfig,
+    TickLoopSummaryV1,
+    TickLoopWindowSpec,
+    iter_cmp0_tick_loop,
+    run_cmp0_tick_loop,
+)
+from governance import GovernanceConfigV1
+from loom.chain import BackgroundChainRecorder, LoomBlockStore, LoomChainRecorder
+from loom.run_context import LoomRunContext
+from uledger import ULedgerChainBuilder, build_and_validate_uledger
+from umx.profile_cmp0 import gf01_profile_cmp0
+from umx.run_context import UMXRunContext
+from umx.topology_profile import gf01_topology_profile
+
+INITIAL_STATE = [3, 1, 0, 0, 0, 0]
+
+
+def _kwargs(primary: str = "FULL", **overrides):
+    kwargs = dict(
+        topo=gf01_topology_profile(),
+        profile=gf01_profile_cmp0(),
+        initial_state=INITIAL_STATE,
+        total_ticks=8,
+        window_specs=[
+            TickLoopWindowSpec(window_id="FULL", apx_name="APX_FULL", start_tick=1, end_tick=8),
+            TickLoopWindowSpec(window_id="HEAD", apx_name="APX_HEAD", start_tick=1, end_tick=2),
+        ],
+        primary_window_id=primary,
+        run_id="STREAM",
+        nid="N/A",
+        governance=GovernanceConfigV1(gid="GF01", run_id="STREAM"),
+    )
+    kwargs.update(overrides)
+    return kwargs
+
+
+def test_streamed_artifacts_match_collected_run():
+    result = run_cmp0_tick_loop(**_kwargs())
+    artifacts = list(iter_cmp0_tick_loop(**_kwargs()))
+    by_kind = {}
+    for artifact in artifacts:
+        by_kind.setdefault(artifact.kind, []).append(artifact.value)
+
+    assert by_kind["ledger"] == result.ledgers
+    assert by_kind["scene"] == result.scenes
+    assert by_kind["envelope"] == result.envelopes
+    assert by_kind["u_ledger_entry"] == result.u_ledger_entries
+    assert by_kind.get("governance_envelope", []) == result.governance_envelopes
+    assert artifacts[-1].kind == "summary"
+    summary = artifacts[-1].value
+    assert isinstance(summary, TickLoopSummaryV1)
+    assert summary.manifests == result.manifests
+    assert summary.u_ledger_checkpoint == result.u_ledger_checkpoint
+
+
+def test_windows_close_and_scenes_flow_once_primary_window_ends():
+    kinds = [
+        (artifact.kind, artifact.tick, artifact.window_id)
+        for artifact in iter_cmp0_tick_loop(**_kwargs(primary="HEAD"))
+    ]
+    head_closed = kinds.index(("manifest", None, "HEAD"))
+    assert kinds.index(("ledger", 2, None)) < head_closed < kinds.index(("ledger", 3, None))
+    # Ticks 1-2 wait for the primary manifest; later ticks are emitted inline.
+    assert kinds.index(("scene", 3, None)) < kinds.index(("ledger", 4, None))
+    assert kinds.index(("u_ledger_entry", 3, None)) < kinds.index(("ledger", 4, None))
+
+    reference = run_cmp0_tick_loop(**_kwargs(primary="HEAD"))
+    entries = [
+        artifact.value
+        for artifact in iter_cmp0_tick_loop(**_kwargs(primary="HEAD"))
+        if artifact.kind == "u_ledger_entry"
+    ]
+    assert entries == reference.u_ledger_entries
+
+
+def test_streamed_codex_ingest_matches_batch_ingest():
+    streamed = CodexContext(library_id="CE_MAIN")
+    result = run_cmp0_tick_loop(**_kwargs(codex_ctx=streamed))
+
+    batch = CodexContext(library_id="CE_MAIN")
+    batch.ingest(
+        gid=result.topo.gid,
+        run_id=result.run_id,
+        ledgers=result.ledgers,
+        p_blocks=result.p_blocks,
+        i_blocks=result.i_blocks,
+        manifests=result.manifests,
+        envelopes=result.envelopes,
+        window_id="FULL",
+    )
+    assert streamed.runtime_stats == batch.runtime_stats
+
+    # Codex-emitted proposals only settle the U-ledger governance meta at the end.
+    _, checkpoint = build_and_validate_uledger(
+        gid=result.topo.gid,
+        run_id=result.run_id,
+        window_id="FULL",
+        ledgers=result.ledgers,
+        p_blocks=result.p_blocks,
+        envelopes=result.envelopes,
+        manifest=result.manifests["APX_FULL"],
+        policy_set_hash=result.governance.policy_set_hash if result.governance else None,
+        governance_meta=result.u_ledger_entries[0].meta or None,
+    )
+    assert checkpoint == result.u_ledger_checkpoint
+
+
+def test_chain_builder_matches_batch_uledger():
+    result = run_cmp0_tick_loop(**_kwargs())
+    builder = ULedgerChainBuilder(
+        gid=result.topo.gid,
+        run_id=result.run_id,
+        window_id="FULL",
+        manifest=result.manifests["APX_FULL"],
+    )
+    entries = [
+        builder.append(ledger, p_block, envelope)
+        for ledger, p_block, envelope in zip(result.ledgers, result.p_blocks, result.envelopes)
+    ]
+    expected, checkpoint = build_and_validate_uledger(
+        gid=result.topo.gid,
+        run_id=result.run_id,
+        window_id="FULL",
+        ledgers=result.ledgers,
+        p_blocks=result.p_blocks,
+        envelopes=result.envelopes,
+        manifest=result.manifests["APX_FULL"],
+    )
+    assert entries == expected
+    assert builder.checkpoint() == checkpoint
+
+
+def test_loom_history_limit_bounds_retained_blocks():
+    def loom(**kwargs):
+        umx_ctx = UMXRunContext(topo=gf01_topology_profile(), profile=gf01_profile_cmp0())
+        umx_ctx.init_state(INITIAL_STATE)
+        return LoomRunContext(profile=umx_ctx.profile, umx_ctx=umx_ctx, **kwargs)
+
+    bounded = loom(history_limit=2)
+    reference = loom()
+    bounded.run_until(20)
+    reference.run_until(20)
+
+    assert list(bounded.p_blocks) == reference.p_blocks[-2:]
+    assert len(bounded.ledgers) == 2
+    assert bounded.current_chain_value() == reference.current_chain_value()
+    assert bounded.chain_state() == reference.chain_state()
+
+
+def test_pipelined_run_matches_serial_run(tmp_path):
+    def run(store_dir, pipeline=None):
+        return run_cmp0_tick_loop(
+            **_kwargs(
+                primary="HEAD",
+                total_ticks=40,
+                codex_ctx=CodexContext(library_id="CE_MAIN"),
+                governance=GovernanceConfigV1(
+                    codex_action_mode="GOVERNED_APPLY", governance_mode="OBSERVE"
+                ),
+                loom_block_store=LoomBlockStore(tmp_path / store_dir),
+                pipeline=pipeline,
+            )
+        )
+
+    serial = run("serial")
+    pipelined = run("pipelined", TickLoopPipelineConfig(depth=3, workers=2))
+
+    assert pipelined == serial
+    assert pipelined.governance_envelopes
+    serial_index = LoomBlockStore(tmp_path / "serial").replay_index()
+    pipelined_index = LoomBlockStore(tmp_path / "pipelined").replay_index()
+    for kind in ("p", "i"):
+        assert [entry["hash"] for entry in pipelined_index[kind]] == [
+            entry["hash"] for entry in serial_index[kind]
+        ]
+
+
+def test_pipelined_generator_stops_its_threads_when_closed():
+    before = threading.active_count()
+    artifacts = iter_cmp0_tick_loop(
+        **_kwargs(total_ticks=10_000, pipeline=TickLoopPipelineConfig(depth=2))
+    )
+    for _ in range(6):
+        next(artifacts)
+    artifacts.close()
+    assert threading.active_count() == before
+
+    with pytest.raises(ValueError):
+        TickLoopPipelineConfig(depth=0)
+
+
+def test_background_chain_recorder_matches_inline_recorder():
+    def loom(recorder):
+        umx_ctx = UMXRunContext(topo=gf01_topology_profile(), profile=gf01_profile_cmp0())
+        umx_ctx.init_state(INITIAL_STATE)
+        ctx = LoomRunContext(profile=umx_ctx.profile, umx_ctx=umx_ctx, recorder=recorder)
+        ctx.run_until(30)
+        return ctx
+
+    background = BackgroundChainRecorder()
+    try:
+        threaded = loom(background)
+        inline = loom(LoomChainRecorder())
+        assert threaded.chain_state() == inline.chain_state()
+        assert background.recent_p_hashes(8) == inline.recorder.recent_p_hashes(8)
+        assert background.i_blocks == inline.recorder.i_blocks
+    finally:
+        background.close()
+
+
+class _FailingStore(LoomBlockStore):
+    def write_p_block(self, p_block, canonical, p_hash):
+        if p_block.tick == 5:
+            raise OSError("disk full")
+        super().write_p_block(p_block, canonical, p_hash)
+
+
+@pytest.mark.parametrize("pipeline", [None, TickLoopPipelineConfig(depth=4, workers=2)])
+def test_failed_block_store_write_surfaces_in_every_mode(tmp_path, pipeline):
+    store = _FailingStore(tmp_path)
+    with pytest.raises(OSError, match="disk full"):
+        run_cmp0_tick_loop(**_kwargs(loom_block_store=store, pipeline=pipeline))
+    # Nothing after the failed tick is persisted past the gap.
+    assert [entry["tick"] for entry in store.replay_index()["p"]] == [1, 2, 3, 4]
+
+
+
+def test_background_recorder_keeps_the_first_failure(tmp_path):
+    topo = gf01_topology_profile()
+    recorder = BackgroundChainRecorder(store=_FailingStore(tmp_path))
+    umx_ctx = UMXRunContext(topo=topo, profile=gf01_profile_cmp0())
+    umx_ctx.init_state(INITIAL_STATE)
+    loom_ctx = LoomRunContext(
+        profile=gf01_profile_cmp0(), topo=topo, umx_ctx=umx_ctx, recorder=recorder
+    )
+    loom_ctx.run_until(7)
+    # Tick 5 failed; ticks 6 and 7 were queued behind it and never recorded.
+    for call in (recorder.flush, recorder.chain_state, recorder.close):
+        with pytest.raises(OSError, match="disk full"):
+            call()
+    with pytest.raises(OSError, match="disk full"):
+        recorder.record_p_block(loom_ctx.p_blocks[-1])
+    assert recorder.height == 5
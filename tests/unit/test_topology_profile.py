@@ -1,5 +1,14 @@
 """Tests for CMP-0 topology and profile helpers."""
+import copy
+import pickle
+from pathlib import Path
+
+import pytest
+
+from core.slp import SLPEventType, SLPEventV1, apply_slp_events
 from umx import (
+    EMPTY_ATTRS,
+    EdgeColumnsV1,
     EdgeProfileV1,
     NodeProfileV1,
     ProfileCMP0V1,
@@ -7,8 +16,13 @@ from umx import (
     gf01_profile_cmp0,
     gf01_topology_profile,
     load_topology_profile,
+    step,
     topology_profile_from_dict,
 )
+from umx.compiled_topology import compile_topology
+from loom.loom import _snapshot_topology
+
+TOPOLOGY_DIR = Path(__file__).resolve().parents[2] / "docs" / "fixtures" / "topologies"
 
 
 def test_gf01_topology_structure():
@@ -153,3 +167,74 @@ def test_gf01_profile_constants():
 
     # Deterministic construction
     assert profile == gf01_profile_cmp0()
+
+
+def test_profile_records_are_slotted_and_share_empty_attrs():
+    topo = gf01_topology_profile()
+    edge = topo.edges[0]
+
+    assert not hasattr(edge, "__dict__")
+    assert not hasattr(topo.nodes[0], "__dict__")
+    assert edge.attrs is EMPTY_ATTRS and topo.nodes[0].attrs is EMPTY_ATTRS
+    assert edge.attrs == {}
+    with pytest.raises(TypeError):
+        edge.attrs["weight"] = 1  # type: ignore[index]
+    assert copy.deepcopy(edge).attrs is EMPTY_ATTRS
+    assert pickle.loads(pickle.dumps(edge)) == edge
+
+
+def test_compact_topology_matches_record_topology():
+    path = TOPOLOGY_DIR / "gf01_topology_profile.json"
+    topo = load_topology_profile(path)
+    compact = load_topology_profile(path, compact=True)
+    profile = gf01_profile_cmp0()
+
+    assert isinstance(compact.edges, EdgeColumnsV1)
+    assert compact == topo
+    assert list(compact.edges) == topo.edges
+    assert compact.edges[-1] == topo.edges[-1]
+    assert _snapshot_topology(compact) == _snapshot_topology(topo)
+    for name in ("e_ids", "i_idx", "j_idx", "k", "caps", "radii"):
+        assert getattr(compile_topology(compact), name) == getattr(compile_topology(topo), name)
+    state = [50, 0, 10, 0, 30, 0]
+    assert step(1, state, compact, profile) == step(1, state, topo, profile)
+    assert pickle.loads(pickle.dumps(compact.edges)) == compact.edges
+
+
+def test_compact_topology_validates_columns_and_keeps_attrs():
+    data = {
+        "gid": "COMPACT",
+        "profile": "CMP-0",
+        "N": 2,
+        "nodes": [{"node_id": 1}, {"node_id": 2}],
+        "edges": [
+            {"e_id": 1, "i": 1, "j": 2, "k": 1, "cap": 5, "SC": 8, "attrs": {"w": 2}},
+            {"e_id": 2, "i": 2, "j": 1, "k": 1, "cap": 5, "SC": 8, "causal_radius": 3},
+        ],
+        "SC": 8,
+    }
+    compact = topology_profile_from_dict(data, compact=True)
+
+    assert compact.edges[0].attrs == {"w": 2}
+    assert compact.edges[1].causal_radius == 3 and compact.edges[0].causal_radius is None
+
+    bad = dict(data, edges=[dict(data["edges"][0], j=3)])
+    with pytest.raises(ValueError, match="Edge endpoints"):
+        topology_profile_from_dict(bad, compact=True)
+
+
+def test_slp_events_keep_compact_topologies_compact():
+    topo = load_topology_profile(TOPOLOGY_DIR / "line_4_topology_profile.json", compact=True)
+    event = SLPEventV1(
+        event_id="add",
+        gid=topo.gid,
+        tick_effective=1,
+        op_type=SLPEventType.ADD_EDGE,
+        payload={"e_id": len(topo.edges) + 1, "i": 1, "j": 4, "k": 1, "cap": 8},
+    )
+
+    grown = apply_slp_events(topo, [event])
+
+    assert isinstance(grown.edges, EdgeColumnsV1)
+    assert len(grown.edges) == len(topo.edges) + 1
+    assert (grown.edges[-1].i, grown.edges[-1].j) == (1, 4)
@@ -0,0 +1,117 @@
+"""Tests for the active-set UMX stepping mode."""
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from umx.active_set import ActiveSetStepper
+from umx.engine import step
+from umx.ensemble import UMXEnsembleContext
+from umx.profile_cmp0 import ProfileCMP0V1, gf01_profile_cmp0
+from umx.run_context import UMXRunContext
+from umx.topology_profile import load_topology_profile, topology_profile_from_dict
+
+TOPOLOGY_DIR = Path("docs/fixtures/topologies")
+
+
+def _line_topology(n: int):
+    return topology_profile_from_dict(
+        {
+            "gid": "ACTIVE_LINE",
+            "profile": "CMP-0",
+            "N": n,
+            "nodes": [{"node_id": idx, "label": f"n{idx}"} for idx in range(1, n + 1)],
+            "edges": [
+                {"e_id": idx, "i": idx, "j": idx + 1, "k": 3, "cap": 7, "SC": 4, "c": 0}
+                for idx in range(1, n)
+            ],
+            "SC": 4,
+        }
+    )
+
+
+@pytest.mark.parametrize("path", sorted(TOPOLOGY_DIR.glob("*.json")), ids=lambda path: path.stem)
+def test_active_backend_matches_full_step(path):
+    topo = load_topology_profile(path)
+    profile = ProfileCMP0V1(epsilon_cap=2, SC=topo.SC)
+    initial_state = [300 * (idx % 4) - 200 for idx in range(topo.N)]
+
+    reference = UMXRunContext(topo=topo, profile=profile)
+    active = UMXRunContext(topo=topo, profile=profile, backend="active")
+    reference.init_state(initial_state)
+    active.init_state(initial_state)
+
+    assert active.run_until(15) == reference.run_until(15)
+
+
+def test_active_set_handles_local_injections_and_external_inputs():
+    topo = _line_topology(200)
+    profile = gf01_profile_cmp0()
+    state = [0] * topo.N
+    state[100] = 400
+
+    reference = UMXRunContext(topo=topo, profile=profile)
+    active = UMXRunContext(topo=topo, profile=profile, backend="active", columnar=True)
+    for ctx in (reference, active):
+        ctx.init_state(state)
+
+    for tick in range(1, 31):
+        if tick == 12:
+            deltas = [0] * topo.N
+            deltas[10] = 50
+            deltas[11] = -50
+            reference.apply_external_inputs(deltas)
+            active.apply_external_inputs(deltas)
+        assert active.step() == reference.step()
+
+    active.fast_forward(40)
+    reference.fast_forward(40)
+    assert active.current_state() == reference.current_state()
+
+
+def test_active_set_only_reevaluates_the_frontier():
+    topo = _line_topology(500)
+    profile = gf01_profile_cmp0()
+    state = [0] * topo.N
+    state[250] = 64
+    stepper = ActiveSetStepper()
+
+    first = stepper.step(1, state, topo, profile)
+    evaluated = []
+    original = stepper._evaluate_edge
+
+    def _counting(position, *args):
+        evaluated.append(position)
+        return original(position, *args)
+
+    stepper._evaluate_edge = _counting
+    second = stepper.step(2, first.post_u, topo, profile)
+
+    assert second == step(2, first.post_u, topo, profile)
+    assert 0 < len(evaluated) <= 6
+
+
+def test_active_set_refreshes_on_topology_change():
+    stepper = ActiveSetStepper()
+    profile = gf01_profile_cmp0()
+    small = _line_topology(4)
+    other = _line_topology(4)
+    state = [40, 0, 0, 0]
+
+    stepper.step(1, state, small, profile)
+
+    assert stepper.step(2, state, other, profile) == step(2, state, other, profile)
+
+
+def test_active_ensemble_matches_python_ensemble():
+    topo = _line_topology(30)
+    states = [[(member + 1) * 10 if idx == member else 0 for idx in range(topo.N)] for member in range(4)]
+    results = []
+    for backend in ("python", "active"):
+        ensemble = UMXEnsembleContext(topo=topo, profile=gf01_profile_cmp0(), backend=backend)
+        ensemble.init_states(states)
+        ensemble.run_until(20)
+        results.append(ensemble.current_states())
+
+    assert results[0] == results[1]
@@ -0,0 +1,108 @@
+"""Tests for topology-specialised generated UMX kernels."""
+from __future__ import annotations
+
+import pickle
+import random
+from pathlib import Path
+
+import pytest
+
+from umx.codegen import CodegenKernel, generate_kernel_source, generated_kernels
+from umx.compiled_topology import compile_topology
+from umx.engine import advance_state, step
+from umx.ensemble import UMXEnsembleContext
+from umx.profile_cmp0 import ProfileCMP0V1
+from umx.run_context import UMXRunContext
+from umx.topology_profile import load_topology_profile, topology_profile_from_dict
+
+TOPOLOGY_DIR = Path("docs/fixtures/topologies")
+
+
+def _odd_topology():
+    # k > SC, a negative cap, a self-loop, a per-edge radius and a node
+    # without edges exercise every optional clause of the generated code.
+    return topology_profile_from_dict(
+        {
+            "gid": "CODEGEN_ODD",
+            "profile": "CMP-0",
+            "N": 4,
+            "nodes": [{"node_id": idx} for idx in range(1, 5)],
+            "edges": [
+                {"e_id": 1, "i": 1, "j": 2, "k": 20, "cap": 1000, "SC": 8},
+                {"e_id": 2, "i": 2, "j": 3, "k": 3, "cap": -2, "SC": 8, "causal_radius": 5},
+                {"e_id": 3, "i": 3, "j": 3, "k": 4, "cap": 9, "SC": 8},
+            ],
+            "SC": 8,
+        }
+    )
+
+
+@pytest.mark.parametrize("epsilon_cap", [None, 2])
+@pytest.mark.parametrize("path", sorted(TOPOLOGY_DIR.glob("*.json")), ids=lambda path: path.stem)
+def test_codegen_backend_matches_engine(path, epsilon_cap):
+    topo = load_topology_profile(path)
+    profile = ProfileCMP0V1(epsilon_cap=epsilon_cap, SC=topo.SC)
+    rng = random.Random(path.stem)
+    initial_state = [rng.randint(-400, 400) for _ in range(topo.N)]
+
+    reference = UMXRunContext(topo=topo, profile=profile, backend="python")
+    generated = UMXRunContext(topo=topo, profile=profile, backend="codegen")
+    reference.init_state(initial_state)
+    generated.init_state(initial_state)
+
+    assert generated.run_until(12) == reference.run_until(12)
+    reference.fast_forward(40)
+    generated.fast_forward(40)
+    assert generated.current_state() == reference.current_state()
+
+
+def test_codegen_handles_every_edge_shape():
+    topo = _odd_topology()
+    profile = ProfileCMP0V1(SC=topo.SC)
+    kernel = CodegenKernel()
+    for state in ([50, -3, 7, 1], [0, 0, 0, 0], [-(2**70), 2**65, 3, 9]):
+        assert kernel.step(1, state, topo, profile) == step(1, state, topo, profile)
+        assert kernel.step(1, state, topo, profile, columnar=True) == step(
+            1, state, topo, profile, columnar=True
+        )
+        assert kernel.advance(state, topo, profile) == advance_state(state, topo, profile)
+
+
+def test_generated_code_is_straight_line_and_cached_by_content():
+    topo = load_topology_profile(TOPOLOGY_DIR / "ring_5_topology_profile.json")
+    source = generate_kernel_source(compile_topology(topo), None)
+    assert "for " not in source and "epsilon = True" not in source
+
+    rebuilt = load_topology_profile(TOPOLOGY_DIR / "ring_5_topology_profile.json")
+    assert compile_topology(rebuilt) is not compile_topology(topo)
+    assert generated_kernels(compile_topology(rebuilt), None) is generated_kernels(
+        compile_topology(topo), None
+    )
+    assert generated_kernels(compile_topology(topo), 3) != generated_kernels(
+        compile_topology(topo), None
+    )
+
+    # Generated functions stay out of the compiled view, so it still pickles.
+    codegen = CodegenKernel()
+    codegen.step(1, [1, 0, 0, 0, 0], topo, ProfileCMP0V1(SC=topo.SC))
+    restored = pickle.loads(pickle.dumps(compile_topology(topo)))
+    assert restored == compile_topology(topo)
+
+
+def test_codegen_falls_back_for_large_topologies_and_feeds_ensembles():
+    topo = _odd_topology()
+    profile = ProfileCMP0V1(SC=topo.SC)
+    state = [50, -3, 7, 1]
+    small_limit = CodegenKernel(max_edges=2)
+
+    assert small_limit.step(4, state, topo, profile) == step(4, state, topo, profile)
+    with pytest.raises(ValueError):
+        CodegenKernel(max_edges=0)
+
+    ensemble = UMXEnsembleContext(topo=topo, profile=profile, backend="codegen")
+    ensemble.init_states([state, [1, 2, 3, 4]])
+    ensemble.run_until(5)
+    reference = UMXRunContext(topo=topo, profile=profile)
+    reference.init_state(state)
+    reference.fast_forward(5)
+    assert ensemble.member_state(0) == reference.current_state()
@@ -0,0 +1,84 @@
+"""Tests for columnar UMX tick ledgers."""
+from __future__ import annotations
+
+import pickle
+from array import array
+from pathlib import Path
+
+import pytest
+
+from codex.context import CodexRuntimeStats
+from core.serialization import serialize_umx_tick_ledger
+from uledger.canonical import hash_record
+from umx.engine import step
+from umx.profile_cmp0 import gf01_profile_cmp0
+from umx.run_context import UMXRunContext
+from umx.tick_ledger import EdgeFluxColumnsV1, EdgeFluxV1
+from umx.topology_profile import gf01_topology_profile, load_topology_profile
+
+FIXTURE = Path("docs/fixtures/topologies/ring_5_topology_profile.json")
+
+
+def _ledgers(columnar: bool, backend: str = "python"):
+    topo = load_topology_profile(FIXTURE)
+    ctx = UMXRunContext(
+        topo=topo, profile=gf01_profile_cmp0(), backend=backend, columnar=columnar
+    )
+    ctx.init_state([90, -30, 5, 0, 12])
+    return ctx.run_until(6)
+
+
+def test_columnar_ledgers_match_object_ledgers():
+    expected = _ledgers(columnar=False)
+    actual = _ledgers(columnar=True)
+
+    assert actual == expected
+    for ledger, reference in zip(actual, expected):
+        assert isinstance(ledger.edges, EdgeFluxColumnsV1)
+        assert isinstance(ledger.edges.f_e, array)
+        assert list(ledger.edges) == reference.edges
+        assert ledger.edges[-1] == reference.edges[-1]
+        assert ledger.edges[1:3] == reference.edges[1:3]
+        assert hash_record(ledger) == hash_record(reference)
+        assert serialize_umx_tick_ledger(ledger) == serialize_umx_tick_ledger(reference)
+
+
+def test_columnar_ledgers_feed_codex_stats_like_object_ledgers():
+    expected = CodexRuntimeStats()
+    actual = CodexRuntimeStats()
+
+    for ledger in _ledgers(columnar=False):
+        expected.record_tick(ledger.edges, ledger.tick)
+    for ledger in _ledgers(columnar=True):
+        actual.record_tick(ledger.edges, ledger.tick)
+
+    assert actual.edge_pattern_counts == expected.edge_pattern_counts
+    assert actual.ledger_pattern_counts == expected.ledger_pattern_counts
+    assert actual.ledger_pattern_edge_ids == expected.ledger_pattern_edge_ids
+
+
+def test_columnar_numpy_backend_matches_python():
+    pytest.importorskip("numpy")
+
+    assert _ledgers(columnar=True, backend="numpy") == _ledgers(columnar=False)
+
+
+def test_edge_flux_columns_keep_exact_ints_beyond_int64():
+    edge = EdgeFluxV1(e_id=1, i=1, j=2, du=2**70, raw=2**69, cap=2**80, f_e=2**69)
+    columns = EdgeFluxColumnsV1.from_edges([edge])
+
+    assert isinstance(columns.du, list)
+    assert isinstance(columns.e_id, array)
+    assert columns == [edge]
+    assert pickle.loads(pickle.dumps(columns)) == columns
+
+
+def test_edge_flux_columns_are_read_only_and_validated():
+    ledger = step(1, [3, 1, 0, 0, 0, 0], gf01_topology_profile(), gf01_profile_cmp0(), columnar=True)
+
+    with pytest.raises(AttributeError):
+        ledger.edges.f_e = array("q")
+    with pytest.raises(ValueError):
+        EdgeFluxColumnsV1(e_id=[1], i=[1], j=[2], du=[0], raw=[0], cap=[1], f_e=[])
+    with pytest.raises(ValueError):
+        ledger.edges.column("missing")
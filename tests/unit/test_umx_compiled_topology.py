@@ -0,0 +1,88 @@
+"""Tests for the memoised compiled topology view."""
+from __future__ import annotations
+
+from pathlib import Path
+
+from core.slp import SLPEventType, SLPEventV1, apply_slp_events
+from loom.chain import canonicalize_i_block
+from loom.run_context import LoomRunContext
+from umx.compiled_topology import compile_topology
+from umx.profile_cmp0 import gf01_profile_cmp0
+from umx.run_context import UMXRunContext
+from umx.topology_profile import load_topology_profile, topology_profile_from_dict
+
+FIXTURE = Path("docs/fixtures/topologies/line_4_topology_profile.json")
+
+
+def test_compile_topology_is_memoised_per_topology():
+    topo = load_topology_profile(FIXTURE)
+
+    compiled = compile_topology(topo)
+
+    assert compile_topology(topo) is compiled
+    assert compiled.e_ids == tuple(edge.e_id for edge in topo.edges)
+    assert compiled.i_idx == tuple(edge.i - 1 for edge in topo.edges)
+    assert compiled.j_idx == tuple(edge.j - 1 for edge in topo.edges)
+    assert compiled.E == len(topo.edges)
+
+
+def test_compile_topology_resolves_effective_caps_and_radii():
+    topo = topology_profile_from_dict(
+        {
+            "gid": "COMPILED",
+            "profile": "CMP-0",
+            "N": 3,
+            "nodes": [{"node_id": idx, "label": f"n{idx}"} for idx in (1, 2, 3)],
+            "edges": [
+                {"e_id": 1, "i": 1, "j": 2, "k": 1, "cap": 50, "SC": 4, "c": 0, "causal_radius": 3},
+                {"e_id": 2, "i": 2, "j": 3, "k": 1, "cap": 5, "SC": 4, "c": 2},
+                {"e_id": 3, "i": 1, "j": 3, "k": 1, "cap": 9, "SC": 4, "c": 0},
+            ],
+            "SC": 4,
+            "causal_radius": 7,
+            "max_edge_cap": 8,
+        }
+    )
+
+    compiled = compile_topology(topo)
+
+    assert compiled.caps == (8, 5, 8)
+    assert compiled.radii == (3, 2, 7)
+
+
+def test_slp_update_produces_a_fresh_compilation():
+    topo = load_topology_profile(FIXTURE)
+    compiled = compile_topology(topo)
+
+    mutated = apply_slp_events(
+        topo,
+        [
+            SLPEventV1(
+                event_id="update",
+                gid=topo.gid,
+                tick_effective=1,
+                op_type=SLPEventType.UPDATE_EDGE,
+                payload={"e_id": 1, "k": 3},
+            )
+        ],
+    )
+
+    assert compile_topology(mutated) is not compiled
+    assert compile_topology(mutated).k[0] == 3
+    assert compile_topology(topo) is compiled
+
+
+def test_cached_i_block_canonicalisation_matches_uncached():
+    topo = load_topology_profile(FIXTURE)
+    profile = gf01_profile_cmp0()
+    umx_ctx = UMXRunContext(topo=topo, profile=profile)
+    umx_ctx.init_state([40, 0, 0, 0])
+    loom_ctx = LoomRunContext(profile=profile, umx_ctx=umx_ctx, W=2)
+
+    _, _, i_blocks = loom_ctx.run_until(4)
+
+    compiled = compile_topology(topo)
+    for i_block in i_blocks:
+        assert canonicalize_i_block(
+            i_block, merkle_root="root", prev_hash=None, compiled=compiled
+        ) == canonicalize_i_block(i_block, merkle_root="root", prev_hash=None)
@@ -1,9 +1,12 @@
 """Tests for optional UMX diagnostics and invariants."""
 from __future__ import annotations
 
+from dataclasses import replace
+
 import pytest
 
 from src.umx import (
+    ProfileCMP0V1,
     UMXDiagnosticsConfig,
     UMXRunContext,
     gf01_profile_cmp0,
@@ -73,3 +76,90 @@ def test_diagnostics_flag_violations_and_optionally_raise():
             sum_post_u=7,
             z_check=5,
         )
+
+
+def test_sampling_keeps_cadence_and_violation_ticks():
+    topo = gf01_topology_profile()
+    config = UMXDiagnosticsConfig(enabled=True, sample_every=4)
+    ctx = UMXRunContext(topo=topo, profile=gf01_profile_cmp0(), diag_config=config)
+    ctx.init_state([3, 1, 0, 0, 0, 0])
+
+    ctx.run_until(10)
+
+    assert [record.tick for record in ctx.diagnostics] == [4, 8]
+    assert ctx.diagnostics_summary.ticks_checked == 10
+    assert ctx.diagnostics_summary.ticks_sampled == 2
+    assert ctx.diagnostics_summary.ticks_flagged == 0
+
+    # Unsampled ticks whose policy notes violate the config are still recorded.
+    strict = UMXDiagnosticsConfig(enabled=True, sample_every=100, enforce_epsilon_cap=True)
+    profile = ProfileCMP0V1(epsilon_cap=1, SC=topo.SC)
+    strict_ctx = UMXRunContext(topo=topo, profile=profile, diag_config=strict)
+    strict_ctx.init_state([320, 0, 0, 0, 0, 0])
+
+    ledgers = strict_ctx.run_until(3)
+
+    flagged = [ledger.tick for ledger in ledgers if ledger.epsilon_applied]
+    assert flagged
+    assert [record.tick for record in strict_ctx.diagnostics] == flagged
+    assert strict_ctx.diagnostics_summary.violation_ticks == len(flagged)
+    assert strict_ctx.diagnostics_summary.ticks_flagged == len(flagged)
+    assert strict_ctx.diagnostics_summary.ticks_sampled == 0
+    assert strict_ctx.diagnostics_summary.first_violation_tick == flagged[0]
+
+
+@pytest.mark.parametrize("overrides", [{"overflow_limit": 5}, {"allow_negative": False}])
+def test_kill_switch_fires_on_unsampled_state_violations(overrides):
+    topo = gf01_topology_profile()
+    config = UMXDiagnosticsConfig(enabled=True, kill_on_violation=True, **overrides)
+    initial = [9, 1, 0, 0, 0, 0] if "overflow_limit" in overrides else [3, -1, 0, 0, 0, 0]
+
+    killed_at = []
+    for sample_every in (1, 10):
+        ctx = UMXRunContext(
+            topo=topo,
+            profile=gf01_profile_cmp0(),
+            diag_config=replace(config, sample_every=sample_every),
+        )
+        ctx.init_state(initial)
+        with pytest.raises(ValueError, match="killed at tick 1"):
+            ctx.run_until(5)
+        assert ctx.killed and ctx.diagnostics_summary.violation_ticks == 1
+        killed_at.append(ctx.diagnostics[-1])
+    assert killed_at[0].violations == killed_at[1].violations
+    assert ctx.diagnostics_summary.ticks_flagged == 1
+
+
+def test_history_limit_bounds_records_but_not_aggregates():
+    topo = gf01_topology_profile()
+    config = UMXDiagnosticsConfig(enabled=True, history_limit=3)
+    ctx = UMXRunContext(topo=topo, profile=gf01_profile_cmp0(), diag_config=config)
+    ctx.init_state([3, 1, 0, 0, 0, 0])
+
+    ctx.run_until(8)
+
+    assert [record.tick for record in ctx.diagnostics] == [6, 7, 8]
+    assert ctx.diagnostics_summary.ticks_sampled == 8
+    assert ctx.diagnostics_summary.min_value == 0
+    assert ctx.diagnostics_summary.max_value == 3
+
+
+def test_fused_reduction_matches_array_inputs():
+    np = pytest.importorskip("numpy")
+    config = UMXDiagnosticsConfig(enabled=True, allow_negative=False, overflow_limit=5)
+
+    from_lists = config.evaluate_tick(tick=1, pre_u=[10, -1], post_u=[9, 0])
+    from_arrays = config.evaluate_tick(
+        tick=1, pre_u=np.array([10, -1]), post_u=np.array([9, 0])
+    )
+
+    assert from_arrays == from_lists
+    assert (from_lists.min_pre, from_lists.max_pre, from_lists.sum_post_u) == (-1, 10, 9)
+    assert from_lists.overflow_post is True and from_lists.has_negative_post is False
+
+
+def test_invalid_sampling_configuration_is_rejected():
+    with pytest.raises(ValueError):
+        UMXDiagnosticsConfig(sample_every=0)
+    with pytest.raises(ValueError):
+        UMXDiagnosticsConfig(history_limit=0)
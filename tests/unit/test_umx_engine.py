@@ -310,3 +310,37 @@ def test_kill_switch_halts_on_violation():
 
     assert ctx.killed is True
     assert ctx.kill_reason and "negative values detected" in ctx.kill_reason
+
+
+def test_fast_forward_matches_run_until_and_emits_selected_ledgers():
+    topo = load_topology_profile(_fixture_path("ring_5_topology_profile.json"))
+    profile = gf01_profile_cmp0()
+    reference = UMXRunContext(topo=topo, profile=profile)
+    reference.init_state([90, -30, 5, 0, 12])
+    expected = reference.run_until(20)
+
+    ctx = UMXRunContext(topo=topo, profile=profile)
+    ctx.init_state([90, -30, 5, 0, 12])
+    emitted = ctx.fast_forward(20, emit_every=6, emit_final=True)
+
+    assert ctx.tick == 20
+    assert ctx.current_state() == reference.current_state()
+    assert [ledger.tick for ledger in emitted] == [6, 12, 18, 20]
+    assert emitted == [expected[tick - 1] for tick in (6, 12, 18, 20)]
+
+
+def test_fast_forward_runs_diagnostics_at_check_cadence():
+    topo = gf01_topology_profile()
+    ctx = UMXRunContext(
+        topo=topo,
+        profile=gf01_profile_cmp0(),
+        diag_config=UMXDiagnosticsConfig(enabled=True),
+    )
+    ctx.init_state([3, 1, 0, 0, 0, 0])
+
+    assert ctx.fast_forward(9, check_every=4) == []
+    assert [record.tick for record in ctx.diagnostics] == [4, 8]
+    assert all(record.conservation_ok for record in ctx.diagnostics)
+
+    with pytest.raises(ValueError):
+        ctx.fast_forward(12, check_every=0)
@@ -0,0 +1,94 @@
+"""Tests for batched UMX ensemble stepping."""
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from ops.sweeps import SweepConfig, build_ensemble
+from umx.ensemble import UMXEnsembleContext
+from umx.profile_cmp0 import ProfileCMP0V1, gf01_profile_cmp0
+from umx.run_context import UMXRunContext
+from umx.topology_profile import load_topology_profile
+
+FIXTURE = Path("docs/fixtures/topologies/star_5_topology_profile.json")
+
+def _states(topo, members=6):
+    rng = random.Random(7)
+    return [[rng.randint(-400, 400) for _ in range(topo.N)] for _ in range(members)]
+
+
+def _reference(topo, profile, state, t_max):
+    ctx = UMXRunContext(topo=topo, profile=profile)
+    ctx.init_state(state)
+    return ctx.run_until(t_max), ctx.current_state()
+
+
+@pytest.mark.parametrize("backend", ["python", "numpy"])
+def test_ensemble_matches_independent_runs(backend):
+    if backend == "numpy":
+        pytest.importorskip("numpy")
+    topo = load_topology_profile(FIXTURE)
+    profile = ProfileCMP0V1(epsilon_cap=4, SC=topo.SC)
+    states = _states(topo)
+
+    ensemble = UMXEnsembleContext(topo=topo, profile=profile, backend=backend)
+    ensemble.init_states(states)
+    ledgers = ensemble.run_until(10, members=[0, 3])
+
+    for member, state in enumerate(states):
+        expected_ledgers, expected_state = _reference(topo, profile, state, 10)
+        assert ensemble.member_state(member) == expected_state
+        if member in ledgers:
+            assert ledgers[member] == expected_ledgers
+    summaries = ensemble.summaries()
+    assert [summary.member for summary in summaries] == list(range(len(states)))
+    assert all(summary.conservation_ok and summary.tick == 10 for summary in summaries)
+
+
+def test_ensemble_requires_states_and_known_members():
+    topo = load_topology_profile(FIXTURE)
+    ensemble = UMXEnsembleContext(topo=topo, profile=gf01_profile_cmp0())
+
+    with pytest.raises(ValueError):
+        ensemble.step()
+    ensemble.init_states(_states(topo, members=2))
+    with pytest.raises(ValueError):
+        ensemble.step(members=[2])
+    with pytest.raises(ValueError):
+        ensemble.init_states([[1, 2]])
+
+
+def test_build_ensemble_from_sweep_grid():
+    topo = load_topology_profile(FIXTURE)
+    states = _states(topo, members=3)
+    config = SweepConfig(
+        name="ensemble",
+        kind="simulate",
+        base_params={"ticks": 5},
+        grid={"initial_state": states},
+    )
+
+    points, ensemble = build_ensemble(config, topo, gf01_profile_cmp0(), limit=2)
+    ensemble.run_until(5)
+
+    assert [point.index for point in points] == [0, 1]
+    assert ensemble.current_states() == [
+        _reference(topo, gf01_profile_cmp0(), state, 5)[1] for state in states[:2]
+    ]
+
+
+def test_numpy_ensemble_falls_back_to_exact_ints_beyond_int64():
+    pytest.importorskip("numpy")
+    topo = load_topology_profile(FIXTURE)
+    profile = gf01_profile_cmp0()
+    states = [[2**70] + [0] * (topo.N - 1), [5] * topo.N]
+
+    ensemble = UMXEnsembleContext(topo=topo, profile=profile, backend="numpy")
+    ensemble.init_states(states)
+    ensemble.run_until(3)
+
+    assert ensemble.current_states() == [
+        _reference(topo, profile, state, 3)[1] for state in states
+    ]
@@ -0,0 +1,193 @@
+"""Tests for copy-on-write run context forks and batch what-if evaluation."""
+from __future__ import annotations
+
+import pickle
+
+import pytest
+
+from codex.context import CodexProposalV1
+from governance import GovernanceConfigV1, governed_decision_loop
+from loom.run_context import LoomRunContext
+from umx.diagnostics import UMXDiagnosticsConfig
+from umx.forking import ForkedHistory, evaluate_forks, fork_history
+from umx.profile_cmp0 import gf01_profile_cmp0
+from umx.run_context import UMXRunContext
+from umx.topology_profile import gf01_topology_profile, topology_profile_from_dict
+
+INITIAL_STATE = [3, 1, 0, 0, 0, 0]
+
+
+def _umx(**kwargs):
+    ctx = UMXRunContext(topo=gf01_topology_profile(), profile=gf01_profile_cmp0(), **kwargs)
+    ctx.init_state(INITIAL_STATE)
+    return ctx
+
+
+def _loom():
+    umx_ctx = _umx()
+    return LoomRunContext(profile=umx_ctx.profile, umx_ctx=umx_ctx)
+
+
+def _push_first_node(ctx):
+    ctx.apply_external_inputs([7, 0, 0, 0, 0, 0])
+
+
+def _push_last_node(ctx):
+    ctx.apply_external_inputs([0, 0, 0, 0, 0, 7])
+
+
+def _overdraw(ctx):
+    ctx.apply_external_inputs([-50, 50, 0, 0, 0, 0])
+
+
+def _chain_value(loom_ctx):
+    return loom_ctx.current_chain_value()
+
+
+def test_forked_history_shares_prefix_and_keeps_appends_private():
+    parent = [1, 2, 3]
+    child = fork_history(parent)
+    parent.append(4)
+    child.append(9)
+
+    assert child == [1, 2, 3, 9]
+    assert child[-2:] == [3, 9]
+    assert child[0] == 1 and len(child) == 4
+    assert parent == [1, 2, 3, 4]
+
+    grandchild = fork_history(fork_history(parent))
+    assert isinstance(grandchild, ForkedHistory) and grandchild._base is parent
+    assert pickle.loads(pickle.dumps(child)) == [1, 2, 3, 9]
+    with pytest.raises(IndexError):
+        child[4]
+
+
+def test_umx_fork_shares_state_until_it_diverges():
+    ctx = _umx(diag_config=UMXDiagnosticsConfig(enabled=True))
+    ctx.run_until(3)
+    fork = ctx.fork()
+
+    assert fork.state is ctx.state
+    assert fork.diagnostics == ctx.diagnostics
+
+    _push_first_node(fork)
+    fork.run_until(6)
+    reference = _umx()
+    reference.run_until(3)
+    reference.run_until(6)
+
+    assert ctx.tick == 3 and len(ctx.diagnostics) == 3
+    assert len(fork.diagnostics) == 6
+    assert fork.current_state() != reference.current_state()
+    ctx.run_until(6)
+    assert ctx.current_state() == reference.current_state()
+
+
+def test_umx_fork_rejects_topology_with_other_node_count():
+    ctx = _umx()
+    smaller = topology_profile_from_dict(
+        {
+            "gid": "PAIR",
+            "profile": "CMP-0",
+            "N": 2,
+            "nodes": [{"node_id": 1}, {"node_id": 2}],
+            "edges": [{"e_id": 1, "i": 1, "j": 2, "k": 1, "cap": 5, "SC": 8}],
+            "SC": 8,
+        }
+    )
+
+    with pytest.raises(ValueError, match="state length"):
+        ctx.fork(topo=smaller)
+
+
+def test_loom_fork_matches_an_unforked_run():
+    base = _loom()
+    base.run_until(4)
+    fork = base.fork()
+    fork.run_until(12)
+
+    reference = _loom()
+    reference.run_until(12)
+
+    assert base.umx_ctx.tick == 4 and len(base.p_blocks) == 4
+    assert fork.p_blocks == reference.p_blocks
+    assert fork.i_blocks == reference.i_blocks
+    assert fork.chain_state() == reference.chain_state()
+    assert fork.replay_state_at(9) == reference.replay_state_at(9)
+    assert base.recorder.chain_state().height == 4
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_evaluate_forks_runs_scenarios_without_touching_base(workers):
+    base = _umx()
+    base.run_until(2)
+    before = base.current_state()
+
+    outcomes = evaluate_forks(
+        base, [None, _push_first_node, _push_last_node], 10, workers=workers
+    )
+
+    assert base.tick == 2 and base.current_state() == before
+    assert [outcome.index for outcome in outcomes] == [0, 1, 2]
+    expected = base.fork()
+    expected.run_until(10)
+    assert outcomes[0].result == tuple(expected.current_state())
+    assert sum(outcomes[1].result) == sum(before) + 7
+    assert all(outcome.tick == 10 and outcome.error is None for outcome in outcomes)
+
+
+def test_evaluate_forks_records_kill_switch_errors_and_loom_measures():
+    config = UMXDiagnosticsConfig(enabled=True, allow_negative=False, kill_on_violation=True)
+    strict = _umx(diag_config=config)
+    outcomes = evaluate_forks(strict, [None, _overdraw], 3, workers=1)
+    assert outcomes[0].error is None
+    assert outcomes[1].result is None and "killed" in outcomes[1].error
+
+    loom = _loom()
+    reference = _loom()
+    reference.run_until(5)
+    (outcome,) = evaluate_forks(loom, [None], 5, measure=_chain_value)
+    assert outcome.result == reference.current_chain_value()
+
+
+def test_governed_decision_loop_merges_impact_scores():
+    proposals = [
+        CodexProposalV1(
+            proposal_id=f"P{idx}",
+            library_id="LIB",
+            gid="G1",
+            action="TUNE",
+            expected_effect={},
+            created_at_tick=0,
+            status="PENDING",
+        )
+        for idx in range(2)
+    ]
+    base = _umx()
+    seen = []
+
+    def impact(batch):
+        seen.append(len(batch))
+        scenarios = [_push_first_node if p.proposal_id == "P0" else _push_last_node for p in batch]
+        outcomes = evaluate_forks(base, scenarios, 5, workers=1)
+        return [{"impact_max_u": max(outcome.result)} for outcome in outcomes]
+
+    queue = governed_decision_loop(
+        proposals=proposals,
+        config=GovernanceConfigV1(codex_action_mode="GOVERNED_APPLY"),
+        window_id="w0",
+        impact_evaluator=impact,
+    )
+
+    assert seen == [2]
+    assert [p.governance_scores["impact_max_u"] for p in queue.evaluated] == [
+        float(max(outcome.result))
+        for outcome in evaluate_forks(base, [_push_first_node, _push_last_node], 5, workers=1)
+    ]
+    with pytest.raises(ValueError, match="one score mapping"):
+        governed_decision_loop(
+            proposals=proposals,
+            config=GovernanceConfigV1(codex_action_mode="GOVERNED_APPLY"),
+            window_id="w0",
+            impact_evaluator=lambda batch: [{}],
+        )
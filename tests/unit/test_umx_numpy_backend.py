@@ -0,0 +1,169 @@
+"""Parity tests for the vectorised NumPy UMX backend."""
+from __future__ import annotations
+
+import copy
+import pickle
+import random
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.umx import (
+    ProfileCMP0V1,
+    UMXDiagnosticsConfig,
+    UMXRunContext,
+    gf01_profile_cmp0,
+    load_topology_profile,
+    step,
+    topology_profile_from_dict,
+)
+from src.umx.numpy_backend import step_numpy
+
+TOPOLOGY_DIR = Path(__file__).resolve().parents[2] / "docs" / "fixtures" / "topologies"
+TOPOLOGY_PATHS = sorted(TOPOLOGY_DIR.glob("*.json"))
+
+
+def _two_node_topology(**edge_overrides):
+    edge = {"e_id": 1, "i": 1, "j": 2, "k": 10, "cap": 50, "SC": 10, "c": 0}
+    edge.update(edge_overrides)
+    return topology_profile_from_dict(
+        {
+            "gid": "NUMPY_PARITY",
+            "profile": "CMP-0",
+            "N": 2,
+            "nodes": [{"node_id": 1, "label": "a"}, {"node_id": 2, "label": "b"}],
+            "edges": [edge],
+            "SC": 10,
+        }
+    )
+
+
+@pytest.mark.parametrize("path", TOPOLOGY_PATHS, ids=lambda path: path.stem)
+def test_numpy_backend_matches_python_on_fixture_topologies(path):
+    topo = load_topology_profile(path)
+    profile = gf01_profile_cmp0()
+    rng = random.Random(path.stem)
+
+    for _ in range(5):
+        initial_state = [rng.randint(-500, 500) for _ in range(topo.N)]
+        python_ctx = UMXRunContext(topo=topo, profile=profile)
+        numpy_ctx = UMXRunContext(topo=topo, profile=profile, backend="numpy")
+        python_ctx.init_state(initial_state)
+        numpy_ctx.init_state(initial_state)
+
+        assert numpy_ctx.run_until(12) == python_ctx.run_until(12)
+
+
+@pytest.mark.parametrize("path", TOPOLOGY_PATHS, ids=lambda path: path.stem)
+def test_numpy_backend_matches_python_with_policy_clamps(path):
+    topo = load_topology_profile(path)
+    profile = ProfileCMP0V1(epsilon_cap=3, SC=topo.SC)
+    state = [1_000 * (idx % 3) for idx in range(topo.N)]
+
+    expected = step(1, state, topo, profile)
+    actual = step_numpy(1, state, topo, profile)
+
+    assert actual == expected
+    assert actual.epsilon_applied == expected.epsilon_applied
+    assert all(type(value) is int for value in actual.post_u)
+
+
+def test_numpy_backend_reports_causal_radius_flag():
+    topo = _two_node_topology(causal_radius=2)
+    profile = gf01_profile_cmp0()
+
+    ledger = step_numpy(1, [20, 0], topo, profile)
+
+    assert ledger == step(1, [20, 0], topo, profile)
+    assert ledger.causal_radius_applied is True
+    assert ledger.policy_notes == ["causal_radius_clamped"]
+
+
+def test_numpy_backend_falls_back_to_exact_ints_beyond_int64():
+    topo = _two_node_topology(cap=2**70)
+    profile = gf01_profile_cmp0()
+    state = [2**65, -(2**64)]
+
+    assert step_numpy(1, state, topo, profile) == step(1, state, topo, profile)
+
+
+def test_numpy_caches_stay_out_of_pickled_topologies():
+    topo = load_topology_profile(TOPOLOGY_PATHS[0])
+    fresh = pickle.dumps(topo)
+    ctx = UMXRunContext(topo=topo, profile=ProfileCMP0V1(SC=topo.SC), backend="numpy")
+    ctx.init_state([5] * topo.N)
+    ctx.run_until(3)
+    assert "_compiled" in topo.__dict__
+    assert pickle.dumps(topo) == fresh
+    for clone in (pickle.loads(fresh), copy.copy(topo), copy.deepcopy(topo)):
+        assert clone == topo and "_compiled" not in clone.__dict__
+
+
+def test_unknown_backend_is_rejected():
+    topo = _two_node_topology()
+    with pytest.raises(ValueError):
+        UMXRunContext(topo=topo, profile=gf01_profile_cmp0(), backend="gpu")
+
+
+@pytest.mark.parametrize("path", TOPOLOGY_PATHS, ids=lambda path: path.stem)
+def test_numpy_fast_forward_matches_python(path):
+    topo = load_topology_profile(path)
+    profile = ProfileCMP0V1(epsilon_cap=3, SC=topo.SC)
+    initial_state = [1_000 * (idx % 3) for idx in range(topo.N)]
+    python_ctx = UMXRunContext(topo=topo, profile=profile)
+    numpy_ctx = UMXRunContext(topo=topo, profile=profile, backend="numpy")
+    python_ctx.init_state(initial_state)
+    numpy_ctx.init_state(initial_state)
+
+    python_ctx.fast_forward(25)
+    numpy_ctx.fast_forward(25)
+
+    assert numpy_ctx.current_state() == python_ctx.current_state()
+
+
+def _ring_topology(nodes: int, cap: int = 50):
+    return topology_profile_from_dict(
+        {
+            "gid": "NUMPY_RING",
+            "profile": "CMP-0",
+            "N": nodes,
+            "nodes": [{"node_id": idx} for idx in range(1, nodes + 1)],
+            "edges": [
+                {"e_id": idx, "i": idx, "j": idx % nodes + 1, "k": 3, "cap": cap, "SC": 4}
+                for idx in range(1, nodes + 1)
+            ],
+            "SC": 4,
+        }
+    )
+
+
+def test_auto_backend_reports_int64_and_bigint_paths():
+    topo = _ring_topology(80, cap=2**40)
+    profile = ProfileCMP0V1(SC=topo.SC)
+    config = UMXDiagnosticsConfig(enabled=True, overflow_limit=2**70)
+    small = [idx * 7 for idx in range(topo.N)]
+    huge = [2**61 if idx == 0 else 0 for idx in range(topo.N)]
+
+    for initial_state, expected_path in ((small, "int64"), (huge, "bigint")):
+        auto_ctx = UMXRunContext(topo=topo, profile=profile, diag_config=config)
+        python_ctx = UMXRunContext(topo=topo, profile=profile, backend="python")
+        auto_ctx.init_state(initial_state)
+        python_ctx.init_state(initial_state)
+
+        assert auto_ctx.run_until(3) == python_ctx.run_until(3)
+        assert auto_ctx.numeric_path == expected_path
+        assert [record.numeric_path for record in auto_ctx.diagnostics] == [expected_path] * 3
+        assert python_ctx.numeric_path == "bigint"
+
+
+def test_auto_backend_keeps_small_topologies_on_python_ints():
+    topo = _two_node_topology()
+    ctx = UMXRunContext(topo=topo, profile=gf01_profile_cmp0())
+    ctx.init_state([20, 0])
+
+    ctx.fast_forward(2)
+
+    assert ctx.backend == "auto"
+    assert ctx.numeric_path == "bigint"
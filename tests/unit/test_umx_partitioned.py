@@ -0,0 +1,93 @@
+"""Parity tests for the partitioned multi-process UMX executor."""
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import pytest
+
+from src.umx import (
+    PartitionedExecutor,
+    ProfileCMP0V1,
+    UMXRunContext,
+    gf01_profile_cmp0,
+    load_topology_profile,
+    step,
+    topology_profile_from_dict,
+)
+from src.umx.partitioned import partition_nodes, plan_partitions
+
+TOPOLOGY_DIR = Path(__file__).resolve().parents[2] / "docs" / "fixtures" / "topologies"
+TOPOLOGY_PATHS = sorted(TOPOLOGY_DIR.glob("*.json"))
+
+
+@pytest.fixture
+def executor():
+    with PartitionedExecutor(workers=2) as pool:
+        yield pool
+
+
+def test_partitioner_is_contiguous_and_covers_every_edge():
+    topo = load_topology_profile(TOPOLOGY_DIR / "gf01_topology_profile.json")
+    owners = partition_nodes(topo, 3)
+
+    assert owners == partition_nodes(topo, 3)
+    assert list(owners) == sorted(owners)
+    plan = plan_partitions(topo, 3)
+    positions = sorted(pos for bucket in plan.edge_positions for pos in bucket)
+    assert positions == list(range(len(topo.edges)))
+    for part, halo in enumerate(plan.halo_nodes):
+        assert all(plan.node_owner[node] != part for node in halo)
+
+
+@pytest.mark.parametrize("path", TOPOLOGY_PATHS, ids=lambda path: path.stem)
+def test_partitioned_runs_match_engine(path, executor):
+    topo = load_topology_profile(path)
+    profile = ProfileCMP0V1(epsilon_cap=3, SC=topo.SC)
+    rng = random.Random(path.stem)
+    initial_state = [rng.randint(-500, 500) for _ in range(topo.N)]
+    reference = UMXRunContext(topo=topo, profile=profile)
+    partitioned = UMXRunContext(topo=topo, profile=profile, executor=executor, columnar=True)
+    reference.init_state(initial_state)
+    partitioned.init_state(initial_state)
+
+    assert partitioned.run_until(8) == reference.run_until(8)
+
+    reference.fast_forward(20)
+    partitioned.fast_forward(20)
+    assert partitioned.current_state() == reference.current_state()
+
+
+def test_partitioned_step_keeps_edge_order_and_flags(executor):
+    topo = load_topology_profile(TOPOLOGY_DIR / "star_5_topology_profile.json")
+    profile = gf01_profile_cmp0()
+    state = [10_000, 0, 0, 0, 0]
+
+    ledger = executor.step(1, state, topo, profile)
+
+    assert ledger == step(1, state, topo, profile)
+    assert [edge.e_id for edge in ledger.edges] == sorted(edge.e_id for edge in topo.edges)
+    assert executor.fallback_ticks == 0
+
+
+def test_partitioned_step_falls_back_beyond_int64(executor):
+    topo = topology_profile_from_dict(
+        {
+            "gid": "PARTITIONED_BIG",
+            "profile": "CMP-0",
+            "N": 2,
+            "nodes": [{"node_id": 1, "label": "a"}, {"node_id": 2, "label": "b"}],
+            "edges": [{"e_id": 1, "i": 1, "j": 2, "k": 10, "cap": 2**70, "SC": 10}],
+            "SC": 10,
+        }
+    )
+    profile = gf01_profile_cmp0()
+    state = [2**65, -(2**64)]
+
+    assert executor.step(1, state, topo, profile) == step(1, state, topo, profile)
+    assert executor.fallback_ticks == 1
+
+
+def test_executor_rejects_non_positive_workers():
+    with pytest.raises(ValueError):
+        PartitionedExecutor(workers=0)
@@ -0,0 +1,152 @@
+"""Tests for the binary, memory-mapped topology format."""
+from __future__ import annotations
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from src.umx import (
+    ProfileCMP0V1,
+    UMXRunContext,
+    compile_topology,
+    load_topology_profile,
+    topology_profile_from_dict,
+)
+from src.umx import topology_binary
+from src.umx.topology_binary import (
+    convert_topology_json,
+    load_topology_binary,
+    write_topology_binary,
+)
+from src.cli import main as cli_main
+
+TOPOLOGY_DIR = Path(__file__).resolve().parents[2] / "docs" / "fixtures" / "topologies"
+TOPOLOGY_PATHS = sorted(TOPOLOGY_DIR.glob("*.json"))
+
+
+def _attr_topology(**overrides):
+    data = {
+        "gid": "BIN_ATTRS",
+        "profile": "CMP-0",
+        "N": 3,
+        "nodes": [
+            {"node_id": 1, "label": "a", "attrs": {"role": "source"}},
+            {"node_id": 2, "label": "b"},
+            {"node_id": 3, "label": "c"},
+        ],
+        "edges": [
+            {"e_id": 1, "i": 1, "j": 2, "k": 3, "cap": 9, "SC": 8, "causal_radius": 5},
+            {"e_id": 2, "i": 2, "j": 3, "k": 4, "cap": 90, "SC": 8, "c": 2, "attrs": {"w": 1}},
+        ],
+        "SC": 8,
+        "causal_radius": 7,
+        "max_edge_cap": 40,
+        "nap_ref": "NAP_BIN",
+        "meta": {"version": "v2"},
+    }
+    data.update(overrides)
+    return topology_profile_from_dict(data)
+
+
+@pytest.mark.parametrize("path", TOPOLOGY_PATHS, ids=lambda path: path.stem)
+def test_binary_round_trip_matches_json(path, tmp_path):
+    topo = load_topology_profile(path)
+    target = convert_topology_json(path, tmp_path / "topo.umxtopo")
+
+    binary = load_topology_binary(target)
+
+    assert binary.to_topology_profile() == topo
+    assert list(binary.edges) == sorted(topo.edges, key=lambda edge: edge.e_id)
+    compiled = compile_topology(binary)
+    reference = compile_topology(topo)
+    for name in ("e_ids", "i_nodes", "j_nodes", "i_idx", "j_idx", "k", "caps", "radii"):
+        assert list(getattr(compiled, name)) == list(getattr(reference, name))
+
+
+def test_binary_topology_runs_like_json(tmp_path):
+    topo = _attr_topology()
+    write_topology_binary(topo, tmp_path / "attrs.umxtopo")
+    binary = load_topology_binary(tmp_path / "attrs.umxtopo")
+    profile = ProfileCMP0V1(SC=topo.SC)
+
+    assert binary.edges[1].attrs == {"w": 1}
+    assert binary.nodes[0].attrs == {"role": "source"}
+    assert binary.to_topology_profile() == topo
+
+    json_ctx = UMXRunContext(topo=topo, profile=profile)
+    binary_ctx = UMXRunContext(topo=binary, profile=profile)
+    json_ctx.init_state([100, 0, 50])
+    binary_ctx.init_state([100, 0, 50])
+    assert binary_ctx.run_until(6) == json_ctx.run_until(6)
+
+
+def test_pure_python_loader_matches_vectorised_loader(tmp_path, monkeypatch):
+    path = tmp_path / "attrs.umxtopo"
+    write_topology_binary(_attr_topology(), path)
+    vectorised = compile_topology(load_topology_binary(path))
+
+    monkeypatch.setattr(topology_binary, "np", None)
+    fallback = compile_topology(load_topology_binary(path))
+
+    for name in ("i_idx", "j_idx", "caps", "radii"):
+        assert list(getattr(fallback, name)) == list(getattr(vectorised, name))
+
+
+def test_content_hash_is_stable_and_content_sensitive(tmp_path):
+    first = write_topology_binary(_attr_topology(), tmp_path / "a.umxtopo")
+    again = write_topology_binary(_attr_topology(), tmp_path / "b.umxtopo")
+    changed = write_topology_binary(_attr_topology(nap_ref="OTHER"), tmp_path / "c.umxtopo")
+
+    assert first == again == load_topology_binary(tmp_path / "b.umxtopo").content_hash
+    assert changed != first
+
+
+def test_loader_rejects_corrupt_files(tmp_path):
+    path = tmp_path / "topo.umxtopo"
+    write_topology_binary(_attr_topology(), path)
+    raw = bytearray(path.read_bytes())
+
+    bad_magic = tmp_path / "magic.umxtopo"
+    bad_magic.write_bytes(b"NOTTOPO!" + raw[8:])
+    with pytest.raises(ValueError, match="magic"):
+        load_topology_binary(bad_magic)
+
+    truncated = tmp_path / "truncated.umxtopo"
+    truncated.write_bytes(raw[:-3])
+    with pytest.raises(ValueError, match="truncated"):
+        load_topology_binary(truncated)
+
+    # Point the second edge's j endpoint (column 2, row 1) past N.
+    bad_endpoint = tmp_path / "endpoint.umxtopo"
+    offset = 80 + (2 * 2 + 1) * 8
+    struct.pack_into("<q", raw, offset, 99)
+    bad_endpoint.write_bytes(bytes(raw))
+    with pytest.raises(ValueError, match="endpoints"):
+        load_topology_binary(bad_endpoint)
+
+
+def test_writer_rejects_values_beyond_int64(tmp_path):
+    big = topology_profile_from_dict(
+        {
+            "gid": "BIN_BIG",
+            "profile": "CMP-0",
+            "N": 2,
+            "nodes": [{"node_id": 1}, {"node_id": 2}],
+            "edges": [{"e_id": 1, "i": 1, "j": 2, "k": 1, "cap": 2**70, "SC": 8}],
+            "SC": 8,
+        }
+    )
+    with pytest.raises(ValueError, match="int64"):
+        write_topology_binary(big, tmp_path / "big.umxtopo")
+
+
+def test_cli_topology_convert(tmp_path, capsys):
+    source = TOPOLOGY_DIR / "ring_5_topology_profile.json"
+    output = tmp_path / "ring.umxtopo"
+
+    cli_main(["topology", "convert", str(source), "--output", str(output)])
+
+    out = capsys.readouterr().out
+    assert '"E": 5' in out
+    assert load_topology_binary(output).content_hash in out